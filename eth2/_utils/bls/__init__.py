@@ -1,11 +1,11 @@
-from typing import Tuple, Type
+from typing import List, Sequence, Tuple, Type
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
 
 from eth2.beacon.exceptions import SignatureError
 
 from .backends import DEFAULT_BACKEND, NoOpBackend
-from .backends.base import BaseBLSBackend
+from .backends.base import BaseBLSBackend, SignatureSet
 from .validation import (
     validate_many_public_keys,
     validate_private_key,
@@ -46,6 +46,16 @@ class Eth2BLS:
     def aggregate(cls, *signatures: BLSSignature) -> BLSSignature:
         return cls.backend.Aggregate(signatures)
 
+    @classmethod
+    def aggregate_pubkeys(cls, *public_keys: BLSPubkey) -> BLSPubkey:
+        """
+        Return the public key to ``verify`` the aggregate signature of ``public_keys``
+        with, like ``fast_aggregate_verify`` does.
+
+        Raise ``ValueError`` if ``public_keys`` is empty or holds an invalid public key.
+        """
+        return cls.backend.AggregatePKs(public_keys)
+
     @classmethod
     def verify(
         cls, message: Hash32, signature: BLSSignature, public_key: BLSPubkey
@@ -68,21 +78,37 @@ class Eth2BLS:
         return cls.backend.FastAggregateVerify(public_keys, message, signature)
 
     @classmethod
-    def validate(
-        cls, message: Hash32, signature: BLSSignature, *public_keys: BLSPubkey
+    def verify_multiple(cls, signature_sets: Sequence[SignatureSet]) -> bool:
+        """
+        Return whether all the ``(public_keys, message, signature)`` sets are valid.
+
+        Prefer ``SignatureBatch``, which also validates the format of the signatures
+        and finds the invalid ones.
+        """
+        return cls.backend.VerifyMultipleAggregateSignatures(signature_sets)
+
+    @classmethod
+    def validate_format(
+        cls, signature: BLSSignature, public_keys: Sequence[BLSPubkey]
     ) -> None:
         if len(public_keys) == 0:
             raise SignatureError("public_keys is empty")
 
-        is_aggregate = len(public_keys) > 1
-
         if cls.backend != NoOpBackend:
             validate_signature(signature)
-            if is_aggregate:
+            if len(public_keys) > 1:
                 validate_many_public_keys(public_keys)
             else:
                 validate_public_key(public_keys[0])
 
+    @classmethod
+    def validate(
+        cls, message: Hash32, signature: BLSSignature, *public_keys: BLSPubkey
+    ) -> None:
+        cls.validate_format(signature, public_keys)
+
+        is_aggregate = len(public_keys) > 1
+
         if is_aggregate:
             if not cls.fast_aggregate_verify(message, signature, *public_keys):
                 raise SignatureError(
@@ -102,3 +128,53 @@ class Eth2BLS:
 
 
 bls = Eth2BLS()
+
+
+class SignatureBatch:
+    """
+    Collect signatures to check them all with a single ``Eth2BLS.verify_multiple`` call.
+
+    When the batch is invalid, the signatures are checked one by one to find the
+    invalid ones.
+    """
+
+    def __init__(self) -> None:
+        self._signature_sets: List[SignatureSet] = []
+
+    def __len__(self) -> int:
+        return len(self._signature_sets)
+
+    def add(
+        self, message: Hash32, signature: BLSSignature, *public_keys: BLSPubkey
+    ) -> None:
+        """
+        Add the signature to the batch, with the same arguments as ``Eth2BLS.validate``.
+
+        Raise immediately if the signature or public keys are ill-formed.
+        """
+        Eth2BLS.validate_format(signature, public_keys)
+        self._signature_sets.append((public_keys, message, signature))
+
+    def get_invalid_indices(self) -> Tuple[int, ...]:
+        """
+        Return the positions, in the order they were added, of the invalid signatures.
+        """
+        if Eth2BLS.verify_multiple(self._signature_sets):
+            return ()
+
+        return tuple(
+            index
+            for index, (public_keys, message, signature) in enumerate(
+                self._signature_sets
+            )
+            if not Eth2BLS.fast_aggregate_verify(message, signature, *public_keys)
+        )
+
+    def validate(self) -> None:
+        """
+        Raise ``SignatureError`` for the first invalid signature of the batch.
+        """
+        invalid_indices = self.get_invalid_indices()
+        if invalid_indices:
+            public_keys, message, signature = self._signature_sets[invalid_indices[0]]
+            Eth2BLS.validate(message, signature, *public_keys)
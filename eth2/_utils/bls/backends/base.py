@@ -3,6 +3,9 @@ from typing import Sequence, Tuple
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
 
+# The public keys, the message and the signature of a (fast) aggregate signature
+SignatureSet = Tuple[Sequence[BLSPubkey], Hash32, BLSSignature]
+
 
 class BaseBLSBackend(ABC):
     @staticmethod
@@ -34,9 +37,29 @@ class BaseBLSBackend(ABC):
     def Aggregate(signatures: Sequence[BLSSignature]) -> BLSSignature:
         ...
 
+    @staticmethod
+    @abstractmethod
+    def AggregatePKs(PKs: Sequence[BLSPubkey]) -> BLSPubkey:
+        ...
+
     @staticmethod
     @abstractmethod
     def FastAggregateVerify(
         PKs: Sequence[BLSPubkey], message: Hash32, signature: BLSSignature
     ) -> bool:
         ...
+
+    @classmethod
+    def VerifyMultipleAggregateSignatures(
+        cls, signature_sets: Sequence[SignatureSet]
+    ) -> bool:
+        """
+        Return whether every signature of ``signature_sets`` is valid.
+
+        Checks the signature sets one by one, backends able to check them at once should
+        override it.
+        """
+        return all(
+            cls.FastAggregateVerify(public_keys, message, signature)
+            for public_keys, message, signature in signature_sets
+        )
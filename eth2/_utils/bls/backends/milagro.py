@@ -9,6 +9,7 @@ from milagro_bls_binding import (
     Sign,
     SkToPk,
     Verify,
+    _AggregatePKs,
 )
 
 from eth2._utils.bls.backends.base import BaseBLSBackend
@@ -56,6 +57,12 @@ class MilagroBackend(BaseBLSBackend):
     ) -> bool:
         return AggregateVerify(list(public_keys), list(messages), signature)
 
+    @staticmethod
+    def AggregatePKs(PKs: Sequence[BLSPubkey]) -> BLSPubkey:
+        if len(PKs) == 0:
+            raise ValueError("Insufficient number of PKs. (n < 1)")
+        return _AggregatePKs(list(PKs))
+
     @staticmethod
     def FastAggregateVerify(
         PKs: Sequence[BLSPubkey], message: Hash32, signature: BLSSignature
@@ -2,7 +2,7 @@ from typing import Sequence, Tuple
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
 
-from eth2.beacon.constants import EMPTY_SIGNATURE
+from eth2.beacon.constants import EMPTY_PUBKEY, EMPTY_SIGNATURE
 
 from .base import BaseBLSBackend
 
@@ -32,6 +32,10 @@ class NoOpBackend(BaseBLSBackend):
     def Aggregate(signatures: Sequence[BLSSignature]) -> BLSSignature:
         return EMPTY_SIGNATURE
 
+    @staticmethod
+    def AggregatePKs(PKs: Sequence[BLSPubkey]) -> BLSPubkey:
+        return EMPTY_PUBKEY
+
     @staticmethod
     def FastAggregateVerify(
         PKs: Sequence[BLSPubkey], message: Hash32, signature: BLSSignature
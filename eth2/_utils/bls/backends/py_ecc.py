@@ -1,11 +1,55 @@
-from typing import Sequence, Tuple
+import secrets
+from typing import Dict, Sequence, Tuple
 
 from eth_typing import BLSPubkey, BLSSignature, Hash32
+from eth_utils import ValidationError
+from lru import LRU
 from py_ecc.bls import G2ProofOfPossession
+from py_ecc.bls.g2_primatives import G1_to_pubkey, pubkey_to_G1, signature_to_G2
+from py_ecc.bls.hash_to_curve import hash_to_G2
+from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
+from py_ecc.fields import optimized_bls12_381_FQ as FQ
+from py_ecc.optimized_bls12_381 import (
+    G1,
+    Z1,
+    Z2,
+    add,
+    final_exponentiate,
+    multiply,
+    neg,
+    pairing,
+)
+from py_ecc.typing import Optimized_Point3D
 
-from eth2._utils.bls.backends.base import BaseBLSBackend
+from eth2._utils.bls.backends.base import BaseBLSBackend, SignatureSet
 from eth2.beacon.constants import EMPTY_SIGNATURE
 
+# Bits of the random scalar each signature set is weighted with in a batch
+RANDOM_SCALAR_BITS = 64
+
+# Decompressing a public key takes a square root, keep the points of the recent ones
+PUBKEY_POINT_CACHE_SIZE = 2 ** 15
+_pubkey_points: "LRU[BLSPubkey, Optimized_Point3D[FQ]]" = LRU(PUBKEY_POINT_CACHE_SIZE)
+
+
+def _pubkey_to_G1(pubkey: BLSPubkey) -> Optimized_Point3D[FQ]:
+    if pubkey in _pubkey_points:
+        return _pubkey_points[pubkey]
+
+    point = pubkey_to_G1(pubkey)
+    _pubkey_points[pubkey] = point
+    return point
+
+
+def _aggregate_pubkey_points(PKs: Sequence[BLSPubkey]) -> Optimized_Point3D[FQ]:
+    if len(PKs) == 0:
+        raise ValueError("Insufficient number of PKs. (n < 1)")
+
+    aggregate = Z1
+    for pubkey in PKs:
+        aggregate = add(aggregate, _pubkey_to_G1(pubkey))
+    return aggregate
+
 
 class PyECCBackend(BaseBLSBackend):
     @staticmethod
@@ -35,8 +79,54 @@ class PyECCBackend(BaseBLSBackend):
             return EMPTY_SIGNATURE
         return G2ProofOfPossession.Aggregate(signatures)
 
+    @staticmethod
+    def AggregatePKs(PKs: Sequence[BLSPubkey]) -> BLSPubkey:
+        return G1_to_pubkey(_aggregate_pubkey_points(PKs))
+
     @staticmethod
     def FastAggregateVerify(
         PKs: Sequence[BLSPubkey], message: Hash32, signature: BLSSignature
     ) -> bool:
-        return G2ProofOfPossession.FastAggregateVerify(PKs, message, signature)
+        try:
+            aggregate_pubkey = PyECCBackend.AggregatePKs(PKs)
+        except (ValidationError, ValueError):
+            return False
+        return G2ProofOfPossession.Verify(aggregate_pubkey, message, signature)
+
+    @staticmethod
+    def VerifyMultipleAggregateSignatures(
+        signature_sets: Sequence[SignatureSet]
+    ) -> bool:
+        """
+        Check all the signature sets with a single multi-pairing.
+
+        Each set is weighted by a random scalar, so that invalid signatures can not cancel
+        each other out, and the sets signing the same message share their pairing.
+        """
+        try:
+            signature_sum = Z2
+            weighted_pubkeys: Dict[Hash32, Optimized_Point3D[FQ]] = {}
+            for public_keys, message, signature in signature_sets:
+                scalar = secrets.randbits(RANDOM_SCALAR_BITS) | 1
+
+                pubkey_point = _aggregate_pubkey_points(public_keys)
+                weighted_pubkeys[message] = add(
+                    weighted_pubkeys.get(message, Z1), multiply(pubkey_point, scalar)
+                )
+                signature_sum = add(
+                    signature_sum, multiply(signature_to_G2(signature), scalar)
+                )
+
+            aggregate = pairing(signature_sum, neg(G1), final_exponentiate=False)
+            for message, pubkey_point in weighted_pubkeys.items():
+                message_point = hash_to_G2(
+                    message,
+                    G2ProofOfPossession.DST,
+                    G2ProofOfPossession.xmd_hash_function,
+                )
+                aggregate *= pairing(
+                    message_point, pubkey_point, final_exponentiate=False
+                )
+            return final_exponentiate(aggregate) == FQ12.one()
+        except (ValidationError, ValueError, AssertionError):
+            return False
@@ -5,10 +5,11 @@ from abc import ABC
 from dataclasses import asdict, dataclass, field
 from enum import Enum, unique
 import logging
-from typing import Collection, Iterable, Optional, Set
+from typing import Collection, Dict, Iterable, Optional, Set, Tuple
 
 from eth_typing import BLSPubkey, BLSSignature
 from eth_utils import decode_hex, encode_hex, humanize_hash, to_tuple
+from lru import LRU
 from ssz.tools.dump import to_formatted_dict
 from ssz.tools.parse import from_formatted_dict
 
@@ -20,22 +21,46 @@ from eth2.beacon.helpers import (
     compute_start_slot_at_epoch,
     get_block_root_at_slot,
 )
-from eth2.beacon.tools.builder.committee_assignment import get_committee_assignment
-from eth2.beacon.tools.builder.proposer import create_block_proposal, is_proposer
+from eth2.beacon.tools.builder.duty_index import (
+    DutyIndex,
+    ShufflingKey,
+    compute_shuffling_key,
+)
+from eth2.beacon.tools.builder.proposer import create_block_proposal
 from eth2.beacon.types.attestations import Attestation, AttestationData
 from eth2.beacon.types.blocks import BeaconBlock, SignedBeaconBlock
 from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.beacon.types.states import BeaconState
-from eth2.beacon.typing import Bitfield, CommitteeIndex, Epoch, Root, Slot, Timestamp
+from eth2.beacon.typing import (
+    Bitfield,
+    CommitteeIndex,
+    Epoch,
+    Root,
+    Slot,
+    Timestamp,
+    ValidatorIndex,
+)
 from eth2.clock import Clock
 from eth2.configs import Eth2Config
 from trinity._utils.trio_utils import Request, Response
+from trinity.metrics.registry import metrics
 
 logger = logging.getLogger("eth2.api.http.validator")
 
 # TODO what is a reasonable number here?
 MAX_SEARCH_SLOTS = 500
 
+# Enough for the duties of the previous, current and next epoch, across a reorg
+DUTY_INDEX_CACHE_SIZE = 8
+
+# States advanced to the slots that validators are currently asking about, on top of
+# the few most recent heads.
+ADVANCED_STATE_CACHE_SIZE = 16
+
+# NOTE: temporary sentinel value for "no slot"
+# The API has since been updated w/ much better ergonomics
+NO_SLOT = Slot((1 << 64) - 1)
+
 
 class ServerError(Exception):
     pass
@@ -105,6 +130,14 @@ class Context:
     clock: Clock
     block_broadcaster: BlockBroadcasterAPI
     _broadcast_operations: Set[Root] = field(default_factory=set)
+    _duty_indices: "LRU[ShufflingKey, DutyIndex]" = field(
+        default_factory=lambda: LRU(DUTY_INDEX_CACHE_SIZE)
+    )
+    _pubkey_to_index: Dict[BLSPubkey, ValidatorIndex] = field(default_factory=dict)
+    # (block root, slot) -> the state of the block, advanced through empty slots to slot
+    _advanced_states: "LRU[Tuple[Root, Slot], BeaconState]" = field(
+        default_factory=lambda: LRU(ADVANCED_STATE_CACHE_SIZE)
+    )
 
     @property
     def genesis_time(self) -> Timestamp:
@@ -121,33 +154,84 @@ class Context:
             return ()
 
         current_tick = self.clock.compute_current_tick()
-        state = advance_state_to_slot(self.chain, current_tick.slot)
+        state = self._get_advanced_state(
+            self.chain.get_canonical_head(), current_tick.slot
+        )
+        duty_index = self._get_duty_index(state, epoch)
+        self._sync_pubkeys(state)
         for public_key in public_keys:
-            validator_index = state.get_validator_index_for_public_key(public_key)
+            validator_index = self._pubkey_to_index.get(public_key)
+            if validator_index is None:
+                continue
             try:
-                committee_assignment = get_committee_assignment(
-                    state, self.eth2_config, epoch, validator_index
-                )
+                assignment = duty_index.get_assignment(validator_index)
             except NoCommitteeAssignment:
                 continue
 
-            if is_proposer(state, validator_index, self.eth2_config):
-                # TODO (ralexstokes) clean this up!
-                if state.slot != 0:
-                    block_proposal_slot = state.slot
-                else:
-                    block_proposal_slot = Slot((1 << 64) - 1)
-            else:
-                # NOTE: temporary sentinel value for "no slot"
-                # The API has since been updated w/ much better ergonomics
-                block_proposal_slot = Slot((1 << 64) - 1)
+            # Report the next block this validator proposes in the epoch, if any.
+            # There is no proposal at the genesis slot.
+            block_proposal_slot = next(
+                (
+                    slot
+                    for slot in assignment.proposer_slots
+                    if slot >= state.slot and slot != 0
+                ),
+                NO_SLOT,
+            )
             yield ValidatorDuty(
                 public_key,
-                committee_assignment.slot,
-                committee_assignment.committee_index,
+                assignment.slot,
+                assignment.committee_index,
                 block_proposal_slot,
             )
 
+    def _get_advanced_state(self, block: BeaconBlock, slot: Slot) -> BeaconState:
+        """
+        Return the post-state of ``block``, advanced through empty slots to ``slot``.
+
+        The result is cached, so that all the validators asking about the same slot only
+        pay for the slot transitions once.
+        """
+        key: Tuple[Root, Slot] = (block.hash_tree_root, slot)
+        try:
+            state = self._advanced_states[key]
+        except KeyError:
+            metrics.validator_api_state_cache_misses.inc()
+        else:
+            metrics.validator_api_state_cache_hits.inc()
+            return state
+
+        state_machine = self.chain.get_state_machine(block.slot)
+        block_state = self.chain.db.get_state_by_root(
+            block.state_root, BeaconState, state_machine.config
+        )
+        state = advance_state_to_slot(self.chain, slot, block_state)
+        self._advanced_states[key] = state
+        return state
+
+    def _get_duty_index(self, state: BeaconState, epoch: Epoch) -> DutyIndex:
+        """
+        Return the ``DutyIndex`` of ``epoch``, only building it again if the shuffling
+        of the epoch (or its proposers) changed.
+        """
+        shuffling_key = compute_shuffling_key(state, epoch, self.eth2_config)
+        try:
+            return self._duty_indices[shuffling_key]
+        except KeyError:
+            duty_index = DutyIndex.from_state(state, epoch, self.eth2_config)
+            self._duty_indices[shuffling_key] = duty_index
+            return duty_index
+
+    def _sync_pubkeys(self, state: BeaconState) -> None:
+        """
+        Add the public keys of validators that joined since the last call. Validators
+        are only ever appended to the registry, so existing entries stay valid.
+        """
+        validators = state.validators
+        for index in range(len(self._pubkey_to_index), len(validators)):
+            pubkey = validators[index].pubkey
+            self._pubkey_to_index[pubkey] = ValidatorIndex(index)
+
     def _search_linearly_for_parent(
         self, target_slot: Slot
     ) -> Optional[SignedBeaconBlock]:
@@ -185,18 +269,16 @@ class Context:
                 parent = self._search_linearly_for_parent(parent_slot)
                 if not parent:
                     raise ServerError()
-                parent_block_root = parent.message.hash_tree_root
+                parent_block = parent.message
             else:
                 # the head is a satisfactory parent, continue!
-                parent_block_root = parent.hash_tree_root
+                parent_block = parent
         else:
-            parent_block_root = parent.message.hash_tree_root
+            parent_block = parent.message
+        parent_block_root = parent_block.hash_tree_root
 
         state_machine = self.chain.get_state_machine(slot)
-        parent_state = self.chain.db.get_state_by_root(
-            parent.state_root, BeaconState, state_machine.config
-        )
-        parent_state = advance_state_to_slot(self.chain, parent_slot, parent_state)
+        parent_state = self._get_advanced_state(parent_block, parent_slot)
 
         # TODO: query for latest eth1 data...
         eth1_data = parent_state.eth1_data
@@ -223,7 +305,9 @@ class Context:
         self, public_key: BLSPubkey, slot: Slot, committee_index: CommitteeIndex
     ) -> Attestation:
         current_tick = self.clock.compute_current_tick()
-        state = advance_state_to_slot(self.chain, current_tick.slot)
+        state = self._get_advanced_state(
+            self.chain.get_canonical_head(), current_tick.slot
+        )
         block = self.chain.get_block_by_slot(slot)
         if not block:
             # try to find earlier block, assuming skipped slots
@@ -244,15 +328,17 @@ class Context:
             target=target_checkpoint,
         )
 
-        validator_index = state.get_validator_index_for_public_key(public_key)
+        self._sync_pubkeys(state)
+        validator_index = self._pubkey_to_index.get(public_key)
+        if validator_index is None:
+            raise NoCommitteeAssignment
         epoch = compute_epoch_at_slot(slot, self.eth2_config.SLOTS_PER_EPOCH)
-        committee_assignment = get_committee_assignment(
-            state, self.eth2_config, epoch, validator_index
-        )
-        committee = committee_assignment.committee
-        committee_validator_index = committee.index(validator_index)
+        assignment = self._get_duty_index(state, epoch).get_assignment(validator_index)
         aggregation_bits = Bitfield(
-            tuple(i == committee_validator_index for i in range(len(committee)))
+            tuple(
+                i == assignment.committee_position
+                for i in range(assignment.committee_size)
+            )
         )
         return Attestation.create(aggregation_bits=aggregation_bits, data=data)
 
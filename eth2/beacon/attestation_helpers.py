@@ -1,6 +1,6 @@
 from eth_utils import ValidationError
 
-from eth2._utils.bls import bls
+from eth2._utils.bls import SignatureBatch, bls
 from eth2.beacon.exceptions import SignatureError
 from eth2.beacon.helpers import compute_signing_root, get_domain
 from eth2.beacon.signature_domain import SignatureDomain
@@ -10,8 +10,15 @@ from eth2.beacon.types.states import BeaconState
 
 
 def validate_indexed_attestation_aggregate_signature(
-    state: BeaconState, indexed_attestation: IndexedAttestation, slots_per_epoch: int
+    state: BeaconState,
+    indexed_attestation: IndexedAttestation,
+    slots_per_epoch: int,
+    signature_batch: SignatureBatch = None,
 ) -> None:
+    """
+    If ``signature_batch`` is given, the signature is added to it to be validated
+    with the rest of the batch.
+    """
     public_keys = tuple(
         state.validators[i].pubkey for i in indexed_attestation.attesting_indices
     )
@@ -22,7 +29,10 @@ def validate_indexed_attestation_aggregate_signature(
         indexed_attestation.data.target.epoch,
     )
     signing_root = compute_signing_root(indexed_attestation.data, domain)
-    bls.validate(signing_root, indexed_attestation.signature, *public_keys)
+    if signature_batch is None:
+        bls.validate(signing_root, indexed_attestation.signature, *public_keys)
+    else:
+        signature_batch.add(signing_root, indexed_attestation.signature, *public_keys)
 
 
 def validate_indexed_attestation(
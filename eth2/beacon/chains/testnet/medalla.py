@@ -14,6 +14,7 @@ from eth2.beacon.db.chain2 import BeaconChainDB, StateNotFound
 from eth2.beacon.fork_choice.abc import BaseForkChoice, BlockSink
 from eth2.beacon.helpers import compute_epoch_at_slot
 from eth2.beacon.state_machines.forks.medalla.eth2fastspec import get_attesting_indices
+from eth2.beacon.state_machines.forks.medalla.pubkey_registry import PubkeyRegistry
 from eth2.beacon.state_machines.forks.medalla.state_machine import (
     MedallaStateMachineFast,
     MedallaStateMachineTest,
@@ -60,12 +61,12 @@ def _validate_sm_configuration(sm_configuration: StateMachineConfiguration) -> N
 
 @to_dict
 def _load_state_machines(
-    sm_configuration: StateMachineConfiguration
+    sm_configuration: StateMachineConfiguration, pubkey_registry: PubkeyRegistry
 ) -> Iterable[Tuple[Container[int], MedallaStateMachineFast]]:
     sm_configuration += ((FAR_FUTURE_SLOT, None),)
     for (first_fork, second_fork) in toolz.sliding_window(2, sm_configuration):
         valid_range = range(first_fork[0], second_fork[0])
-        valid_sm = first_fork[1]()
+        valid_sm = first_fork[1](pubkey_registry)
         yield (valid_range, valid_sm)
 
 
@@ -92,8 +93,14 @@ class BeaconChain(BaseBeaconChain):
     ) -> None:
         self._chain_db = chain_db
 
+        # NOTE: loading the pubkeys persisted by previous runs saves reading them
+        # from the validators of the first state we process.
+        self._pubkey_registry = PubkeyRegistry(chain_db.get_validator_pubkeys())
+
         _validate_sm_configuration(self._sm_configuration)
-        self._state_machines_by_range = _load_state_machines(self._sm_configuration)
+        self._state_machines_by_range = _load_state_machines(
+            self._sm_configuration, self._pubkey_registry
+        )
 
         self._fork_choice = fork_choice
         self._current_head = fork_choice.find_head()
@@ -268,11 +275,19 @@ class BeaconChain(BaseBeaconChain):
         # NOTE: if we have a valid block/state, then record in the database.
         self._chain_db.persist_block(block)
         self._chain_db.persist_state(state, state_machine.config)
+        self._persist_validator_pubkeys()
 
         self._reconcile_justification_and_finality(state)
 
         return imported_block
 
+    def _persist_validator_pubkeys(self) -> None:
+        persisted_count = self._chain_db.get_validator_pubkey_count()
+        if len(self._pubkey_registry) > persisted_count:
+            self._chain_db.append_validator_pubkeys(
+                self._pubkey_registry.get_pubkeys(persisted_count)
+            )
+
     def _reconcile_justification_and_finality(self, state: BeaconState) -> None:
         justified_checkpoint = state.current_justified_checkpoint
         finalized_checkpoint = state.finalized_checkpoint
@@ -3,8 +3,10 @@ from eth_typing import BLSPubkey, BLSSignature
 
 from eth2.beacon.typing import Epoch, Root, Slot, Timestamp
 
+BLS_PUBKEY_SIZE = 48
+
 EMPTY_SIGNATURE = BLSSignature(b"\x00" * 96)
-EMPTY_PUBKEY = BLSPubkey(b"\x00" * 48)
+EMPTY_PUBKEY = BLSPubkey(b"\x00" * BLS_PUBKEY_SIZE)
 GWEI_PER_ETH = 10 ** 9
 FAR_FUTURE_SLOT = Slot(2 ** 64 - 1)
 FAR_FUTURE_EPOCH = Epoch(2 ** 64 - 1)
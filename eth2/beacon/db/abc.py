@@ -108,3 +108,23 @@ class BaseBeaconChainDB(ABC):
     @abstractmethod
     def persist_state(self, state: BeaconState, config: Eth2Config) -> None:
         ...
+
+    @abstractmethod
+    def get_validator_pubkey_count(self) -> int:
+        ...
+
+    @abstractmethod
+    def get_validator_pubkeys(self) -> bytes:
+        """
+        Return the concatenated public keys of the validators known to the database,
+        in validator index order.
+        """
+        ...
+
+    @abstractmethod
+    def append_validator_pubkeys(self, pubkeys: bytes) -> None:
+        """
+        Store the concatenated ``pubkeys`` as the public keys of the validators following
+        the ones already in the database.
+        """
+        ...
@@ -10,7 +10,7 @@ from ssz.hashable_list import HashableList
 from ssz.hashable_vector import HashableVector
 from ssz.sedes import Bitvector
 
-from eth2.beacon.constants import JUSTIFICATION_BITS_LENGTH
+from eth2.beacon.constants import BLS_PUBKEY_SIZE, JUSTIFICATION_BITS_LENGTH
 from eth2.beacon.db.abc import BaseBeaconChainDB
 import eth2.beacon.db.schema2 as SchemaV1
 from eth2.beacon.genesis import get_genesis_block
@@ -45,6 +45,8 @@ class StateNotFound(Exception):
 BLOCK_CACHE_SIZE = 64
 # two epochs of states
 STATE_CACHE_SIZE = 64
+# number of validator pubkeys stored under a single key
+VALIDATOR_PUBKEYS_CHUNK_SIZE = 1024
 
 
 class BeaconChainDB(BaseBeaconChainDB):
@@ -740,6 +742,51 @@ class BeaconChainDB(BaseBeaconChainDB):
 
         self._write_state(state, config)
 
+    def get_validator_pubkey_count(self) -> int:
+        key = SchemaV1.validator_pubkey_count()
+        try:
+            return ssz.decode(self.db[key], ssz.uint64)
+        except KeyError:
+            return 0
+
+    def get_validator_pubkeys(self) -> bytes:
+        count = self.get_validator_pubkey_count()
+        chunk_count = (
+            count + VALIDATOR_PUBKEYS_CHUNK_SIZE - 1
+        ) // VALIDATOR_PUBKEYS_CHUNK_SIZE
+        return b"".join(
+            self.db[SchemaV1.validator_pubkeys_chunk(chunk_index)]
+            for chunk_index in range(chunk_count)
+        )
+
+    def append_validator_pubkeys(self, pubkeys: bytes) -> None:
+        """
+        The pubkeys are stored in chunks of ``VALIDATOR_PUBKEYS_CHUNK_SIZE``, so that
+        appending only rewrites the last chunk.
+        """
+        if len(pubkeys) % BLS_PUBKEY_SIZE:
+            raise ValueError(
+                f"Length of the pubkeys ({len(pubkeys)}) is not a multiple"
+                f" of {BLS_PUBKEY_SIZE}"
+            )
+        if not pubkeys:
+            return
+
+        persisted_count = self.get_validator_pubkey_count()
+        chunk_index, offset = divmod(persisted_count, VALIDATOR_PUBKEYS_CHUNK_SIZE)
+        if offset:
+            # Complete the partial last chunk
+            pubkeys = self.db[SchemaV1.validator_pubkeys_chunk(chunk_index)] + pubkeys
+
+        chunk_size = VALIDATOR_PUBKEYS_CHUNK_SIZE * BLS_PUBKEY_SIZE
+        with self.db.atomic_batch() as db:
+            for start in range(0, len(pubkeys), chunk_size):
+                key = SchemaV1.validator_pubkeys_chunk(chunk_index)
+                db[key] = pubkeys[start : start + chunk_size]
+                chunk_index += 1
+            count = persisted_count - offset + len(pubkeys) // BLS_PUBKEY_SIZE
+            db[SchemaV1.validator_pubkey_count()] = ssz.encode(count, ssz.uint64)
+
     def _get_genesis_data(self) -> Tuple[Timestamp, Root]:
         key = SchemaV1.genesis_data()
         try:
@@ -121,3 +121,11 @@ def state_root_to_finalized_checkpoint_root(root: Root) -> bytes:
 
 def genesis_data() -> bytes:
     return b"v1:beacon:genesis-data"
+
+
+def validator_pubkey_count() -> bytes:
+    return b"v1:beacon:validator-pubkey-count"
+
+
+def validator_pubkeys_chunk(chunk_index: int) -> bytes:
+    return b"v1:beacon:validator-pubkeys-chunk:" + ssz.encode(chunk_index, ssz.uint64)
@@ -1,9 +1,22 @@
-from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+from array import array
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from eth_typing import BLSPubkey, Hash32
 from eth_utils import ValidationError, encode_hex
+from lru import LRU
 
-from eth2._utils.bls import bls
+from eth2._utils.bls import SignatureBatch, bls
 from eth2._utils.hash import hash_eth2
 from eth2.beacon.committee_helpers import compute_shuffled_index
 from eth2.beacon.constants import (
@@ -31,6 +44,7 @@ from eth2.beacon.helpers import (
     signature_domain_to_domain_type,
 )
 from eth2.beacon.signature_domain import SignatureDomain
+from eth2.beacon.state_machines.forks.medalla.pubkey_registry import PubkeyRegistry
 from eth2.beacon.state_machines.forks.serenity.block_validation import (
     _validate_checkpoint,
     _validate_eligible_exit_epoch,
@@ -99,14 +113,14 @@ def xor(bytes_1: bytes, bytes_2: bytes) -> bytes:
 
 # ShuffleList shuffles a list, using the given seed for randomness. Mutates the input list.
 def shuffle_list(input: List[ValidatorIndex], seed: Hash32, config: Eth2Config) -> None:
-    _inner_shuffle_list(input, seed, True, config)
+    _shuffle_list_in_place(input, seed, True, config)
 
 
 # UnshuffleList undoes a list shuffling using the seed of the shuffling. Mutates the input list.
 def unshuffle_list(
     input: List[ValidatorIndex], seed: Hash32, config: Eth2Config
 ) -> None:
-    _inner_shuffle_list(input, seed, False, config)
+    _shuffle_list_in_place(input, seed, False, config)
 
 
 _SHUFFLE_H_SEED_SIZE = 32
@@ -255,6 +269,59 @@ def _inner_shuffle_list(
             r -= 1
 
 
+# The NumPy implementation swaps all the pairs of a round at once, use it if available.
+_shuffle_list_in_place = _inner_shuffle_list
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    pass
+else:
+    from eth2.beacon.state_machines.forks.medalla.vectorized_shuffling import (
+        inner_shuffle_list as _vectorized_inner_shuffle_list,
+    )
+
+    _shuffle_list_in_place = _vectorized_inner_shuffle_list
+
+
+# Shufflings are shared by all ``EpochsContext``s, e.g. of sibling forks, and of replayed epochs.
+SHUFFLING_CACHE_SIZE = 8
+_shuffling_cache: "LRU[Tuple[Hash32, Hash32, int], Tuple[ValidatorIndex, ...]]" = LRU(
+    SHUFFLING_CACHE_SIZE
+)
+
+# Aggregate public keys of attestations, kept by each ``ShufflingEpoch``
+AGGREGATE_PUBKEY_CACHE_SIZE = 1024
+
+
+def compute_active_indices_root(active_indices: Sequence[ValidatorIndex]) -> Hash32:
+    return hash_eth2(array("Q", active_indices).tobytes())
+
+
+def compute_shuffling(
+    active_indices: Sequence[ValidatorIndex], seed: Hash32, config: Eth2Config
+) -> Tuple[ValidatorIndex, ...]:
+    """
+    Return the active validator indices, shuffled into their committees.
+
+    The shuffling only depends on the seed and the active indices, so it is cached
+    across calls, keyed by the seed and the root of the active indices.
+    """
+    key = (
+        seed,
+        compute_active_indices_root(active_indices),
+        config.SHUFFLE_ROUND_COUNT,
+    )
+    if key in _shuffling_cache:
+        return _shuffling_cache[key]
+
+    shuffling = list(active_indices)  # copy
+    unshuffle_list(shuffling, seed, config)
+    # Shared by every ``ShufflingEpoch`` with this key, so it must not be mutated
+    committee_order = tuple(shuffling)
+    _shuffling_cache[key] = committee_order
+    return committee_order
+
+
 def compute_committee_count(active_validators_count: int, config: Eth2Config) -> int:
     validators_per_slot = active_validators_count // config.SLOTS_PER_EPOCH
     committees_per_slot = validators_per_slot // config.TARGET_COMMITTEE_SIZE
@@ -281,6 +348,8 @@ class ShufflingEpoch(object):
     # the active validator indices, shuffled into their committee
     shuffling: Sequence[ValidatorIndex]
     committees: EpochCommittees  # list of lists of slices of Shuffling
+    # (slot, committee index, aggregation bits) -> aggregate pubkey of the attesters
+    aggregate_pubkeys: "LRU[Tuple[Slot, CommitteeIndex, Tuple[bool, ...]], BLSPubkey]"
 
     # indices_bounded: (index, activation_epoch, exit_epoch) per validator.
     def __init__(
@@ -292,6 +361,7 @@ class ShufflingEpoch(object):
     ):
         self.epoch = epoch
         self.config = config
+        self.aggregate_pubkeys = LRU(AGGREGATE_PUBKEY_CACHE_SIZE)
 
         seed = get_seed(
             state,
@@ -306,9 +376,7 @@ class ShufflingEpoch(object):
             if activation_epoch <= epoch < exit_epoch
         ]
 
-        shuffling = list(self.active_indices)  # copy
-        unshuffle_list(shuffling, seed, config)
-        self.shuffling = shuffling
+        self.shuffling = compute_shuffling(self.active_indices, seed, config)
 
         active_validator_count = len(self.active_indices)
         committees_per_slot = compute_committee_count(active_validator_count, config)
@@ -370,17 +438,22 @@ def compute_proposer_index(
 
 
 class EpochsContext(object):
-    pubkey2index: Dict[BLSPubkey, ValidatorIndex]
-    index2pubkey: List[BLSPubkey]
+    # Shared between contexts, only the first ``pubkey_count`` entries are of this context.
+    pubkey_registry: PubkeyRegistry
+    pubkey_count: int
     proposers: Sequence[ValidatorIndex]  # 1 proposer per slot, only of current epoch.
     previous_shuffling: Optional[ShufflingEpoch]
     current_shuffling: Optional[ShufflingEpoch]
     next_shuffling: Optional[ShufflingEpoch]
     config: Eth2Config
 
-    def __init__(self, config: Eth2Config) -> None:
-        self.pubkey2index = {}
-        self.index2pubkey = []
+    def __init__(
+        self, config: Eth2Config, pubkey_registry: PubkeyRegistry = None
+    ) -> None:
+        if pubkey_registry is None:
+            pubkey_registry = PubkeyRegistry()
+        self.pubkey_registry = pubkey_registry
+        self.pubkey_count = 0
         self.proposers = []
         self.previous_shuffling = None
         self.current_shuffling = None
@@ -437,10 +510,9 @@ class EpochsContext(object):
         ]
 
     def copy(self) -> "EpochsContext":
-        epochs_ctx = EpochsContext(self.config)
-        # Full copy of pubkeys, this can mutate
-        epochs_ctx.pubkey2index = self.pubkey2index.copy()
-        epochs_ctx.index2pubkey = self.index2pubkey.copy()
+        # The pubkey registry is append-only, so it is shared and only the count is copied
+        epochs_ctx = EpochsContext(self.config, self.pubkey_registry)
+        epochs_ctx.pubkey_count = self.pubkey_count
         # Only shallow-copy the other data, it doesn't mutate (only completely replaced on rotation)
         epochs_ctx.proposers = self.proposers
         epochs_ctx.previous_shuffling = self.previous_shuffling
@@ -449,22 +521,34 @@ class EpochsContext(object):
         return epochs_ctx
 
     def sync_pubkeys(self, state: BeaconState) -> None:
-        if self.pubkey2index is None:
-            self.pubkey2index = {}
-        if self.index2pubkey is None:
-            self.index2pubkey = []
-
-        current_count = len(self.pubkey2index)
-        if current_count != len(self.index2pubkey):
-            raise ValidationError(
-                f"length of pubkey2index and index2pubkey do not match  "
-                f"{current_count} != {len(self.index2pubkey)}"
-            )
-        for i in range(current_count, len(state.validators)):
-            pubkey: BLSPubkey = state.validators[i].pubkey
-            index = ValidatorIndex(i)
-            self.pubkey2index[pubkey] = index
-            self.index2pubkey.append(pubkey)
+        validators = state.validators
+        validator_count = len(validators)
+        registry = self.pubkey_registry
+
+        # Entries another context added to the registry are only checked by their last one:
+        # validator indices follow the deposit order, so they match on every fork.
+        shared_count = min(validator_count, len(registry))
+        if shared_count > self.pubkey_count:
+            last_index = ValidatorIndex(shared_count - 1)
+            if registry.get_pubkey(last_index) != validators[last_index].pubkey:
+                registry = PubkeyRegistry()
+                registry.extend(validator.pubkey for validator in validators)
+                self.pubkey_registry = registry
+
+        for i in range(len(registry), validator_count):
+            registry.append(validators[i].pubkey)
+        self.pubkey_count = validator_count
+
+    def get_validator_index(self, pubkey: BLSPubkey) -> Optional[ValidatorIndex]:
+        index = self.pubkey_registry.get_index(pubkey)
+        if index is None or index >= self.pubkey_count:
+            return None
+        return index
+
+    def get_pubkey(self, index: ValidatorIndex) -> BLSPubkey:
+        if index >= self.pubkey_count:
+            raise IndexError(f"Validator {index} is not in the epochs context")
+        return self.pubkey_registry.get_pubkey(index)
 
     def rotate_epochs(self, state: BeaconState) -> None:
         self.previous_shuffling = self.current_shuffling
@@ -479,20 +563,23 @@ class EpochsContext(object):
         )
         self._reset_proposers(state)
 
-    def _get_slot_comms(self, slot: Slot) -> SlotCommittees:
+    def _get_shuffling(self, slot: Slot) -> ShufflingEpoch:
         epoch = compute_epoch_at_slot(slot, self.config.SLOTS_PER_EPOCH)
-        epoch_slot = slot % self.config.SLOTS_PER_EPOCH
         if epoch == self.previous_shuffling.epoch:
-            return self.previous_shuffling.committees[epoch_slot]
+            return self.previous_shuffling
         elif epoch == self.current_shuffling.epoch:
-            return self.current_shuffling.committees[epoch_slot]
+            return self.current_shuffling
         elif epoch == self.next_shuffling.epoch:
-            return self.next_shuffling.committees[epoch_slot]
+            return self.next_shuffling
         else:
             raise Exception(
                 f"crosslink committee retrieval: out of range epoch: {epoch}"
             )
 
+    def _get_slot_comms(self, slot: Slot) -> SlotCommittees:
+        epoch_slot = slot % self.config.SLOTS_PER_EPOCH
+        return self._get_shuffling(slot).committees[epoch_slot]
+
     # Return the beacon committee at slot for index.
     def get_beacon_committee(self, slot: Slot, index: CommitteeIndex) -> Committee:
         slot_comms = self._get_slot_comms(slot)
@@ -504,6 +591,28 @@ class EpochsContext(object):
 
         return slot_comms[index]
 
+    def get_aggregate_pubkey(
+        self, slot: Slot, index: CommitteeIndex, bitfield: Bitfield
+    ) -> BLSPubkey:
+        """
+        Return the aggregate pubkey of the members of the committee ``index`` at ``slot``
+        that are set in ``bitfield``.
+
+        The aggregate pubkeys are cached by the shuffling of the committee, so that
+        attestations seen again, e.g. in a block after gossip, are not aggregated again.
+        """
+        shuffling = self._get_shuffling(slot)
+        key = (slot, index, tuple(bitfield))
+        if key in shuffling.aggregate_pubkeys:
+            return shuffling.aggregate_pubkeys[key]
+
+        committee = self.get_beacon_committee(slot, index)
+        aggregate_pubkey = bls.aggregate_pubkeys(
+            *(self.get_pubkey(i) for i, bit in zip(committee, bitfield) if bit)
+        )
+        shuffling.aggregate_pubkeys[key] = aggregate_pubkey
+        return aggregate_pubkey
+
     def get_committee_count_at_slot(self, slot: Slot) -> int:
         return int(len(self._get_slot_comms(slot)))
 
@@ -1217,13 +1326,6 @@ def process_final_updates(
     DOWNWARD_THRESHOLD = HYSTERESIS_INCREMENT * config.HYSTERESIS_DOWNWARD_MULTIPLIER
     UPWARD_THRESHOLD = HYSTERESIS_INCREMENT * config.HYSTERESIS_UPWARD_MULTIPLIER
 
-    current_epoch = process.current_epoch
-    next_epoch = Epoch(current_epoch + 1)
-
-    # Reset eth1 data votes
-    if next_epoch % config.EPOCHS_PER_ETH1_VOTING_PERIOD == 0:
-        state = state.set("eth1_data_votes", [])
-
     # Update effective balances with hysteresis
     for (index, status), balance in zip(enumerate(process.statuses), state.balances):
         effective_balance = status.validator.effective_balance
@@ -1242,6 +1344,25 @@ def process_final_updates(
                 ),
             )
 
+    return process_historical_updates(epochs_ctx, process, state, config)
+
+
+def process_historical_updates(
+    epochs_ctx: EpochsContext,
+    process: EpochProcess,
+    state: BeaconState,
+    config: Eth2Config,
+) -> BeaconState:
+    """
+    The final updates that do not depend on the validator registry.
+    """
+    current_epoch = process.current_epoch
+    next_epoch = Epoch(current_epoch + 1)
+
+    # Reset eth1 data votes
+    if next_epoch % config.EPOCHS_PER_ETH1_VOTING_PERIOD == 0:
+        state = state.set("eth1_data_votes", [])
+
     # Reset slashings
     state = state.transform(
         ("slashings", next_epoch % config.EPOCHS_PER_SLASHINGS_VECTOR),
@@ -1369,16 +1490,28 @@ def process_operations(
     ):
         raise ValidationError(f"Incorrect number of deposits ({len(body.deposits)})")
 
-    for operations, function in (
+    # The signatures of the attestations are verified at once, after processing them all
+    attestation_signatures = SignatureBatch()
+    processors: Tuple[Tuple[Sequence[Any], Callable[..., BeaconState]], ...] = (
         (body.proposer_slashings, process_proposer_slashing),
         (body.attester_slashings, process_attester_slashing),
-        (body.attestations, process_attestation),
+        (
+            body.attestations,
+            partial(process_attestation, signature_batch=attestation_signatures),
+        ),
         (body.deposits, process_deposit),
         (body.voluntary_exits, process_voluntary_exit),
-    ):
+    )
+    for operations, function in processors:
         for operation in operations:
             state = function(epochs_ctx, state, operation, config)
 
+    invalid_indices = attestation_signatures.get_invalid_indices()
+    if invalid_indices:
+        raise ValidationError(
+            f"Invalid attestation signature: {body.attestations[invalid_indices[0]]}."
+        )
+
     return state
 
 
@@ -1536,16 +1669,25 @@ def is_valid_indexed_attestation(
     state: BeaconState,
     indexed_attestation: IndexedAttestation,
     config: Eth2Config,
+    signature_batch: SignatureBatch = None,
+    aggregate_pubkey: BLSPubkey = None,
 ) -> bool:
     """
     Check if ``indexed_attestation`` has sorted and unique indices and a valid aggregate signature.
+
+    If ``signature_batch`` is given, the aggregate signature is added to it instead of
+    being verified. ``aggregate_pubkey`` is the aggregate pubkey of the attesting
+    indices, if it is known.
     """
     # Verify indices are sorted and unique
     indices = list(indexed_attestation.attesting_indices)
     if len(indices) == 0 or not indices == sorted(set(indices)):
         return False
     # Verify aggregate signature
-    pubkeys = [epochs_ctx.index2pubkey[i] for i in indices]
+    if aggregate_pubkey is None:
+        pubkeys = [epochs_ctx.get_pubkey(i) for i in indices]
+    else:
+        pubkeys = [aggregate_pubkey]
     domain = get_domain(
         state,
         SignatureDomain.DOMAIN_BEACON_ATTESTER,
@@ -1553,6 +1695,9 @@ def is_valid_indexed_attestation(
         indexed_attestation.data.target.epoch,
     )  # TODO maybe optimize get_domain?
     signing_root = compute_signing_root(indexed_attestation.data, domain)
+    if signature_batch is not None:
+        signature_batch.add(signing_root, indexed_attestation.signature, *pubkeys)
+        return True
     return bls.fast_aggregate_verify(
         signing_root, indexed_attestation.signature, *pubkeys
     )
@@ -1563,6 +1708,7 @@ def process_attestation(
     state: BeaconState,
     attestation: Attestation,
     config: Eth2Config,
+    signature_batch: SignatureBatch = None,
 ) -> BeaconState:
     slot = state.slot
     data = attestation.data
@@ -1628,7 +1774,20 @@ def process_attestation(
 
     # Verify signature
     indexed_attestation = get_indexed_attestation(attestation)
-    if not is_valid_indexed_attestation(epochs_ctx, state, indexed_attestation, config):
+    if indexed_attestation.attesting_indices:
+        aggregate_pubkey = epochs_ctx.get_aggregate_pubkey(
+            data.slot, data.index, attestation.aggregation_bits
+        )
+    else:
+        aggregate_pubkey = None
+    if not is_valid_indexed_attestation(
+        epochs_ctx,
+        state,
+        indexed_attestation,
+        config,
+        signature_batch,
+        aggregate_pubkey,
+    ):
         raise ValidationError(f"Invalid indexed attestation: {indexed_attestation}.")
     return state
 
@@ -1655,7 +1814,8 @@ def process_deposit(
 
     pubkey = deposit.data.pubkey
     amount = deposit.data.amount
-    if pubkey not in epochs_ctx.pubkey2index:
+    index = epochs_ctx.get_validator_index(pubkey)
+    if index is None:
         # Verify the deposit signature (proof of possession) which is not checked by the deposit
         # contract
         deposit_message = DepositMessage.create(
@@ -1692,7 +1852,6 @@ def process_deposit(
         )
     else:
         # Increase balance by deposit amount
-        index = ValidatorIndex(epochs_ctx.pubkey2index[pubkey])
         state = increase_balance(state, index, amount)
     # Now that there is a new validator, update the epoch context with the new pubkey
     epochs_ctx.sync_pubkeys(state)
@@ -1725,20 +1884,29 @@ def process_voluntary_exit(
     )
 
 
+EpochProcessor = Callable[[EpochsContext, BeaconState, Eth2Config], BeaconState]
+
+
 def process_slots(
-    epochs_ctx: EpochsContext, state: BeaconState, slot: Slot, config: Eth2Config
+    epochs_ctx: EpochsContext,
+    state: BeaconState,
+    slot: Slot,
+    config: Eth2Config,
+    epoch_processor: EpochProcessor = None,
 ) -> BeaconState:
     if state.slot >= slot:
         raise ValidationError(
             f"Requested a slot transition at {slot}, behind the current slot {state.slot}"
         )
+    if epoch_processor is None:
+        epoch_processor = process_epoch
 
     while state.slot < slot:
         state = _process_slot(state, config)
         # Process epoch on the start slot of the next epoch
         next_slot = state.slot + 1
         if next_slot % config.SLOTS_PER_EPOCH == 0:
-            state = process_epoch(epochs_ctx, state, config)
+            state = epoch_processor(epochs_ctx, state, config)
             epochs_ctx.rotate_epochs(state.set("slot", next_slot))
 
         state = state.set("slot", next_slot)
@@ -1,6 +1,8 @@
 from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    EpochProcessor,
     EpochsContext,
     process_block,
+    process_epoch,
     process_slots,
 )
 from eth2.beacon.state_machines.forks.serenity.block_validation import (
@@ -11,6 +13,20 @@ from eth2.beacon.types.states import BeaconState
 from eth2.beacon.typing import Slot
 from eth2.configs import Eth2Config
 
+DEFAULT_EPOCH_PROCESSOR: EpochProcessor = process_epoch
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    # The vectorized epoch processing needs numpy, from the eth2-extra dependencies
+    pass
+else:
+    from eth2.beacon.state_machines.forks.medalla.vectorized_epoch import (
+        process_epoch as vectorized_process_epoch,
+    )
+
+    DEFAULT_EPOCH_PROCESSOR = vectorized_process_epoch
+
 
 def apply_fast_state_transition(
     epochs_ctx: EpochsContext,
@@ -19,16 +35,20 @@ def apply_fast_state_transition(
     signed_block: BaseSignedBeaconBlock = None,
     future_slot: Slot = None,
     check_proposer_signature: bool = True,
+    epoch_processor: EpochProcessor = DEFAULT_EPOCH_PROCESSOR,
 ) -> BeaconState:
     """
     Callers should request a transition to some slot past the ``state.slot``.
     This can be done by providing either a ``block`` *or* a ``future_slot``.
     We enforce this invariant with the assertion on ``target_slot``.
+
+    Epoch transitions are done by ``epoch_processor``, which is the NumPy-based
+    ``vectorized_epoch.process_epoch`` if NumPy is installed.
     """
     target_slot = signed_block.message.slot if signed_block else future_slot
     assert target_slot is not None
 
-    state = process_slots(epochs_ctx, state, target_slot, config)
+    state = process_slots(epochs_ctx, state, target_slot, config, epoch_processor)
 
     if signed_block:
         if check_proposer_signature:
@@ -0,0 +1,97 @@
+"""
+An append-only registry of validator public keys, shared by every ``EpochsContext``.
+
+Validator indices are assigned in deposit order, so the public key at a given index is the
+same on every fork. The registry is kept as a single compact bytes array, with a hash index
+from each public key to its validator index, and an ``EpochsContext`` only records how many
+of the entries belong to its state instead of holding its own copy.
+"""
+from typing import Dict, Iterable, Optional
+
+from eth_typing import BLSPubkey
+
+from eth2.beacon.constants import BLS_PUBKEY_SIZE
+from eth2.beacon.typing import ValidatorIndex
+
+# Number of leading bytes of a public key used as its hash in the index.
+_PUBKEY_HASH_SIZE = 8
+
+
+def _hash_pubkey(pubkey: bytes) -> int:
+    # Public keys are compressed curve points: apart from the flag bits of the first byte,
+    # their leading bytes are spread well enough to be used directly.
+    return int.from_bytes(pubkey[:_PUBKEY_HASH_SIZE], "little")
+
+
+class PubkeyRegistry:
+    def __init__(self, pubkeys: bytes = b"") -> None:
+        """
+        ``pubkeys`` is the concatenation of the public keys of the first validators, in
+        validator index order.
+        """
+        if len(pubkeys) % BLS_PUBKEY_SIZE:
+            raise ValueError(
+                f"Length of the pubkeys ({len(pubkeys)}) is not a multiple"
+                f" of {BLS_PUBKEY_SIZE}"
+            )
+        self._pubkeys = bytearray()
+        self._count = 0
+        self._indices: Dict[int, ValidatorIndex] = {}
+        # Public keys that share their hash with a public key of a lower index
+        self._colliding_indices: Dict[BLSPubkey, ValidatorIndex] = {}
+
+        self.extend(
+            BLSPubkey(pubkeys[offset : offset + BLS_PUBKEY_SIZE])
+            for offset in range(0, len(pubkeys), BLS_PUBKEY_SIZE)
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, pubkey: BLSPubkey) -> ValidatorIndex:
+        """
+        Register ``pubkey`` as the public key of the next validator and return its index.
+        """
+        if len(pubkey) != BLS_PUBKEY_SIZE:
+            raise ValueError(
+                f"Invalid public key length, expect {BLS_PUBKEY_SIZE} got {len(pubkey)}"
+            )
+
+        index = ValidatorIndex(self._count)
+        pubkey_hash = _hash_pubkey(pubkey)
+        if pubkey_hash in self._indices:
+            self._colliding_indices.setdefault(pubkey, index)
+        else:
+            self._indices[pubkey_hash] = index
+        self._pubkeys += pubkey
+        self._count += 1
+        return index
+
+    def extend(self, pubkeys: Iterable[BLSPubkey]) -> None:
+        for pubkey in pubkeys:
+            self.append(pubkey)
+
+    def get_pubkey(self, index: ValidatorIndex) -> BLSPubkey:
+        if not 0 <= index < self._count:
+            raise IndexError(f"No public key registered for validator {index}")
+        offset = index * BLS_PUBKEY_SIZE
+        return BLSPubkey(bytes(self._pubkeys[offset : offset + BLS_PUBKEY_SIZE]))
+
+    def get_index(self, pubkey: BLSPubkey) -> Optional[ValidatorIndex]:
+        """
+        Return the lowest validator index registered with ``pubkey``, or ``None``
+        if it is not in the registry.
+        """
+        index = self._indices.get(_hash_pubkey(pubkey))
+        if index is None:
+            return None
+        elif self.get_pubkey(index) == pubkey:
+            return index
+        else:
+            return self._colliding_indices.get(pubkey)
+
+    def get_pubkeys(self, start: int = 0) -> bytes:
+        """
+        Return the concatenated public keys of the validators from index ``start`` on.
+        """
+        return bytes(self._pubkeys[start * BLS_PUBKEY_SIZE :])
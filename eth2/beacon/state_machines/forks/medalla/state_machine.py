@@ -8,6 +8,7 @@ from eth2.beacon.state_machines.forks.medalla.eth2fastspec import EpochsContext
 from eth2.beacon.state_machines.forks.medalla.fast_state_transition import (
     apply_fast_state_transition,
 )
+from eth2.beacon.state_machines.forks.medalla.pubkey_registry import PubkeyRegistry
 from eth2.beacon.state_machines.forks.serenity.state_transitions import (
     apply_state_transition,
 )
@@ -29,6 +30,11 @@ class MedallaStateMachine(BaseBeaconStateMachine):
     state_class: Type[BeaconState] = BeaconState
     fork_choice_class: Type[BaseForkChoice] = LMDGHOSTForkChoice
 
+    def __init__(self, pubkey_registry: PubkeyRegistry = None) -> None:
+        if pubkey_registry is None:
+            pubkey_registry = PubkeyRegistry()
+        self.pubkey_registry = pubkey_registry
+
     def apply_state_transition(
         self,
         state: BeaconState,
@@ -59,7 +65,7 @@ class MedallaStateMachineFast(MedallaStateMachine):
         check_proposer_signature: bool = True,
     ) -> Tuple[BeaconState, BaseSignedBeaconBlock]:
         if not self._epochs_ctx:
-            self._epochs_ctx = EpochsContext(self.config)
+            self._epochs_ctx = EpochsContext(self.config, self.pubkey_registry)
             self._epochs_ctx.load_state(state)
 
         if self._epochs_ctx.current_shuffling.epoch != state.current_epoch(
@@ -0,0 +1,532 @@
+"""
+Epoch processing over NumPy arrays of the validator registry.
+
+``process_epoch`` here is a drop-in replacement for the one in ``eth2fastspec``: the
+validator fields, balances and attester flags are loaded into arrays once, the statuses,
+rewards, penalties, slashings and effective balance updates are computed with array
+operations, and the results are written back into the ``BeaconState`` in one go.
+
+All arithmetic is done on unsigned 64-bit integers, in the same order as the spec, so
+that the resulting state is identical to the one from ``eth2fastspec.process_epoch``.
+"""
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from eth2.beacon.constants import (
+    BASE_REWARDS_PER_EPOCH,
+    FAR_FUTURE_EPOCH,
+    GENESIS_EPOCH,
+)
+from eth2.beacon.epoch_processing_helpers import compute_activation_exit_epoch
+from eth2.beacon.helpers import compute_start_slot_at_epoch, get_block_root_at_slot
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    FLAG_CURR_HEAD_ATTESTER,
+    FLAG_CURR_SOURCE_ATTESTER,
+    FLAG_CURR_TARGET_ATTESTER,
+    FLAG_ELIGIBLE_ATTESTER,
+    FLAG_PREV_HEAD_ATTESTER,
+    FLAG_PREV_SOURCE_ATTESTER,
+    FLAG_PREV_TARGET_ATTESTER,
+    FLAG_UNSLASHED,
+    EpochProcess,
+    EpochsContext,
+    get_churn_limit,
+    integer_squareroot,
+    process_historical_updates,
+    process_justification_and_finalization,
+)
+from eth2.beacon.types.pending_attestations import PendingAttestation
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.types.validators import Validator
+from eth2.beacon.typing import Epoch, Gwei, ValidatorIndex
+from eth2.configs import Eth2Config
+
+# The validator fields that epoch processing reads, in ``Validator`` field order,
+# after the pubkey and withdrawal credentials.
+_VALIDATOR_FIELD_COUNT = 6
+
+_FAR_FUTURE_EPOCH = np.uint64(FAR_FUTURE_EPOCH)
+
+
+def _has_markers(flags: "np.ndarray[Any, Any]", markers: int) -> "np.ndarray[Any, Any]":
+    return flags & markers == markers
+
+
+class ValidatorArrays:
+    """
+    The fields of every validator that epoch processing reads, one array per field.
+    """
+
+    __slots__ = (
+        "effective_balance",
+        "slashed",
+        "activation_eligibility_epoch",
+        "activation_epoch",
+        "exit_epoch",
+        "withdrawable_epoch",
+    )
+
+    def __init__(self, state: BeaconState) -> None:
+        # fast read-only iterate over tree-structured validator set.
+        rows = [tuple(validator)[2:] for validator in state.validators]
+        columns = np.array(rows, dtype=np.uint64).reshape(
+            len(rows), _VALIDATOR_FIELD_COUNT
+        )
+        (
+            self.effective_balance,
+            slashed,
+            self.activation_eligibility_epoch,
+            self.activation_epoch,
+            self.exit_epoch,
+            self.withdrawable_epoch,
+        ) = (np.ascontiguousarray(column) for column in columns.T)
+        self.slashed = slashed.astype(bool)
+
+    def is_active(self, epoch: Epoch) -> "np.ndarray[Any, Any]":
+        return (self.activation_epoch <= epoch) & (epoch < self.exit_epoch)
+
+
+class VectorizedEpochProcess(EpochProcess):
+    """
+    An ``EpochProcess`` that keeps the attester statuses as arrays instead of a list of
+    ``AttesterStatus``, so ``statuses`` stays empty.
+    """
+
+    validators: ValidatorArrays
+    flags: "np.ndarray[Any, Any]"
+    proposer_indices: "np.ndarray[Any, Any]"  # -1 when not included by any proposer
+    inclusion_delays: "np.ndarray[Any, Any]"
+    active: "np.ndarray[Any, Any]"
+
+
+def _process_attestations(
+    epochs_ctx: EpochsContext,
+    process: VectorizedEpochProcess,
+    state: BeaconState,
+    attestations: Tuple[PendingAttestation, ...],
+    epoch: Epoch,
+    source_flag: int,
+    target_flag: int,
+    head_flag: int,
+    config: Eth2Config,
+) -> None:
+    actual_target_block_root = get_block_root_at_slot(
+        state,
+        compute_start_slot_at_epoch(epoch, config.SLOTS_PER_EPOCH),
+        config.SLOTS_PER_HISTORICAL_ROOT,
+    )
+    flags = process.flags
+    proposer_indices = process.proposer_indices
+    inclusion_delays = process.inclusion_delays
+
+    # Many aggregates are included for the same committee
+    committees: Dict[Tuple[int, int], "np.ndarray[Any, Any]"] = {}
+
+    for att in attestations:
+        aggregation_bits, att_data, inclusion_delay, proposer_index = att
+        att_slot, committee_index, att_beacon_block_root, _, att_target = att_data
+
+        try:
+            committee = committees[(att_slot, committee_index)]
+        except KeyError:
+            committee = np.array(
+                epochs_ctx.get_beacon_committee(att_slot, committee_index),
+                dtype=np.int64,
+            )
+            committees[(att_slot, committee_index)] = committee
+
+        att_bits = np.array(aggregation_bits, dtype=bool)[: len(committee)]
+        participants = committee[att_bits]
+
+        if epoch == process.prev_epoch:
+            # If the attestation is the earliest, i.e. has the smallest delay
+            is_earliest = (proposer_indices[participants] == -1) | (
+                inclusion_delays[participants] > inclusion_delay
+            )
+            earliest = participants[is_earliest]
+            proposer_indices[earliest] = proposer_index
+            inclusion_delays[earliest] = inclusion_delay
+
+        att_flags = source_flag
+        # If the attestation is for the boundary:
+        if att_target.root == actual_target_block_root:
+            att_flags |= target_flag
+            # Head votes must be a subset of target votes
+            if att_beacon_block_root == get_block_root_at_slot(
+                state, att_slot, config.SLOTS_PER_HISTORICAL_ROOT
+            ):
+                att_flags |= head_flag
+
+        flags[participants] |= att_flags
+
+
+def _sum_effective_balances(
+    process: VectorizedEpochProcess, mask: "np.ndarray[Any, Any]"
+) -> Gwei:
+    return Gwei(int(process.validators.effective_balance[mask].sum()))
+
+
+def prepare_epoch_process_arrays(
+    epochs_ctx: EpochsContext, state: BeaconState, config: Eth2Config
+) -> VectorizedEpochProcess:
+    out = VectorizedEpochProcess()
+
+    current_epoch = epochs_ctx.current_shuffling.epoch
+    prev_epoch = epochs_ctx.previous_shuffling.epoch
+    out.current_epoch = current_epoch
+    out.prev_epoch = prev_epoch
+
+    v = ValidatorArrays(state)
+    out.validators = v
+    validator_count = len(v.effective_balance)
+
+    slashings_epoch = current_epoch + (config.EPOCHS_PER_SLASHINGS_VECTOR // 2)
+    out.indices_to_slash = np.flatnonzero(
+        v.slashed & (v.withdrawable_epoch == slashings_epoch)
+    ).tolist()
+
+    flags = np.zeros(validator_count, dtype=np.uint8)
+    flags[~v.slashed] |= FLAG_UNSLASHED
+    flags[
+        v.is_active(prev_epoch)
+        | (v.slashed & (np.uint64(prev_epoch + 1) < v.withdrawable_epoch))
+    ] |= FLAG_ELIGIBLE_ATTESTER
+    out.flags = flags
+    out.proposer_indices = np.full(validator_count, -1, dtype=np.int64)
+    out.inclusion_delays = np.zeros(validator_count, dtype=np.uint64)
+
+    out.active = v.is_active(current_epoch)
+    out.active_validators = int(np.count_nonzero(out.active))
+    out.total_active_stake = max(
+        _sum_effective_balances(out, out.active), config.EFFECTIVE_BALANCE_INCREMENT
+    )
+
+    exit_queue_end = compute_activation_exit_epoch(
+        current_epoch, config.MAX_SEED_LOOKAHEAD
+    )
+    exiting = v.exit_epoch[v.exit_epoch != _FAR_FUTURE_EPOCH]
+    if len(exiting):
+        exit_queue_end = max(exit_queue_end, Epoch(int(exiting.max())))
+
+    out.indices_to_set_activation_eligibility = np.flatnonzero(
+        (v.activation_eligibility_epoch == _FAR_FUTURE_EPOCH)
+        & (v.effective_balance == config.MAX_EFFECTIVE_BALANCE)
+    ).tolist()
+
+    # order by the sequence of activation_eligibility_epoch setting and then index
+    maybe_activate = np.flatnonzero(
+        (v.activation_epoch == _FAR_FUTURE_EPOCH)
+        & (v.activation_eligibility_epoch <= current_epoch)
+    )
+    activation_order = np.argsort(
+        v.activation_eligibility_epoch[maybe_activate], kind="stable"
+    )
+    out.indices_to_maybe_activate = maybe_activate[activation_order].tolist()
+
+    out.indices_to_eject = np.flatnonzero(
+        out.active
+        & (v.effective_balance <= config.EJECTION_BALANCE)
+        & (v.exit_epoch == _FAR_FUTURE_EPOCH)
+    ).tolist()
+
+    exit_queue_end_churn = int(np.count_nonzero(v.exit_epoch == exit_queue_end))
+    churn_limit = get_churn_limit(out.active_validators, config)
+    if exit_queue_end_churn >= churn_limit:
+        exit_queue_end = Epoch(exit_queue_end + 1)
+        exit_queue_end_churn = 0
+
+    out.exit_queue_end_churn = exit_queue_end_churn
+    out.exit_queue_end = exit_queue_end
+    out.churn_limit = churn_limit
+
+    # When used in a non-epoch transition on top of genesis state, avoid reaching to a block from
+    # before genesis.
+    if state.slot > 0:
+        _process_attestations(
+            epochs_ctx,
+            out,
+            state,
+            state.previous_epoch_attestations,
+            prev_epoch,
+            FLAG_PREV_SOURCE_ATTESTER,
+            FLAG_PREV_TARGET_ATTESTER,
+            FLAG_PREV_HEAD_ATTESTER,
+            config,
+        )
+    # When used in a non-epoch transition, it may be the absolute start of the epoch,
+    # and the current epoch will not have any attestations (or a target block root to match them
+    # against)
+    if compute_start_slot_at_epoch(current_epoch, config.SLOTS_PER_EPOCH) < state.slot:
+        _process_attestations(
+            epochs_ctx,
+            out,
+            state,
+            state.current_epoch_attestations,
+            current_epoch,
+            FLAG_CURR_SOURCE_ATTESTER,
+            FLAG_CURR_TARGET_ATTESTER,
+            FLAG_CURR_HEAD_ATTESTER,
+            config,
+        )
+
+    prev_source = _has_markers(flags, FLAG_PREV_SOURCE_ATTESTER | FLAG_UNSLASHED)
+    prev_target = prev_source & _has_markers(flags, FLAG_PREV_TARGET_ATTESTER)
+    prev_head = prev_target & _has_markers(flags, FLAG_PREV_HEAD_ATTESTER)
+    curr_target = _has_markers(flags, FLAG_CURR_TARGET_ATTESTER | FLAG_UNSLASHED)
+
+    increment = config.EFFECTIVE_BALANCE_INCREMENT
+    out.prev_epoch_unslashed_stake.source_stake = max(
+        _sum_effective_balances(out, prev_source), increment
+    )
+    out.prev_epoch_unslashed_stake.target_stake = max(
+        _sum_effective_balances(out, prev_target), increment
+    )
+    out.prev_epoch_unslashed_stake.head_stake = max(
+        _sum_effective_balances(out, prev_head), increment
+    )
+    out.curr_epoch_unslashed_target_stake = max(
+        _sum_effective_balances(out, curr_target), increment
+    )
+
+    return out
+
+
+def process_rewards_and_penalties(
+    process: VectorizedEpochProcess,
+    state: BeaconState,
+    balances: "np.ndarray[Any, Any]",
+    config: Eth2Config,
+) -> None:
+    """
+    Apply the attestation rewards and penalties to ``balances``, in place.
+    """
+    if process.current_epoch == GENESIS_EPOCH:
+        return
+
+    flags = process.flags
+    effective_balances = process.validators.effective_balance
+
+    increment = config.EFFECTIVE_BALANCE_INCREMENT
+    total_balance = max(process.total_active_stake, increment)
+
+    # Sqrt first, before factoring out the increment for later usage.
+    balance_sq_root = integer_squareroot(total_balance)
+    finality_delay = process.prev_epoch - state.finalized_checkpoint.epoch
+
+    is_inactivity_leak = finality_delay > config.MIN_EPOCHS_TO_INACTIVITY_PENALTY
+
+    # All summed effective balances are normalized to effective-balance increments, to avoid
+    # overflows.
+    total_balance = Gwei(total_balance // increment)
+
+    base_rewards = (
+        effective_balances
+        * np.uint64(config.BASE_REWARD_FACTOR)
+        // np.uint64(balance_sq_root)
+        // np.uint64(BASE_REWARDS_PER_EPOCH)
+    )
+    proposer_rewards = base_rewards // np.uint64(config.PROPOSER_REWARD_QUOTIENT)
+
+    rewards = np.zeros(len(balances), dtype=np.uint64)
+    penalties = np.zeros(len(balances), dtype=np.uint64)
+
+    # Inclusion speed bonus
+    prev_source = _has_markers(flags, FLAG_PREV_SOURCE_ATTESTER | FLAG_UNSLASHED)
+    np.add.at(
+        rewards, process.proposer_indices[prev_source], proposer_rewards[prev_source]
+    )
+    rewards[prev_source] += (
+        base_rewards[prev_source] - proposer_rewards[prev_source]
+    ) // process.inclusion_delays[prev_source]
+
+    eligible = flags & FLAG_ELIGIBLE_ATTESTER != 0
+    for flag, stake in (
+        (FLAG_PREV_SOURCE_ATTESTER, process.prev_epoch_unslashed_stake.source_stake),
+        (FLAG_PREV_TARGET_ATTESTER, process.prev_epoch_unslashed_stake.target_stake),
+        (FLAG_PREV_HEAD_ATTESTER, process.prev_epoch_unslashed_stake.head_stake),
+    ):
+        attested = _has_markers(flags, flag | FLAG_UNSLASHED)
+        rewarded = eligible & attested
+        penalized = eligible & ~attested
+        if is_inactivity_leak:
+            # Since full base reward will be canceled out by inactivity penalty deltas,
+            # optimal participation receives full base reward compensation here.
+            rewards[rewarded] += base_rewards[rewarded]
+        else:
+            stake_increments = np.uint64(max(stake, increment) // increment)
+            rewards[rewarded] += (
+                base_rewards[rewarded] * stake_increments // np.uint64(total_balance)
+            )
+        penalties[penalized] += base_rewards[penalized]
+
+    # Take away max rewards if we're not finalizing
+    if is_inactivity_leak:
+        penalties[eligible] += (
+            base_rewards[eligible] * np.uint64(BASE_REWARDS_PER_EPOCH)
+            - proposer_rewards[eligible]
+        )
+        not_target = eligible & ~_has_markers(
+            flags, FLAG_PREV_TARGET_ATTESTER | FLAG_UNSLASHED
+        )
+        penalties[not_target] += (
+            effective_balances[not_target]
+            * np.uint64(finality_delay)
+            // np.uint64(config.INACTIVITY_PENALTY_QUOTIENT)
+        )
+
+    # All rewards are applied before any penalty, and a balance that drops below zero
+    # is clamped to zero, same as applying the penalties one by one.
+    balances += rewards
+    balances[:] = np.where(balances > penalties, balances - penalties, 0)
+
+
+def process_registry_updates(
+    epochs_ctx: EpochsContext,
+    process: VectorizedEpochProcess,
+    state: BeaconState,
+    updated_validators: Dict[ValidatorIndex, Validator],
+    config: Eth2Config,
+) -> None:
+    """
+    Collect the validators changed by the registry updates into ``updated_validators``.
+    """
+    exit_end = process.exit_queue_end
+    end_churn = process.exit_queue_end_churn
+    # Process ejections
+    for index in process.indices_to_eject:
+        # Set validator exit epoch and withdrawable epoch
+        validator = updated_validators.get(index, state.validators[index])
+        updated_validators[index] = validator.mset(
+            "exit_epoch",
+            exit_end,
+            "withdrawable_epoch",
+            Epoch(exit_end + config.MIN_VALIDATOR_WITHDRAWABILITY_DELAY),
+        )
+
+        end_churn += 1
+        if end_churn >= process.churn_limit:
+            end_churn = 0
+            exit_end = Epoch(exit_end + 1)
+
+    # Set new activation eligibilities
+    for index in process.indices_to_set_activation_eligibility:
+        validator = updated_validators.get(index, state.validators[index])
+        updated_validators[index] = validator.set(
+            "activation_eligibility_epoch", epochs_ctx.current_shuffling.epoch + 1
+        )
+
+    finality_epoch = state.finalized_checkpoint.epoch
+    activation_eligibility_epochs = process.validators.activation_eligibility_epoch
+    activation_epoch = compute_activation_exit_epoch(
+        process.current_epoch, config.MAX_SEED_LOOKAHEAD
+    )
+    # Dequeue validators for activation up to churn limit
+    for index in process.indices_to_maybe_activate[: process.churn_limit]:
+        # Placement in queue is finalized
+        if activation_eligibility_epochs[index] > finality_epoch:
+            # remaining validators all have an activation_eligibility_epoch that is higher anyway,
+            # break early.
+            break
+        validator = updated_validators.get(index, state.validators[index])
+        updated_validators[index] = validator.set("activation_epoch", activation_epoch)
+
+
+def process_slashings(
+    process: VectorizedEpochProcess,
+    state: BeaconState,
+    balances: "np.ndarray[Any, Any]",
+    config: Eth2Config,
+) -> None:
+    """
+    Apply the penalties of slashed validators to ``balances``, in place.
+    """
+    if not process.indices_to_slash:
+        return
+
+    total_balance = process.total_active_stake
+    slashings_scale = min(sum(state.slashings) * 3, total_balance)
+    indices = np.array(process.indices_to_slash, dtype=np.int64)
+    # Factored out from penalty numerator to avoid int overflow
+    increment = np.uint64(config.EFFECTIVE_BALANCE_INCREMENT)
+    penalty_numerators = (
+        process.validators.effective_balance[indices] // increment
+    ) * np.uint64(slashings_scale)
+    penalties = penalty_numerators // np.uint64(total_balance) * increment
+    balances[indices] = np.where(
+        balances[indices] > penalties, balances[indices] - penalties, 0
+    )
+
+
+def process_effective_balance_updates(
+    process: VectorizedEpochProcess,
+    state: BeaconState,
+    balances: "np.ndarray[Any, Any]",
+    updated_validators: Dict[ValidatorIndex, Validator],
+    config: Eth2Config,
+) -> None:
+    """
+    Collect the validators whose effective balance changes into ``updated_validators``.
+    """
+    hysteresis_increment = (
+        config.EFFECTIVE_BALANCE_INCREMENT // config.HYSTERESIS_QUOTIENT
+    )
+    downward_threshold = np.uint64(
+        hysteresis_increment * config.HYSTERESIS_DOWNWARD_MULTIPLIER
+    )
+    upward_threshold = np.uint64(
+        hysteresis_increment * config.HYSTERESIS_UPWARD_MULTIPLIER
+    )
+
+    effective_balances = process.validators.effective_balance
+    indices = np.flatnonzero(
+        (balances + downward_threshold < effective_balances)
+        | (effective_balances + upward_threshold < balances)
+    )
+    changed_balances = balances[indices]
+    new_effective_balances = np.minimum(
+        changed_balances
+        - changed_balances % np.uint64(config.EFFECTIVE_BALANCE_INCREMENT),
+        np.uint64(config.MAX_EFFECTIVE_BALANCE),
+    )
+    for index, new_effective_balance in zip(
+        indices.tolist(), new_effective_balances.tolist()
+    ):
+        validator = updated_validators.get(index, state.validators[index])
+        updated_validators[index] = validator.set(
+            "effective_balance", new_effective_balance
+        )
+
+
+def process_epoch(
+    epochs_ctx: EpochsContext, state: BeaconState, config: Eth2Config
+) -> BeaconState:
+    process = prepare_epoch_process_arrays(epochs_ctx, state, config)
+    state = process_justification_and_finalization(epochs_ctx, process, state, config)
+
+    balances = np.fromiter(state.balances, dtype=np.uint64, count=len(state.balances))
+    updated_validators: Dict[ValidatorIndex, Validator] = {}
+
+    process_rewards_and_penalties(process, state, balances, config)
+    process_registry_updates(epochs_ctx, process, state, updated_validators, config)
+    process_slashings(process, state, balances, config)
+    process_effective_balance_updates(
+        process, state, balances, updated_validators, config
+    )
+
+    # Important: do not change state one balance at a time.
+    # Set them all at once, constructing the tree in one go.
+    state = state.set("balances", balances.tolist())
+    if updated_validators:
+        state = state.set(
+            "validators",
+            state.validators.mset(
+                *(
+                    item
+                    for index_and_validator in sorted(updated_validators.items())
+                    for item in index_and_validator
+                )
+            ),
+        )
+
+    return process_historical_updates(epochs_ctx, process, state, config)
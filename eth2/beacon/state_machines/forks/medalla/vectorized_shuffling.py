@@ -0,0 +1,69 @@
+"""
+The swap-or-not shuffle of ``eth2fastspec``, over a NumPy array.
+
+Instead of swapping the pairs of a round one by one, each round computes the bit of every
+position from the round hashes, and permutes the whole list at once.
+"""
+from typing import Any, List
+
+import numpy as np
+from typing_extensions import Literal
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.typing import ValidatorIndex
+from eth2.configs import Eth2Config
+
+ENDIANNESS: Literal["little"] = "little"
+
+# Every hash of a round provides the bits of 256 positions.
+_POSITIONS_PER_HASH = 256
+
+
+def _compute_round_bits(seed: bytes, list_size: int) -> "np.ndarray[Any, Any]":
+    """
+    Return the bit of each position in a round, where ``seed`` is the shuffling seed
+    followed by the round number.
+    """
+    hash_count = (list_size + _POSITIONS_PER_HASH - 1) // _POSITIONS_PER_HASH
+    source = b"".join(
+        hash_eth2(seed + position_window.to_bytes(4, byteorder=ENDIANNESS))
+        for position_window in range(hash_count)
+    )
+    return np.unpackbits(np.frombuffer(source, dtype=np.uint8), bitorder="little")
+
+
+def inner_shuffle_list(
+    input: List[ValidatorIndex], seed: bytes, dir: bool, config: Eth2Config
+) -> None:
+    """
+    Shuffle ``input`` in place if ``dir`` is true, or unshuffle it otherwise, exactly
+    like ``eth2fastspec._inner_shuffle_list``.
+    """
+    list_size = len(input)
+    if list_size <= 1:
+        # nothing to (un)shuffle
+        return
+
+    values = np.array(input, dtype=np.uint64)
+    positions = np.arange(list_size, dtype=np.int64)
+
+    if dir:
+        rounds = range(config.SHUFFLE_ROUND_COUNT)
+    else:
+        # Iterating through the rounds in reverse, un-swaps everything, effectively
+        # un-shuffling the list.
+        rounds = range(config.SHUFFLE_ROUND_COUNT - 1, -1, -1)
+
+    for round in rounds:
+        round_seed = bytes(seed) + round.to_bytes(1, byteorder=ENDIANNESS)
+        pivot = (
+            int.from_bytes(hash_eth2(round_seed)[:8], byteorder=ENDIANNESS) % list_size
+        )
+        # The position pairs are mirrored around the pivot, and each pair is swapped
+        # according to the bit of its higher position.
+        flips = (pivot - positions) % list_size
+        bits = _compute_round_bits(round_seed, list_size)
+        swapped = bits[np.maximum(positions, flips)].astype(bool)
+        values = values[np.where(swapped, flips, positions)]
+
+    input[:] = values.tolist()
@@ -3,7 +3,7 @@ from typing import Sequence
 from eth_typing import BLSSignature
 from eth_utils import ValidationError
 
-from eth2._utils.bls import bls
+from eth2._utils.bls import SignatureBatch, bls
 from eth2._utils.hash import hash_eth2
 from eth2.beacon.attestation_helpers import (
     validate_indexed_attestation_aggregate_signature,
@@ -136,9 +136,11 @@ def validate_aggregate_and_proof(
             " is not a selected aggregator"
         )
 
-    validate_aggregator_proof(state, aggregate_and_proof, config)
-
-    validate_attestation_signature(state, attestation, config)
+    # Both signatures are validated with a single check
+    signature_batch = SignatureBatch()
+    validate_aggregator_proof(state, aggregate_and_proof, config, signature_batch)
+    validate_attestation_signature(state, attestation, config, signature_batch)
+    signature_batch.validate()
 
 
 def validate_attestation_propagation_slot_range(
@@ -159,7 +161,10 @@ def validate_attestation_propagation_slot_range(
 
 
 def validate_aggregator_proof(
-    state: BeaconState, aggregate_and_proof: AggregateAndProof, config: Eth2Config
+    state: BeaconState,
+    aggregate_and_proof: AggregateAndProof,
+    config: Eth2Config,
+    signature_batch: SignatureBatch = None,
 ) -> None:
     slot = aggregate_and_proof.aggregate.data.slot
     pubkey = state.validators[aggregate_and_proof.aggregator_index].pubkey
@@ -171,13 +176,19 @@ def validate_aggregator_proof(
     )
     signing_root = compute_signing_root(SerializableUint64(slot), domain)
 
-    bls.validate(signing_root, aggregate_and_proof.selection_proof, pubkey)
+    if signature_batch is None:
+        bls.validate(signing_root, aggregate_and_proof.selection_proof, pubkey)
+    else:
+        signature_batch.add(signing_root, aggregate_and_proof.selection_proof, pubkey)
 
 
 def validate_attestation_signature(
-    state: BeaconState, attestation: Attestation, config: Eth2Config
+    state: BeaconState,
+    attestation: Attestation,
+    config: Eth2Config,
+    signature_batch: SignatureBatch = None,
 ) -> None:
     indexed_attestation = get_indexed_attestation(state, attestation, config)
     validate_indexed_attestation_aggregate_signature(
-        state, indexed_attestation, config.SLOTS_PER_EPOCH
+        state, indexed_attestation, config.SLOTS_PER_EPOCH, signature_batch
     )
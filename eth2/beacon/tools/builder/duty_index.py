@@ -0,0 +1,150 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from eth_typing import Hash32
+from eth_utils import ValidationError
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.exceptions import NoCommitteeAssignment
+from eth2.beacon.helpers import (
+    compute_start_slot_at_epoch,
+    get_seed,
+    signature_domain_to_domain_type,
+)
+from eth2.beacon.signature_domain import SignatureDomain
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    ShufflingEpoch,
+    compute_proposer_index,
+)
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.typing import CommitteeIndex, Epoch, Slot, ValidatorIndex
+from eth2.configs import Eth2Config
+
+DutyAssignment = NamedTuple(
+    "DutyAssignment",
+    (
+        ("slot", Slot),
+        ("committee_index", CommitteeIndex),
+        ("committee_position", int),
+        ("committee_size", int),
+        ("proposer_slots", Tuple[Slot, ...]),
+    ),
+)
+
+# Identifies the shuffling (and proposers) that a ``DutyIndex`` was built from.
+ShufflingKey = Tuple[Epoch, Hash32, Optional[Hash32]]
+
+
+def compute_shuffling_key(
+    state: BeaconState, epoch: Epoch, config: Eth2Config
+) -> ShufflingKey:
+    """
+    Return the key of the shuffling of ``epoch``, as seen from ``state``.
+
+    The committees of an epoch are fixed by the attester seed, because the set of
+    active validators can't change for an epoch after the seed is known. The proposers
+    also depend on effective balances, which only change at epoch boundaries, so they
+    are only included for the current epoch of ``state``.
+    """
+    attester_seed = get_seed(
+        state,
+        epoch,
+        signature_domain_to_domain_type(SignatureDomain.DOMAIN_BEACON_ATTESTER),
+        config,
+    )
+    if epoch == state.current_epoch(config.SLOTS_PER_EPOCH):
+        proposer_seed = get_seed(
+            state,
+            epoch,
+            signature_domain_to_domain_type(SignatureDomain.DOMAIN_BEACON_PROPOSER),
+            config,
+        )
+    else:
+        proposer_seed = None
+    return (epoch, attester_seed, proposer_seed)
+
+
+def _compute_proposers(
+    state: BeaconState,
+    shuffling: ShufflingEpoch,
+    proposer_seed: Hash32,
+    config: Eth2Config,
+) -> Iterable[Tuple[Slot, ValidatorIndex]]:
+    start_slot = compute_start_slot_at_epoch(shuffling.epoch, config.SLOTS_PER_EPOCH)
+    for slot in range(start_slot, start_slot + config.SLOTS_PER_EPOCH):
+        seed = hash_eth2(proposer_seed + slot.to_bytes(length=8, byteorder="little"))
+        yield (
+            Slot(slot),
+            compute_proposer_index(state, shuffling.active_indices, seed, config),
+        )
+
+
+class DutyIndex:
+    """
+    The attestation duties, and block proposals if known, of every validator in one
+    epoch. It is built once from the committee shuffling of the epoch, so that the
+    duties of each validator can be looked up in constant time.
+    """
+
+    def __init__(
+        self,
+        shuffling_key: ShufflingKey,
+        assignments: Dict[ValidatorIndex, DutyAssignment],
+    ) -> None:
+        self.shuffling_key = shuffling_key
+        self._assignments = assignments
+
+    @property
+    def epoch(self) -> Epoch:
+        return self.shuffling_key[0]
+
+    @classmethod
+    def from_state(
+        cls, state: BeaconState, epoch: Epoch, config: Eth2Config
+    ) -> "DutyIndex":
+        next_epoch = state.next_epoch(config.SLOTS_PER_EPOCH)
+        if epoch > next_epoch:
+            raise ValidationError(
+                f"Epoch for duty index ({epoch}) must not be after next epoch "
+                f"{next_epoch}."
+            )
+
+        shuffling_key = compute_shuffling_key(state, epoch, config)
+        _, _, proposer_seed = shuffling_key
+
+        indices_bounded = [
+            (ValidatorIndex(index), validator.activation_epoch, validator.exit_epoch)
+            for index, validator in enumerate(state.validators)
+        ]
+        shuffling = ShufflingEpoch(state, indices_bounded, epoch, config)
+
+        proposer_slots: Dict[ValidatorIndex, List[Slot]] = {}
+        if proposer_seed is not None:
+            for slot, proposer_index in _compute_proposers(
+                state, shuffling, proposer_seed, config
+            ):
+                proposer_slots.setdefault(proposer_index, []).append(slot)
+
+        start_slot = compute_start_slot_at_epoch(epoch, config.SLOTS_PER_EPOCH)
+        assignments: Dict[ValidatorIndex, DutyAssignment] = {}
+        for slot_offset, slot_committees in enumerate(shuffling.committees):
+            slot = Slot(start_slot + slot_offset)
+            for committee_index, committee in enumerate(slot_committees):
+                for position, validator_index in enumerate(committee):
+                    assignments[validator_index] = DutyAssignment(
+                        slot,
+                        CommitteeIndex(committee_index),
+                        position,
+                        len(committee),
+                        tuple(proposer_slots.get(validator_index, ())),
+                    )
+        return cls(shuffling_key, assignments)
+
+    def get_assignment(self, validator_index: ValidatorIndex) -> DutyAssignment:
+        """
+        Return the ``DutyAssignment`` of ``validator_index``, raising
+        ``NoCommitteeAssignment`` if the validator is not active in the epoch.
+        """
+        try:
+            return self._assignments[validator_index]
+        except KeyError:
+            raise NoCommitteeAssignment
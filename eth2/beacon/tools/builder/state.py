@@ -1,11 +1,33 @@
-from typing import Sequence
+import random
+from typing import List, Sequence
 
-from eth2.beacon.constants import GENESIS_EPOCH
+from eth.constants import ZERO_HASH32
+from eth_typing import BLSPubkey, Hash32
+
+from eth2.beacon.constants import FAR_FUTURE_EPOCH, GENESIS_EPOCH
 from eth2.beacon.genesis import initialize_beacon_state_from_eth1
+from eth2.beacon.helpers import (
+    compute_start_slot_at_epoch,
+    get_block_root,
+    get_block_root_at_slot,
+)
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import EpochsContext
+from eth2.beacon.types.attestation_data import AttestationData
+from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.beacon.types.eth1_data import Eth1Data
+from eth2.beacon.types.pending_attestations import PendingAttestation
 from eth2.beacon.types.states import BeaconState
 from eth2.beacon.types.validators import Validator
-from eth2.beacon.typing import Epoch, Gwei, Timestamp
+from eth2.beacon.typing import (
+    Bitfield,
+    CommitteeIndex,
+    Epoch,
+    Gwei,
+    Root,
+    Slot,
+    Timestamp,
+    ValidatorIndex,
+)
 from eth2.configs import Eth2Config
 
 
@@ -83,3 +105,195 @@ def create_mock_genesis_state_from_validators(
     )
 
     return state_with_validators
+
+
+def _mk_random_validator(
+    rng: random.Random, index: int, epoch: Epoch, config: Eth2Config
+) -> Validator:
+    validator = Validator.create(
+        pubkey=BLSPubkey(index.to_bytes(48, "little")),
+        withdrawal_credentials=ZERO_HASH32,
+        effective_balance=Gwei(
+            config.MAX_EFFECTIVE_BALANCE
+            - rng.choice((0, 0, 0, 1, 2)) * config.EFFECTIVE_BALANCE_INCREMENT
+        ),
+        slashed=False,
+        activation_eligibility_epoch=GENESIS_EPOCH,
+        activation_epoch=GENESIS_EPOCH,
+        exit_epoch=FAR_FUTURE_EPOCH,
+        withdrawable_epoch=FAR_FUTURE_EPOCH,
+    )
+    kind = rng.random()
+    if kind < 0.02:
+        # Slashed, with some of them penalized in this epoch
+        exit_epoch = epoch + rng.randint(1, 4)
+        slashings_epoch = epoch + config.EPOCHS_PER_SLASHINGS_VECTOR // 2
+        return validator.mset(
+            "slashed",
+            True,
+            "exit_epoch",
+            exit_epoch,
+            "withdrawable_epoch",
+            slashings_epoch + rng.choice((0, 1)),
+        )
+    elif kind < 0.03:
+        exit_epoch = epoch + rng.randint(1, 5)
+        return validator.mset(
+            "exit_epoch",
+            exit_epoch,
+            "withdrawable_epoch",
+            exit_epoch + config.MIN_VALIDATOR_WITHDRAWABILITY_DELAY,
+        )
+    elif kind < 0.04:
+        # Waiting for activation, with or without eligibility
+        return validator.mset(
+            "effective_balance",
+            config.MAX_EFFECTIVE_BALANCE,
+            "activation_eligibility_epoch",
+            rng.choice((FAR_FUTURE_EPOCH, rng.randint(GENESIS_EPOCH, epoch))),
+            "activation_epoch",
+            FAR_FUTURE_EPOCH,
+        )
+    elif kind < 0.05:
+        return validator.set("effective_balance", config.EJECTION_BALANCE)
+    else:
+        return validator
+
+
+def _mk_random_root(rng: random.Random) -> Root:
+    return Root(Hash32(rng.getrandbits(256).to_bytes(32, "little")))
+
+
+def _mk_random_balance(
+    rng: random.Random, validator: Validator, config: Eth2Config
+) -> Gwei:
+    increment = config.EFFECTIVE_BALANCE_INCREMENT
+    if rng.random() < 0.05:
+        # Far enough from the effective balance to update it
+        offset = rng.randint(-increment, increment * 2)
+    else:
+        offset = rng.randint(-increment // 8, increment // 8)
+    return Gwei(max(0, validator.effective_balance + offset))
+
+
+def _mk_random_pending_attestations(
+    rng: random.Random,
+    state: BeaconState,
+    epochs_ctx: EpochsContext,
+    epoch: Epoch,
+    config: Eth2Config,
+) -> List[PendingAttestation]:
+    target_root = get_block_root(
+        state, epoch, config.SLOTS_PER_EPOCH, config.SLOTS_PER_HISTORICAL_ROOT
+    )
+    max_attestations = config.MAX_ATTESTATIONS * config.SLOTS_PER_EPOCH
+    start_slot = compute_start_slot_at_epoch(epoch, config.SLOTS_PER_EPOCH)
+    attestations: List[PendingAttestation] = []
+    for slot in range(start_slot, min(start_slot + config.SLOTS_PER_EPOCH, state.slot)):
+        for committee_index in range(
+            epochs_ctx.get_committee_count_at_slot(Slot(slot))
+        ):
+            committee = epochs_ctx.get_beacon_committee(
+                Slot(slot), CommitteeIndex(committee_index)
+            )
+            for _ in range(rng.choice((1, 1, 2))):
+                if len(attestations) == max_attestations:
+                    return attestations
+                if rng.random() < 0.8:
+                    head_root = get_block_root_at_slot(
+                        state, Slot(slot), config.SLOTS_PER_HISTORICAL_ROOT
+                    )
+                else:
+                    head_root = _mk_random_root(rng)
+                data = AttestationData.create(
+                    slot=Slot(slot),
+                    index=CommitteeIndex(committee_index),
+                    beacon_block_root=head_root,
+                    target=Checkpoint.create(
+                        epoch=epoch,
+                        root=target_root
+                        if rng.random() < 0.9
+                        else _mk_random_root(rng),
+                    ),
+                )
+                attestations.append(
+                    PendingAttestation.create(
+                        aggregation_bits=Bitfield(
+                            tuple(rng.random() < 0.9 for _ in committee)
+                        ),
+                        data=data,
+                        inclusion_delay=rng.randint(
+                            config.MIN_ATTESTATION_INCLUSION_DELAY,
+                            config.SLOTS_PER_EPOCH,
+                        ),
+                        proposer_index=ValidatorIndex(
+                            rng.randrange(len(state.validators))
+                        ),
+                    )
+                )
+    return attestations
+
+
+def create_mock_epoch_transition_state(
+    state: BeaconState,
+    validator_count: int,
+    epoch: Epoch,
+    finalized_epoch: Epoch,
+    config: Eth2Config,
+    seed: int = 0,
+) -> BeaconState:
+    """
+    Return ``state`` with ``validator_count`` validators, on the last slot of ``epoch``,
+    with random block roots, balances, slashings, exits, activations and pending
+    attestations, so that every part of epoch processing has some work to do.
+
+    The validators have fake pubkeys, and the attestations are not signed.
+    """
+    rng = random.Random(seed)
+
+    validators = tuple(
+        _mk_random_validator(rng, index, epoch, config)
+        for index in range(validator_count)
+    )
+    balances = tuple(
+        _mk_random_balance(rng, validator, config) for validator in validators
+    )
+    state = state.mset(
+        "slot",
+        compute_start_slot_at_epoch(Epoch(epoch + 1), config.SLOTS_PER_EPOCH) - 1,
+        "validators",
+        validators,
+        "balances",
+        balances,
+        "block_roots",
+        tuple(_mk_random_root(rng) for _ in range(config.SLOTS_PER_HISTORICAL_ROOT)),
+        "slashings",
+        tuple(
+            rng.choice((0, 0, 0, config.MAX_EFFECTIVE_BALANCE))
+            for _ in range(config.EPOCHS_PER_SLASHINGS_VECTOR)
+        ),
+        "justification_bits",
+        tuple(rng.random() < 0.5 for _ in range(len(state.justification_bits))),
+        "previous_justified_checkpoint",
+        Checkpoint.create(epoch=finalized_epoch),
+        "current_justified_checkpoint",
+        Checkpoint.create(epoch=Epoch(max(finalized_epoch, epoch - 1))),
+        "finalized_checkpoint",
+        Checkpoint.create(epoch=finalized_epoch),
+    )
+
+    epochs_ctx = EpochsContext(config)
+    epochs_ctx.load_state(state)
+    previous_epoch_attestations = (
+        _mk_random_pending_attestations(
+            rng, state, epochs_ctx, Epoch(epoch - 1), config
+        )
+        if epoch > GENESIS_EPOCH
+        else ()
+    )
+    return state.mset(
+        "previous_epoch_attestations",
+        previous_epoch_attestations,
+        "current_epoch_attestations",
+        _mk_random_pending_attestations(rng, state, epochs_ctx, epoch, config),
+    )
@@ -1,12 +1,12 @@
 import logging
 import random
 from types import TracebackType
-from typing import Any, Callable, Collection, Dict, Optional, Set, Tuple, Type
+from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple, Type
 
 from asks import Session
 from eth_typing import BLSPubkey, BLSSignature
 from eth_utils import ValidationError, decode_hex, encode_hex
-from eth_utils.toolz import mapcat
+from eth_utils.toolz import mapcat, partition_all
 import ssz
 from ssz.tools.dump import to_formatted_dict
 from ssz.tools.parse import from_formatted_dict
@@ -37,6 +37,10 @@ from eth2.validator_client.duty import (
 
 SYNCING_POLL_INTERVAL = 10  # seconds
 CONNECTION_RETRY_INTERVAL = 1  # second(s)
+# Number of pooled connections to the beacon node
+MAX_CONNECTIONS = 8
+# Number of validator public keys in each request for duties
+DUTIES_REQUEST_CHUNK_SIZE = 128
 
 logger = logging.getLogger("eth2.validator_client.beacon_node")
 
@@ -243,7 +247,7 @@ class BeaconNode(BeaconNodeAPI):
         self._beacon_node_endpoint = _normalize_url(beacon_node_endpoint)
         self._seconds_per_slot = seconds_per_slot
         self._ticks_per_slot = TICKS_PER_SLOT
-        self._session = Session()
+        self._session = Session(connections=MAX_CONNECTIONS)
         self._connection_lock = trio.Lock()
         self._is_connected = False
         self.client_version: Optional[str] = None
@@ -343,25 +347,50 @@ class BeaconNode(BeaconNodeAPI):
             return ()
 
         url = self._url_for(BeaconNodePath.validator_duties)
-        duties_data = await _get_duties_from_beacon_node(
-            self._session, url, public_keys, target_epoch
-        )
-        return tuple(
-            filter(
-                _is_current_duty,
-                mapcat(
-                    lambda data: _parse_duties(
-                        data,
-                        current_tick,
-                        target_epoch,
-                        self._genesis_time,
-                        self._seconds_per_slot,
-                        self._ticks_per_slot,
-                    ),
-                    duties_data,
-                ),
+        # NOTE: split the public keys in chunks requested concurrently over
+        # the pooled connections, rather than in one request for every key.
+        duties: List[Duty] = []
+        failed_chunks: List[Collection[BLSPubkey]] = []
+
+        async def _fetch_duties(public_keys: Collection[BLSPubkey]) -> None:
+            try:
+                duties_data = await _get_duties_from_beacon_node(
+                    self._session, url, public_keys, target_epoch
+                )
+                chunk_duties = tuple(
+                    mapcat(
+                        lambda data: _parse_duties(
+                            data,
+                            current_tick,
+                            target_epoch,
+                            self._genesis_time,
+                            self._seconds_per_slot,
+                            self._ticks_per_slot,
+                        ),
+                        duties_data,
+                    )
+                )
+            except (OSError, KeyError, TypeError, ValueError) as e:
+                # NOTE: a missing or malformed response fails the chunk like an unreachable node
+                self.logger.debug("could not fetch a chunk of duties: %s", e)
+                failed_chunks.append(public_keys)
+            else:
+                duties.extend(chunk_duties)
+
+        chunks = tuple(partition_all(DUTIES_REQUEST_CHUNK_SIZE, public_keys))
+        async with trio.open_nursery() as nursery:
+            for chunk in chunks:
+                nursery.start_soon(_fetch_duties, chunk)
+
+        if failed_chunks:
+            # NOTE: fail the whole fetch, so the epoch is not taken as fetched
+            # without the duties of these validators
+            raise OSError(
+                f"could not fetch the duties of {len(failed_chunks)} of"
+                f" {len(chunks)} chunks of validators for epoch {target_epoch}"
             )
-        )
+
+        return tuple(filter(_is_current_duty, duties))
 
     async def fetch_attestation(
         self, public_key: BLSPubkey, slot: Slot, committee_index: CommitteeIndex
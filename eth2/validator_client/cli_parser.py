@@ -3,12 +3,15 @@ import logging
 
 import argcomplete
 from async_service.trio import background_trio_service
+from eth.db.backends.level import LevelDB
 
 from eth2.clock import Clock
 from eth2.validator_client.beacon_node import BeaconNode
 from eth2.validator_client.client import Client
 from eth2.validator_client.config import Config
 from eth2.validator_client.key_store import KeyStore
+from eth2.validator_client.signatory_db import PersistentSignatoryDB
+from eth2.validator_client.tools.directory import create_dir_if_missing
 from eth2.validator_client.tools.password_providers import terminal_password_provider
 from trinity._utils.trio_utils import wait_for_interrupts
 from trinity.cli_parser import parser, subparser
@@ -17,6 +20,18 @@ IMPORT_PARSER_HELP_MSG = (
     "import a validator private key to the keystore discovered from the configuration"
 )
 IMPORT_PARSER_KEY_ARGUMENT_HELP_MSG = "private key, encoded as big-endian hex"
+IMPORT_SLASHING_PROTECTION_PARSER_HELP_MSG = (
+    "import the signing history of validators to the slashing protection database"
+)
+EXPORT_SLASHING_PROTECTION_PARSER_HELP_MSG = (
+    "export the signing history of validators from the slashing protection database"
+)
+INTERCHANGE_FILE_ARGUMENT_HELP_MSG = "path to the slashing protection interchange file"
+
+
+def _open_signatory_db(config: Config) -> PersistentSignatoryDB:
+    create_dir_if_missing(config.signatory_db_dir)
+    return PersistentSignatoryDB(LevelDB(config.signatory_db_dir))
 
 
 async def _main(
@@ -30,10 +45,11 @@ async def _main(
         config.seconds_per_epoch,
     )
     beacon_node = BeaconNode.from_config(config)
+    signature_db = _open_signatory_db(config)
 
     # with key_store.persistence():
     async with beacon_node:
-        client = Client(key_store, clock, beacon_node)
+        client = Client(key_store, clock, beacon_node, signature_db=signature_db)
         async with background_trio_service(client):
             await wait_for_interrupts()
             logger.info("received interrupt; shutting down...")
@@ -54,6 +70,30 @@ async def _import_key(
         logger.exception("error importing key")
 
 
+async def _import_slashing_protection(
+    logger: logging.Logger, config: Config, arguments: argparse.Namespace
+) -> None:
+    logger.info("importing slashing protection data...")
+    signature_db = _open_signatory_db(config)
+    try:
+        with open(arguments.interchange_file) as interchange_file:
+            signature_db.import_interchange(interchange_file)
+    except Exception:
+        logger.exception("error importing slashing protection data")
+
+
+async def _export_slashing_protection(
+    logger: logging.Logger, config: Config, arguments: argparse.Namespace
+) -> None:
+    logger.info("exporting slashing protection data...")
+    signature_db = _open_signatory_db(config)
+    try:
+        with open(arguments.interchange_file, "w") as interchange_file:
+            signature_db.export_interchange(interchange_file)
+    except Exception:
+        logger.exception("error exporting slashing protection data")
+
+
 def parse_cli_args() -> argparse.ArgumentParser:
     parser.set_defaults(func=_main)
 
@@ -63,5 +103,21 @@ def parse_cli_args() -> argparse.ArgumentParser:
     )
     import_key_parser.set_defaults(func=_import_key)
 
+    import_slashing_protection_parser = subparser.add_parser(
+        "import-slashing-protection", help=IMPORT_SLASHING_PROTECTION_PARSER_HELP_MSG
+    )
+    import_slashing_protection_parser.add_argument(
+        "interchange_file", type=str, help=INTERCHANGE_FILE_ARGUMENT_HELP_MSG
+    )
+    import_slashing_protection_parser.set_defaults(func=_import_slashing_protection)
+
+    export_slashing_protection_parser = subparser.add_parser(
+        "export-slashing-protection", help=EXPORT_SLASHING_PROTECTION_PARSER_HELP_MSG
+    )
+    export_slashing_protection_parser.add_argument(
+        "interchange_file", type=str, help=INTERCHANGE_FILE_ARGUMENT_HELP_MSG
+    )
+    export_slashing_protection_parser.set_defaults(func=_export_slashing_protection)
+
     argcomplete.autocomplete(parser)
     return parser
@@ -1,21 +1,26 @@
 import logging
-from typing import AsyncIterable, Collection
+from typing import AsyncIterable, Collection, List, Optional
 
 from async_service.base import Service
 from eth_typing import BLSPubkey
 import trio
+from trio import MemoryReceiveChannel
 from trio.abc import ReceiveChannel, SendChannel
 
 from eth2.clock import Tick
 from eth2.validator_client.abc import BeaconNodeAPI, KeyStoreAPI, SignatoryDatabaseAPI
 from eth2.validator_client.duty import Duty
 from eth2.validator_client.duty_scheduler import (
+    DutyPrefetcher,
     resolve_duty,
     schedule_and_dispatch_duties_at_tick,
 )
 from eth2.validator_client.duty_store import DutyStore
 from eth2.validator_client.randao import mk_randao_provider
-from eth2.validator_client.signatory import sign_and_broadcast_operation_if_valid
+from eth2.validator_client.signatory import (
+    SigningPool,
+    sign_and_broadcast_operations_if_valid,
+)
 from eth2.validator_client.signatory_db import InMemorySignatoryDB
 from eth2.validator_client.typing import (
     PrivateKeyProvider,
@@ -47,13 +52,20 @@ class Client(Service):
         key_store: KeyStoreAPI,
         clock: AsyncIterable[Tick],
         beacon_node: BeaconNodeAPI,
+        signing_pool: Optional[SigningPool] = None,
+        signature_db: Optional[SignatoryDatabaseAPI] = None,
     ) -> None:
         self._key_store = key_store
         self._clock = clock
         self._beacon_node = beacon_node
 
         self._duty_store = DutyStore()
-        self._signature_db = InMemorySignatoryDB()
+        if signature_db is None:
+            signature_db = InMemorySignatoryDB()
+        self._signature_db = signature_db
+        if signing_pool is None:
+            signing_pool = SigningPool()
+        self._signing_pool = signing_pool
 
     async def _run_client(self) -> None:
         # NOTE: all duties dispatched from the scheduler are expected to be
@@ -94,9 +106,13 @@ class Client(Service):
             self._signature_db,
             self._beacon_node,
             self._key_store.private_key_for,
+            self._signing_pool,
         )
 
-        await self.manager.wait_finished()
+        try:
+            await self.manager.wait_finished()
+        finally:
+            self._signing_pool.shutdown()
 
     async def _verify_client_state_at_boot(self) -> None:
         """
@@ -126,17 +142,17 @@ class Client(Service):
         """
         ``duty_scheduler`` manages the set of duties for the validator public keys in the key store.
 
-        This task involves polling the beacon node periodically to get the latest set of assignments
-        based on the beacon chain state. Duties are dispatched to consumers of the ``duty_channel``
-        at the appropriate point in time.
+        This task involves polling the beacon node once per epoch to get the assignments of the
+        next epoch based on the beacon chain state. Duties are dispatched to consumers of the
+        ``duty_channel`` at the appropriate point in time.
         """
+        duty_prefetcher = DutyPrefetcher(beacon_node, validator_public_keys, duty_store)
         async with duty_dispatcher:
             async for tick in clock:
                 self.manager.run_task(
                     schedule_and_dispatch_duties_at_tick,
                     tick,
-                    beacon_node,
-                    validator_public_keys,
+                    duty_prefetcher,
                     duty_store,
                     duty_dispatcher,
                 )
@@ -156,18 +172,27 @@ class Client(Service):
 
     async def signatory(
         self,
-        duty_provider: ReceiveChannel[ResolvedDuty],
+        duty_provider: "MemoryReceiveChannel[ResolvedDuty]",
         signature_store: SignatoryDatabaseAPI,
         beacon_node: BeaconNodeAPI,
         private_key_provider: PrivateKeyProvider,
+        signing_pool: SigningPool,
     ) -> None:
         async with duty_provider:
-            async for duty, operation in duty_provider:
+            async for resolved_duty in duty_provider:
+                # NOTE: sign every duty resolved so far together, so the signing pool
+                # can order them by deadline.
+                resolved_duties: List[ResolvedDuty] = [resolved_duty]
+                while True:
+                    try:
+                        resolved_duties.append(duty_provider.receive_nowait())
+                    except trio.WouldBlock:
+                        break
                 self.manager.run_task(
-                    sign_and_broadcast_operation_if_valid,
-                    duty,
-                    operation,
+                    sign_and_broadcast_operations_if_valid,
+                    resolved_duties,
                     signature_store,
                     beacon_node,
                     private_key_provider,
+                    signing_pool,
                 )
@@ -46,3 +46,7 @@ class Config:
     @cached_property
     def key_store_dir(self) -> Path:
         return self._root_data_dir / self.key_store_dir_suffix
+
+    @cached_property
+    def signatory_db_dir(self) -> Path:
+        return self._root_data_dir / self.signatory_db_handle
@@ -1,7 +1,8 @@
 import logging
-from typing import Collection, Tuple, cast
+from typing import Collection, Dict, Tuple, cast
 
 from eth_typing import BLSPubkey
+import trio
 from trio.abc import SendChannel
 
 from eth2.beacon.typing import Epoch
@@ -45,10 +46,7 @@ async def resolve_duty(
 
 
 async def _dispatch_duties_for(
-    tick: Tick,
-    duty_store: DutyStore,
-    beacon_node: BeaconNodeAPI,
-    duty_dispatcher: SendChannel[Duty],
+    tick: Tick, duty_store: DutyStore, duty_dispatcher: SendChannel[Duty]
 ) -> None:
     duties = await duty_store.duties_at_tick(tick)
     if not duties:
@@ -60,40 +58,89 @@ async def _dispatch_duties_for(
         await duty_dispatcher.send(duty)
 
 
-async def _fetch_latest_duties(
-    tick: Tick,
-    beacon_node: BeaconNodeAPI,
-    validator_public_keys: Collection[BLSPubkey],
-    duty_store: DutyStore,
-) -> None:
-    current_epoch = tick.epoch
-    next_epoch = Epoch(current_epoch + 1)
-
-    current_duties = await beacon_node.fetch_duties(
-        tick, validator_public_keys, current_epoch
-    )
-    upcoming_duties = await beacon_node.fetch_duties(
-        tick, validator_public_keys, next_epoch
-    )
-    latest_duties = cast(Tuple[Duty, ...], current_duties) + cast(
-        Tuple[Duty, ...], upcoming_duties
-    )
-    if not latest_duties:
-        return
+class DutyPrefetcher:
+    """
+    Fetches the duties of each epoch one epoch ahead of their execution, and once more
+    when the epoch starts to pick up the changes since, e.g. from a re-org.
+    """
 
-    logger.debug("%s: found %d duties", tick, len(latest_duties))
+    def __init__(
+        self,
+        beacon_node: BeaconNodeAPI,
+        validator_public_keys: Collection[BLSPubkey],
+        duty_store: DutyStore,
+    ) -> None:
+        self._beacon_node = beacon_node
+        self._validator_public_keys = validator_public_keys
+        self._duty_store = duty_store
+        # NOTE: keyed by the epoch and whether it was fetched once it started;
+        # set once the duties of the epoch are in the ``duty_store``
+        self._fetched_epochs: Dict[Tuple[Epoch, bool], trio.Event] = {}
+
+    def has_fetched(self, epoch: Epoch) -> bool:
+        """
+        Return whether the duties for ``epoch`` are in the duty store from any fetch.
+        """
+        return any(
+            is_fetched.is_set()
+            for (fetched_epoch, _), is_fetched in self._fetched_epochs.items()
+            if fetched_epoch == epoch
+        )
 
-    # TODO manage duties correctly, accounting for re-orgs, etc.
-    # NOTE: the naive strategy is likely "last write wins"
-    await duty_store.add_duties(*latest_duties)
+    async def fetch_duties(self, tick: Tick, epoch: Epoch) -> None:
+        """
+        Fetch the duties for ``epoch`` into the duty store, unless they were already
+        fetched ahead of the epoch or, if it has started, since it started. Waits for
+        the duties if another task is fetching them.
+        """
+        key = (epoch, tick.epoch >= epoch)
+        if key in self._fetched_epochs:
+            await self._fetched_epochs[key].wait()
+            return
+
+        is_fetched = trio.Event()
+        self._fetched_epochs[key] = is_fetched
+        is_stored = False
+        try:
+            duties = await self._beacon_node.fetch_duties(
+                tick, self._validator_public_keys, epoch
+            )
+            if duties:
+                logger.debug(
+                    "%s: found %d duties for epoch %d", tick, len(duties), epoch
+                )
+                await self._duty_store.replace_duties(epoch, *duties)
+            is_stored = True
+        except OSError as e:
+            logger.warning(
+                "%s: could not fetch duties for epoch %d: %s", tick, epoch, e
+            )
+        finally:
+            if not is_stored:
+                # NOTE: retry on a later tick
+                del self._fetched_epochs[key]
+            is_fetched.set()
+
+        for fetched_epoch, is_started in tuple(self._fetched_epochs):
+            if fetched_epoch < epoch - 1:
+                del self._fetched_epochs[(fetched_epoch, is_started)]
 
 
 async def schedule_and_dispatch_duties_at_tick(
     tick: Tick,
-    beacon_node: BeaconNodeAPI,
-    validator_public_keys: Collection[BLSPubkey],
+    duty_prefetcher: DutyPrefetcher,
     duty_store: DutyStore,
     duty_dispatcher: SendChannel[Duty],
 ) -> None:
-    await _fetch_latest_duties(tick, beacon_node, validator_public_keys, duty_store)
-    await _dispatch_duties_for(tick, duty_store, beacon_node, duty_dispatcher)
+    async with trio.open_nursery() as nursery:
+        # NOTE: the duties of the next epoch are fetched in the background, so they are
+        # ready by the time the epoch starts.
+        nursery.start_soon(duty_prefetcher.fetch_duties, tick, Epoch(tick.epoch + 1))
+        # NOTE: the duties of the current epoch are fetched again on its first tick,
+        # and on every tick until that succeeds. The prefetched duties are dispatched
+        # meanwhile, so only wait for the duties if they were never fetched.
+        if duty_prefetcher.has_fetched(tick.epoch):
+            nursery.start_soon(duty_prefetcher.fetch_duties, tick, tick.epoch)
+        else:
+            await duty_prefetcher.fetch_duties(tick, tick.epoch)
+        await _dispatch_duties_for(tick, duty_store, duty_dispatcher)
@@ -1,9 +1,9 @@
-from collections import defaultdict
-from typing import Collection, Dict, Tuple
+from typing import Collection, Dict, List, Tuple
 
+from eth_typing import BLSPubkey
 import trio
 
-from eth2.beacon.typing import Slot
+from eth2.beacon.typing import Epoch, Slot
 from eth2.clock import Tick
 from eth2.validator_client.duty import Duty
 
@@ -16,32 +16,56 @@ def to_tick_count(tick: Tick) -> TickCount:
     return (tick.slot, tick.count)
 
 
-def _contains_duty_at_tick(duties: Tuple[Duty, ...], duty: Duty) -> bool:
-    """
-    ``duties`` are a collection of duties at one particular tick
-    """
-    return duty.validator_public_key in map(
-        lambda duty: duty.validator_public_key, duties
-    )
-
-
 class DutyStore:
     def __init__(self) -> None:
-        self._store: Dict[TickCount, Tuple[Duty, ...]] = defaultdict(tuple)
+        # NOTE: at most one duty per validator at each tick, in the order they were added
+        self._store: Dict[TickCount, Dict[BLSPubkey, Duty]] = {}
+        # NOTE: the ticks of the stored duties of each validator in each epoch
+        self._ticks_by_epoch: Dict[Epoch, Dict[BLSPubkey, List[TickCount]]] = {}
         self._store_lock = trio.Lock()
 
     async def duties_at_tick(self, tick: Tick) -> Collection[Duty]:
         target = to_tick_count(tick)
         async with self._store_lock:
-            return self._store[target]
+            return tuple(self._store.get(target, {}).values())
+
+    def _add_duties(self, duties: Collection[Duty]) -> None:
+        for duty in duties:
+            target = to_tick_count(duty.tick_for_execution)
+            existing_duties = self._store.setdefault(target, {})
+            if duty.validator_public_key in existing_duties:
+                continue
+            existing_duties[duty.validator_public_key] = duty
+            ticks = self._ticks_by_epoch.setdefault(duty.tick_for_execution.epoch, {})
+            ticks.setdefault(duty.validator_public_key, []).append(target)
+
+    def _remove_duties(self, epoch: Epoch, public_keys: Collection[BLSPubkey]) -> None:
+        ticks = self._ticks_by_epoch.get(epoch, {})
+        for public_key in public_keys:
+            for target in ticks.pop(public_key, ()):
+                existing_duties = self._store[target]
+                del existing_duties[public_key]
+                if not existing_duties:
+                    del self._store[target]
 
     async def add_duties(self, *duties: Duty) -> None:
         async with self._store_lock:
-            for duty in duties:
-                target = to_tick_count(duty.tick_for_execution)
-                existing_duties = self._store[target]
-                if _contains_duty_at_tick(existing_duties, duty):
-                    continue
-                else:
-                    existing_duties += (duty,)
-                    self._store[target] = existing_duties
+            self._add_duties(duties)
+
+    async def replace_duties(self, epoch: Epoch, *duties: Duty) -> None:
+        """
+        Replace the duties in ``epoch`` of the validators of ``duties`` with ``duties``,
+        dropping the duties the beacon node no longer reports, e.g. after a re-org.
+
+        The duties of the epochs before the one preceding ``epoch`` are pruned.
+        """
+        public_keys = set(duty.validator_public_key for duty in duties)
+        async with self._store_lock:
+            self._remove_duties(epoch, public_keys)
+            self._add_duties(duties)
+            for stale_epoch in tuple(self._ticks_by_epoch):
+                if stale_epoch < epoch - 1:
+                    self._remove_duties(
+                        stale_epoch, tuple(self._ticks_by_epoch[stale_epoch])
+                    )
+                    del self._ticks_by_epoch[stale_epoch]
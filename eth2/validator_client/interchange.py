@@ -0,0 +1,251 @@
+"""
+Reads and writes the slashing protection interchange format (EIP-3076), used to move the
+signing history of validators between clients.
+
+Both directions are streamed: the history of one validator is held in memory at a time,
+so that the history of thousands of validators does not have to fit in memory at once.
+"""
+from dataclasses import dataclass
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from eth_typing import BLSPubkey, Hash32
+from eth_utils import ValidationError, decode_hex, encode_hex
+
+from eth2.beacon.typing import Epoch, Root, Slot
+
+INTERCHANGE_FORMAT_VERSION = "5"
+
+# Number of characters read from the stream at once
+READ_SIZE = 2 ** 16
+
+
+@dataclass(frozen=True)
+class SignedBlock:
+    slot: Slot
+    signing_root: Optional[Hash32] = None
+
+
+@dataclass(frozen=True)
+class SignedAttestation:
+    source_epoch: Epoch
+    target_epoch: Epoch
+    signing_root: Optional[Hash32] = None
+
+
+@dataclass(frozen=True)
+class ValidatorHistory:
+    pubkey: BLSPubkey
+    signed_blocks: Iterable[SignedBlock]
+    signed_attestations: Iterable[SignedAttestation]
+
+
+def _decode_signing_root(record: Dict[str, Any]) -> Optional[Hash32]:
+    signing_root = record.get("signing_root")
+    if signing_root is None:
+        return None
+    return Hash32(decode_hex(signing_root))
+
+
+def _decode_validator_history(record: Dict[str, Any]) -> ValidatorHistory:
+    return ValidatorHistory(
+        pubkey=BLSPubkey(decode_hex(record["pubkey"])),
+        signed_blocks=tuple(
+            SignedBlock(Slot(int(block["slot"])), _decode_signing_root(block))
+            for block in record.get("signed_blocks", ())
+        ),
+        signed_attestations=tuple(
+            SignedAttestation(
+                Epoch(int(attestation["source_epoch"])),
+                Epoch(int(attestation["target_epoch"])),
+                _decode_signing_root(attestation),
+            )
+            for attestation in record.get("signed_attestations", ())
+        ),
+    )
+
+
+def _encode_record(record: Dict[str, str], signing_root: Optional[Hash32]) -> str:
+    if signing_root is not None:
+        record["signing_root"] = encode_hex(signing_root)
+    return json.dumps(record)
+
+
+class _JSONStreamReader:
+    """
+    Decodes the JSON values of a stream one at a time, reading more of the stream
+    whenever the buffered text ends in the middle of a value.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._buffer = ""
+        self._position = 0
+        self._decoder = json.JSONDecoder()
+        self._is_exhausted = False
+
+    def _read_more(self) -> bool:
+        if self._is_exhausted:
+            return False
+        # Read at least as much as is buffered, so that decoding a long value is
+        # retried a logarithmic number of times.
+        text = self._stream.read(max(READ_SIZE, len(self._buffer) - self._position))
+        if not text:
+            self._is_exhausted = True
+            return False
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Return the next character which is not whitespace, without consuming it.
+        """
+        while True:
+            while self._position < len(self._buffer):
+                if not self._buffer[self._position].isspace():
+                    return self._buffer[self._position]
+                self._position += 1
+            if not self._read_more():
+                raise ValidationError("Unexpected end of the interchange data")
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise ValidationError(
+                f"Expected {character!r} in the interchange data,"
+                f" got {self._buffer[self._position]!r}"
+            )
+        self._position += 1
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, self._position = self._decoder.raw_decode(
+                    self._buffer, self._position
+                )
+            except json.JSONDecodeError as error:
+                if not self._read_more():
+                    raise ValidationError(
+                        f"Invalid interchange data: {error}"
+                    ) from error
+            else:
+                return value
+
+
+def _validate_metadata(metadata: Any, genesis_validators_root: Root) -> None:
+    try:
+        version = metadata.get("interchange_format_version")
+        encoded_root = metadata.get("genesis_validators_root")
+        root = decode_hex(encoded_root)
+    except (AttributeError, TypeError, ValueError) as error:
+        raise ValidationError(
+            f"Invalid metadata in the interchange data: {error}"
+        ) from error
+
+    if version != INTERCHANGE_FORMAT_VERSION:
+        raise ValidationError(f"Unsupported interchange format version: {version}")
+    if root != genesis_validators_root:
+        raise ValidationError(
+            "Interchange data is for the chain with genesis validators root"
+            f" {encoded_root}"
+        )
+
+
+def _read_validator_histories(reader: _JSONStreamReader) -> Iterator[ValidatorHistory]:
+    reader.expect("[")
+    while reader.peek() != "]":
+        record = reader.decode()
+        try:
+            history = _decode_validator_history(record)
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValidationError(
+                f"Invalid validator record in the interchange data: {error}"
+            ) from error
+        yield history
+        if reader.peek() != "]":
+            reader.expect(",")
+    reader.expect("]")
+
+
+def read_interchange(
+    stream: TextIO, genesis_validators_root: Root
+) -> Iterator[ValidatorHistory]:
+    """
+    Yield the history of each validator in the interchange data of ``stream``.
+
+    Raise ``ValidationError`` if the data is not in the interchange format, or if it is
+    not for the chain of ``genesis_validators_root``. No history is yielded before the
+    metadata is validated: if the data comes before the metadata, it is held in memory
+    until the metadata is read.
+    """
+    reader = _JSONStreamReader(stream)
+    has_metadata = False
+    unvalidated_histories: List[ValidatorHistory] = []
+    is_first_field = True
+
+    reader.expect("{")
+    while reader.peek() != "}":
+        if not is_first_field:
+            reader.expect(",")
+        is_first_field = False
+        key = reader.decode()
+        reader.expect(":")
+
+        if key == "metadata":
+            _validate_metadata(reader.decode(), genesis_validators_root)
+            has_metadata = True
+        elif key == "data":
+            if has_metadata:
+                yield from _read_validator_histories(reader)
+            else:
+                unvalidated_histories.extend(_read_validator_histories(reader))
+        else:
+            # Ignore unknown fields
+            reader.decode()
+    reader.expect("}")
+
+    if not has_metadata:
+        raise ValidationError("Interchange data is missing its metadata")
+    yield from unvalidated_histories
+
+
+def write_interchange(
+    stream: TextIO,
+    genesis_validators_root: Root,
+    validator_histories: Iterable[ValidatorHistory],
+) -> None:
+    """
+    Write ``validator_histories`` to ``stream`` in the interchange format, one record
+    at a time.
+    """
+    metadata = {
+        "interchange_format_version": INTERCHANGE_FORMAT_VERSION,
+        "genesis_validators_root": encode_hex(genesis_validators_root),
+    }
+    stream.write(f'{{"metadata": {json.dumps(metadata)}, "data": [')
+    for index, history in enumerate(validator_histories):
+        if index:
+            stream.write(", ")
+        stream.write(f'{{"pubkey": "{encode_hex(history.pubkey)}", "signed_blocks": [')
+        stream.write(
+            ", ".join(
+                _encode_record({"slot": str(block.slot)}, block.signing_root)
+                for block in history.signed_blocks
+            )
+        )
+        stream.write('], "signed_attestations": [')
+        stream.write(
+            ", ".join(
+                _encode_record(
+                    {
+                        "source_epoch": str(attestation.source_epoch),
+                        "target_epoch": str(attestation.target_epoch),
+                    },
+                    attestation.signing_root,
+                )
+                for attestation in history.signed_attestations
+            )
+        )
+        stream.write("]}")
+    stream.write("]}\n")
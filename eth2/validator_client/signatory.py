@@ -1,18 +1,23 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+import functools
 import logging
-from typing import cast
+import time
+from typing import AsyncIterator, Optional, Sequence, Tuple, cast
 
 from eth_typing import BLSSignature, Hash32
 from eth_utils import ValidationError
+import trio
 
 from eth2._utils.bls import bls
 from eth2._utils.humanize import humanize_bytes
 from eth2.beacon.helpers import compute_domain, compute_signing_root
 from eth2.beacon.types.attestations import Attestation
 from eth2.beacon.types.blocks import BeaconBlock, SignedBeaconBlock
-from eth2.beacon.typing import Operation, Root, SignedOperation
+from eth2.beacon.typing import Operation, Root, SignedOperation, Slot
 from eth2.validator_client.abc import BeaconNodeAPI, SignatoryDatabaseAPI
 from eth2.validator_client.duty import Duty, DutyType
-from eth2.validator_client.typing import PrivateKeyProvider
+from eth2.validator_client.typing import BLSPrivateKey, PrivateKeyProvider, ResolvedDuty
+from trinity.metrics.registry import metrics
 
 logger = logging.getLogger("eth2.validator_client.signatory")
 
@@ -30,29 +35,124 @@ async def _validate_duty(
         )
 
 
-def sign(
-    duty: Duty, operation: Operation, private_key_provider: PrivateKeyProvider
-) -> BLSSignature:
-    privkey = private_key_provider(duty.validator_public_key)
+# NOTE: hardcoded for testing, based on generating the minimal set of validators
+GENESIS_VALIDATORS_ROOT = Root(
+    Hash32(
+        bytes.fromhex(
+            "83431ec7fcf92cfc44947fc0418e831c25e1d0806590231c439830db7ad54fda"
+        )
+    )
+)
+
+
+def get_signing_root(duty: Duty, operation: Operation) -> Hash32:
     # TODO use correct ``domain`` value
     # NOTE currently only uses part of the domain value
     # need to get fork from the state and compute the full domain value locally
-    # NOTE: hardcoded for testing, based on generating the minimal set of validators
-    genesis_validators_root = Root(
-        Hash32(
-            bytes.fromhex(
-                "83431ec7fcf92cfc44947fc0418e831c25e1d0806590231c439830db7ad54fda"
-            )
-        )
-    )
     domain = compute_domain(
-        duty.signature_domain, genesis_validators_root=genesis_validators_root
+        duty.signature_domain, genesis_validators_root=GENESIS_VALIDATORS_ROOT
     )
-    signing_root = compute_signing_root(operation, domain)
+    return compute_signing_root(operation, domain)
 
+
+def _sign(privkey: BLSPrivateKey, signing_root: Hash32) -> BLSSignature:
+    # NOTE: runs in the workers of a ``SigningPool``
     return bls.sign(privkey, signing_root)
 
 
+def sign(
+    duty: Duty, operation: Operation, private_key_provider: PrivateKeyProvider
+) -> BLSSignature:
+    privkey = private_key_provider(duty.validator_public_key)
+    return _sign(privkey, get_signing_root(duty, operation))
+
+
+def _signing_deadline(resolved_duty: ResolvedDuty) -> Tuple[Slot, int]:
+    """
+    Duties are due at their tick within their slot, which puts block proposals ahead
+    of the attestations of the same slot.
+    """
+    duty, _ = resolved_duty
+    return duty.tick_for_execution.slot, duty.tick_count
+
+
+class SigningPool:
+    """
+    Signs the operations of duties in a pool of workers, outside of the trio event loop.
+
+    Signing is CPU bound: when many validators have duties in the same slot, signing
+    them in the task handling each duty would hold up the event loop past the
+    deadlines of the duties.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None) -> None:
+        if executor is None:
+            executor = ProcessPoolExecutor()
+        self._executor = executor
+
+    async def sign_many(
+        self,
+        resolved_duties: Sequence[ResolvedDuty],
+        private_key_provider: PrivateKeyProvider,
+    ) -> AsyncIterator[Tuple[ResolvedDuty, BLSSignature]]:
+        """
+        Sign the operations of ``resolved_duties``, yielding each duty with its
+        signature as soon as it is signed.
+
+        Duties are handed to the workers by deadline, so that block proposals are signed
+        (and yielded) before attestations.
+        """
+        trio_token = trio.hazmat.current_trio_token()
+        # NOTE: buffered for every duty so the done callbacks never block
+        signed, signed_provider = trio.open_memory_channel[
+            Tuple[ResolvedDuty, "Future[BLSSignature]", float]
+        ](len(resolved_duties))
+
+        def _on_signed(
+            resolved_duty: ResolvedDuty,
+            submitted_at: float,
+            future: "Future[BLSSignature]",
+        ) -> None:
+            signing_seconds = time.perf_counter() - submitted_at
+            trio_token.run_sync_soon(
+                signed.send_nowait, (resolved_duty, future, signing_seconds)
+            )
+
+        futures = []
+        try:
+            for resolved_duty in sorted(resolved_duties, key=_signing_deadline):
+                duty, operation = resolved_duty
+                submitted_at = time.perf_counter()
+                future = self._executor.submit(
+                    _sign,
+                    private_key_provider(duty.validator_public_key),
+                    get_signing_root(duty, operation),
+                )
+                future.add_done_callback(
+                    functools.partial(_on_signed, resolved_duty, submitted_at)
+                )
+                futures.append(future)
+
+            for _ in futures:
+                resolved_duty, future, signing_seconds = await signed_provider.receive()
+                signature = future.result()
+                duty, _ = resolved_duty
+                metrics.validator_signing_seconds.labels(duty.duty_type.name).observe(
+                    signing_seconds
+                )
+                yield resolved_duty, signature
+        finally:
+            # NOTE: no-op for the futures that are done, otherwise drops the pending
+            # work if we are cancelled
+            for future in futures:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        # NOTE: not waiting for the workers can leave them running after
+        # the client exits on Python 3.8 (see bpo-39104)
+        self._executor.shutdown(wait=True)
+
+
 def _attach_signature(
     duty: Duty, operation: Operation, signature: BLSSignature
 ) -> SignedOperation:
@@ -66,34 +166,39 @@ def _attach_signature(
         raise NotImplementedError(f"unrecognized duty type in duty {duty}")
 
 
-async def sign_and_broadcast_operation_if_valid(
-    duty: Duty,
-    operation: Operation,
+async def sign_and_broadcast_operations_if_valid(
+    resolved_duties: Sequence[ResolvedDuty],
     signature_store: SignatoryDatabaseAPI,
     beacon_node: BeaconNodeAPI,
     private_key_provider: PrivateKeyProvider,
+    signing_pool: SigningPool,
 ) -> None:
-    try:
-        await _validate_duty(duty, operation, signature_store)
-    except ValidationError as e:
-        logger.warning("a duty %s was not valid: %s", duty, e)
-        return
-    else:
-        logger.debug(
-            "received a valid duty %s for the operation with hash tree root %s; signing...",
-            duty,
-            humanize_bytes(operation.hash_tree_root),
-        )
+    valid_duties = []
+    for duty, operation in resolved_duties:
+        try:
+            await _validate_duty(duty, operation, signature_store)
+        except ValidationError as e:
+            logger.warning("a duty %s was not valid: %s", duty, e)
+            continue
+        else:
+            logger.debug(
+                "received a valid duty %s for the operation with hash tree root %s; signing...",
+                duty,
+                humanize_bytes(operation.hash_tree_root),
+            )
 
-    await signature_store.record_signature_for(duty, operation)
-    signature = sign(duty, operation, private_key_provider)
+        await signature_store.record_signature_for(duty, operation)
+        valid_duties.append((duty, operation))
 
-    operation_with_signature = _attach_signature(duty, operation, signature)
+    async for (duty, operation), signature in signing_pool.sign_many(
+        valid_duties, private_key_provider
+    ):
+        operation_with_signature = _attach_signature(duty, operation, signature)
 
-    logger.debug(
-        "got signature %s for duty %s with (signed) hash tree root %s",
-        humanize_bytes(signature),
-        duty,
-        humanize_bytes(operation_with_signature.hash_tree_root),
-    )
-    await beacon_node.publish(duty, operation_with_signature)
+        logger.debug(
+            "got signature %s for duty %s with (signed) hash tree root %s",
+            humanize_bytes(signature),
+            duty,
+            humanize_bytes(operation_with_signature.hash_tree_root),
+        )
+        await beacon_node.publish(duty, operation_with_signature)
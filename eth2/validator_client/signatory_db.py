@@ -1,12 +1,24 @@
 from enum import Enum, unique
 import logging
-from typing import Dict
+from typing import Dict, Iterable, Optional, Set, TextIO, Tuple, cast
 
+from eth.abc import AtomicDatabaseAPI, DatabaseAPI
+from eth_typing import BLSPubkey, Hash32
 import ssz
 
-from eth2.beacon.typing import Operation
+from eth2.beacon.constants import ZERO_ROOT
+from eth2.beacon.types.attestations import Attestation
+from eth2.beacon.typing import Epoch, Operation, Root, Slot
 from eth2.validator_client.abc import SignatoryDatabaseAPI
 from eth2.validator_client.duty import Duty, DutyType
+from eth2.validator_client.interchange import (
+    SignedAttestation,
+    SignedBlock,
+    ValidatorHistory,
+    read_interchange,
+    write_interchange,
+)
+from eth2.validator_client.signatory import GENESIS_VALIDATORS_ROOT, get_signing_root
 
 
 @unique
@@ -103,3 +115,403 @@ class InMemorySignatoryDB(SignatoryDatabaseAPI):
         if not isinstance(key, bytes):
             raise Exception("element type is ``bytes``")
         return key in self._store
+
+
+# Number of source epochs in each chunk of the span arrays of a validator
+SPAN_CHUNK_SIZE = 256
+# Target epoch stored in the span arrays, as a ``uint64``
+SPAN_VALUE_SIZE = 8
+# Min target span of the source epochs after the last source of a validator
+FAR_FUTURE_TARGET = Epoch(2 ** 64 - 1)
+# Signing root stored for the signatures imported without one
+UNKNOWN_SIGNING_ROOT = Hash32(ZERO_ROOT)
+
+
+def _encode_uint64(value: int) -> bytes:
+    return ssz.encode(value, ssz.uint64)
+
+
+def _decode_uint64(data: bytes) -> int:
+    return ssz.decode(data, ssz.uint64)
+
+
+def _validator_count_key() -> bytes:
+    return b"v1:signatory:validator-count"
+
+
+def _validator_key(index: int) -> bytes:
+    return b"v1:signatory:validator:" + _encode_uint64(index)
+
+
+def _validator_index_key(public_key: BLSPubkey) -> bytes:
+    return b"v1:signatory:validator-index:" + public_key
+
+
+def _block_count_key(public_key: BLSPubkey) -> bytes:
+    return b"v1:signatory:block-count:" + public_key
+
+
+def _block_slot_key(public_key: BLSPubkey, index: int) -> bytes:
+    return b"v1:signatory:block-slot:" + public_key + _encode_uint64(index)
+
+
+def _block_signing_root_key(public_key: BLSPubkey, slot: Slot) -> bytes:
+    return b"v1:signatory:block-signing-root:" + public_key + _encode_uint64(slot)
+
+
+def _attestation_count_key(public_key: BLSPubkey) -> bytes:
+    return b"v1:signatory:attestation-count:" + public_key
+
+
+def _attestation_target_key(public_key: BLSPubkey, index: int) -> bytes:
+    return b"v1:signatory:attestation-target:" + public_key + _encode_uint64(index)
+
+
+def _attestation_key(public_key: BLSPubkey, target_epoch: Epoch) -> bytes:
+    """
+    Key of the source epoch and signing root of the attestation for ``target_epoch``.
+    """
+    return b"v1:signatory:attestation:" + public_key + _encode_uint64(target_epoch)
+
+
+def _span_bounds_key(public_key: BLSPubkey) -> bytes:
+    """
+    Key of the lowest source and target epochs of the attestations of a validator.
+    """
+    return b"v1:signatory:span-bounds:" + public_key
+
+
+def _min_target_span_key(public_key: BLSPubkey) -> bytes:
+    return b"v1:signatory:min-target-span:" + public_key
+
+
+def _max_target_span_key(public_key: BLSPubkey) -> bytes:
+    return b"v1:signatory:max-target-span:" + public_key
+
+
+class _SpanArray:
+    """
+    An array of target epochs of a validator, indexed by source epoch and stored in chunks
+    of ``SPAN_CHUNK_SIZE`` epochs. Changes are kept in memory until ``persist``.
+    """
+
+    def __init__(self, db: DatabaseAPI, key_prefix: bytes, empty_value: Epoch) -> None:
+        self._db = db
+        self._key_prefix = key_prefix
+        self._empty_chunk = _encode_uint64(empty_value) * SPAN_CHUNK_SIZE
+        self._chunks: Dict[int, bytearray] = {}
+        self._changed_chunks: Set[int] = set()
+
+    def _get_chunk(self, chunk_index: int) -> bytearray:
+        if chunk_index not in self._chunks:
+            chunk = self._db.get(self._key_prefix + _encode_uint64(chunk_index))
+            self._chunks[chunk_index] = bytearray(
+                self._empty_chunk if chunk is None else chunk
+            )
+        return self._chunks[chunk_index]
+
+    def __getitem__(self, epoch: Epoch) -> Epoch:
+        chunk_index, position = divmod(epoch, SPAN_CHUNK_SIZE)
+        offset = position * SPAN_VALUE_SIZE
+        chunk = self._get_chunk(chunk_index)
+        return Epoch(_decode_uint64(chunk[offset : offset + SPAN_VALUE_SIZE]))
+
+    def __setitem__(self, epoch: Epoch, target_epoch: Epoch) -> None:
+        chunk_index, position = divmod(epoch, SPAN_CHUNK_SIZE)
+        offset = position * SPAN_VALUE_SIZE
+        chunk = self._get_chunk(chunk_index)
+        chunk[offset : offset + SPAN_VALUE_SIZE] = _encode_uint64(target_epoch)
+        self._changed_chunks.add(chunk_index)
+
+    def persist(self, db: DatabaseAPI) -> None:
+        for chunk_index in self._changed_chunks:
+            db[self._key_prefix + _encode_uint64(chunk_index)] = bytes(
+                self._chunks[chunk_index]
+            )
+        self._changed_chunks.clear()
+
+
+class PersistentSignatoryDB(SignatoryDatabaseAPI):
+    """
+    Slashing protection kept in ``db``, usually a ``LevelDB``, so that it survives
+    restarts of the client.
+
+    Besides the signing root of every block and attestation signed by a validator, two
+    span arrays indexed by source epoch are kept for each validator:
+
+    - ``min_targets[e]``, the lowest target of the attestations with a source after ``e``:
+      a new attestation ``(s, t)`` surrounds one of them if ``min_targets[s] < t``;
+    - ``max_targets[e]``, the highest target of the attestations with a source before ``e``:
+      a new attestation ``(s, t)`` is surrounded by one of them if ``max_targets[s] > t``.
+
+    so that double and surround votes are each found with a single lookup, whatever
+    the length of the history.
+    """
+
+    logger = logging.getLogger("eth2.validator_client.signatory_db")
+
+    def __init__(
+        self,
+        db: AtomicDatabaseAPI,
+        genesis_validators_root: Root = GENESIS_VALIDATORS_ROOT,
+    ) -> None:
+        self._db = db
+        self._genesis_validators_root = genesis_validators_root
+
+    async def record_signature_for(self, duty: Duty, operation: Operation) -> None:
+        self.logger.debug("recording signature for duty %s", duty)
+        public_key = duty.validator_public_key
+        signing_root = get_signing_root(duty, operation)
+        if duty.duty_type == DutyType.Attestation:
+            attestation = cast(Attestation, operation)
+            self._record_attestation(
+                public_key,
+                attestation.data.source.epoch,
+                attestation.data.target.epoch,
+                signing_root,
+            )
+        elif duty.duty_type == DutyType.BlockProposal:
+            self._record_block(public_key, duty.tick_for_execution.slot, signing_root)
+        else:
+            raise NotImplementedError(
+                f"missing a signature recorder handler for the duty type {duty.duty_type}"
+            )
+
+    async def is_slashable(self, duty: Duty, operation: Operation) -> bool:
+        public_key = duty.validator_public_key
+        signing_root = get_signing_root(duty, operation)
+        if duty.duty_type == DutyType.Attestation:
+            attestation = cast(Attestation, operation)
+            return self._is_attestation_slashable(
+                public_key,
+                attestation.data.source.epoch,
+                attestation.data.target.epoch,
+                signing_root,
+            )
+        elif duty.duty_type == DutyType.BlockProposal:
+            return self._is_block_slashable(
+                public_key, duty.tick_for_execution.slot, signing_root
+            )
+        else:
+            raise NotImplementedError(
+                f"missing a slashing validation handler for the duty type {duty.duty_type}"
+            )
+
+    def insert(self, key: bytes, value: bytes) -> None:
+        self._db[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, bytes):
+            raise Exception("element type is ``bytes``")
+        return key in self._db
+
+    #
+    # Slashing conditions
+    #
+    def _is_block_slashable(
+        self, public_key: BLSPubkey, slot: Slot, signing_root: Hash32
+    ) -> bool:
+        """
+        A block proposal is slashable if we already signed a different block at its slot.
+        """
+        existing_signing_root = self._db.get(_block_signing_root_key(public_key, slot))
+        return (
+            existing_signing_root is not None and existing_signing_root != signing_root
+        )
+
+    def _is_attestation_slashable(
+        self,
+        public_key: BLSPubkey,
+        source_epoch: Epoch,
+        target_epoch: Epoch,
+        signing_root: Hash32,
+    ) -> bool:
+        if source_epoch > target_epoch:
+            return True
+
+        existing_attestation = self._db.get(_attestation_key(public_key, target_epoch))
+        if existing_attestation is not None:
+            # Double vote, unless signing the same attestation again
+            return existing_attestation[SPAN_VALUE_SIZE:] != signing_root
+
+        span_bounds = self._db.get(_span_bounds_key(public_key))
+        if span_bounds is None:
+            return False
+        lowest_source_epoch, lowest_target_epoch = self._decode_span_bounds(span_bounds)
+
+        if source_epoch < lowest_source_epoch:
+            min_target_epoch = lowest_target_epoch
+        else:
+            min_target_epoch = _SpanArray(
+                self._db, _min_target_span_key(public_key), FAR_FUTURE_TARGET
+            )[source_epoch]
+        max_target_epoch = _SpanArray(
+            self._db, _max_target_span_key(public_key), Epoch(0)
+        )[source_epoch]
+
+        return min_target_epoch < target_epoch or max_target_epoch > target_epoch
+
+    #
+    # Signature records
+    #
+    @staticmethod
+    def _decode_span_bounds(span_bounds: bytes) -> Tuple[Epoch, Epoch]:
+        return (
+            Epoch(_decode_uint64(span_bounds[:SPAN_VALUE_SIZE])),
+            Epoch(_decode_uint64(span_bounds[SPAN_VALUE_SIZE:])),
+        )
+
+    def _get_count(self, key: bytes) -> int:
+        count = self._db.get(key)
+        if count is None:
+            return 0
+        return _decode_uint64(count)
+
+    def _add_validator(self, batch: DatabaseAPI, public_key: BLSPubkey) -> None:
+        if _validator_index_key(public_key) in self._db:
+            return
+        validator_count = self._get_count(_validator_count_key())
+        batch[_validator_key(validator_count)] = public_key
+        batch[_validator_index_key(public_key)] = _encode_uint64(validator_count)
+        batch[_validator_count_key()] = _encode_uint64(validator_count + 1)
+
+    def _record_block(
+        self, public_key: BLSPubkey, slot: Slot, signing_root: Hash32
+    ) -> None:
+        signing_root_key = _block_signing_root_key(public_key, slot)
+        if signing_root_key in self._db:
+            return
+
+        block_count = self._get_count(_block_count_key(public_key))
+        with self._db.atomic_batch() as batch:
+            self._add_validator(batch, public_key)
+            batch[signing_root_key] = signing_root
+            batch[_block_slot_key(public_key, block_count)] = _encode_uint64(slot)
+            batch[_block_count_key(public_key)] = _encode_uint64(block_count + 1)
+
+    def _record_attestation(
+        self,
+        public_key: BLSPubkey,
+        source_epoch: Epoch,
+        target_epoch: Epoch,
+        signing_root: Hash32,
+    ) -> None:
+        min_targets = _SpanArray(
+            self._db, _min_target_span_key(public_key), FAR_FUTURE_TARGET
+        )
+        max_targets = _SpanArray(self._db, _max_target_span_key(public_key), Epoch(0))
+
+        span_bounds = self._db.get(_span_bounds_key(public_key))
+        if span_bounds is None:
+            lowest_source_epoch = source_epoch
+            lowest_target_epoch = target_epoch
+        else:
+            lowest_source_epoch, lowest_target_epoch = self._decode_span_bounds(
+                span_bounds
+            )
+            # The min targets below the lowest source are all the lowest target, so
+            # they are not stored until an attestation with a lower source comes in.
+            for epoch in range(source_epoch, lowest_source_epoch):
+                min_targets[Epoch(epoch)] = lowest_target_epoch
+            lowest_source_epoch = min(lowest_source_epoch, source_epoch)
+            lowest_target_epoch = min(lowest_target_epoch, target_epoch)
+
+        # Both arrays are monotonic, so the updates stop at the first epoch which
+        # already accounts for the new attestation.
+        for epoch in range(source_epoch - 1, lowest_source_epoch - 1, -1):
+            if min_targets[Epoch(epoch)] <= target_epoch:
+                break
+            min_targets[Epoch(epoch)] = target_epoch
+        # Attestations with a source from ``target_epoch`` on can not be surrounded.
+        for epoch in range(source_epoch + 1, target_epoch):
+            if max_targets[Epoch(epoch)] >= target_epoch:
+                break
+            max_targets[Epoch(epoch)] = target_epoch
+
+        attestation_key = _attestation_key(public_key, target_epoch)
+        with self._db.atomic_batch() as batch:
+            if attestation_key not in self._db:
+                self._add_validator(batch, public_key)
+                attestation_count = self._get_count(_attestation_count_key(public_key))
+                batch[attestation_key] = _encode_uint64(source_epoch) + signing_root
+                batch[
+                    _attestation_target_key(public_key, attestation_count)
+                ] = _encode_uint64(target_epoch)
+                batch[_attestation_count_key(public_key)] = _encode_uint64(
+                    attestation_count + 1
+                )
+            batch[_span_bounds_key(public_key)] = _encode_uint64(
+                lowest_source_epoch
+            ) + _encode_uint64(lowest_target_epoch)
+            min_targets.persist(batch)
+            max_targets.persist(batch)
+
+    #
+    # Interchange
+    #
+    def _get_signed_blocks(self, public_key: BLSPubkey) -> Iterable[SignedBlock]:
+        for index in range(self._get_count(_block_count_key(public_key))):
+            slot = Slot(_decode_uint64(self._db[_block_slot_key(public_key, index)]))
+            signing_root = Hash32(self._db[_block_signing_root_key(public_key, slot)])
+            yield SignedBlock(slot, _export_signing_root(signing_root))
+
+    def _get_signed_attestations(
+        self, public_key: BLSPubkey
+    ) -> Iterable[SignedAttestation]:
+        for index in range(self._get_count(_attestation_count_key(public_key))):
+            target_epoch = Epoch(
+                _decode_uint64(self._db[_attestation_target_key(public_key, index)])
+            )
+            attestation = self._db[_attestation_key(public_key, target_epoch)]
+            yield SignedAttestation(
+                Epoch(_decode_uint64(attestation[:SPAN_VALUE_SIZE])),
+                target_epoch,
+                _export_signing_root(Hash32(attestation[SPAN_VALUE_SIZE:])),
+            )
+
+    def get_validator_histories(self) -> Iterable[ValidatorHistory]:
+        for index in range(self._get_count(_validator_count_key())):
+            public_key = BLSPubkey(self._db[_validator_key(index)])
+            yield ValidatorHistory(
+                public_key,
+                self._get_signed_blocks(public_key),
+                self._get_signed_attestations(public_key),
+            )
+
+    def import_interchange(self, stream: TextIO) -> None:
+        """
+        Import the signatures of the slashing protection interchange data in ``stream``.
+        """
+        for history in read_interchange(stream, self._genesis_validators_root):
+            for block in history.signed_blocks:
+                self._record_block(
+                    history.pubkey, block.slot, _import_signing_root(block.signing_root)
+                )
+            for attestation in history.signed_attestations:
+                self._record_attestation(
+                    history.pubkey,
+                    attestation.source_epoch,
+                    attestation.target_epoch,
+                    _import_signing_root(attestation.signing_root),
+                )
+
+    def export_interchange(self, stream: TextIO) -> None:
+        """
+        Export the signatures of every validator to ``stream``, in the slashing protection
+        interchange format.
+        """
+        write_interchange(
+            stream, self._genesis_validators_root, self.get_validator_histories()
+        )
+
+
+def _import_signing_root(signing_root: Optional[Hash32]) -> Hash32:
+    if signing_root is None:
+        return UNKNOWN_SIGNING_ROOT
+    return signing_root
+
+
+def _export_signing_root(signing_root: Hash32) -> Optional[Hash32]:
+    if signing_root == UNKNOWN_SIGNING_ROOT:
+        return None
+    return signing_root
@@ -32,6 +32,7 @@ from eth_keys import keys
 from p2p.enr import ENR
 from p2p.identity_schemes import IdentitySchemeRegistry
 from p2p.typing import (
+    CacheInfo,
     Capabilities,
     Capability,
     TCommandPayload,
@@ -281,6 +282,21 @@ class TransportAPI(ABC):
     def send(self, message: MessageAPI) -> None:
         ...
 
+    @property
+    @abstractmethod
+    def queued_bytes(self) -> int:
+        """
+        Return the number of bytes that were sent but not yet written to the remote.
+        """
+        ...
+
+    @abstractmethod
+    async def drain(self) -> None:
+        """
+        Wait until the queued bytes are low enough to send more.
+        """
+        ...
+
     @abstractmethod
     async def close(self) -> None:
         ...
@@ -408,6 +424,13 @@ class MultiplexerAPI(ABC):
     def is_closing(self) -> bool:
         ...
 
+    @abstractmethod
+    async def drain(self) -> None:
+        """
+        Wait until the remote has read enough of the messages sent to it to send more.
+        """
+        ...
+
     @abstractmethod
     async def close(self) -> None:
         ...
@@ -792,10 +815,25 @@ class NodeDBAPI(ABC):
     def get_enr(self, node_id: NodeID) -> ENR:
         ...
 
+    @abstractmethod
+    def get_node(self, node_id: NodeID) -> NodeAPI:
+        """
+        Return a Node for the ENR with the given ID, raising ``KeyError`` if there is none.
+        """
+        ...
+
     @abstractmethod
     def delete_enr(self, node_id: NodeID) -> None:
         ...
 
+    @property
+    @abstractmethod
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the hits and misses of the in-memory cache of decoded ENRs.
+        """
+        ...
+
     @abstractmethod
     def set_last_pong_time(self, node_id: NodeID, last_pong: int) -> None:
         ...
@@ -32,6 +32,19 @@ HEADER_LEN = 16
 # Length of an RLPx header's/frame's MAC
 MAC_LEN = 16
 
+# Outbound bytes buffered for a peer, above which Transport.drain() waits for them to be sent
+WRITE_BUFFER_HIGH_WATER = 4 * 1024 * 1024
+
+# Once draining, Transport.drain() waits until no more than this many bytes are buffered
+WRITE_BUFFER_LOW_WATER = 1 * 1024 * 1024
+
+# A peer that has this many outbound bytes buffered can't keep up, and is disconnected
+MAX_WRITE_BUFFER_SIZE = 64 * 1024 * 1024
+
+# Seconds that a send waits for the peer to read enough to get below the low water mark,
+# before the peer is disconnected for not keeping up
+WRITE_BUFFER_DRAIN_TIMEOUT = 30
+
 # The amount of seconds a connection can be idle.
 CONN_IDLE_TIMEOUT = 30
 
@@ -109,6 +122,10 @@ DISCOVERY_V5_BOOTNODES = (
     'enode://85c85d7143ae8bb96924f2b54f1b3e70d8c4d367af305325d30a61385a432f247d2c75c45c6b4a60335060d072d7f5b35dd1d4c45f76941f62a4f83b6e75daaf@40.118.3.223:30307',    # noqa: E501
 )
 
+# Number of decoded ENRs (and the Nodes created from them) that the NodeDB keeps in memory. Large
+# enough to hold a full discovery routing table.
+NODE_DB_CACHE_SIZE = 4096
+
 # Maximum peers number, we'll try to keep open connections up to this number of peers
 DEFAULT_MAX_PEERS = 25
 
@@ -203,11 +203,11 @@ class DiscoveryService(Service):
     def bootstrap_nodes(self) -> Iterable[NodeAPI]:
         for node_id in self._bootstrap_node_ids:
             try:
-                enr = self.node_db.get_enr(node_id)
+                node = self.node_db.get_node(node_id)
             except KeyError:
                 self.logger.exception("Bootnode not found in our DB")
             else:
-                yield Node(enr)
+                yield node
 
     def is_bond_valid_with(self, node_id: NodeID) -> bool:
         try:
@@ -302,17 +302,16 @@ class DiscoveryService(Service):
             return
 
         try:
-            enr = self.node_db.get_enr(node_id)
+            node = self.node_db.get_node(node_id)
         except KeyError:
             self.logger.warning(
                 "Attempted to fetch ENR for Node (%s) not in our DB", encode_hex(node_id))
             return
 
-        if enr.sequence_number >= enr_seq:
+        if node.enr.sequence_number >= enr_seq:
             self.logger.debug2("Already got latest ENR for %s", encode_hex(node_id))
             return
 
-        node = Node(enr)
         try:
             await self.request_enr(node)
         except CouldNotRetrieveENR as e:
@@ -333,6 +332,11 @@ class DiscoveryService(Service):
                 "Routing table has %s nodes in %s buckets (%s of which are full), and %s nodes "
                 "are in the replacement cache", total_nodes, len(self.routing.buckets),
                 len(full_buckets), nodes_in_replacement_cache)
+            cache_info = self.node_db.cache_info
+            self.logger.debug(
+                "Node DB cache has %d of %d ENRs, hit rate: %.1f%% (%d hits, %d misses)",
+                cache_info.size, cache_info.max_size, cache_info.hit_rate * 100,
+                cache_info.hits, cache_info.misses)
             self.logger.debug("===========================================================")
 
     def update_routing_table(self, node: NodeAPI) -> None:
@@ -379,7 +383,7 @@ class DiscoveryService(Service):
             return False
 
         try:
-            node = Node(self.node_db.get_enr(node_id))
+            node = self.node_db.get_node(node_id)
         except KeyError:
             self.logger.exception("Attempted to bond with node that doesn't exist in our DB")
             return False
@@ -653,7 +657,7 @@ class DiscoveryService(Service):
     def iter_nodes(self) -> Iterator[NodeAPI]:
         for node_id in self.routing.iter_all_random():
             try:
-                yield Node(self.node_db.get_enr(node_id))
+                yield self.node_db.get_node(node_id)
             except KeyError:
                 self.logger.exception(
                     "Node with ID %s is in routing table but not in node DB", encode_hex(node_id))
@@ -757,7 +761,7 @@ class DiscoveryService(Service):
             self.logger.warning("Ignoring uknown msg type: %s; payload=%s", cmd_id, payload)
             return
 
-        node = Node(self.lookup_and_maybe_update_enr(remote_pubkey, address))
+        node = self._lookup_and_maybe_update_node(remote_pubkey, address)
         self.logger.debug2("Received %s from %s with payload: %s", cmd.name, node, payload)
         handler = self._get_handler(cmd)
         await handler(node, payload, message_hash)
@@ -772,13 +776,18 @@ class DiscoveryService(Service):
         If the ENR in our DB has a different address, we create a stub ENR using the new address
         and overwrite the existing one with that.
         """
+        return self._lookup_and_maybe_update_node(pubkey, address).enr
+
+    def _lookup_and_maybe_update_node(
+            self, pubkey: datatypes.PublicKey, address: AddressAPI) -> NodeAPI:
         try:
-            enr = self.node_db.get_enr(node_id_from_pubkey(pubkey))
+            node = self.node_db.get_node(node_id_from_pubkey(pubkey))
         except KeyError:
             enr = create_stub_enr(pubkey, address)
             self.node_db.set_enr(enr)
-        else:
             node = Node(enr)
+        else:
+            enr = node.enr
             if node.address != address:
                 self.logger.debug(
                     "Received msg from %s, using an address (%s) different than what we have "
@@ -790,8 +799,9 @@ class DiscoveryService(Service):
                 self.node_db.delete_enr(enr.node_id)
                 enr = create_stub_enr(pubkey, address)
                 self.node_db.set_enr(enr)
+                node = Node(enr)
 
-        return enr
+        return node
 
     def _is_msg_expired(self, rlp_expiration: bytes) -> bool:
         expiration = rlp.sedes.big_endian_int.deserialize(rlp_expiration)
@@ -915,7 +925,7 @@ class DiscoveryService(Service):
         count = 0
         for node_id in self.routing.iter_nodes_around(target_id):
             try:
-                yield Node(self.node_db.get_enr(node_id))
+                yield self.node_db.get_node(node_id)
                 count += 1
             except KeyError:
                 self.logger.exception(
@@ -1,6 +1,7 @@
 from .abc import ExchangeAPI, PerformanceAPI, ValidatorAPI  # noqa: F401
 from .exchange import BaseExchange  # noqa: F401
 from .logic import ExchangeLogic  # noqa: F401
-from .normalizers import BaseNormalizer  # noqa: F401
+from .normalizers import BaseNormalizer, BaseParallelNormalizer  # noqa: F401
+from .pool import normalization_pool  # noqa: F401
 from .tracker import BasePerformanceTracker  # noqa: F401
 from .validator import noop_payload_validator  # noqa: F401
@@ -1,5 +1,6 @@
 import asyncio
 from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
 import logging
 from typing import (
     Callable,
@@ -20,6 +21,8 @@ from .abc import (
     PerformanceTrackerAPI,
     ResponseCandidateStreamAPI,
 )
+from .normalizers import BaseParallelNormalizer
+from .pool import get_normalization_pool
 from .typing import TRequestCommand, TResponseCommand
 
 
@@ -53,19 +56,13 @@ class ExchangeManager(ExchangeManagerAPI[TRequestCommand, TResponseCommand, TRes
                 f"Response stream closed before sending request to {self._connection}"
             )
 
-        loop = asyncio.get_event_loop()
-
         with futures.ThreadPoolExecutor() as executor:
             async for payload in stream.payload_candidates(request, tracker, timeout=timeout):
                 try:
                     payload_validator(payload)
 
                     if normalizer.is_normalization_slow:
-                        result = await loop.run_in_executor(
-                            executor,
-                            normalizer.normalize_result,
-                            payload
-                        )
+                        result = await self._normalize_slow(normalizer, payload, executor)
                     else:
                         result = normalizer.normalize_result(payload)
 
@@ -92,6 +89,27 @@ class ExchangeManager(ExchangeManagerAPI[TRequestCommand, TResponseCommand, TRes
 
         raise PeerConnectionLost(f"Response stream of {self._connection} was apparently closed")
 
+    async def _normalize_slow(
+            self,
+            normalizer: NormalizerAPI[TResponseCommand, TResult],
+            payload: TResponseCommand,
+            executor: futures.Executor) -> TResult:
+        loop = asyncio.get_event_loop()
+        pool = get_normalization_pool()
+
+        if pool is not None and isinstance(normalizer, BaseParallelNormalizer):
+            try:
+                computed = await loop.run_in_executor(pool, normalizer.compute, payload.payload)
+            except BrokenProcessPool:
+                self.logger.warning(
+                    "Normalization process pool is broken, normalizing %s in-process",
+                    type(payload).__name__,
+                )
+            else:
+                return normalizer.combine(payload, computed)
+
+        return await loop.run_in_executor(executor, normalizer.normalize_result, payload)
+
     @property
     def service(self) -> ResponseCandidateStreamAPI[TRequestCommand, TResponseCommand]:
         """
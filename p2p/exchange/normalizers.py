@@ -1,13 +1,49 @@
-from typing import Type, Callable
+from abc import abstractmethod
+from typing import Any, Callable, Generic, Type, TypeVar
 
 from .abc import NormalizerAPI
 from .typing import TResponseCommand, TResult
 
 
+TComputed = TypeVar('TComputed')
+
+
 class BaseNormalizer(NormalizerAPI[TResponseCommand, TResult]):
     is_normalization_slow = False
 
 
+class BaseParallelNormalizer(
+        BaseNormalizer[TResponseCommand, TResult],
+        Generic[TResponseCommand, TResult, TComputed]):
+    """
+    A slow normalizer whose expensive part can run in another process.
+
+    The expensive part, :meth:`compute`, only gets the command payload, and only returns the
+    derived data (like hashes and trie nodes). The payload is combined with the derived data
+    in the calling process, so it never needs to be sent back.
+    """
+    is_normalization_slow = True
+
+    @staticmethod
+    @abstractmethod
+    def compute(payload: Any) -> TComputed:
+        """
+        Derive the expensive part of the result from the payload. This must be a staticmethod
+        of a module-level class, so that it can be pickled and sent to a worker process.
+        """
+        ...
+
+    @abstractmethod
+    def combine(self, cmd: TResponseCommand, computed: TComputed) -> TResult:
+        """
+        Build the final result from the command and the output of :meth:`compute`
+        """
+        ...
+
+    def normalize_result(self, cmd: TResponseCommand) -> TResult:
+        return self.combine(cmd, self.compute(cmd.payload))
+
+
 def _pick_payload(cmd: TResponseCommand) -> TResult:
     return cmd.payload
 
@@ -0,0 +1,41 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+import contextlib
+from typing import Iterator, Optional
+
+
+# The process pool that parallel normalizers run in, see normalization_pool()
+_normalization_pool: Optional[Executor] = None
+
+
+def get_normalization_pool() -> Optional[Executor]:
+    """
+    Return the process pool for normalizing responses, or ``None`` if responses are
+    normalized in the process that requested them.
+    """
+    return _normalization_pool
+
+
+@contextlib.contextmanager
+def normalization_pool(num_workers: int) -> Iterator[Optional[Executor]]:
+    """
+    While the context is open, run the expensive part of any
+    :class:`~p2p.exchange.normalizers.BaseParallelNormalizer` in a pool of
+    ``num_workers`` processes. With no workers, responses are normalized in a thread of the
+    requesting process, as usual.
+    """
+    global _normalization_pool
+
+    if num_workers < 0:
+        raise ValueError(f"Number of normalization workers cannot be negative: {num_workers}")
+    elif num_workers == 0:
+        yield None
+        return
+    elif _normalization_pool is not None:
+        raise RuntimeError("A normalization pool is already running")
+
+    with ProcessPoolExecutor(num_workers) as pool:
+        _normalization_pool = pool
+        try:
+            yield pool
+        finally:
+            _normalization_pool = None
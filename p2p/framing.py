@@ -0,0 +1,229 @@
+import functools
+import hmac
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+import rlp
+import sha3
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from p2p._utils import roundup_16
+from p2p.abc import MessageAPI
+from p2p.constants import (
+    HEADER_LEN,
+    MAC_LEN,
+)
+from p2p.exceptions import (
+    DecryptionError,
+    MalformedMessage,
+)
+from p2p.message import Message
+
+
+HEADER_DATA_SEDES = rlp.sedes.List((rlp.sedes.big_endian_int, rlp.sedes.big_endian_int))
+
+# The encrypted header and its MAC, which precede every frame
+FRAME_HEADER_SIZE = HEADER_LEN + MAC_LEN
+
+_ZERO_PADDING = b'\x00' * 16
+
+
+@functools.lru_cache(256)
+def _decode_header_data(data: bytes) -> Tuple[int, int]:
+    header_data = rlp.decode(data, sedes=HEADER_DATA_SEDES, strict=False)
+    return header_data
+
+
+@functools.lru_cache(256)
+def _unpad_header_data(padded_header_data: bytes) -> bytes:
+    """
+    Recover the header data, without the padding, by decoding it and re-encoding it. Almost
+    all peers send the same header data, so this is cached.
+    """
+    try:
+        header_data = _decode_header_data(padded_header_data)
+    except rlp.exceptions.DeserializationError as err:
+        raise MalformedMessage(*err.args) from err
+    return rlp.encode(header_data)
+
+
+def _pad_16(data: bytes) -> bytes:
+    padding_size = -len(data) % 16
+    if padding_size:
+        return data + _ZERO_PADDING[:padding_size]
+    else:
+        return data
+
+
+def _xor_16(left: bytes, right: bytes) -> bytes:
+    xored = int.from_bytes(left, 'big') ^ int.from_bytes(right, 'big')
+    return xored.to_bytes(16, 'big')
+
+
+class FrameCodec:
+    """
+    Encrypt and authenticate RLPx frames in one direction, and decrypt and check them in the
+    other, keeping the AES and MAC state for a single connection.
+
+    Received bytes are fed in with :meth:`feed`, in chunks of any size. Every complete frame
+    in the fed bytes is decrypted at once, and returned as a message.
+    """
+    def __init__(self,
+                 aes_secret: bytes,
+                 mac_secret: bytes,
+                 egress_mac: sha3.keccak_256,
+                 ingress_mac: sha3.keccak_256) -> None:
+        # FIXME: Insecure Encryption: https://github.com/ethereum/devp2p/issues/32
+        iv = b"\x00" * 16
+        aes_cipher = Cipher(algorithms.AES(aes_secret), modes.CTR(iv), default_backend())
+        self._aes_enc = aes_cipher.encryptor().update
+        self._aes_dec = aes_cipher.decryptor().update
+
+        mac_cipher = Cipher(algorithms.AES(mac_secret), modes.ECB(), default_backend())
+        self._mac_enc = mac_cipher.encryptor().update
+
+        self._egress_mac = egress_mac
+        self._ingress_mac = ingress_mac
+
+        # Every MAC update is followed by taking a digest, so the latest digest of each MAC is
+        # kept, instead of computing it again when the next frame starts.
+        self._egress_digest = egress_mac.digest()[:MAC_LEN]
+        self._ingress_digest = ingress_mac.digest()[:MAC_LEN]
+
+        self._buffer = bytearray()
+        # The decrypted (frame size, header) of a frame whose body has not fully arrived yet
+        self._pending_header: Optional[Tuple[int, bytes]] = None
+
+    @property
+    def bytes_needed(self) -> int:
+        """
+        How many more bytes must be fed before the next frame (or its header) is complete
+        """
+        if self._pending_header is None:
+            needed = FRAME_HEADER_SIZE
+        else:
+            frame_size, _ = self._pending_header
+            needed = roundup_16(frame_size) + MAC_LEN
+        return max(0, needed - len(self._buffer))
+
+    def encrypt(self, header: bytes, body: bytes) -> bytes:
+        """
+        Encrypt one frame, padding the header and body to the 16-byte boundary.
+        """
+        padded_header = _pad_16(header)
+        if len(padded_header) != HEADER_LEN:
+            raise ValueError(f"Unexpected header length: {len(padded_header)}")
+
+        egress_mac = self._egress_mac
+        header_ciphertext = self._aes_enc(padded_header)
+        egress_mac.update(_xor_16(self._mac_enc(self._egress_digest), header_ciphertext))
+        header_mac = egress_mac.digest()[:MAC_LEN]
+
+        frame_ciphertext = self._aes_enc(_pad_16(body))
+        egress_mac.update(frame_ciphertext)
+        fmac_seed = egress_mac.digest()[:MAC_LEN]
+        egress_mac.update(_xor_16(self._mac_enc(fmac_seed), fmac_seed))
+        frame_mac = egress_mac.digest()[:MAC_LEN]
+        self._egress_digest = frame_mac
+
+        return b''.join((header_ciphertext, header_mac, frame_ciphertext, frame_mac))
+
+    def encrypt_message(self, message: MessageAPI) -> bytes:
+        return self.encrypt(message.header, message.body)
+
+    def decrypt_header(self, data: bytes) -> Tuple[int, bytes]:
+        """
+        Check the MAC of an encrypted frame header and decrypt it.
+
+        :return: the size of the frame body, and the unpadded header
+        """
+        if len(data) != FRAME_HEADER_SIZE:
+            raise ValueError(
+                f"Unexpected header length: {len(data)}, expected {HEADER_LEN} + {MAC_LEN}"
+            )
+
+        ingress_mac = self._ingress_mac
+        header_ciphertext = bytes(data[:HEADER_LEN])
+        header_mac = data[HEADER_LEN:]
+        ingress_mac.update(_xor_16(self._mac_enc(self._ingress_digest), header_ciphertext))
+        expected_header_mac = ingress_mac.digest()[:MAC_LEN]
+        # The ingress MAC was updated, so keep its digest even if the check fails
+        self._ingress_digest = expected_header_mac
+        if not hmac.compare_digest(expected_header_mac, header_mac):
+            raise DecryptionError(
+                f'Invalid header mac: expected {expected_header_mac.hex()}, '
+                f'got {bytes(header_mac).hex()}'
+            )
+
+        padded_header = self._aes_dec(header_ciphertext)
+        frame_size = int.from_bytes(padded_header[:3], 'big')
+        header = padded_header[:3] + _unpad_header_data(padded_header[3:])
+        return frame_size, header
+
+    def decrypt_body(self, data: bytes, body_size: int) -> bytes:
+        """
+        Check the MAC of an encrypted frame body and decrypt it, dropping the padding.
+        """
+        read_size = roundup_16(body_size)
+        if len(data) < read_size + MAC_LEN:
+            raise ValueError(
+                f'Insufficient body length; Got {len(data)}, wanted {read_size} + {MAC_LEN}'
+            )
+
+        ingress_mac = self._ingress_mac
+        frame_ciphertext = data[:read_size]
+        frame_mac = data[read_size:read_size + MAC_LEN]
+
+        ingress_mac.update(frame_ciphertext)
+        fmac_seed = ingress_mac.digest()[:MAC_LEN]
+        ingress_mac.update(_xor_16(self._mac_enc(fmac_seed), fmac_seed))
+        expected_frame_mac = ingress_mac.digest()[:MAC_LEN]
+        self._ingress_digest = expected_frame_mac
+        if not hmac.compare_digest(expected_frame_mac, frame_mac):
+            raise DecryptionError(
+                f'Invalid frame mac: expected {expected_frame_mac.hex()}, '
+                f'got {bytes(frame_mac).hex()}'
+            )
+        body = self._aes_dec(frame_ciphertext)
+        if len(body) == body_size:
+            return body
+        else:
+            return body[:body_size]
+
+    def feed(self, data: bytes) -> Tuple[MessageAPI, ...]:
+        """
+        Add received bytes, and decrypt all the frames that are now complete.
+
+        :return: the messages of the completed frames, in the order they were received
+        """
+        buffer = self._buffer
+        buffer += data
+
+        messages: List[MessageAPI] = []
+        offset = 0
+        with memoryview(buffer) as view:
+            while True:
+                if self._pending_header is None:
+                    if len(buffer) - offset < FRAME_HEADER_SIZE:
+                        break
+                    header_end = offset + FRAME_HEADER_SIZE
+                    self._pending_header = self.decrypt_header(view[offset:header_end])
+                    offset = header_end
+
+                frame_size, header = self._pending_header
+                body_end = offset + roundup_16(frame_size) + MAC_LEN
+                if len(buffer) < body_end:
+                    break
+                body = self.decrypt_body(view[offset:body_end], frame_size)
+                offset = body_end
+                self._pending_header = None
+
+                messages.append(Message(header, body))
+
+        del buffer[:offset]
+        return tuple(messages)
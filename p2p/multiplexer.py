@@ -197,6 +197,9 @@ class Multiplexer(MultiplexerAPI):
     def is_closing(self) -> bool:
         return self._transport.is_closing
 
+    async def drain(self) -> None:
+        await self._transport.drain()
+
     async def close(self) -> None:
         await self._transport.close()
 
@@ -5,26 +5,53 @@ from eth_utils.encoding import (
 
 from eth.abc import DatabaseAPI
 
+from lru import LRU
 import rlp
 
-from p2p.abc import NodeDBAPI
+from p2p.abc import NodeAPI, NodeDBAPI
+from p2p.constants import NODE_DB_CACHE_SIZE
 from p2p.enr import ENR
 from p2p.identity_schemes import IdentitySchemeRegistry
-from p2p.typing import NodeID
+from p2p.kademlia import Node
+from p2p.typing import CacheInfo, NodeID
 from p2p._utils import get_logger
 
 
 class NodeDB(NodeDBAPI):
+    """
+    Store ENRs and pong times of remote nodes.
 
-    def __init__(self, identity_scheme_registry: IdentitySchemeRegistry, db: DatabaseAPI) -> None:
+    Decoded ENRs, and the Nodes created from them, are kept in an LRU cache. Writes go through
+    the cache, so it never holds an ENR that differs from the one in the database.
+    """
+
+    def __init__(self,
+                 identity_scheme_registry: IdentitySchemeRegistry,
+                 db: DatabaseAPI,
+                 cache_size: int = NODE_DB_CACHE_SIZE) -> None:
         self.db = db
         self.logger = get_logger(".".join((self.__module__, self.__class__.__name__,)))
         self._identity_scheme_registry = identity_scheme_registry
+        self._cache_size = cache_size
+        self._enr_cache: 'LRU[NodeID, ENR]' = LRU(cache_size)
+        # Nodes are only created when asked for, from the cached ENR
+        self._node_cache: 'LRU[NodeID, NodeAPI]' = LRU(cache_size)
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     @property
     def identity_scheme_registry(self) -> IdentitySchemeRegistry:
         return self._identity_scheme_registry
 
+    @property
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            size=len(self._enr_cache),
+            max_size=self._cache_size,
+        )
+
     def validate_identity_scheme(self, enr: ENR) -> None:
         """Check that we know the identity scheme of the ENR.
 
@@ -41,7 +68,7 @@ class NodeDB(NodeDBAPI):
     def set_enr(self, enr: ENR) -> None:
         self.validate_identity_scheme(enr)
         try:
-            existing_enr = self.get_enr(enr.node_id)
+            existing_enr = self._get_enr(enr.node_id)
         except KeyError:
             existing_enr = None
         if existing_enr and existing_enr.sequence_number > enr.sequence_number:
@@ -49,11 +76,45 @@ class NodeDB(NodeDBAPI):
                 f"Cannot overwrite existing ENR ({existing_enr.sequence_number}) with old one "
                 f"({enr.sequence_number})")
         self.db.set(self._get_enr_key(enr.node_id), rlp.encode(enr))
+        self._enr_cache[enr.node_id] = enr
+        if enr != existing_enr and enr.node_id in self._node_cache:
+            del self._node_cache[enr.node_id]
 
     def get_enr(self, node_id: NodeID) -> ENR:
-        return rlp.decode(self.db[self._get_enr_key(node_id)], sedes=ENR)
+        if node_id in self._enr_cache:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+        return self._get_enr(node_id)
+
+    def _get_enr(self, node_id: NodeID) -> ENR:
+        # Like get_enr(), but without counting the lookup in the cache info
+        try:
+            return self._enr_cache[node_id]
+        except KeyError:
+            enr = rlp.decode(self.db[self._get_enr_key(node_id)], sedes=ENR)
+            self._enr_cache[node_id] = enr
+            return enr
+
+    def get_node(self, node_id: NodeID) -> NodeAPI:
+        try:
+            node = self._node_cache[node_id]
+        except KeyError:
+            # get_enr() counts the lookup, as a hit if the ENR is still cached
+            pass
+        else:
+            self._cache_hits += 1
+            return node
+
+        node = Node(self.get_enr(node_id))
+        self._node_cache[node_id] = node
+        return node
 
     def delete_enr(self, node_id: NodeID) -> None:
+        if node_id in self._enr_cache:
+            del self._enr_cache[node_id]
+        if node_id in self._node_cache:
+            del self._node_cache[node_id]
         del self.db[self._get_enr_key(node_id)]
 
     def set_last_pong_time(self, node_id: NodeID, last_pong: int) -> None:
@@ -43,10 +43,13 @@ class MemoryWriteTransport(asyncio.WriteTransport):
     #
     # WriteTransport methods
     #
-    # methods we don't overwrite because they already raise NotImplementedError
-    # and we don't need them
-    # - set_write_buffer_limits
-    # - get_write_buffer_size
+    # Data is fed to the reader right away, so nothing is ever buffered
+    def set_write_buffer_limits(self, high: int = None, low: int = None) -> None:
+        pass
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
     def write(self, data: bytes) -> None:
         self._reader.feed_data(data)
 
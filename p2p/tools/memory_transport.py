@@ -1,6 +1,6 @@
 import asyncio
 import struct
-from typing import Tuple
+from typing import Tuple, cast
 
 from cached_property import cached_property
 from eth_keys import datatypes
@@ -34,6 +34,7 @@ class MemoryTransport(TransportAPI):
         self._private_key = private_key
         self._reader = reader
         self._writer = writer
+        self._drain_lock = asyncio.Lock()
 
     @classmethod
     def connected_pair(cls,
@@ -90,6 +91,15 @@ class MemoryTransport(TransportAPI):
             return
         self.write(encoded_sizes + message.header + message.body)
 
+    @property
+    def queued_bytes(self) -> int:
+        write_transport = cast(asyncio.WriteTransport, self._writer.transport)
+        return write_transport.get_write_buffer_size()
+
+    async def drain(self) -> None:
+        async with self._drain_lock:
+            await self._writer.drain()
+
     async def close(self) -> None:
         """Close this peer's writer stream.
 
@@ -1,17 +1,10 @@
 import asyncio
-import functools
-import hmac
+import collections
 import secrets
-import struct
-from typing import ByteString, Tuple
+from typing import Deque, List, cast
 
 import sha3
 
-import rlp
-
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-
 from cached_property import cached_property
 
 from eth_keys import datatypes
@@ -22,10 +15,6 @@ from eth_utils import (
 )
 
 from p2p import auth
-from p2p._utils import (
-    roundup_16,
-    sxor,
-)
 from p2p.abc import MessageAPI, NodeAPI, TransportAPI
 from p2p.auth import (
     decode_authentication,
@@ -35,9 +24,10 @@ from p2p.constants import (
     CONN_IDLE_TIMEOUT,
     ENCRYPTED_AUTH_MSG_LEN,
     HASH_LEN,
-    HEADER_LEN,
-    MAC_LEN,
+    MAX_WRITE_BUFFER_SIZE,
     REPLY_TIMEOUT,
+    WRITE_BUFFER_HIGH_WATER,
+    WRITE_BUFFER_LOW_WATER,
 )
 from p2p.exceptions import (
     HandshakeFailure,
@@ -46,18 +36,13 @@ from p2p.exceptions import (
     PeerConnectionLost,
     UnreachablePeer,
 )
+from p2p.framing import FrameCodec
 from p2p.kademlia import Address, Node
-from p2p.message import Message
 from p2p.session import Session
 
 
-HEADER_DATA_SEDES = rlp.sedes.List((rlp.sedes.big_endian_int, rlp.sedes.big_endian_int))
-
-
-@functools.lru_cache(256)
-def _decode_header_data(data: ByteString) -> Tuple[int, int]:
-    header_data = rlp.decode(data, sedes=HEADER_DATA_SEDES, strict=False)
-    return header_data
+# Read up to this many bytes at a time, decrypting all the frames they complete at once
+RECV_CHUNK_SIZE = 64 * 1024
 
 
 class Transport(TransportAPI):
@@ -78,23 +63,27 @@ class Transport(TransportAPI):
         self._private_key = private_key
 
         # Encryption and Cryptography *stuff*
-        self._egress_mac = egress_mac
-        self._ingress_mac = ingress_mac
+        self._codec = FrameCodec(aes_secret, mac_secret, egress_mac, ingress_mac)
 
         self._reader = reader
         self._writer = writer
 
-        # FIXME: Insecure Encryption: https://github.com/ethereum/devp2p/issues/32
-        iv = b"\x00" * 16
-        aes_secret = aes_secret
-        mac_secret = mac_secret
+        # Messages that were decrypted from an earlier read, but not returned by recv() yet
+        self._received_messages: Deque[MessageAPI] = collections.deque()
+
+        # Encrypted frames waiting to be written together, at the next event loop iteration
+        self._outbound_frames: List[bytes] = []
+        self._outbound_size = 0
 
-        aes_cipher = Cipher(algorithms.AES(aes_secret), modes.CTR(iv), default_backend())
-        self._aes_enc = aes_cipher.encryptor()
-        self._aes_dec = aes_cipher.decryptor()
+        # StreamWriter.drain() only supports one waiter at a time, so drain() callers queue up
+        self._drain_lock = asyncio.Lock()
 
-        mac_cipher = Cipher(algorithms.AES(mac_secret), modes.ECB(), default_backend())
-        self._mac_enc = mac_cipher.encryptor().update
+        # drain() waits while more than the high water mark is buffered, until at most the
+        # low water mark is left.
+        self._write_transport.set_write_buffer_limits(
+            high=WRITE_BUFFER_HIGH_WATER,
+            low=WRITE_BUFFER_LOW_WATER,
+        )
 
     @classmethod
     async def connect(cls, remote: NodeAPI, private_key: datatypes.PrivateKey) -> TransportAPI:
@@ -241,50 +230,102 @@ class Transport(TransportAPI):
         self._writer.write(data)
 
     async def recv(self) -> MessageAPI:
-        header_bytes = await self.read(HEADER_LEN + MAC_LEN)
-        try:
-            padded_header = self._decrypt_header(header_bytes)
-        except (ValueError, DecryptionError) as err:
-            self.logger.info("Bad message header from peer %s: Error: %r", self, err)
-            raise MalformedMessage(*err.args) from err
-        # TODO: use `int.from_bytes(...)`
-        frame_size = self._get_frame_size(padded_header)
-        # The frame_size specified in the header does not include the padding to 16-byte boundary,
-        # so need to do this here to ensure we read all the frame's data.
-        read_size = roundup_16(frame_size)
-        frame_data = await self.read(read_size + MAC_LEN)
-        try:
-            body = self._decrypt_body(frame_data, frame_size)
-        except (ValueError, DecryptionError) as err:
-            self.logger.info("Bad message body from peer %s: Error: %r", self, err)
-            raise MalformedMessage(*err.args) from err
+        while not self._received_messages:
+            data = await self._read_available(max(self._codec.bytes_needed, RECV_CHUNK_SIZE))
+            try:
+                messages = self._codec.feed(data)
+            except (ValueError, DecryptionError) as err:
+                self.logger.info("Bad message from peer %s: Error: %r", self, err)
+                raise MalformedMessage(*err.args) from err
+            self._received_messages.extend(messages)
 
-        # Decode the header data and re-encode to recover the unpadded header size.
-        try:
-            header_data = _decode_header_data(padded_header[3:])
-        except rlp.exceptions.DeserializationError as err:
-            raise MalformedMessage(*err.args) from err
+        return self._received_messages.popleft()
 
-        header = padded_header[:3] + rlp.encode(header_data)
+    async def _read_available(self, n: int) -> bytes:
+        """
+        Wait for some bytes from the remote, and return up to ``n`` of them.
+        """
+        try:
+            data = await asyncio.wait_for(self._reader.read(n), timeout=CONN_IDLE_TIMEOUT)
+        except (ConnectionResetError, BrokenPipeError) as err:
+            raise PeerConnectionLost(f"Lost connection to {self.remote}") from err
 
-        return Message(header, body)
+        if not data:
+            raise PeerConnectionLost(f"Lost connection to {self.remote}")
+        return data
 
     def send(self, message: MessageAPI) -> None:
-        header = message.header.ljust(roundup_16(len(message.header)), b'\x00')
-        body = message.body.ljust(roundup_16(len(message.body)), b'\x00')
+        """
+        Encrypt the message and queue it, to be written along with any other messages sent
+        during this iteration of the event loop.
+
+        Raise ``PeerConnectionLost`` if the transport is closing, or if the remote is too far
+        behind reading what was already sent, in which case the transport is also closed.
+        """
         if self.is_closing:
             raise PeerConnectionLost(
                 f"Attempted to send msg with cmd id {message.command_id} to "
                 f"{self.remote} but transport is closing"
             )
 
-        self.write(self._encrypt(header, body))
+        frame = self._codec.encrypt_message(message)
+        if not self._outbound_frames:
+            asyncio.get_event_loop().call_soon(self._flush_outbound_frames)
+        self._outbound_frames.append(frame)
+        self._outbound_size += len(frame)
+
+        queued_bytes = self.queued_bytes
+        if queued_bytes > MAX_WRITE_BUFFER_SIZE:
+            self.logger.info(
+                "Closing connection to %s, which has %d unsent bytes queued up",
+                self.remote,
+                queued_bytes,
+            )
+            self._outbound_frames.clear()
+            self._outbound_size = 0
+            self._write_transport.abort()
+            raise PeerConnectionLost(
+                f"{self.remote} is not keeping up with the messages being sent to it"
+            )
+
+    @property
+    def queued_bytes(self) -> int:
+        """
+        The number of bytes that were sent, but not yet written to the socket
+        """
+        return self._outbound_size + self._write_transport.get_write_buffer_size()
+
+    async def drain(self) -> None:
+        """
+        Write all queued messages. If more than the high water mark of bytes is buffered, wait
+        until the remote has read enough of them to get below the low water mark.
+        """
+        self._flush_outbound_frames()
+        async with self._drain_lock:
+            try:
+                await self._writer.drain()
+            except (ConnectionResetError, BrokenPipeError) as err:
+                raise PeerConnectionLost(f"Lost connection to {self.remote}") from err
+
+    def _flush_outbound_frames(self) -> None:
+        if not self._outbound_frames:
+            return
+        elif len(self._outbound_frames) == 1:
+            data = self._outbound_frames[0]
+        else:
+            data = b''.join(self._outbound_frames)
+
+        self._outbound_frames.clear()
+        self._outbound_size = 0
+        if not self.is_closing:
+            self.write(data)
 
     async def close(self) -> None:
         """Close this peer's writer stream.
 
         This will cause the peer to stop in case it is running.
         """
+        self._flush_outbound_frames()
         try:
             await self._writer.drain()
         except (ConnectionResetError, BrokenPipeError) as e:
@@ -295,66 +336,6 @@ class Transport(TransportAPI):
     def is_closing(self) -> bool:
         return self._writer.transport.is_closing()
 
-    def _encrypt(self, header: bytes, frame: bytes) -> bytes:
-        if len(header) != HEADER_LEN:
-            raise ValueError(f"Unexpected header length: {len(header)}")
-
-        header_ciphertext = self._aes_enc.update(header)
-        mac_secret = self._egress_mac.digest()[:HEADER_LEN]
-        self._egress_mac.update(sxor(self._mac_enc(mac_secret), header_ciphertext))
-        header_mac = self._egress_mac.digest()[:HEADER_LEN]
-
-        frame_ciphertext = self._aes_enc.update(frame)
-        self._egress_mac.update(frame_ciphertext)
-        fmac_seed = self._egress_mac.digest()[:HEADER_LEN]
-
-        mac_secret = self._egress_mac.digest()[:HEADER_LEN]
-        self._egress_mac.update(sxor(self._mac_enc(mac_secret), fmac_seed))
-        frame_mac = self._egress_mac.digest()[:HEADER_LEN]
-
-        return header_ciphertext + header_mac + frame_ciphertext + frame_mac
-
-    def _decrypt_header(self, data: bytes) -> bytes:
-        if len(data) != HEADER_LEN + MAC_LEN:
-            raise ValueError(
-                f"Unexpected header length: {len(data)}, expected {HEADER_LEN} + {MAC_LEN}"
-            )
-
-        header_ciphertext = data[:HEADER_LEN]
-        header_mac = data[HEADER_LEN:]
-        mac_secret = self._ingress_mac.digest()[:HEADER_LEN]
-        aes = self._mac_enc(mac_secret)[:HEADER_LEN]
-        self._ingress_mac.update(sxor(aes, header_ciphertext))
-        expected_header_mac = self._ingress_mac.digest()[:HEADER_LEN]
-        if not hmac.compare_digest(expected_header_mac, header_mac):
-            raise DecryptionError(
-                f'Invalid header mac: expected {expected_header_mac.hex()}, got {header_mac.hex()}'
-            )
-        return self._aes_dec.update(header_ciphertext)
-
-    def _decrypt_body(self, data: bytes, body_size: int) -> bytes:
-        read_size = roundup_16(body_size)
-        if len(data) < read_size + MAC_LEN:
-            raise ValueError(
-                f'Insufficient body length; Got {len(data)}, wanted {read_size} + {MAC_LEN}'
-            )
-
-        frame_ciphertext = data[:read_size]
-        frame_mac = data[read_size:read_size + MAC_LEN]
-
-        self._ingress_mac.update(frame_ciphertext)
-        fmac_seed = self._ingress_mac.digest()[:MAC_LEN]
-        self._ingress_mac.update(sxor(self._mac_enc(fmac_seed), fmac_seed))
-        expected_frame_mac = self._ingress_mac.digest()[:MAC_LEN]
-        if not hmac.compare_digest(expected_frame_mac, frame_mac):
-            raise DecryptionError(
-                f'Invalid frame mac: expected {expected_frame_mac.hex()}, got {frame_mac.hex()}'
-            )
-        return self._aes_dec.update(frame_ciphertext)[:body_size]
-
-    def _get_frame_size(self, header: bytes) -> int:
-        # The frame size is encoded in the header as a 3-byte int, so before we unpack we need
-        # to prefix it with an extra byte.
-        encoded_size = b'\x00' + header[:3]
-        (size,) = struct.unpack(b'>I', encoded_size)
-        return size
+    @property
+    def _write_transport(self) -> asyncio.WriteTransport:
+        return cast(asyncio.WriteTransport, self._writer.transport)
@@ -20,3 +20,18 @@ class SessionKeys(NamedTuple):
     encryption_key: AES128Key
     decryption_key: AES128Key
     auth_response_key: AES128Key
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        else:
+            return self.hits / lookups
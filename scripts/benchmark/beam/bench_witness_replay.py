@@ -0,0 +1,254 @@
+import argparse
+from collections import Counter
+import logging
+from pathlib import Path
+import statistics
+import sys
+import time
+
+from eth.chains.base import Chain
+from eth.db.atomic import AtomicDB
+from eth.db.chain import ChainDB
+from eth_hash.auto import keccak
+from eth_utils import ValidationError
+
+from trinity.network_configurations import PRECONFIGURED_NETWORKS
+from trinity.sync.beam.witness import read_block_witnesses
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+# Opcode categories of the yellow paper, by the first opcode of each category. Storage
+# access is split from the rest of its category, because it is where beam sync is slowest.
+OPCODE_CATEGORIES = (
+    (0x00, 'arithmetic'),
+    (0x10, 'comparison & bitwise'),
+    (0x20, 'sha3'),
+    (0x30, 'environment'),
+    (0x40, 'block'),
+    (0x50, 'stack, memory & flow'),
+    (0x54, 'storage'),
+    (0x56, 'stack, memory & flow'),
+    (0x60, 'push, dup & swap'),
+    (0xa0, 'logging'),
+    (0xf0, 'system'),
+)
+
+
+def get_opcode_category(opcode):
+    category = None
+    for first_opcode, category_name in OPCODE_CATEGORIES:
+        if opcode < first_opcode:
+            break
+        category = category_name
+    return category
+
+
+class ExecutionTimer:
+    """
+    Collect the time spent in each transaction, and in each category of opcodes. The time
+    of an opcode excludes the time of the opcodes in the child computations it runs, so
+    that a CALL does not count the whole call as system time.
+    """
+    def __init__(self):
+        self.transaction_seconds = []
+        self.opcode_seconds = Counter()
+        self.opcode_counts = Counter()
+        # Time spent in child computations, for each opcode in progress
+        self._nested_seconds = [0.0]
+
+    def time_opcode(self, category, opcode_fn, computation):
+        self._nested_seconds.append(0.0)
+        start = time.perf_counter()
+        try:
+            return opcode_fn(computation=computation)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.opcode_seconds[category] += elapsed - self._nested_seconds.pop()
+            self.opcode_counts[category] += 1
+            self._nested_seconds[-1] += elapsed
+
+
+class TimedOpcode:
+    def __init__(self, opcode_fn, category, timer):
+        self.mnemonic = opcode_fn.mnemonic
+        self.gas_cost = opcode_fn.gas_cost
+        self._opcode_fn = opcode_fn
+        self._category = category
+        self._timer = timer
+
+    def __call__(self, computation):
+        return self._timer.time_opcode(self._category, self._opcode_fn, computation)
+
+
+def make_timed_vm_class(vm_class, timer):
+    state_class = vm_class.get_state_class()
+    computation_class = state_class.computation_class
+    timed_computation_class = computation_class.configure(
+        __name__=f'Timed{computation_class.__name__}',
+        opcodes={
+            opcode: TimedOpcode(opcode_fn, get_opcode_category(opcode), timer)
+            for opcode, opcode_fn in computation_class.opcodes.items()
+        },
+    )
+    timed_state_class = state_class.configure(
+        __name__=f'Timed{state_class.__name__}',
+        computation_class=timed_computation_class,
+    )
+
+    class TimedVM(vm_class):
+        _state_class = timed_state_class
+
+        def apply_transaction(self, header, transaction):
+            start = time.perf_counter()
+            try:
+                return super().apply_transaction(header, transaction)
+            finally:
+                timer.transaction_seconds.append(time.perf_counter() - start)
+
+    return TimedVM
+
+
+def replay_witnesses(witness_file, vm_configuration, chain_id, first_block, last_block):
+    timer = ExecutionTimer()
+    ReplayChain = Chain.configure(
+        __name__='ReplayChain',
+        vm_configuration=tuple(
+            (block_number, make_timed_vm_class(vm_class, timer))
+            for block_number, vm_class in vm_configuration
+        ),
+        chain_id=chain_id,
+    )
+    db = AtomicDB()
+    chaindb = ChainDB(db)
+    chain = ReplayChain(db)
+
+    num_blocks = 0
+    total_import_seconds = 0.0
+    with witness_file.open('rb') as stream:
+        for witness in read_block_witnesses(stream):
+            if witness.block_number < first_block:
+                continue
+            elif last_block is not None and witness.block_number > last_block:
+                break
+
+            if chaindb.header_exists(witness.parent_header.hash):
+                # The parent was imported from the previous witness
+                pass
+            elif witness.parent_header.block_number == 0:
+                chaindb.persist_header(witness.parent_header)
+            else:
+                chaindb.persist_checkpoint_header(
+                    witness.parent_header,
+                    witness.parent_header.difficulty,
+                )
+            with db.atomic_batch() as batch:
+                for node in witness.nodes:
+                    batch[keccak(node)] = node
+
+            vm_class = chain.get_vm_class_for_block_number(witness.block_number)
+            block = witness.get_block(vm_class.get_block_class())
+
+            num_transactions = len(timer.transaction_seconds)
+            start = time.perf_counter()
+            # Seals were validated when the block was first imported, and uncle validation
+            # needs ancestors that were not recorded.
+            imported_block = chain.import_block(block, perform_validation=False).imported_block
+            import_seconds = time.perf_counter() - start
+            if imported_block.header != block.header:
+                raise ValidationError(
+                    f"Replay of {block} produced a different header: {imported_block.header}"
+                )
+
+            num_blocks += 1
+            total_import_seconds += import_seconds
+            logger.info(
+                "#%-9d %4d txns %12s gas %6d nodes %9d bytes %8.3fs",
+                block.number,
+                len(timer.transaction_seconds) - num_transactions,
+                f'{block.header.gas_used:,d}',
+                len(witness.nodes),
+                sum(len(node) for node in witness.nodes),
+                import_seconds,
+            )
+
+    return num_blocks, total_import_seconds, timer
+
+
+def report(num_blocks, total_import_seconds, timer):
+    logger.info("\n%d blocks imported in %.3fs", num_blocks, total_import_seconds)
+    if not num_blocks:
+        return
+
+    transaction_seconds = timer.transaction_seconds
+    if transaction_seconds:
+        logger.info(
+            "%d transactions: mean %.2fms, median %.2fms, max %.2fms\n",
+            len(transaction_seconds),
+            1000 * statistics.mean(transaction_seconds),
+            1000 * statistics.median(transaction_seconds),
+            1000 * max(transaction_seconds),
+        )
+
+    total_opcode_seconds = sum(timer.opcode_seconds.values())
+    logger.info("%-22s | %12s | %10s | %6s", "Opcode category", "Count", "Time (s)", "Share")
+    logger.info("%s", "-" * 60)
+    for category, seconds in timer.opcode_seconds.most_common():
+        logger.info(
+            "%-22s | %12d | %10.3f | %5.1f%%",
+            category,
+            timer.opcode_counts[category],
+            seconds,
+            100 * seconds / total_opcode_seconds,
+        )
+
+
+parser = argparse.ArgumentParser(description='Beam Sync Witness Replay Benchmark')
+parser.add_argument(
+    'witness_file',
+    type=Path,
+    help="File of block witnesses, recorded with --record-beam-witnesses",
+)
+parser.add_argument(
+    '--network-id',
+    type=int,
+    required=False,
+    default=1,
+    choices=sorted(PRECONFIGURED_NETWORKS),
+    help="Network that the witnesses were recorded on",
+)
+parser.add_argument(
+    '--first-block',
+    type=int,
+    required=False,
+    default=0,
+    help="Number of the first recorded block to import",
+)
+parser.add_argument(
+    '--last-block',
+    type=int,
+    required=False,
+    default=None,
+    help="Number of the last recorded block to import",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Replaying beam imports of %s against an in-memory database\n*****************************\n",  # noqa: E501
+        args.witness_file,
+    )
+    report(*replay_witnesses(
+        args.witness_file,
+        PRECONFIGURED_NETWORKS[args.network_id].vm_configuration,
+        args.network_id,
+        args.first_block,
+        args.last_block,
+    ))
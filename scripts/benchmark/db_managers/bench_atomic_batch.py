@@ -0,0 +1,136 @@
+import argparse
+import itertools
+import logging
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+from eth.db.atomic import AtomicDB
+
+from trinity._utils.socket import BufferedSocket
+from trinity.db.manager import DBManager
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+KEY_SIZE = 32
+
+KB = 1024
+MB = 1024 * KB
+# Payload sizes go from 1 KB to 64 MB, in steps of 4x
+PAYLOAD_SIZES = tuple(KB * 4 ** exponent for exponent in range(9))
+
+
+class PreviousBufferedSocket:
+    """
+    The previous BufferedSocket implementation, for comparison. It receives 4096 bytes
+    at a time, and copies the rest of the buffer on every read.
+    """
+    def __init__(self, sock):
+        self._socket = sock
+        self._buffer = bytearray()
+        self.sendall = sock.sendall
+
+    def read_exactly(self, num_bytes):
+        while len(self._buffer) < num_bytes:
+
+            data = self._socket.recv(4096)
+
+            if data == b"":
+                raise OSError("Connection closed")
+
+            self._buffer.extend(data)
+        payload = self._buffer[:num_bytes]
+        self._buffer = self._buffer[num_bytes:]
+        return bytes(payload)
+
+
+def encode_atomic_batch(payload_size, value_size):
+    """
+    Encode an ATOMIC_BATCH request (without the operation byte) the same way DBClient
+    does, writing ``payload_size`` bytes of keys and values.
+    """
+    num_items = max(1, payload_size // (KEY_SIZE + value_size))
+    value = os.urandom(value_size)
+    kv_pairs = tuple(
+        (index.to_bytes(KEY_SIZE, 'big'), value) for index in range(num_items)
+    )
+    kv_sizes = tuple(len(item) for item in itertools.chain(*kv_pairs))
+    fmt_str = '<II' + 'I' * len(kv_sizes)
+    size_data = struct.pack(fmt_str, num_items, 0, *kv_sizes)
+    return num_items * (KEY_SIZE + value_size), size_data + b''.join(itertools.chain(*kv_pairs))
+
+
+def measure_handler(request_data, use_previous, num_rounds):
+    best_duration = float('inf')
+    for _ in range(num_rounds):
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            manager = DBManager(AtomicDB())
+            if use_previous:
+                sock = PreviousBufferedSocket(receiver)
+            else:
+                sock = BufferedSocket(receiver)
+
+            # Send from another thread, like a client in another process would
+            sender_thread = threading.Thread(target=sender.sendall, args=(request_data,))
+
+            start = time.perf_counter()
+            sender_thread.start()
+            manager.handle_ATOMIC_BATCH(sock)
+            best_duration = min(best_duration, time.perf_counter() - start)
+
+            sender_thread.join()
+
+    return best_duration
+
+
+parser = argparse.ArgumentParser(description='Database Manager ATOMIC_BATCH Benchmark')
+parser.add_argument(
+    '--num-rounds',
+    type=int,
+    required=False,
+    default=3,
+    help=(
+        "Number of atomic batches to handle at each payload size. The fastest one is reported."
+    ),
+)
+parser.add_argument(
+    '--value-size',
+    type=int,
+    required=False,
+    default=512,
+    help=(
+        "Size of each value in the batch. The default is a typical trie node size."
+    ),
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running ATOMIC_BATCH handler benchmark:\n - payloads from 1 KB to 64 MB\n - %d byte values\n - best of %d rounds\n*****************************\n",  # noqa: E501
+        args.value_size,
+        args.num_rounds,
+    )
+    logger.info("%12s  %14s  %14s  %8s", "payload", "current MB/s", "previous MB/s", "speedup")
+    for payload_size in PAYLOAD_SIZES:
+        transferred_size, request_data = encode_atomic_batch(payload_size, args.value_size)
+        current_duration = measure_handler(request_data, False, args.num_rounds)
+        previous_duration = measure_handler(request_data, True, args.num_rounds)
+        logger.info(
+            "%9d KB  %14.1f  %14.1f  %7.2fx",
+            payload_size // KB,
+            transferred_size / current_duration / MB,
+            transferred_size / previous_duration / MB,
+            previous_duration / current_duration,
+        )
+    logger.info('\n')
@@ -9,6 +9,8 @@ import sys
 import tempfile
 import time
 
+from eth_utils.toolz import partition_all
+
 from eth.db.backends.level import LevelDB
 
 from trinity.db.manager import (
@@ -24,6 +26,9 @@ handler_stream.setLevel(logging.INFO)
 
 logger.addHandler(handler_stream)
 
+# Batch sizes are measured in powers of two, up to this size
+MAX_BATCH_SIZE = 1024
+
 
 def random_bytes(num):
     return random.getrandbits(8 * num).to_bytes(num, 'little')
@@ -65,6 +70,39 @@ def run_client(ipc_path, client_id, num_operations):
     )
 
 
+def run_batch_client(ipc_path, client_id, num_operations):
+    keys = tuple(random_bytes(32) for i in range(num_operations))
+
+    db_client = DBClient.connect(ipc_path)
+    # Half of the keys are present, the other half are missing
+    with db_client.atomic_batch() as batch:
+        for key in keys[::2]:
+            batch[key] = random_bytes(256)
+
+    batch_size = 1
+    while batch_size <= MAX_BATCH_SIZE:
+        batches = tuple(partition_all(batch_size, keys))
+
+        start = time.perf_counter()
+        for batch_keys in batches:
+            db_client.multi_get(batch_keys)
+        multi_get_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for batch_keys in batches:
+            db_client.multi_exists(batch_keys)
+        multi_exists_duration = time.perf_counter() - start
+
+        logger.info(
+            "Client %d: batch size %4d: %d multi_get keys per second, %d multi_exists keys per second",  # noqa: E501
+            client_id,
+            batch_size,
+            num_operations / multi_get_duration,
+            num_operations / multi_exists_duration,
+        )
+        batch_size *= 2
+
+
 parser = argparse.ArgumentParser(description='Database Manager Benchmark')
 parser.add_argument(
     '--num-clients',
@@ -84,14 +122,29 @@ parser.add_argument(
         "Number of set+get operations that should be performed for each client"
     ),
 )
+parser.add_argument(
+    '--batch',
+    action='store_true',
+    help=(
+        "Measure keys per second of multi_get and multi_exists with batch sizes "
+        f"from 1 to {MAX_BATCH_SIZE}, instead of single set+get operations"
+    ),
+)
 
 
 if __name__ == '__main__':
     args = parser.parse_args()
+    if args.batch:
+        client_fn = run_batch_client
+        operation_name = "batched get/exists keys"
+    else:
+        client_fn = run_client
+        operation_name = "get-set operations"
     logger.info(
-        "Running database manager benchmark:\n - %d client(s)\n - %d get-set operations\n*****************************\n",  # noqa: E501
+        "Running database manager benchmark:\n - %d client(s)\n - %d %s\n*****************************\n",  # noqa: E501
         args.num_clients,
         args.num_operations,
+        operation_name,
     )
     with tempfile.TemporaryDirectory() as ipc_base_dir:
         ipc_path = pathlib.Path(ipc_base_dir) / 'db.ipc'
@@ -100,7 +153,7 @@ if __name__ == '__main__':
 
         clients = [
             multiprocessing.Process(
-                target=run_client,
+                target=client_fn,
                 args=(ipc_path, client_id, args.num_operations),
             ) for client_id in range(args.num_clients)
         ]
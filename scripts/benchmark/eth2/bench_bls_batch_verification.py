@@ -0,0 +1,121 @@
+import argparse
+import logging
+import sys
+import time
+
+from eth2._utils.bls import SignatureBatch, bls
+from eth2._utils.bls.backends import AVAILABLE_BACKENDS, NoOpBackend
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+BACKENDS = {
+    backend.__name__: backend for backend in AVAILABLE_BACKENDS if backend is not NoOpBackend
+}
+BATCH_SIZES = (8, 32, 128)
+
+
+def mk_signature_sets(batch_size, committee_size, message_count):
+    signature_sets = []
+    for index in range(batch_size):
+        message = (index % message_count).to_bytes(32, 'little')
+        privkeys = range(
+            index * committee_size + 1,
+            (index + 1) * committee_size + 1,
+        )
+        pubkeys = tuple(bls.sk_to_pk(privkey) for privkey in privkeys)
+        signature = bls.aggregate(*(bls.sign(privkey, message) for privkey in privkeys))
+        signature_sets.append((pubkeys, message, signature))
+    return signature_sets
+
+
+def measure_individual_verification(signature_sets):
+    start = time.perf_counter()
+    for pubkeys, message, signature in signature_sets:
+        if not bls.fast_aggregate_verify(message, signature, *pubkeys):
+            raise Exception("Invalid signature")
+    return time.perf_counter() - start
+
+
+def measure_batch_verification(signature_sets):
+    start = time.perf_counter()
+    batch = SignatureBatch()
+    for pubkeys, message, signature in signature_sets:
+        batch.add(message, signature, *pubkeys)
+    if batch.get_invalid_indices():
+        raise Exception("Invalid signature batch")
+    return time.perf_counter() - start
+
+
+parser = argparse.ArgumentParser(description='BLS batch verification benchmark')
+parser.add_argument(
+    '--backends',
+    choices=tuple(BACKENDS),
+    nargs='+',
+    required=False,
+    default=tuple(BACKENDS),
+    help="BLS backends to benchmark",
+)
+parser.add_argument(
+    '--batch-sizes',
+    type=int,
+    nargs='+',
+    required=False,
+    default=BATCH_SIZES,
+    help="Numbers of signatures verified together",
+)
+parser.add_argument(
+    '--committee-size',
+    type=int,
+    required=False,
+    default=1,
+    help="Number of public keys of each (aggregate) signature",
+)
+parser.add_argument(
+    '--message-count',
+    type=int,
+    required=False,
+    default=None,
+    help="Number of distinct messages in a batch, defaults to one per signature",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    logger.info(
+        "Running BLS batch verification benchmark:\n - %s signatures per batch\n - %d public keys per signature\n*****************************\n",  # noqa: E501
+        ', '.join(str(size) for size in args.batch_sizes),
+        args.committee_size,
+    )
+    logger.info(
+        "%16s  %10s  %14s  %14s  %8s",
+        "backend",
+        "signatures",
+        "batch sigs/s",
+        "single sigs/s",
+        "speedup",
+    )
+    for backend_name in args.backends:
+        bls.use(BACKENDS[backend_name])
+        for batch_size in args.batch_sizes:
+            message_count = args.message_count or batch_size
+            signature_sets = mk_signature_sets(batch_size, args.committee_size, message_count)
+
+            batch_duration = measure_batch_verification(signature_sets)
+            individual_duration = measure_individual_verification(signature_sets)
+
+            logger.info(
+                "%16s  %10d  %14.1f  %14.1f  %7.2fx",
+                backend_name,
+                batch_size,
+                batch_size / batch_duration,
+                batch_size / individual_duration,
+                individual_duration / batch_duration,
+            )
+    logger.info('\n')
@@ -0,0 +1,107 @@
+import argparse
+import logging
+import sys
+import time
+
+from eth2.beacon.state_machines.forks.medalla.configs import MEDALLA_CONFIG
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    EpochsContext,
+    process_epoch,
+)
+from eth2.beacon.state_machines.forks.medalla.vectorized_epoch import (
+    process_epoch as vectorized_process_epoch,
+)
+from eth2.beacon.tools.builder.state import (
+    create_mock_epoch_transition_state,
+    create_mock_genesis_state_from_validators,
+)
+from eth2.beacon.tools.misc.ssz_vector import override_lengths
+from eth2.beacon.types.eth1_data import Eth1Data
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+VALIDATOR_COUNTS = (16384, 100000, 300000)
+
+# Far enough from genesis to have rewards, and to not be in an inactivity leak
+EPOCH = 10
+FINALIZED_EPOCH = 8
+
+
+def mk_state(validator_count, config):
+    genesis_state = create_mock_genesis_state_from_validators(
+        0, Eth1Data.create(), (), (), config,
+    )
+    return create_mock_epoch_transition_state(
+        genesis_state, validator_count, EPOCH, FINALIZED_EPOCH, config,
+    )
+
+
+def measure_epoch_processing(epoch_processor, state, config, num_rounds):
+    epochs_ctx = EpochsContext(config)
+    epochs_ctx.load_state(state)
+
+    best_duration = float('inf')
+    for _ in range(num_rounds):
+        start = time.perf_counter()
+        post_state = epoch_processor(epochs_ctx, state, config)
+        best_duration = min(best_duration, time.perf_counter() - start)
+
+    return best_duration, post_state
+
+
+parser = argparse.ArgumentParser(description='Epoch processing benchmark')
+parser.add_argument(
+    '--num-rounds',
+    type=int,
+    required=False,
+    default=3,
+    help="Number of epoch transitions at each validator count. The fastest one is reported.",
+)
+parser.add_argument(
+    '--validator-counts',
+    type=int,
+    nargs='+',
+    required=False,
+    default=VALIDATOR_COUNTS,
+    help="Numbers of validators in the state",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    config = MEDALLA_CONFIG
+    override_lengths(config)
+
+    logger.info(
+        "Running epoch processing benchmark:\n - %s validators\n - best of %d rounds\n*****************************\n",  # noqa: E501
+        ', '.join(str(count) for count in args.validator_counts),
+        args.num_rounds,
+    )
+    logger.info("%10s  %12s  %12s  %8s", "validators", "vectorized s", "fastspec s", "speedup")
+    for validator_count in args.validator_counts:
+        state = mk_state(validator_count, config)
+        vectorized_duration, vectorized_state = measure_epoch_processing(
+            vectorized_process_epoch, state, config, args.num_rounds,
+        )
+        fastspec_duration, fastspec_state = measure_epoch_processing(
+            process_epoch, state, config, args.num_rounds,
+        )
+        if vectorized_state.hash_tree_root != fastspec_state.hash_tree_root:
+            raise Exception(
+                f"Vectorized epoch processing differs with {validator_count} validators"
+            )
+
+        logger.info(
+            "%10d  %12.3f  %12.3f  %7.2fx",
+            validator_count,
+            vectorized_duration,
+            fastspec_duration,
+            fastspec_duration / vectorized_duration,
+        )
+    logger.info('\n')
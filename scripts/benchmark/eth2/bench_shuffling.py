@@ -0,0 +1,91 @@
+import argparse
+import logging
+import os
+import sys
+import time
+
+from eth2.beacon.state_machines.forks.medalla.configs import MEDALLA_CONFIG
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    _inner_shuffle_list,
+    compute_shuffling,
+)
+from eth2.beacon.state_machines.forks.medalla.vectorized_shuffling import (
+    inner_shuffle_list,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+LIST_SIZES = (16384, 100000, 300000)
+
+
+def measure_unshuffle(shuffle_fn, indices, seed, config):
+    shuffling = list(indices)
+    start = time.perf_counter()
+    shuffle_fn(shuffling, seed, False, config)
+    return time.perf_counter() - start, shuffling
+
+
+def measure_cached_shuffling(indices, seed, config):
+    # The first call fills the cache
+    compute_shuffling(indices, seed, config)
+    start = time.perf_counter()
+    compute_shuffling(list(indices), seed, config)
+    return time.perf_counter() - start
+
+
+parser = argparse.ArgumentParser(description='Committee shuffling benchmark')
+parser.add_argument(
+    '--list-sizes',
+    type=int,
+    nargs='+',
+    required=False,
+    default=LIST_SIZES,
+    help="Numbers of active validators to shuffle",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    config = MEDALLA_CONFIG
+
+    logger.info(
+        "Running committee shuffling benchmark:\n - %s active validators\n - %d rounds\n*****************************\n",  # noqa: E501
+        ', '.join(str(size) for size in args.list_sizes),
+        config.SHUFFLE_ROUND_COUNT,
+    )
+    logger.info(
+        "%10s  %12s  %12s  %8s  %12s",
+        "validators",
+        "vectorized s",
+        "loop s",
+        "speedup",
+        "cache hit s",
+    )
+    for list_size in args.list_sizes:
+        indices = list(range(list_size))
+        seed = os.urandom(32)
+
+        vectorized_duration, vectorized_shuffling = measure_unshuffle(
+            inner_shuffle_list, indices, seed, config,
+        )
+        loop_duration, loop_shuffling = measure_unshuffle(
+            _inner_shuffle_list, indices, seed, config,
+        )
+        if vectorized_shuffling != loop_shuffling:
+            raise Exception(f"Vectorized shuffling differs with {list_size} validators")
+
+        logger.info(
+            "%10d  %12.3f  %12.3f  %7.1fx  %12.4f",
+            list_size,
+            vectorized_duration,
+            loop_duration,
+            loop_duration / vectorized_duration,
+            measure_cached_shuffling(indices, seed, config),
+        )
+    logger.info('\n')
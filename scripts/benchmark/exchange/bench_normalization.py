@@ -0,0 +1,130 @@
+import argparse
+import asyncio
+from concurrent import futures
+import logging
+import os
+import sys
+import time
+
+from eth.rlp.transactions import BaseTransactionFields
+
+from p2p.exchange import normalization_pool
+
+from trinity.protocol.eth.commands import BlockBodiesV65
+from trinity.protocol.eth.constants import MAX_BODIES_FETCH
+from trinity.protocol.eth.normalizers import GetBlockBodiesNormalizer
+from trinity.rlp.block_body import BlockBody
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def make_block_bodies_response(num_bodies, num_transactions):
+    bodies = tuple(
+        BlockBody(
+            tuple(
+                BaseTransactionFields(
+                    nonce,
+                    10 ** 9,
+                    21000,
+                    os.urandom(20),
+                    10 ** 18,
+                    os.urandom(68),
+                    27,
+                    int.from_bytes(os.urandom(32), 'big'),
+                    int.from_bytes(os.urandom(32), 'big'),
+                )
+                for nonce in range(num_transactions)
+            ),
+            (),
+        )
+        for _ in range(num_bodies)
+    )
+    return BlockBodiesV65(bodies)
+
+
+async def normalize_all(normalizer, responses, pool):
+    """
+    Normalize all responses concurrently, the way ExchangeManager does when many peers
+    respond at once: in a thread, or in the process pool if there is one.
+    """
+    loop = asyncio.get_event_loop()
+
+    async def normalize(cmd):
+        if pool is None:
+            return await loop.run_in_executor(thread_executor, normalizer.normalize_result, cmd)
+        else:
+            computed = await loop.run_in_executor(pool, normalizer.compute, cmd.payload)
+            return normalizer.combine(cmd, computed)
+
+    with futures.ThreadPoolExecutor() as thread_executor:
+        return await asyncio.gather(*(normalize(cmd) for cmd in responses))
+
+
+def measure_bodies_per_second(responses, num_workers):
+    normalizer = GetBlockBodiesNormalizer()
+    num_bodies = sum(len(cmd.payload) for cmd in responses)
+    loop = asyncio.get_event_loop()
+
+    with normalization_pool(num_workers) as pool:
+        if pool is not None:
+            # warm up the workers, so process startup isn't measured
+            loop.run_until_complete(normalize_all(normalizer, responses[:num_workers], pool))
+
+        start = time.perf_counter()
+        loop.run_until_complete(normalize_all(normalizer, responses, pool))
+        duration = time.perf_counter() - start
+
+    return num_bodies / duration
+
+
+parser = argparse.ArgumentParser(description='Block body normalization benchmark')
+parser.add_argument(
+    '--num-responses',
+    type=int,
+    required=False,
+    default=32,
+    help="Number of BlockBodies responses to normalize",
+)
+parser.add_argument(
+    '--num-transactions',
+    type=int,
+    required=False,
+    default=150,
+    help="Number of transactions in each block body",
+)
+parser.add_argument(
+    '--workers',
+    type=int,
+    nargs='+',
+    required=False,
+    default=[1, 2, 4, 8],
+    help="Process pool sizes to compare against inline normalization",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running block body normalization benchmark:\n - %d responses of %d bodies\n - %d transactions per body\n*****************************\n",  # noqa: E501
+        args.num_responses,
+        MAX_BODIES_FETCH,
+        args.num_transactions,
+    )
+    responses = tuple(
+        make_block_bodies_response(MAX_BODIES_FETCH, args.num_transactions)
+        for _ in range(args.num_responses)
+    )
+
+    inline_rate = measure_bodies_per_second(responses, 0)
+    logger.info("%8s  %12s  %8s", "workers", "bodies/sec", "speedup")
+    logger.info("%8s  %12.1f  %7.2fx", "inline", inline_rate, 1.0)
+    for num_workers in args.workers:
+        rate = measure_bodies_per_second(responses, num_workers)
+        logger.info("%8d  %12.1f  %7.2fx", num_workers, rate, rate / inline_rate)
+    logger.info('\n')
@@ -0,0 +1,216 @@
+import argparse
+import hmac
+import logging
+import os
+import sys
+import time
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+import rlp
+import sha3
+
+from p2p._utils import roundup_16, sxor
+from p2p.constants import HEADER_LEN, MAC_LEN, RLPX_HEADER_DATA
+from p2p.framing import FrameCodec, HEADER_DATA_SEDES
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+KB = 1024
+MB = 1024 * KB
+
+# Payload sizes go from 100 B to 10 MB, in steps of 10x
+PAYLOAD_SIZES = tuple(10 ** exponent for exponent in range(2, 8))
+
+AES_SECRET = b'\x01' * 32
+MAC_SECRET = b'\x02' * 32
+
+
+class PreviousFrameCodec:
+    """
+    The frame encryption that was previously inlined in Transport, for comparison. It takes a
+    digest of the MAC before and after every update, and decrypts one frame per read.
+    """
+    def __init__(self, aes_secret, mac_secret, egress_mac, ingress_mac):
+        iv = b"\x00" * 16
+        aes_cipher = Cipher(algorithms.AES(aes_secret), modes.CTR(iv), default_backend())
+        self._aes_enc = aes_cipher.encryptor()
+        self._aes_dec = aes_cipher.decryptor()
+        mac_cipher = Cipher(algorithms.AES(mac_secret), modes.ECB(), default_backend())
+        self._mac_enc = mac_cipher.encryptor().update
+        self._egress_mac = egress_mac
+        self._ingress_mac = ingress_mac
+
+    def encrypt(self, header, body):
+        header = header.ljust(roundup_16(len(header)), b'\x00')
+        frame = body.ljust(roundup_16(len(body)), b'\x00')
+
+        header_ciphertext = self._aes_enc.update(header)
+        mac_secret = self._egress_mac.digest()[:HEADER_LEN]
+        self._egress_mac.update(sxor(self._mac_enc(mac_secret), header_ciphertext))
+        header_mac = self._egress_mac.digest()[:HEADER_LEN]
+
+        frame_ciphertext = self._aes_enc.update(frame)
+        self._egress_mac.update(frame_ciphertext)
+        fmac_seed = self._egress_mac.digest()[:HEADER_LEN]
+
+        mac_secret = self._egress_mac.digest()[:HEADER_LEN]
+        self._egress_mac.update(sxor(self._mac_enc(mac_secret), fmac_seed))
+        frame_mac = self._egress_mac.digest()[:HEADER_LEN]
+
+        return header_ciphertext + header_mac + frame_ciphertext + frame_mac
+
+    def decrypt_header(self, data):
+        header_ciphertext = data[:HEADER_LEN]
+        header_mac = data[HEADER_LEN:]
+        mac_secret = self._ingress_mac.digest()[:HEADER_LEN]
+        aes = self._mac_enc(mac_secret)[:HEADER_LEN]
+        self._ingress_mac.update(sxor(aes, header_ciphertext))
+        expected_header_mac = self._ingress_mac.digest()[:HEADER_LEN]
+        if not hmac.compare_digest(expected_header_mac, header_mac):
+            raise ValueError('Invalid header mac')
+        return self._aes_dec.update(header_ciphertext)
+
+    def decrypt_body(self, data, body_size):
+        read_size = roundup_16(body_size)
+        frame_ciphertext = data[:read_size]
+        frame_mac = data[read_size:read_size + MAC_LEN]
+
+        self._ingress_mac.update(frame_ciphertext)
+        fmac_seed = self._ingress_mac.digest()[:MAC_LEN]
+        self._ingress_mac.update(sxor(self._mac_enc(fmac_seed), fmac_seed))
+        expected_frame_mac = self._ingress_mac.digest()[:MAC_LEN]
+        if not hmac.compare_digest(expected_frame_mac, frame_mac):
+            raise ValueError('Invalid frame mac')
+        return self._aes_dec.update(frame_ciphertext)[:body_size]
+
+    def decrypt_frames(self, data):
+        # Like Transport.recv() did: read the header, then the body, then decode the header
+        # data and re-encode it, for every frame.
+        offset = 0
+        messages = []
+        while offset < len(data):
+            padded_header = self.decrypt_header(data[offset:offset + HEADER_LEN + MAC_LEN])
+            offset += HEADER_LEN + MAC_LEN
+            frame_size = int.from_bytes(padded_header[:3], 'big')
+            read_size = roundup_16(frame_size) + MAC_LEN
+            body = self.decrypt_body(data[offset:offset + read_size], frame_size)
+            offset += read_size
+            header_data = rlp.decode(padded_header[3:], sedes=HEADER_DATA_SEDES, strict=False)
+            messages.append((padded_header[:3] + rlp.encode(header_data), body))
+        return messages
+
+
+def make_codec_pair(codec_class):
+    egress_mac = sha3.keccak_256(b'egress')
+    ingress_mac = sha3.keccak_256(b'ingress')
+    sender = codec_class(AES_SECRET, MAC_SECRET, egress_mac.copy(), ingress_mac.copy())
+    receiver = codec_class(AES_SECRET, MAC_SECRET, ingress_mac.copy(), egress_mac.copy())
+    return sender, receiver
+
+
+def make_body(size):
+    # Message bodies start with the command id
+    return b'\x10' + os.urandom(size - 1)
+
+
+def make_header(body):
+    return len(body).to_bytes(3, 'big') + RLPX_HEADER_DATA
+
+
+def measure_frames_per_second(codec_class, body, num_frames, read_size):
+    sender, receiver = make_codec_pair(codec_class)
+    header = make_header(body)
+
+    start = time.perf_counter()
+    ciphertexts = [sender.encrypt(header, body) for _ in range(num_frames)]
+    encrypt_duration = time.perf_counter() - start
+
+    data = b''.join(ciphertexts)
+    start = time.perf_counter()
+    if codec_class is FrameCodec:
+        # Receive the frames in chunks, like Transport.recv() does
+        num_decrypted = sum(
+            len(receiver.feed(data[offset:offset + read_size]))
+            for offset in range(0, len(data), read_size)
+        )
+    else:
+        num_decrypted = len(receiver.decrypt_frames(data))
+    decrypt_duration = time.perf_counter() - start
+
+    assert num_decrypted == num_frames
+    return num_frames / encrypt_duration, num_frames / decrypt_duration
+
+
+def check_compatibility():
+    previous_sender, previous_receiver = make_codec_pair(PreviousFrameCodec)
+    sender, receiver = make_codec_pair(FrameCodec)
+    for body_size in (1, 15, 16, 17, 1000):
+        body = make_body(body_size)
+        ciphertext = sender.encrypt(make_header(body), body)
+        assert ciphertext == previous_sender.encrypt(make_header(body), body)
+        ((_, previous_body), ) = previous_receiver.decrypt_frames(ciphertext)
+        (message, ) = receiver.feed(ciphertext)
+        assert message.body == previous_body == body
+
+
+parser = argparse.ArgumentParser(description='RLPx frame encryption benchmark')
+parser.add_argument(
+    '--total-size',
+    type=int,
+    required=False,
+    default=64 * MB,
+    help="Approximate number of bytes to encrypt and decrypt at each payload size",
+)
+parser.add_argument(
+    '--read-size',
+    type=int,
+    required=False,
+    default=64 * KB,
+    help="Size of the chunks that received data is fed to the codec in",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    check_compatibility()
+
+    logger.info(
+        "Running RLPx frame codec benchmark:\n - payloads from 100 B to 10 MB\n - about %d MB per payload size\n - %d KB reads\n*****************************\n",  # noqa: E501
+        args.total_size // MB,
+        args.read_size // KB,
+    )
+    logger.info(
+        "%10s  %8s  %14s  %14s  %14s  %14s",
+        "payload",
+        "frames",
+        "enc frames/s",
+        "prev enc",
+        "dec frames/s",
+        "prev dec",
+    )
+    for payload_size in PAYLOAD_SIZES:
+        num_frames = max(10, args.total_size // payload_size)
+        body = make_body(payload_size)
+        encrypt_rate, decrypt_rate = measure_frames_per_second(
+            FrameCodec, body, num_frames, args.read_size,
+        )
+        previous_encrypt_rate, previous_decrypt_rate = measure_frames_per_second(
+            PreviousFrameCodec, body, num_frames, args.read_size,
+        )
+        logger.info(
+            "%10d  %8d  %14.1f  %14.1f  %14.1f  %14.1f",
+            payload_size,
+            num_frames,
+            encrypt_rate,
+            previous_encrypt_rate,
+            decrypt_rate,
+            previous_decrypt_rate,
+        )
+    logger.info('\n')
@@ -75,6 +75,7 @@ deps = {
         # only for eth2
         "ruamel.yaml==0.16.10",
         "eth-tester==0.4.0b2",
+        "numpy>=1.16.0,<2",
     ],
     # We have to keep some separation between trio and asyncio based tests
     # because `pytest-asyncio` is greedy and tries to run all asyncio fixtures.
@@ -127,6 +128,7 @@ deps = {
     ],
     'eth2-extra': [
         "milagro-bls-binding==1.3.0",
+        "numpy>=1.16.0,<2",
     ],
     'eth2-lint': [
         "black==19.3b0",
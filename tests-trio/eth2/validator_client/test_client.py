@@ -1,3 +1,5 @@
+from concurrent.futures import Executor, Future
+
 from async_service.exceptions import DaemonTaskExit
 from async_service.trio import background_trio_service
 import pytest
@@ -10,13 +12,25 @@ from eth2.validator_client.client import Client
 from eth2.validator_client.duty import AttestationDuty, BlockProposalDuty, DutyType
 from eth2.validator_client.key_store import KeyStore
 from eth2.validator_client.randao import mk_randao_provider
-from eth2.validator_client.signatory import sign
+from eth2.validator_client.signatory import SigningPool, sign
+
+
+class InlineExecutor(Executor):
+    """
+    Runs the signing work in the calling thread: the autojump clock does not wait
+    for work in other threads or processes.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
 
 
 def _mk_duty_fetcher(public_key, slots_per_epoch, seconds_per_slot):
     """"
-    This ``duty_fetcher`` works by just returning a block proposal duty for the current slot
-    and an attestation duty for the same slot but one epoch ahead.
+    This ``duty_fetcher`` works by just returning a block proposal duty for the second slot
+    of the target epoch and an attestation duty for its last slot.
 
     It is expected that another component will filter slashable duties.
     """
@@ -24,24 +38,20 @@ def _mk_duty_fetcher(public_key, slots_per_epoch, seconds_per_slot):
     def duty_fetcher(
         current_tick, _public_keys, target_epoch, _slots_per_epoch, _seconds_per_slot
     ):
-        duties = ()
         if target_epoch < 0:
-            return duties
+            return ()
 
-        some_slot = current_tick.slot
-        if current_tick.epoch >= 0:
-            block_proposal_duty = BlockProposalDuty(
-                public_key, Tick(0, some_slot, target_epoch, 0), current_tick
-            )
-            duties += (block_proposal_duty,)
+        first_slot = target_epoch * slots_per_epoch
+        block_proposal_duty = BlockProposalDuty(
+            public_key, Tick(0, first_slot + 1, target_epoch, 0), current_tick
+        )
         attestation_duty = AttestationDuty(
             public_key,
-            Tick(0, some_slot + slots_per_epoch, target_epoch, 1),
+            Tick(0, first_slot + slots_per_epoch - 1, target_epoch, 1),
             current_tick,
             CommitteeIndex(22),
         )
-        duties += (attestation_duty,)
-        return duties
+        return (block_proposal_duty, attestation_duty)
 
     return duty_fetcher
 
@@ -84,7 +94,9 @@ async def test_client_works(autojump_clock, sample_bls_key_pairs, eth2_config):
         seconds_per_epoch,
         trio.current_time,
     )
-    client = Client(key_store, clock, beacon_node)
+    client = Client(
+        key_store, clock, beacon_node, signing_pool=SigningPool(InlineExecutor())
+    )
 
     try:
         async with background_trio_service(client):
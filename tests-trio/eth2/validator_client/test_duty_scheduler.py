@@ -0,0 +1,238 @@
+from collections import Counter
+
+import pytest
+import trio
+
+from eth2.beacon.typing import CommitteeIndex
+from eth2.clock import Tick
+from eth2.validator_client import beacon_node as beacon_node_module
+from eth2.validator_client.beacon_node import BeaconNode, MockBeaconNode
+from eth2.validator_client.duty import AttestationDuty, BlockProposalDuty
+from eth2.validator_client.duty_scheduler import (
+    DutyPrefetcher,
+    schedule_and_dispatch_duties_at_tick,
+)
+from eth2.validator_client.duty_store import DutyStore
+
+SLOTS_PER_EPOCH = 8
+
+
+def _mk_tick(slot, count):
+    return Tick(0, slot, slot // SLOTS_PER_EPOCH, count)
+
+
+def _mk_attestation_duty(public_key, slot, committee_index=0):
+    return AttestationDuty(
+        public_key, _mk_tick(slot, 1), Tick(0, 0, 0, 1), CommitteeIndex(committee_index)
+    )
+
+
+def _duty_fetcher(
+    current_tick, public_keys, target_epoch, slots_per_epoch, _seconds_per_slot
+):
+    return tuple(
+        _mk_attestation_duty(public_key, target_epoch * slots_per_epoch)
+        for public_key in public_keys
+    )
+
+
+@pytest.mark.trio
+async def test_duty_store_keeps_one_duty_per_validator_at_tick(sample_bls_key_pairs):
+    public_keys = tuple(sample_bls_key_pairs)
+    duty_store = DutyStore()
+    duties = tuple(_mk_attestation_duty(public_key, 3) for public_key in public_keys)
+
+    await duty_store.add_duties(*duties)
+    await duty_store.add_duties(
+        *(_mk_attestation_duty(public_key, 3, 1) for public_key in public_keys[:4])
+    )
+    await duty_store.add_duties(*duties)
+
+    assert await duty_store.duties_at_tick(Tick(0, 3, 0, 1)) == duties
+    assert not await duty_store.duties_at_tick(Tick(0, 3, 0, 0))
+    assert not await duty_store.duties_at_tick(Tick(0, 4, 0, 1))
+
+
+@pytest.mark.trio
+async def test_duty_store_replaces_duties_of_epoch(sample_bls_key_pairs):
+    public_keys = tuple(sample_bls_key_pairs)[:2]
+    duty_store = DutyStore()
+    epoch_duties = tuple(
+        _mk_attestation_duty(public_key, epoch * SLOTS_PER_EPOCH)
+        for epoch in range(3)
+        for public_key in public_keys
+    )
+    await duty_store.add_duties(*epoch_duties)
+
+    moved_duty = _mk_attestation_duty(public_keys[0], 2 * SLOTS_PER_EPOCH + 1)
+    await duty_store.replace_duties(2, moved_duty)
+
+    # NOTE: the duties of the epochs before the previous one are pruned
+    assert not await duty_store.duties_at_tick(_mk_tick(0, 1))
+    assert await duty_store.duties_at_tick(_mk_tick(SLOTS_PER_EPOCH, 1)) == tuple(
+        epoch_duties[2:4]
+    )
+    assert await duty_store.duties_at_tick(_mk_tick(2 * SLOTS_PER_EPOCH, 1)) == (
+        epoch_duties[5],
+    )
+    assert await duty_store.duties_at_tick(_mk_tick(2 * SLOTS_PER_EPOCH + 1, 1)) == (
+        moved_duty,
+    )
+
+
+@pytest.mark.trio
+async def test_duty_prefetcher_fetches_each_epoch_once(
+    autojump_clock, sample_bls_key_pairs
+):
+    public_keys = tuple(sample_bls_key_pairs)
+    fetched_epochs = Counter()
+
+    class SlowBeaconNode(MockBeaconNode):
+        async def fetch_duties(self, current_tick, public_keys, target_epoch):
+            fetched_epochs[target_epoch] += 1
+            await trio.sleep(1)
+            return await super().fetch_duties(current_tick, public_keys, target_epoch)
+
+    beacon_node = SlowBeaconNode(SLOTS_PER_EPOCH, 6, duty_fetcher=_duty_fetcher)
+    duty_store = DutyStore()
+    duty_prefetcher = DutyPrefetcher(beacon_node, public_keys, duty_store)
+
+    tick = _mk_tick(0, 0)
+
+    async def _fetch_duties(epoch):
+        await duty_prefetcher.fetch_duties(tick, epoch)
+        # NOTE: the duties are stored by the time any fetch of their epoch returns
+        duties = await duty_store.duties_at_tick(_mk_tick(epoch * SLOTS_PER_EPOCH, 1))
+        assert len(duties) == len(public_keys)
+
+    async with trio.open_nursery() as nursery:
+        for _ in range(3):
+            nursery.start_soon(_fetch_duties, 0)
+            nursery.start_soon(_fetch_duties, 1)
+    await _fetch_duties(1)
+
+    assert fetched_epochs == {0: 1, 1: 1}
+
+
+@pytest.mark.trio
+async def test_duty_prefetcher_refetches_epoch_once_started(sample_bls_key_pairs):
+    public_keys = tuple(sample_bls_key_pairs)[:2]
+    attestation_duties = tuple(
+        _mk_attestation_duty(public_key, SLOTS_PER_EPOCH + 1)
+        for public_key in public_keys
+    )
+    stale_block_proposal_duty = BlockProposalDuty(
+        public_keys[0], _mk_tick(SLOTS_PER_EPOCH + 2, 0), Tick(0, 0, 0, 0)
+    )
+    # NOTE: the block proposal is gone by the time the epoch starts
+    responses = [attestation_duties + (stale_block_proposal_duty,), attestation_duties]
+
+    class ReorgingBeaconNode(MockBeaconNode):
+        async def fetch_duties(self, current_tick, public_keys, target_epoch):
+            return responses.pop(0)
+
+    beacon_node = ReorgingBeaconNode(SLOTS_PER_EPOCH, 6)
+    duty_store = DutyStore()
+    duty_prefetcher = DutyPrefetcher(beacon_node, public_keys, duty_store)
+
+    await duty_prefetcher.fetch_duties(_mk_tick(0, 0), 1)
+    await duty_prefetcher.fetch_duties(_mk_tick(1, 0), 1)
+    assert await duty_store.duties_at_tick(_mk_tick(SLOTS_PER_EPOCH + 2, 0)) == (
+        stale_block_proposal_duty,
+    )
+
+    await duty_prefetcher.fetch_duties(_mk_tick(SLOTS_PER_EPOCH, 0), 1)
+    await duty_prefetcher.fetch_duties(_mk_tick(SLOTS_PER_EPOCH + 1, 0), 1)
+    assert not responses
+    assert not await duty_store.duties_at_tick(_mk_tick(SLOTS_PER_EPOCH + 2, 0))
+    assert (
+        await duty_store.duties_at_tick(_mk_tick(SLOTS_PER_EPOCH + 1, 1))
+        == attestation_duties
+    )
+
+
+@pytest.mark.trio
+async def test_duty_prefetcher_retries_failed_fetch(sample_bls_key_pairs):
+    public_keys = tuple(sample_bls_key_pairs)
+
+    class UnreachableBeaconNode(MockBeaconNode):
+        is_reachable = False
+
+        async def fetch_duties(self, current_tick, public_keys, target_epoch):
+            if not self.is_reachable:
+                raise OSError("beacon node is unreachable")
+            return await super().fetch_duties(current_tick, public_keys, target_epoch)
+
+    beacon_node = UnreachableBeaconNode(SLOTS_PER_EPOCH, 6, duty_fetcher=_duty_fetcher)
+    duty_store = DutyStore()
+    duty_prefetcher = DutyPrefetcher(beacon_node, public_keys, duty_store)
+    epoch_start = _mk_tick(SLOTS_PER_EPOCH, 1)
+
+    await duty_prefetcher.fetch_duties(_mk_tick(0, 0), 1)
+    assert not await duty_store.duties_at_tick(epoch_start)
+
+    beacon_node.is_reachable = True
+    await duty_prefetcher.fetch_duties(_mk_tick(0, 1), 1)
+    assert len(await duty_store.duties_at_tick(epoch_start)) == len(public_keys)
+
+
+@pytest.mark.trio
+async def test_duty_prefetcher_fails_fetch_of_malformed_duties(
+    monkeypatch, sample_bls_key_pairs
+):
+    public_keys = tuple(sample_bls_key_pairs)
+
+    async def _get_malformed_duties(session, url, public_keys, epoch):
+        return ({"validator_pubkey": "0x00"},)
+
+    monkeypatch.setattr(
+        beacon_node_module, "_get_duties_from_beacon_node", _get_malformed_duties
+    )
+    beacon_node = BeaconNode(0, "http://localhost", 6)
+    duty_store = DutyStore()
+    duty_prefetcher = DutyPrefetcher(beacon_node, public_keys, duty_store)
+
+    with pytest.raises(OSError):
+        await beacon_node.fetch_duties(_mk_tick(0, 0), public_keys, 1)
+
+    await duty_prefetcher.fetch_duties(_mk_tick(0, 0), 1)
+    assert not duty_prefetcher.has_fetched(1)
+
+
+@pytest.mark.trio
+async def test_scheduler_dispatches_prefetched_duties_during_refetch(
+    sample_bls_key_pairs
+):
+    public_keys = tuple(sample_bls_key_pairs)
+    can_refetch = trio.Event()
+
+    class SlowBeaconNode(MockBeaconNode):
+        fetched_epochs = Counter()
+
+        async def fetch_duties(self, current_tick, public_keys, target_epoch):
+            self.fetched_epochs[target_epoch] += 1
+            if self.fetched_epochs[target_epoch] > 1:
+                await can_refetch.wait()
+            return await super().fetch_duties(current_tick, public_keys, target_epoch)
+
+    beacon_node = SlowBeaconNode(SLOTS_PER_EPOCH, 6, duty_fetcher=_duty_fetcher)
+    duty_store = DutyStore()
+    duty_prefetcher = DutyPrefetcher(beacon_node, public_keys, duty_store)
+    duty_dispatcher, dispatched_duties = trio.open_memory_channel(len(public_keys))
+
+    await duty_prefetcher.fetch_duties(_mk_tick(0, 0), 1)
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(
+            schedule_and_dispatch_duties_at_tick,
+            _mk_tick(SLOTS_PER_EPOCH, 1),
+            duty_prefetcher,
+            duty_store,
+            duty_dispatcher,
+        )
+        for _ in public_keys:
+            with trio.fail_after(1):
+                await dispatched_duties.receive()
+        assert beacon_node.fetched_epochs[1] == 2
+        can_refetch.set()
+
+    assert beacon_node.fetched_epochs == {1: 2, 2: 1}
@@ -0,0 +1,164 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+import trio
+
+from eth2.beacon.types.attestations import Attestation, AttestationData
+from eth2.beacon.types.blocks import BeaconBlock
+from eth2.clock import Tick
+from eth2.validator_client.duty import AttestationDuty, BlockProposalDuty
+from eth2.validator_client.signatory import SigningPool, get_signing_root, sign
+from trinity.metrics.registry import registry
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted_signing_roots = []
+
+    def submit(self, fn, privkey, signing_root):
+        self.submitted_signing_roots.append(signing_root)
+        return super().submit(fn, privkey, signing_root)
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """
+    Signs the first submitted duty right away and holds the others until opened.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.gate = threading.Event()
+        self._is_first = True
+
+    def submit(self, fn, privkey, signing_root):
+        if self._is_first:
+            self._is_first = False
+            return super().submit(fn, privkey, signing_root)
+
+        def _sign_when_open():
+            self.gate.wait()
+            return fn(privkey, signing_root)
+
+        return super().submit(_sign_when_open)
+
+
+def _mk_resolved_duties(public_keys, slot):
+    attestation_duties = tuple(
+        (
+            AttestationDuty(
+                public_key, Tick(0, slot, 0, 1), Tick(0, 0, 0, 1), committee_index=index
+            ),
+            Attestation.create(data=AttestationData.create(slot=slot, index=index)),
+        )
+        for index, public_key in enumerate(public_keys)
+    )
+    block_proposal_duty = (
+        BlockProposalDuty(public_keys[0], Tick(0, slot, 0, 0), Tick(0, 0, 0, 1)),
+        BeaconBlock.create(slot=slot),
+    )
+    return attestation_duties + (block_proposal_duty,)
+
+
+def _get_signing_count(duty_type):
+    return (
+        registry.get_sample_value(
+            "validator_signing_seconds_count", {"duty_type": duty_type.name}
+        )
+        or 0
+    )
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("use_processes", (True, False))
+async def test_signing_pool_signs_many_duties(sample_bls_key_pairs, use_processes):
+    public_keys = tuple(sample_bls_key_pairs.keys())[:4]
+    resolved_duties = _mk_resolved_duties(public_keys, slot=3)
+    if use_processes:
+        signing_pool = SigningPool()
+    else:
+        signing_pool = SigningPool(ThreadPoolExecutor(max_workers=2))
+
+    signing_counts = {
+        duty.duty_type: _get_signing_count(duty.duty_type)
+        for duty, _ in resolved_duties
+    }
+    try:
+        signed_duties = [
+            signed_duty
+            async for signed_duty in signing_pool.sign_many(
+                resolved_duties, sample_bls_key_pairs.__getitem__
+            )
+        ]
+    finally:
+        signing_pool.shutdown()
+
+    assert len(signed_duties) == len(resolved_duties)
+    assert set(signed_duties) == set(
+        ((duty, operation), sign(duty, operation, sample_bls_key_pairs.__getitem__))
+        for duty, operation in resolved_duties
+    )
+    for duty_type, signing_count in signing_counts.items():
+        assert _get_signing_count(duty_type) == signing_count + sum(
+            1 for duty, _ in resolved_duties if duty.duty_type == duty_type
+        )
+
+
+@pytest.mark.trio
+async def test_signing_pool_signs_by_deadline(sample_bls_key_pairs):
+    public_keys = tuple(sample_bls_key_pairs.keys())[:2]
+    resolved_duties = _mk_resolved_duties(public_keys, slot=5) + _mk_resolved_duties(
+        public_keys, slot=4
+    )
+    executor = RecordingExecutor()
+    signing_pool = SigningPool(executor)
+
+    try:
+        signed_duties = [
+            signed_duty
+            async for signed_duty in signing_pool.sign_many(
+                resolved_duties, sample_bls_key_pairs.__getitem__
+            )
+        ]
+    finally:
+        signing_pool.shutdown()
+
+    assert len(signed_duties) == len(resolved_duties)
+    expected_order = sorted(
+        resolved_duties,
+        key=lambda resolved_duty: (
+            resolved_duty[0].tick_for_execution.slot,
+            resolved_duty[0].tick_count,
+        ),
+    )
+    # NOTE: the block proposal of a slot comes before its attestations
+    assert isinstance(expected_order[0][0], BlockProposalDuty)
+    assert executor.submitted_signing_roots == [
+        get_signing_root(duty, operation) for duty, operation in expected_order
+    ]
+
+
+@pytest.mark.trio
+async def test_signing_pool_yields_each_duty_once_signed(sample_bls_key_pairs):
+    public_keys = tuple(sample_bls_key_pairs.keys())[:2]
+    resolved_duties = _mk_resolved_duties(public_keys, slot=2)
+    executor = GatedExecutor()
+    signing_pool = SigningPool(executor)
+
+    signed_duties = []
+    try:
+        with trio.fail_after(5):
+            async for signed_duty in signing_pool.sign_many(
+                resolved_duties, sample_bls_key_pairs.__getitem__
+            ):
+                # NOTE: the other duties are only signed once the first one is out
+                signed_duties.append(signed_duty)
+                executor.gate.set()
+    finally:
+        executor.gate.set()
+        signing_pool.shutdown()
+
+    assert len(signed_duties) == len(resolved_duties)
+    (first_duty, _), _ = signed_duties[0]
+    assert isinstance(first_duty, BlockProposalDuty)
@@ -1,10 +1,22 @@
+import io
+import json
+
+from eth.db.atomic import AtomicDB
+from eth.db.backends.level import LevelDB
+from eth_utils import ValidationError, encode_hex
 import pytest
 
 from eth2.beacon.types.attestations import Attestation, AttestationData
 from eth2.beacon.types.blocks import BeaconBlock
+from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.clock import Tick
+from eth2.validator_client import interchange
 from eth2.validator_client.duty import AttestationDuty, BlockProposalDuty
-from eth2.validator_client.signatory_db import InMemorySignatoryDB
+from eth2.validator_client.signatory import GENESIS_VALIDATORS_ROOT
+from eth2.validator_client.signatory_db import (
+    InMemorySignatoryDB,
+    PersistentSignatoryDB,
+)
 
 
 def _mk_resolved_attestation_duty(slot, public_key):
@@ -77,3 +89,247 @@ async def test_signatory_db_block_proposal_slashing_conditions(
     second_duty, second_operation = second_resolved_duty
     is_slashable_in_db = await db.is_slashable(second_duty, second_operation)
     assert is_slashable_in_db == is_slashable
+
+
+def _mk_resolved_attestation_duty_for_epochs(source_epoch, target_epoch, public_key):
+    return (
+        AttestationDuty(
+            public_key, Tick(0, 0, target_epoch, 1), Tick(0, 0, 0, 1), committee_index=0
+        ),
+        Attestation.create(
+            data=AttestationData.create(
+                source=Checkpoint.create(epoch=source_epoch),
+                target=Checkpoint.create(epoch=target_epoch),
+            )
+        ),
+    )
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize(
+    ("recorded_epochs", "source_epoch", "target_epoch", "is_slashable"),
+    [
+        # double votes
+        (((2, 3),), 1, 3, True),
+        (((2, 3),), 2, 3, False),
+        # surrounding
+        (((2, 3),), 1, 4, True),
+        (((2, 3), (3, 4), (4, 5)), 1, 6, True),
+        (((2, 3), (3, 4), (4, 5)), 3, 6, True),
+        (((300, 301),), 1, 302, True),
+        (((2, 3),), 2, 4, False),
+        (((2, 3),), 1, 3 + 1, True),
+        # surrounded
+        (((1, 4),), 2, 3, True),
+        (((1, 600),), 299, 300, True),
+        (((1, 4),), 4, 5, False),
+        (((1, 4),), 1, 3, False),
+        # sequential
+        (((1, 2), (2, 3), (3, 4)), 4, 5, False),
+        (((1, 2), (2, 3), (3, 4)), 0, 1, False),
+        # source after target
+        ((), 3, 2, True),
+    ],
+)
+async def test_persistent_signatory_db_attestation_slashing_conditions(
+    recorded_epochs, source_epoch, target_epoch, is_slashable, sample_bls_public_key
+):
+    db = PersistentSignatoryDB(AtomicDB())
+    for recorded_source_epoch, recorded_target_epoch in recorded_epochs:
+        duty, operation = _mk_resolved_attestation_duty_for_epochs(
+            recorded_source_epoch, recorded_target_epoch, sample_bls_public_key
+        )
+        assert not await db.is_slashable(duty, operation)
+        await db.record_signature_for(duty, operation)
+        # NOTE: signing the same attestation again is not slashable
+        assert not await db.is_slashable(duty, operation)
+
+    duty, operation = _mk_resolved_attestation_duty_for_epochs(
+        source_epoch, target_epoch, sample_bls_public_key
+    )
+    assert await db.is_slashable(duty, operation) == is_slashable
+
+
+@pytest.mark.trio
+async def test_persistent_signatory_db_attestation_with_lower_source(
+    sample_bls_public_key
+):
+    db = PersistentSignatoryDB(AtomicDB())
+    for source_epoch, target_epoch in ((10, 11), (2, 5)):
+        await db.record_signature_for(
+            *_mk_resolved_attestation_duty_for_epochs(
+                source_epoch, target_epoch, sample_bls_public_key
+            )
+        )
+
+    for source_epoch, target_epoch, is_slashable in (
+        (1, 6, True),
+        (3, 4, True),
+        (6, 12, True),
+        (0, 1, False),
+        (5, 6, False),
+        (11, 12, False),
+    ):
+        duty, operation = _mk_resolved_attestation_duty_for_epochs(
+            source_epoch, target_epoch, sample_bls_public_key
+        )
+        assert await db.is_slashable(duty, operation) == is_slashable
+
+
+@pytest.mark.trio
+async def test_persistent_signatory_db_survives_restart(
+    tmp_path, sample_bls_public_key
+):
+    block_duty, block = _mk_resolved_block_proposal_duty(3, sample_bls_public_key)
+    attestation_duty, attestation = _mk_resolved_attestation_duty_for_epochs(
+        2, 3, sample_bls_public_key
+    )
+
+    db = PersistentSignatoryDB(LevelDB(tmp_path / "signatory"))
+    await db.record_signature_for(block_duty, block)
+    await db.record_signature_for(attestation_duty, attestation)
+    del db
+
+    db = PersistentSignatoryDB(LevelDB(tmp_path / "signatory"))
+    assert not await db.is_slashable(block_duty, block)
+    assert await db.is_slashable(
+        block_duty, block.set("proposer_index", block.proposer_index + 1)
+    )
+    assert await db.is_slashable(
+        *_mk_resolved_attestation_duty_for_epochs(1, 4, sample_bls_public_key)
+    )
+
+
+@pytest.mark.trio
+async def test_persistent_signatory_db_interchange(monkeypatch, sample_bls_key_pairs):
+    # NOTE: read the interchange data in small pieces to exercise the streaming
+    monkeypatch.setattr(interchange, "READ_SIZE", 7)
+    public_keys = tuple(sample_bls_key_pairs)[:3]
+    db = PersistentSignatoryDB(AtomicDB())
+    for index, public_key in enumerate(public_keys):
+        for slot in range(index):
+            await db.record_signature_for(
+                *_mk_resolved_block_proposal_duty(slot, public_key)
+            )
+        for epoch in range(index, 4):
+            await db.record_signature_for(
+                *_mk_resolved_attestation_duty_for_epochs(epoch, epoch + 1, public_key)
+            )
+
+    exported = io.StringIO()
+    db.export_interchange(exported)
+    exported_data = json.loads(exported.getvalue())
+    assert exported_data["metadata"]["interchange_format_version"] == "5"
+    assert [record["pubkey"] for record in exported_data["data"]] == [
+        encode_hex(public_key) for public_key in public_keys
+    ]
+
+    imported_db = PersistentSignatoryDB(AtomicDB())
+    imported_db.import_interchange(io.StringIO(exported.getvalue()))
+    reexported = io.StringIO()
+    imported_db.export_interchange(reexported)
+    assert json.loads(reexported.getvalue()) == exported_data
+
+    assert await imported_db.is_slashable(
+        *_mk_resolved_attestation_duty_for_epochs(0, 5, public_keys[0])
+    )
+    block_duty, block = _mk_resolved_block_proposal_duty(1, public_keys[2])
+    assert not await imported_db.is_slashable(block_duty, block)
+    assert await imported_db.is_slashable(block_duty, block.set("proposer_index", 1))
+    assert not await imported_db.is_slashable(
+        *_mk_resolved_attestation_duty_for_epochs(4, 5, public_keys[1])
+    )
+
+
+def test_persistent_signatory_db_interchange_without_signing_roots(
+    sample_bls_public_key
+):
+    interchange_data = {
+        "metadata": {
+            "interchange_format_version": "5",
+            "genesis_validators_root": encode_hex(GENESIS_VALIDATORS_ROOT),
+        },
+        "data": [
+            {
+                "pubkey": encode_hex(sample_bls_public_key),
+                "signed_blocks": [{"slot": "3"}],
+                "signed_attestations": [{"source_epoch": "1", "target_epoch": "2"}],
+            }
+        ],
+    }
+    db = PersistentSignatoryDB(AtomicDB())
+    db.import_interchange(io.StringIO(json.dumps(interchange_data)))
+
+    exported = io.StringIO()
+    db.export_interchange(exported)
+    assert json.loads(exported.getvalue()) == interchange_data
+
+
+def test_persistent_signatory_db_interchange_with_data_before_metadata(
+    sample_bls_public_key
+):
+    interchange_data = (
+        '{"data": [{"pubkey": "%s", "signed_blocks": [{"slot": "3"}]}],'
+        ' "metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "%s"}}'
+        % (
+            encode_hex(sample_bls_public_key),
+            # NOTE: hex is not case sensitive
+            encode_hex(GENESIS_VALIDATORS_ROOT).upper().replace("0X", "0x"),
+        )
+    )
+    db = PersistentSignatoryDB(AtomicDB())
+    db.import_interchange(io.StringIO(interchange_data))
+
+    exported = io.StringIO()
+    db.export_interchange(exported)
+    exported_data = json.loads(exported.getvalue())
+    assert exported_data["data"] == [
+        {
+            "pubkey": encode_hex(sample_bls_public_key),
+            "signed_blocks": [{"slot": "3"}],
+            "signed_attestations": [],
+        }
+    ]
+
+
+def test_persistent_signatory_db_rejects_data_of_another_chain(sample_bls_public_key):
+    interchange_data = (
+        '{"data": [{"pubkey": "%s", "signed_blocks": [{"slot": "3"}]}],'
+        ' "metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "0x%s"}}'
+        % (encode_hex(sample_bls_public_key), "00" * 32)
+    )
+    db = PersistentSignatoryDB(AtomicDB())
+    with pytest.raises(ValidationError):
+        db.import_interchange(io.StringIO(interchange_data))
+
+    exported = io.StringIO()
+    db.export_interchange(exported)
+    assert json.loads(exported.getvalue())["data"] == []
+
+
+@pytest.mark.parametrize(
+    "interchange_data",
+    (
+        '{"metadata": {"interchange_format_version": "4",'
+        ' "genesis_validators_root": "%s"}, "data": []}',
+        '{"metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "0x%s"}, "data": []}' % ("00" * 32),
+        '{"data": [], "metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "0x%s"}}' % ("00" * 32),
+        '{"metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "0xzz"}, "data": []}',
+        '{"data": []}',
+        '{"metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "%s"}, "data": [{"pubkey": "0x00"',
+        '{"metadata": {"interchange_format_version": "5",'
+        ' "genesis_validators_root": "%s"}, "data": [{"signed_blocks": []}]}',
+    ),
+)
+def test_persistent_signatory_db_rejects_invalid_interchange(interchange_data):
+    if "%s" in interchange_data:
+        interchange_data = interchange_data % encode_hex(GENESIS_VALIDATORS_ROOT)
+    db = PersistentSignatoryDB(AtomicDB())
+    with pytest.raises(ValidationError):
+        db.import_interchange(io.StringIO(interchange_data))
@@ -579,6 +579,32 @@ async def test_lookup_and_maybe_update_enr_existing_node_different_address():
     assert lookedup_enr == discovery.node_db.get_enr(enr.node_id)
 
 
+@pytest.mark.trio
+async def test_receive_looks_up_sender_once(monkeypatch):
+    discovery = MockDiscoveryService([])
+    privkey = PrivateKeyFactory()
+    address = AddressFactory()
+    enr = ENRFactory(private_key=privkey.to_bytes(), address=address)
+    discovery.node_db.set_enr(enr)
+
+    handled_nodes = []
+
+    async def handle(node, payload, message_hash):
+        handled_nodes.append(node)
+
+    monkeypatch.setattr(discovery, '_get_handler', lambda cmd: handle)
+    version = rlp.sedes.big_endian_int.serialize(PROTO_VERSION)
+    payload = (version, address.to_endpoint(), AddressFactory().to_endpoint())
+    message = _pack_v4(CMD_PING.id, payload, privkey)
+
+    cache_info = discovery.node_db.cache_info
+    await discovery.receive(address, message)
+
+    assert [node.enr for node in handled_nodes] == [enr]
+    new_cache_info = discovery.node_db.cache_info
+    assert new_cache_info.hits + new_cache_info.misses == cache_info.hits + cache_info.misses + 1
+
+
 @pytest.mark.trio
 async def test_update_routing_table():
     discovery = MockDiscoveryService([])
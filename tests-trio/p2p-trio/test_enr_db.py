@@ -64,6 +64,77 @@ def test_delete_enr(node_db):
         db.get_enr(enr.node_id)
 
 
+def test_get_node(node_db):
+    private_key = PrivateKeyFactory().to_bytes()
+    db = node_db
+    enr = ENRFactory(private_key=private_key)
+
+    with pytest.raises(KeyError):
+        db.get_node(enr.node_id)
+
+    db.set_enr(enr)
+    node = db.get_node(enr.node_id)
+    assert node.id == enr.node_id
+    assert node.enr == enr
+    # Nodes are cached, as long as their ENR doesn't change
+    assert db.get_node(enr.node_id) is node
+    db.set_enr(enr)
+    assert db.get_node(enr.node_id) is node
+
+    updated_enr = ENRFactory(private_key=private_key, sequence_number=enr.sequence_number + 1)
+    db.set_enr(updated_enr)
+    assert db.get_node(enr.node_id).enr == updated_enr
+
+    db.delete_enr(enr.node_id)
+    with pytest.raises(KeyError):
+        db.get_node(enr.node_id)
+
+
+def test_enr_cache_is_written_through():
+    base_db = MemoryDB()
+    db = NodeDB(default_identity_scheme_registry, base_db, cache_size=2)
+    enrs = tuple(ENRFactory() for _ in range(3))
+    for enr in enrs:
+        db.set_enr(enr)
+
+    # The oldest ENR was evicted from the cache, and is decoded from the database again
+    assert db.cache_info.size == 2
+    assert db.get_enr(enrs[0].node_id) == enrs[0]
+    assert db.cache_info.misses == 1
+
+    for enr in enrs:
+        assert db.get_enr(enr.node_id) == enr
+    assert NodeDB(default_identity_scheme_registry, base_db).get_enr(enrs[2].node_id) == enrs[2]
+
+
+def test_enr_cache_info(node_db):
+    db = node_db
+    enr = ENRFactory()
+    assert db.cache_info.hit_rate == 0
+
+    # Writes are not lookups
+    db.set_enr(enr)
+    db.set_enr(enr)
+    assert db.cache_info.misses == 0
+    assert db.cache_info.hits == 0
+
+    with pytest.raises(KeyError):
+        db.get_enr(ENRFactory().node_id)
+    assert db.cache_info.misses == 1
+
+    db.get_enr(enr.node_id)
+    db.get_enr(enr.node_id)
+    db.get_node(enr.node_id)
+    assert db.cache_info.hits == 3
+    assert db.cache_info.misses == 1
+    assert db.cache_info.hit_rate == 0.75
+
+    # Lookups served by the Node cache are counted too
+    db.get_node(enr.node_id)
+    assert db.cache_info.hits == 4
+    assert db.cache_info.misses == 1
+
+
 def test_get_and_set_last_pong_time(node_db):
     db = node_db
     enr = ENRFactory()
@@ -0,0 +1,157 @@
+import asyncio
+
+from eth.chains.base import MiningChain
+from eth.consensus.applier import ConsensusApplier
+from eth.consensus.context import ConsensusContext
+from eth.consensus.noproof import NoProofConsensus
+from eth import constants as eth_constants
+from eth.db.atomic import AtomicDB
+from eth.db.chain import ChainDB
+from eth.vm.forks.spurious_dragon import SpuriousDragonVM
+from eth_keys import keys
+from eth_utils import to_wei
+import pytest
+
+from trinity.sync.beam.importer import (
+    BeamStats,
+    make_pausing_beam_chain,
+)
+from trinity.sync.common.events import (
+    CollectMissingBytecode,
+    MissingBytecodeResult,
+)
+
+
+CHAIN_ID = 1337
+
+VM_CONFIGURATION = ConsensusApplier(NoProofConsensus).amend_vm_configuration(
+    ((eth_constants.GENESIS_BLOCK_NUMBER, SpuriousDragonVM),),
+)
+
+NUM_STORAGE_SLOTS = 6
+
+# Read every storage slot: PUSH1 slot, SLOAD, POP ... STOP
+CONTRACT_CODE = b''.join(bytes((0x60, slot, 0x54, 0x50)) for slot in range(NUM_STORAGE_SLOTS))
+
+CONTRACT_ADDRESS = b'\xc0' * 20
+
+SENDER_KEYS = tuple(keys.PrivateKey(bytes([index + 1]) * 32) for index in range(8))
+
+
+class StateServingEventBus:
+    """
+    Serve each missing trie node or bytecode from a complete database, after a delay.
+    """
+    def __init__(self, source_db, target_db, latency):
+        self._source_db = source_db
+        self._target_db = target_db
+        self._latency = latency
+
+    def is_any_endpoint_subscribed_to(self, event_type):
+        return True
+
+    async def request(self, event):
+        await asyncio.sleep(self._latency)
+        if isinstance(event, CollectMissingBytecode):
+            self._target_db[event.bytecode_hash] = self._source_db[event.bytecode_hash]
+            return MissingBytecodeResult()
+
+        self._target_db[event.missing_node_hash] = self._source_db[event.missing_node_hash]
+        return event.expected_response_type()(num_nodes_collected=1)
+
+
+@pytest.fixture
+def source_chain():
+    genesis_state = {
+        key.public_key.to_canonical_address(): {
+            'balance': to_wei(1, 'ether'),
+            'nonce': 0,
+            'code': b'',
+            'storage': {},
+        }
+        for key in SENDER_KEYS
+    }
+    genesis_state[CONTRACT_ADDRESS] = {
+        'balance': 0,
+        'nonce': 0,
+        'code': CONTRACT_CODE,
+        'storage': {slot: slot + 1 for slot in range(NUM_STORAGE_SLOTS)},
+    }
+    genesis_params = {
+        'block_number': eth_constants.GENESIS_BLOCK_NUMBER,
+        'difficulty': eth_constants.GENESIS_DIFFICULTY,
+        'gas_limit': 3141592,
+        'parent_hash': eth_constants.GENESIS_PARENT_HASH,
+        'coinbase': eth_constants.GENESIS_COINBASE,
+        'nonce': eth_constants.GENESIS_NONCE,
+        'mix_hash': eth_constants.GENESIS_MIX_HASH,
+        'extra_data': eth_constants.GENESIS_EXTRA_DATA,
+        'timestamp': 1501851927,
+    }
+    klass = MiningChain.configure(
+        __name__='BeamSourceChain',
+        vm_configuration=VM_CONFIGURATION,
+        chain_id=CHAIN_ID,
+    )
+    return klass.from_genesis(AtomicDB(), genesis_params, genesis_state)
+
+
+def _mine_contract_calls(chain):
+    for key in SENDER_KEYS:
+        transaction = chain.create_unsigned_transaction(
+            nonce=0,
+            gas_price=1,
+            gas=100000,
+            to=CONTRACT_ADDRESS,
+            value=0,
+            data=b'',
+        ).as_signed_transaction(key, chain_id=CHAIN_ID)
+        chain.apply_transaction(transaction)
+    return chain.mine_block()
+
+
+async def _beam_import(source_chain, block, batch_missing_data):
+    target_db = AtomicDB()
+    ChainDB(target_db).persist_header(source_chain.get_canonical_block_header_by_number(0))
+
+    loop = asyncio.get_event_loop()
+    beam_chain = make_pausing_beam_chain(
+        VM_CONFIGURATION,
+        CHAIN_ID,
+        ConsensusContext,
+        target_db,
+        StateServingEventBus(source_chain.chaindb.db, target_db, latency=0.01),
+        loop,
+        batch_missing_data=batch_missing_data,
+    )
+    import_result = await loop.run_in_executor(None, beam_chain.import_block, block)
+
+    assert import_result.imported_block == block
+    return beam_chain.get_first_vm().get_beam_stats()
+
+
+@pytest.mark.asyncio
+async def test_batched_missing_data_pauses_less(source_chain):
+    block = _mine_contract_calls(source_chain)
+
+    unbatched_stats = await _beam_import(source_chain, block, batch_missing_data=False)
+    batched_stats = await _beam_import(source_chain, block, batch_missing_data=True)
+
+    assert unbatched_stats.num_predicted_requests == 0
+    assert unbatched_stats.num_pauses == unbatched_stats.num_requests
+
+    # Nothing is requested that the block does not need, but after the first transaction
+    #   the accounts of all the other senders are requested in one batch.
+    assert batched_stats.num_requests == unbatched_stats.num_requests
+    assert batched_stats.num_predicted_requests >= len(SENDER_KEYS) - 1
+    assert batched_stats.num_pauses <= unbatched_stats.num_pauses - (len(SENDER_KEYS) - 1)
+    assert batched_stats.data_pause_time < unbatched_stats.data_pause_time
+
+    comparison = batched_stats.compare(unbatched_stats)
+    assert f"pauses={unbatched_stats.num_pauses}->{batched_stats.num_pauses}" in comparison
+
+
+def test_beam_stats_comparison_without_baseline_pauses():
+    assert BeamStats().compare(BeamStats()).startswith(
+        "BeamStat comparison: pauses=0->0 (n/a), "
+    )
@@ -0,0 +1,61 @@
+import io
+
+from eth.vm.forks.spurious_dragon import SpuriousDragonBlock
+import pytest
+import rlp
+
+from trinity.sync.beam.witness import (
+    BlockWitnessRecorder,
+    read_block_witnesses,
+    write_block_witness,
+)
+
+
+@pytest.fixture
+def blocks(chain_without_block_validation):
+    chain = chain_without_block_validation
+    return tuple(chain.mine_block() for _ in range(3))
+
+
+def test_block_witnesses_round_trip(chain_without_block_validation, blocks):
+    chain = chain_without_block_validation
+    stream = io.BytesIO()
+    witnesses = tuple(
+        (chain.get_block_header_by_hash(block.header.parent_hash), block, (b'node', bytes(64)))
+        for block in blocks
+    )
+
+    num_bytes = sum(write_block_witness(stream, *witness) for witness in witnesses)
+
+    assert num_bytes == len(stream.getvalue())
+    stream.seek(0)
+    read_witnesses = tuple(read_block_witnesses(stream))
+    assert len(read_witnesses) == len(witnesses)
+    for read_witness, (parent_header, block, nodes) in zip(read_witnesses, witnesses):
+        assert read_witness.parent_header == parent_header
+        assert read_witness.block_number == block.number
+        assert read_witness.get_block(SpuriousDragonBlock) == block
+        assert read_witness.nodes == nodes
+
+
+def test_truncated_block_witness(chain_without_block_validation, blocks):
+    chain = chain_without_block_validation
+    stream = io.BytesIO()
+    write_block_witness(stream, chain.get_canonical_block_header_by_number(0), blocks[0], ())
+
+    truncated_stream = io.BytesIO(stream.getvalue()[:-1])
+    with pytest.raises(rlp.DecodingError):
+        tuple(read_block_witnesses(truncated_stream))
+
+
+def test_witness_recorder_appends(tmp_path, chain_without_block_validation, blocks):
+    chain = chain_without_block_validation
+    genesis_header = chain.get_canonical_block_header_by_number(0)
+    recorder = BlockWitnessRecorder(tmp_path / 'witnesses')
+
+    recorder.record(genesis_header, blocks[0], (b'node',))
+    recorder.record(blocks[0].header, blocks[1], ())
+
+    with recorder.path.open('rb') as stream:
+        parent_headers = tuple(witness.parent_header for witness in read_block_witnesses(stream))
+    assert parent_headers == (genesis_header, blocks[0].header)
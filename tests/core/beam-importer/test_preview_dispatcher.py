@@ -0,0 +1,149 @@
+import asyncio
+from pathlib import Path
+import uuid
+
+from async_service import background_asyncio_service
+from eth.rlp.headers import BlockHeader
+from lahja import AsyncioEndpoint, ConnectionConfig
+import pytest
+
+from trinity.components.builtin.metrics.registry import NoopMetricsRegistry
+from trinity.sync.beam import importer
+from trinity.sync.beam.importer import BlockPreviewDispatcher
+from trinity.sync.common.events import (
+    DoStatelessBlockPreview,
+    DoWorkerBlockPreview,
+    WorkerBlockPreviewDone,
+)
+
+
+def _connection_config(name):
+    # Tests run concurrently, therefore we need unique IPC paths
+    return ConnectionConfig(name=name, path=Path(f"{name}-{uuid.uuid4()}.ipc"))
+
+
+class FakePreviewWorker:
+    """
+    Hold every preview until it is released, then reply that it took one second.
+    """
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.previewed_block_numbers = []
+        self.release = asyncio.Event()
+
+    async def serve(self):
+        async for event in self.endpoint.stream(DoWorkerBlockPreview):
+            self.previewed_block_numbers.append(event.header.block_number)
+            asyncio.ensure_future(self._reply_when_released(event))
+
+    async def _reply_when_released(self, event):
+        await self.release.wait()
+        await self.endpoint.broadcast(WorkerBlockPreviewDone(1.0), event.broadcast_config())
+
+
+async def _preview_block(syncer_endpoint, block_number):
+    header = BlockHeader(difficulty=1, block_number=block_number, gas_limit=3141592)
+    await syncer_endpoint.broadcast(DoStatelessBlockPreview(header, ()))
+
+
+@pytest.mark.asyncio
+async def test_block_preview_dispatcher_picks_least_loaded_worker():
+    configs = tuple(
+        _connection_config(name)
+        for name in ('dispatcher', 'syncer', 'preview-worker-0', 'preview-worker-1')
+    )
+    async with AsyncioEndpoint.serve(configs[0]) as dispatcher_endpoint, \
+            AsyncioEndpoint.serve(configs[1]) as syncer_endpoint, \
+            AsyncioEndpoint.serve(configs[2]) as worker_endpoint_0, \
+            AsyncioEndpoint.serve(configs[3]) as worker_endpoint_1:
+
+        for endpoint in (syncer_endpoint, worker_endpoint_0, worker_endpoint_1):
+            await endpoint.connect_to_endpoints(configs[0])
+
+        workers = (FakePreviewWorker(worker_endpoint_0), FakePreviewWorker(worker_endpoint_1))
+        worker_tasks = tuple(asyncio.ensure_future(worker.serve()) for worker in workers)
+        for worker in workers:
+            await dispatcher_endpoint.wait_until_endpoint_subscribed_to(
+                worker.endpoint.name,
+                DoWorkerBlockPreview,
+            )
+
+        dispatcher = BlockPreviewDispatcher(
+            dispatcher_endpoint,
+            (worker_endpoint_0.name, worker_endpoint_1.name),
+            NoopMetricsRegistry(),
+        )
+        async with background_asyncio_service(dispatcher):
+            await syncer_endpoint.wait_until_any_endpoint_subscribed_to(DoStatelessBlockPreview)
+
+            # Previews alternate between workers while both are equally busy
+            for block_number in range(1, 4):
+                await _preview_block(syncer_endpoint, block_number)
+                await asyncio.sleep(0.05)
+            assert workers[0].previewed_block_numbers == [1, 3]
+            assert workers[1].previewed_block_numbers == [2]
+            assert [load.num_queued for load in dispatcher.worker_loads] == [2, 1]
+
+            for worker in workers:
+                worker.release.set()
+            await asyncio.sleep(0.05)
+            assert [load.num_queued for load in dispatcher.worker_loads] == [0, 0]
+            assert [load.num_completed for load in dispatcher.worker_loads] == [2, 1]
+            assert [load.busy_time for load in dispatcher.worker_loads] == [2.0, 1.0]
+
+            # With no previews queued, the worker that was less busy gets the preview
+            await _preview_block(syncer_endpoint, 4)
+            await asyncio.sleep(0.05)
+            assert workers[1].previewed_block_numbers == [2, 4]
+
+        for task in worker_tasks:
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_block_preview_dispatcher_times_out_unresponsive_worker(monkeypatch):
+    monkeypatch.setattr(importer, 'PREVIEW_WORKER_TIMEOUT', 0.1)
+    configs = tuple(
+        _connection_config(name)
+        for name in ('dispatcher', 'syncer', 'preview-worker-0')
+    )
+    async with AsyncioEndpoint.serve(configs[0]) as dispatcher_endpoint, \
+            AsyncioEndpoint.serve(configs[1]) as syncer_endpoint, \
+            AsyncioEndpoint.serve(configs[2]) as worker_endpoint:
+
+        for endpoint in (syncer_endpoint, worker_endpoint):
+            await endpoint.connect_to_endpoints(configs[0])
+
+        # The worker never releases its previews
+        worker = FakePreviewWorker(worker_endpoint)
+        worker_task = asyncio.ensure_future(worker.serve())
+        await dispatcher_endpoint.wait_until_endpoint_subscribed_to(
+            worker_endpoint.name,
+            DoWorkerBlockPreview,
+        )
+
+        dispatcher = BlockPreviewDispatcher(
+            dispatcher_endpoint,
+            (worker_endpoint.name,),
+            NoopMetricsRegistry(),
+        )
+        async with background_asyncio_service(dispatcher):
+            await syncer_endpoint.wait_until_any_endpoint_subscribed_to(DoStatelessBlockPreview)
+
+            await _preview_block(syncer_endpoint, 1)
+            await asyncio.sleep(0.05)
+            assert dispatcher.worker_loads[0].num_queued == 1
+
+            await asyncio.sleep(0.2)
+            load = dispatcher.worker_loads[0]
+            assert worker.previewed_block_numbers == [1]
+            assert load.num_queued == 0
+            assert load.num_timed_out == 1
+            assert load.num_completed == 0
+
+            # A late reply is not counted
+            worker.release.set()
+            await asyncio.sleep(0.05)
+            assert load.num_completed == 0
+
+        worker_task.cancel()
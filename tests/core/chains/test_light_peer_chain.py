@@ -1,9 +1,106 @@
-from trinity.sync.light.service import (
-    LightPeerChain
-)
+import asyncio
+import contextlib
+import itertools
+
+from async_service import background_asyncio_service
+from eth.db.atomic import AtomicDB
+from eth.rlp.headers import BlockHeader
+import pytest
+
 from trinity.chains.light_eventbus import (
     EventBusLightPeerChain
 )
+from trinity.db.eth1.header import AsyncHeaderDB
+from trinity.protocol.les.commands import BlockBodies
+from trinity.protocol.les.payloads import BlockBodiesPayload
+from trinity.rlp.block_body import BlockBody
+from trinity.sync.light.scheduler import (
+    PeerRequestScheduler,
+    RequestBatcher,
+)
+from trinity.sync.light.service import (
+    LightPeerChain
+)
+
+
+GENESIS_HEADER = BlockHeader(difficulty=131072, block_number=0, gas_limit=3141592)
+
+_request_ids = itertools.count()
+
+
+class FakeHeadInfo:
+    def __init__(self, head_td):
+        self.head_td = head_td
+
+
+class FakeLESPeer:
+    """
+    Serve block bodies after a delay, to the subscribers of the peer pool.
+    """
+    def __init__(self, name, head_td, latency, bodies_by_hash):
+        self.name = name
+        self.head_info = FakeHeadInfo(head_td)
+        self.les_api = self
+        self.latency = latency
+        self.peer_pool = None
+        self.requested_batches = []
+        self._bodies_by_hash = bodies_by_hash
+
+    def __repr__(self):
+        return self.name
+
+    def send_get_block_bodies(self, block_hashes):
+        self.requested_batches.append(tuple(block_hashes))
+        request_id = next(_request_ids)
+        bodies = tuple(
+            self._bodies_by_hash[block_hash]
+            for block_hash in block_hashes
+            if block_hash in self._bodies_by_hash
+        )
+        reply = BlockBodies(BlockBodiesPayload(request_id, 0, bodies))
+        asyncio.get_event_loop().call_later(self.latency, self._deliver, reply)
+        return request_id
+
+    def _deliver(self, cmd):
+        for subscriber in self.peer_pool.subscribers:
+            subscriber.msg_queue.put_nowait((self, cmd))
+
+
+class FakeLESPeerPool:
+    def __init__(self, peers):
+        self.connected_nodes = {peer.name: peer for peer in peers}
+        self.subscribers = []
+        for peer in peers:
+            peer.peer_pool = self
+
+    @property
+    def highest_td_peer(self):
+        return max(self.connected_nodes.values(), key=lambda peer: peer.head_info.head_td)
+
+    def subscribe(self, subscriber):
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.remove(subscriber)
+
+
+@pytest.fixture
+def headerdb():
+    headerdb = AsyncHeaderDB(AtomicDB())
+    headerdb.persist_header(GENESIS_HEADER)
+    return headerdb
+
+
+@pytest.fixture
+def bodies_by_hash():
+    bodies = tuple(
+        BlockBody(
+            transactions=(),
+            uncles=(BlockHeader(difficulty=1, block_number=number, gas_limit=3141592),),
+        )
+        for number in range(10)
+    )
+    return {body.uncles[0].hash: body for body in bodies}
 
 
 # These tests may seem obvious but they safe us from runtime errors where
@@ -18,3 +115,110 @@ def test_can_instantiate_eventbus_light_peer_chain():
 def test_can_instantiate_light_peer_chain():
     chain = LightPeerChain(None, None)
     assert chain is not None
+
+
+@pytest.mark.asyncio
+async def test_light_peer_chain_coalesces_concurrent_requests(headerdb, bodies_by_hash):
+    peer = FakeLESPeer('peer', GENESIS_HEADER.difficulty, 0.01, bodies_by_hash)
+    chain = LightPeerChain(headerdb, FakeLESPeerPool([peer]))
+
+    async with background_asyncio_service(chain):
+        block_hashes = tuple(bodies_by_hash)
+        bodies = await asyncio.gather(*(
+            chain.coro_get_block_body_by_hash(block_hash) for block_hash in block_hashes
+        ))
+
+    assert bodies == [bodies_by_hash[block_hash] for block_hash in block_hashes]
+    assert peer.requested_batches == [block_hashes]
+
+
+@pytest.mark.asyncio
+async def test_light_peer_chain_refetches_items_missing_from_batch(headerdb, bodies_by_hash):
+    block_hashes = tuple(bodies_by_hash)
+    missing_hash = block_hashes[3]
+    served_bodies = {
+        block_hash: body for block_hash, body in bodies_by_hash.items()
+        if block_hash != missing_hash
+    }
+    peer = FakeLESPeer('peer', GENESIS_HEADER.difficulty, 0.01, served_bodies)
+    chain = LightPeerChain(headerdb, FakeLESPeerPool([peer]))
+
+    async with background_asyncio_service(chain):
+        results = await asyncio.gather(
+            *(chain.coro_get_block_body_by_hash(block_hash) for block_hash in block_hashes),
+            return_exceptions=True,
+        )
+
+    for block_hash, result in zip(block_hashes, results):
+        if block_hash == missing_hash:
+            assert "has no block" in str(result)
+        else:
+            assert result == bodies_by_hash[block_hash]
+    # The peer returned too few bodies to match them to hashes, so each was requested alone
+    assert len(peer.requested_batches) == 1 + len(block_hashes)
+
+
+@pytest.mark.asyncio
+async def test_peer_request_scheduler_prefers_fast_idle_peers(headerdb):
+    fast_peer = FakeLESPeer('fast', GENESIS_HEADER.difficulty, 0.01, {})
+    slow_peer = FakeLESPeer('slow', GENESIS_HEADER.difficulty + 1, 0.1, {})
+    behind_peer = FakeLESPeer('behind', GENESIS_HEADER.difficulty - 1, 0, {})
+    scheduler = PeerRequestScheduler(
+        FakeLESPeerPool([fast_peer, slow_peer, behind_peer]),
+        headerdb,
+    )
+
+    for peer in (fast_peer, slow_peer):
+        with scheduler.track_request(peer):
+            await asyncio.sleep(peer.latency)
+    assert scheduler.get_latency(fast_peer) < scheduler.get_latency(slow_peer)
+
+    assert await scheduler.choose_peer() is fast_peer
+
+    with contextlib.ExitStack() as stack:
+        for _ in range(20):
+            stack.enter_context(scheduler.track_request(fast_peer))
+        # The fast peer is busy enough that the slow peer should reply sooner
+        assert await scheduler.choose_peer() is slow_peer
+
+    assert await scheduler.choose_peer() is fast_peer
+
+
+@pytest.mark.asyncio
+async def test_peer_request_scheduler_spreads_requests_over_unmeasured_peers(headerdb):
+    peers = tuple(
+        FakeLESPeer(f'peer{index}', GENESIS_HEADER.difficulty, 0, {})
+        for index in range(3)
+    )
+    scheduler = PeerRequestScheduler(FakeLESPeerPool(peers), headerdb)
+
+    chosen_peers = []
+    with contextlib.ExitStack() as stack:
+        for _ in range(2 * len(peers)):
+            peer = await scheduler.choose_peer()
+            chosen_peers.append(peer)
+            stack.enter_context(scheduler.track_request(peer))
+
+    assert all(chosen_peers.count(peer) == 2 for peer in peers)
+
+
+@pytest.mark.asyncio
+async def test_request_batcher_deduplicates_in_flight_requests():
+    requested_batches = []
+
+    async def fetch_batch(keys):
+        requested_batches.append(keys)
+        await asyncio.sleep(0.01)
+        return tuple(key * 10 for key in keys)
+
+    batcher = RequestBatcher(fetch_batch, max_batch_size=2)
+    async with background_asyncio_service(batcher):
+        results = await asyncio.gather(
+            batcher.get(1),
+            batcher.get(2),
+            batcher.get(1),
+            batcher.get(3),
+        )
+
+    assert results == [10, 20, 10, 30]
+    assert requested_batches == [(1, 2), (3,)]
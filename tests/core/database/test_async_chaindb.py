@@ -0,0 +1,67 @@
+from eth.db.atomic import AtomicDB
+from eth.db.trie import make_trie_root_and_nodes
+from eth.exceptions import ParentNotFound
+from eth_hash.auto import keccak
+import pytest
+
+from trinity.db.eth1.chain import AsyncChainDB
+
+from tests.core.integration_test_helpers import (
+    DBFixture,
+    load_fixture_db,
+    load_mining_chain,
+)
+
+
+@pytest.fixture
+def source_chain():
+    for leveldb in load_fixture_db(DBFixture.THOUSAND_POW_HEADERS):
+        yield load_mining_chain(AtomicDB(leveldb))
+
+
+@pytest.fixture
+def fresh_chain():
+    return load_mining_chain(AtomicDB())
+
+
+def _get_blocks(chain, block_numbers):
+    return tuple(chain.get_canonical_block_by_number(number) for number in block_numbers)
+
+
+@pytest.mark.asyncio
+async def test_persist_blocks_in_one_batch(source_chain, fresh_chain):
+    blocks = _get_blocks(source_chain, range(1, 101))
+    # fast sync writes the transaction tries separately, when the bodies arrive
+    transaction_trie_data = tuple(
+        make_trie_root_and_nodes(block.transactions)[1] for block in blocks
+    )
+    receipt_trie_data = {keccak(b'receipt-node'): b'receipt-node'}
+    chaindb = AsyncChainDB(fresh_chain.chaindb.db)
+
+    new_canonical_hashes, old_canonical_hashes = await chaindb.coro_persist_blocks(
+        blocks,
+        transaction_trie_data + (receipt_trie_data, ),
+    )
+
+    assert new_canonical_hashes == tuple(block.hash for block in blocks)
+    assert old_canonical_hashes == ()
+    assert chaindb.get_canonical_head() == blocks[-1].header
+    for block in blocks:
+        assert fresh_chain.get_canonical_block_by_number(block.number) == block
+        for index, transaction in enumerate(block.transactions):
+            assert chaindb.get_transaction_index(transaction.hash) == (block.number, index)
+    assert all(chaindb.exists(node_hash) for node_hash in receipt_trie_data)
+
+
+@pytest.mark.asyncio
+async def test_persist_blocks_is_atomic(source_chain, fresh_chain):
+    blocks = _get_blocks(source_chain, (1, 2, 4))
+    chaindb = AsyncChainDB(fresh_chain.chaindb.db)
+    genesis = chaindb.get_canonical_head()
+
+    with pytest.raises(ParentNotFound):
+        await chaindb.coro_persist_blocks(blocks)
+
+    # none of the blocks was written, not even the ones before the gap
+    assert chaindb.get_canonical_head() == genesis
+    assert not chaindb.header_exists(blocks[0].hash)
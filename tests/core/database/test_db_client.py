@@ -56,3 +56,41 @@ class TestDBClientDatabaseAPI(DatabaseAPITestSuite):
 
 class TestDBClientAtomicBatchAPI(AtomicDatabaseBatchAPITestSuite):
     pass
+
+
+def test_db_client_multi_get(db_client, base_db):
+    base_db[b'key-a'] = b'value-a'
+    base_db[b'key-c'] = b''
+
+    assert db_client.multi_get((b'key-a', b'key-b', b'key-c')) == (b'value-a', None, b'')
+
+
+def test_db_client_multi_get_none_present(db_client):
+    assert db_client.multi_get((b'key-a', b'key-b')) == (None, None)
+
+
+def test_db_client_multi_exists(db_client, base_db):
+    base_db[b'key-a'] = b'value-a'
+    base_db[b'key-c'] = b'value-c'
+
+    assert db_client.multi_exists((b'key-a', b'key-b', b'key-c')) == (True, False, True)
+
+
+@pytest.mark.parametrize('method_name', ('multi_get', 'multi_exists'))
+def test_db_client_multi_empty(db_client, method_name):
+    assert getattr(db_client, method_name)(()) == ()
+
+
+def test_db_client_multi_get_large_batch(db_client, base_db):
+    keys = tuple(i.to_bytes(32, 'big') for i in range(1024))
+    for key in keys[::2]:
+        base_db[key] = key * 10
+
+    values = db_client.multi_get(keys)
+
+    assert values == tuple(
+        key * 10 if index % 2 == 0 else None
+        for index, key in enumerate(keys)
+    )
+    # the connection is still usable after a large batch
+    assert db_client.multi_exists(keys[:2]) == (True, False)
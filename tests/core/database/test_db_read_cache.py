@@ -0,0 +1,186 @@
+import pathlib
+import tempfile
+
+from eth.db.atomic import AtomicDB
+from eth_hash.auto import keccak
+from pyformance import MetricsRegistry
+import pytest
+
+from eth.tools.db.atomic import AtomicDatabaseBatchAPITestSuite
+from eth.tools.db.base import DatabaseAPITestSuite
+
+from trinity.db.cache import ContentAddressedCache, ReadCacheReporter
+from trinity.db.manager import (
+    DBClient,
+    DBManager,
+    PooledDBClient,
+)
+
+
+@pytest.fixture
+def ipc_path():
+    with tempfile.TemporaryDirectory() as dir:
+        ipc_path = pathlib.Path(dir) / "db_manager.ipc"
+        yield ipc_path
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def db_manager(base_db, ipc_path):
+    with DBManager(base_db).run(ipc_path) as manager:
+        yield manager
+
+
+@pytest.fixture
+def read_cache():
+    return ContentAddressedCache()
+
+
+@pytest.fixture(params=[DBClient, PooledDBClient])
+def db_client(request, ipc_path, db_manager, read_cache):
+    client = request.param.connect(ipc_path, read_cache=read_cache)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture
+def db(db_client):
+    return db_client
+
+
+@pytest.fixture
+def atomic_db(db):
+    return db
+
+
+class TestCachedDBClientDatabaseAPI(DatabaseAPITestSuite):
+    pass
+
+
+class TestCachedDBClientAtomicBatchAPI(AtomicDatabaseBatchAPITestSuite):
+    pass
+
+
+def test_cache_only_accepts_content_addressed_values():
+    cache = ContentAddressedCache()
+    value = b'trie-node'
+
+    assert not cache.maybe_add(b'\x00' * 32, value)
+    assert not cache.maybe_add(b'short-key', value)
+    assert cache.maybe_add(keccak(value), value)
+
+    assert cache.get(keccak(value)) == value
+    assert b'\x00' * 32 not in cache
+
+
+def test_cache_evicts_least_recently_used():
+    values = (b'a' * 100, b'b' * 100, b'c' * 100)
+    keys = tuple(keccak(value) for value in values)
+    # room for exactly two items
+    cache = ContentAddressedCache(max_size=2 * (32 + 100))
+
+    cache.maybe_add(keys[0], values[0])
+    cache.maybe_add(keys[1], values[1])
+    # refresh the first item, so the second one is the least recently used
+    assert cache.get(keys[0]) == values[0]
+    cache.maybe_add(keys[2], values[2])
+
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert keys[2] in cache
+    assert cache.size == 2 * (32 + 100)
+
+
+def test_cache_skips_values_bigger_than_cache():
+    cache = ContentAddressedCache(max_size=64)
+    value = b'x' * 64
+
+    assert not cache.maybe_add(keccak(value), value)
+    assert len(cache) == 0
+
+
+def test_client_serves_content_addressed_reads_from_cache(db_client, base_db, read_cache):
+    value = b'trie-node'
+    key = keccak(value)
+    base_db[key] = value
+
+    assert db_client[key] == value
+    assert (read_cache.hits, read_cache.misses) == (0, 1)
+
+    # The cached value is served, even if the database is changed by another client
+    del base_db[key]
+    assert db_client[key] == value
+    assert (read_cache.hits, read_cache.misses) == (1, 1)
+
+
+def test_client_does_not_cache_mutable_values(db_client, base_db, read_cache):
+    key = b'\x01' * 32
+    base_db[key] = b'old-value'
+    assert db_client[key] == b'old-value'
+
+    base_db[key] = b'new-value'
+    assert db_client[key] == b'new-value'
+    assert len(read_cache) == 0
+
+
+def test_client_evicts_local_deletes(db_client, base_db, read_cache):
+    value = b'trie-node'
+    key = keccak(value)
+    base_db[key] = value
+    assert db_client[key] == value
+
+    del db_client[key]
+
+    assert key not in read_cache
+    with pytest.raises(KeyError):
+        db_client[key]
+
+
+def test_client_evicts_local_batch_deletes(db_client, base_db, read_cache):
+    value = b'trie-node'
+    key = keccak(value)
+    base_db[key] = value
+    assert db_client[key] == value
+
+    with db_client.atomic_batch() as batch:
+        del batch[key]
+
+    assert key not in read_cache
+    assert key not in db_client
+
+
+def test_client_multi_get_uses_cache(db_client, base_db, read_cache):
+    values = (b'node-a', b'node-b')
+    keys = tuple(keccak(value) for value in values)
+    for key, value in zip(keys, values):
+        base_db[key] = value
+    missing_key = keccak(b'missing')
+
+    assert db_client[keys[0]] == values[0]
+    assert db_client.multi_get((keys[0], missing_key, keys[1])) == (values[0], None, values[1])
+    assert read_cache.hits == 1
+    assert keys[1] in read_cache
+
+
+def test_read_cache_reporter_sets_gauges():
+    cache = ContentAddressedCache()
+    value = b'node'
+    cache.maybe_add(keccak(value), value)
+    cache.get(keccak(value))
+    cache.get(keccak(b'missing'))
+    registry = MetricsRegistry()
+
+    ReadCacheReporter(cache, 'test', registry).report()
+
+    def get_gauge(stat):
+        return registry.gauge(f'trinity.db/test_read_cache_{stat}.gauge').get_value()
+
+    assert (get_gauge('hits'), get_gauge('misses')) == (1, 1)
+    assert get_gauge('hit_rate') == 0.5
+    assert get_gauge('size') == cache.size
@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+import pathlib
+import tempfile
+import time
+
+from eth.db.atomic import AtomicDB
+import pytest
+
+from eth.tools.db.atomic import AtomicDatabaseBatchAPITestSuite
+from eth.tools.db.base import DatabaseAPITestSuite
+
+from trinity.db.manager import (
+    DBManager,
+    PooledDBClient,
+)
+
+
+POOL_SIZE = 4
+
+
+class SlowReadDB(AtomicDB):
+    read_delay = 0.2
+
+    def __getitem__(self, key):
+        time.sleep(self.read_delay)
+        return super().__getitem__(key)
+
+
+@pytest.fixture
+def ipc_path():
+    with tempfile.TemporaryDirectory() as dir:
+        ipc_path = pathlib.Path(dir) / "db_manager.ipc"
+        yield ipc_path
+
+
+@pytest.fixture
+def base_db():
+    return AtomicDB()
+
+
+@pytest.fixture
+def db_manager(base_db, ipc_path):
+    with DBManager(base_db).run(ipc_path) as manager:
+        yield manager
+
+
+@pytest.fixture
+def pooled_client(ipc_path, db_manager):
+    client = PooledDBClient.connect(ipc_path, pool_size=POOL_SIZE)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+@pytest.fixture
+def db(pooled_client):
+    return pooled_client
+
+
+@pytest.fixture
+def atomic_db(db):
+    return db
+
+
+class TestPooledDBClientDatabaseAPI(DatabaseAPITestSuite):
+    pass
+
+
+class TestPooledDBClientAtomicBatchAPI(AtomicDatabaseBatchAPITestSuite):
+    pass
+
+
+def test_pooled_client_opens_connections_on_demand(pooled_client):
+    assert pooled_client.num_open_connections == 1
+
+    pooled_client[b'key'] = b'value'
+    assert pooled_client[b'key'] == b'value'
+
+    # serial access reuses the same connection
+    assert pooled_client.num_open_connections == 1
+
+
+def test_pooled_client_multi_get_and_exists(pooled_client, base_db):
+    base_db[b'key-a'] = b'value-a'
+
+    assert pooled_client.multi_get((b'key-a', b'key-b')) == (b'value-a', None)
+    assert pooled_client.multi_exists((b'key-a', b'key-b')) == (True, False)
+
+
+def test_pooled_client_concurrent_reads_overlap(ipc_path):
+    base_db = SlowReadDB()
+    base_db[b'key'] = b'value'
+
+    with DBManager(base_db).run(ipc_path):
+        client = PooledDBClient.connect(ipc_path, pool_size=POOL_SIZE)
+        with client:
+            with ThreadPoolExecutor(POOL_SIZE) as executor:
+                start = time.monotonic()
+                values = tuple(executor.map(lambda _: client[b'key'], range(POOL_SIZE)))
+                elapsed = time.monotonic() - start
+
+            assert values == (b'value', ) * POOL_SIZE
+            assert client.num_open_connections == POOL_SIZE
+
+    # A single connection would serialize the reads, taking POOL_SIZE * read_delay
+    assert elapsed < (POOL_SIZE - 1) * SlowReadDB.read_delay
+
+
+def test_pooled_client_never_exceeds_pool_size(pooled_client):
+    pooled_client[b'key'] = b'value'
+
+    with ThreadPoolExecutor(POOL_SIZE * 4) as executor:
+        values = tuple(executor.map(lambda _: pooled_client[b'key'], range(100)))
+
+    assert values == (b'value', ) * 100
+    assert pooled_client.num_open_connections <= POOL_SIZE
+
+
+def test_pooled_client_rejects_empty_pool(ipc_path):
+    with pytest.raises(ValueError):
+        PooledDBClient(ipc_path, pool_size=0)
@@ -0,0 +1,89 @@
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+from eth_hash.auto import keccak
+import pytest
+import rlp
+
+from p2p.exchange import normalization_pool
+from p2p.exchange.pool import get_normalization_pool
+
+from trinity.protocol.eth.commands import (
+    BlockBodiesV65,
+    NodeDataV65,
+    ReceiptsV65,
+)
+from trinity.protocol.eth.normalizers import (
+    GetBlockBodiesNormalizer,
+    GetNodeDataNormalizer,
+    ReceiptsNormalizer,
+)
+from trinity.rlp.block_body import BlockBody
+
+
+def _make_transaction(nonce):
+    return BaseTransactionFields(nonce, 1, 21000, b'\x01' * 20, 10, b'', 27, 1, 2)
+
+
+def _make_receipt(gas_used):
+    return Receipt(b'\x01', gas_used, [])
+
+
+NODE_DATA = NodeDataV65(tuple(b'node-%d' % index for index in range(10)))
+RECEIPTS = ReceiptsV65(tuple(
+    tuple(_make_receipt(gas) for gas in range(num_receipts))
+    for num_receipts in (1, 3, 5)
+))
+BODIES = BlockBodiesV65(tuple(
+    BlockBody(tuple(_make_transaction(nonce) for nonce in range(num_transactions)), ())
+    for num_transactions in (0, 2, 7)
+))
+
+
+def test_node_data_normalizer():
+    result = GetNodeDataNormalizer().normalize_result(NODE_DATA)
+    assert result == tuple((keccak(node), node) for node in NODE_DATA.payload)
+
+
+def test_receipts_normalizer():
+    result = ReceiptsNormalizer().normalize_result(RECEIPTS)
+    assert result == tuple(
+        (receipts, make_trie_root_and_nodes(receipts)) for receipts in RECEIPTS.payload
+    )
+
+
+def test_block_bodies_normalizer():
+    result = GetBlockBodiesNormalizer().normalize_result(BODIES)
+    assert result == tuple(
+        (body, make_trie_root_and_nodes(body.transactions), keccak(rlp.encode(body.uncles)))
+        for body in BODIES.payload
+    )
+
+
+@pytest.mark.parametrize(
+    'normalizer, cmd',
+    (
+        (GetNodeDataNormalizer(), NODE_DATA),
+        (ReceiptsNormalizer(), RECEIPTS),
+        (GetBlockBodiesNormalizer(), BODIES),
+    ),
+)
+def test_normalizers_in_process_pool(normalizer, cmd):
+    with normalization_pool(2) as pool:
+        assert get_normalization_pool() is pool
+        computed = pool.submit(normalizer.compute, cmd.payload).result()
+
+    assert get_normalization_pool() is None
+    assert normalizer.combine(cmd, computed) == normalizer.normalize_result(cmd)
+
+
+def test_normalization_pool_without_workers():
+    with normalization_pool(0) as pool:
+        assert pool is None
+        assert get_normalization_pool() is None
+
+
+def test_normalization_pool_rejects_negative_workers():
+    with pytest.raises(ValueError):
+        with normalization_pool(-1):
+            pass
@@ -5,9 +5,11 @@ import logging
 import uuid
 
 from async_service import Service, background_asyncio_service
+from eth.chains.base import Chain
 from eth.consensus import ConsensusContext
 from eth.constants import EMPTY_SHA3
 from eth.db.atomic import AtomicDB
+from eth.db.chain import ChainDB
 from eth.db.schema import SchemaV1
 from eth.exceptions import (
     BlockNotFound,
@@ -18,7 +20,8 @@ from eth.vm.forks import (
     MuirGlacierVM,
     PetersburgVM,
 )
-from eth_utils import decode_hex
+from eth_hash.auto import keccak
+from eth_utils import ValidationError, decode_hex
 from lahja import ConnectionConfig, AsyncioEndpoint
 import pytest
 import rlp
@@ -35,6 +38,8 @@ from trie.iter import (
     NodeIterator,
 )
 
+from p2p.exchange import normalization_pool
+
 from trinity.constants import TO_NETWORKING_BROADCAST_CONFIG
 from trinity.db.eth1.chain import AsyncChainDB
 from trinity.protocol.eth.payloads import NewBlockHash
@@ -45,7 +50,9 @@ from trinity.sync.beam.importer import (
     make_pausing_beam_chain,
     BlockImportServer,
 )
+from trinity.sync.common import headers as headers_module
 from trinity.sync.common.checkpoint import Checkpoint
+from trinity.sync.common.headers import HeaderMeatSyncer
 from trinity.sync.common.chain import (
     SimpleBlockImporter,
 )
@@ -61,6 +68,10 @@ from trinity.sync.beam.chain import (
     BodyChainGapSyncer,
 )
 from trinity.sync.beam.queen import QueeningQueue
+from trinity.sync.beam.witness import (
+    BlockWitnessRecorder,
+    read_block_witnesses,
+)
 from trinity.sync.header.chain import (
     HeaderChainSyncer,
     HeaderChainGapSyncer,
@@ -238,6 +249,7 @@ async def _beam_syncing(
         checkpoint=None,
         VM_at_0=PetersburgVM,
         enable_state_backfill=False,
+        witness_recorder=None,
 ):
 
     client_context = ChainContextFactory(headerdb__db=chaindb_fresh.db)
@@ -300,6 +312,7 @@ async def _beam_syncing(
                 checkpoint=checkpoint,
                 enable_state_backfill=enable_state_backfill,
                 enable_backfill=False,
+                witness_recorder=witness_recorder,
             )
 
             client_peer.logger.info("%s is serving churner blocks", client_peer)
@@ -368,6 +381,51 @@ async def test_beam_syncer_loads_recent_state_root(
         assert target_head.state_root in chaindb_fresh.db
 
 
+@pytest.mark.asyncio
+async def test_beam_syncer_records_replayable_witnesses(
+        request,
+        event_loop,
+        event_bus,
+        chaindb_fresh,
+        chaindb_churner,
+        tmp_path):
+
+    beam_to_block = 66
+    witness_recorder = BlockWitnessRecorder(tmp_path / 'witnesses')
+    sync_test_service = _beam_syncing(
+        request,
+        event_loop,
+        event_bus,
+        chaindb_fresh,
+        chaindb_churner,
+        beam_to_block,
+        witness_recorder=witness_recorder,
+    )
+
+    async with sync_test_service:
+        target_head = chaindb_churner.get_canonical_block_header_by_number(beam_to_block + 5)
+        await wait_for_head(chaindb_fresh, target_head, sync_timeout=10)
+
+    with witness_recorder.path.open('rb') as witness_file:
+        witnesses = tuple(read_block_witnesses(witness_file))
+    assert witnesses
+
+    # Each witness has all the state needed to import its block, without the network
+    ReplayChain = Chain.configure(vm_configuration=((0, PetersburgVM),), chain_id=999)
+    for witness in witnesses:
+        replay_db = AtomicDB()
+        ChainDB(replay_db).persist_checkpoint_header(
+            witness.parent_header,
+            witness.parent_header.difficulty,
+        )
+        for node in witness.nodes:
+            replay_db[keccak(node)] = node
+
+        block = witness.get_block(PetersburgVM.get_block_class())
+        import_result = ReplayChain(replay_db).import_block(block, perform_validation=False)
+        assert import_result.imported_block.header == block.header
+
+
 @pytest.mark.asyncio
 # Cases of interest:
 # -  0: This doesn't test beam sync or backfill, since all state is available immediately.
@@ -649,6 +707,31 @@ async def test_header_syncer(request,
                 await wait_for_head(chaindb_fresh, complete_chain_tip)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize('num_workers', (0, 2))
+async def test_header_segment_seals_checked_in_normalization_pool(
+        monkeypatch,
+        chaindb_20,
+        num_workers):
+
+    # check every seal, so that the invalid one is always found
+    monkeypatch.setattr(headers_module, 'SEAL_CHECK_RANDOM_SAMPLE_RATE', 1)
+
+    genesis = chaindb_20.get_canonical_block_header_by_number(0)
+    headers = tuple(
+        chaindb_20.get_canonical_block_header_by_number(number) for number in range(1, 21)
+    )
+    bad_nonce = (int.from_bytes(headers[-1].nonce, 'big') + 1).to_bytes(8, 'big')
+    bad_seal_headers = headers[:-1] + (headers[-1].copy(nonce=bad_nonce),)
+    meat_syncer = HeaderMeatSyncer(LatestTestChain(chaindb_20.db), None, None)
+
+    with normalization_pool(num_workers):
+        await meat_syncer._validate_segment(genesis, headers)
+
+        with pytest.raises(ValidationError, match="mix hash mismatch"):
+            await meat_syncer._validate_segment(genesis, bad_seal_headers)
+
+
 @pytest.mark.asyncio
 async def test_block_gapfill_syncer(request,
                                     event_loop,
@@ -0,0 +1,84 @@
+import os
+import socket
+import threading
+
+import pytest
+
+from trinity._utils.socket import (
+    BufferedSocket,
+    INITIAL_RECEIVE_BUFFER_SIZE,
+    MAX_RECEIVE_BUFFER_SIZE,
+)
+
+
+@pytest.fixture
+def socket_pair():
+    sender, receiver = socket.socketpair()
+    with sender, receiver:
+        yield sender, BufferedSocket(receiver)
+
+
+def send_in_background(sock, data):
+    thread = threading.Thread(target=sock.sendall, args=(data,), daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize(
+    'read_sizes',
+    (
+        (1, 2, 3, 4),
+        (0, 5, 0),
+        (INITIAL_RECEIVE_BUFFER_SIZE - 1, 2, 1),
+        (3, INITIAL_RECEIVE_BUFFER_SIZE, 7),
+        (100, 10 * INITIAL_RECEIVE_BUFFER_SIZE, 100),
+        (2 * MAX_RECEIVE_BUFFER_SIZE, 1),
+        (1, ) * 1000,
+    ),
+)
+def test_buffered_socket_read_exactly(socket_pair, read_sizes):
+    sender, buffered = socket_pair
+    data = os.urandom(sum(read_sizes))
+    thread = send_in_background(sender, data)
+
+    offset = 0
+    for read_size in read_sizes:
+        payload = buffered.read_exactly(read_size)
+        assert type(payload) is bytes
+        assert payload == data[offset:offset + read_size]
+        offset += read_size
+
+    thread.join()
+    assert buffered.buffered_size == 0
+
+
+def test_buffered_socket_many_small_reads_across_refills(socket_pair):
+    sender, buffered = socket_pair
+    # Many reads that don't line up with the buffer size, to exercise the compaction
+    read_sizes = tuple(range(1, 2000))
+    data = os.urandom(sum(read_sizes))
+    thread = send_in_background(sender, data)
+
+    received = b''.join(buffered.read_exactly(read_size) for read_size in read_sizes)
+
+    thread.join()
+    assert received == data
+
+
+def test_buffered_socket_raises_on_closed_connection(socket_pair):
+    sender, buffered = socket_pair
+    sender.sendall(b'abc')
+    sender.shutdown(socket.SHUT_WR)
+
+    assert buffered.read_exactly(2) == b'ab'
+    with pytest.raises(OSError):
+        buffered.read_exactly(2)
+
+
+def test_buffered_socket_raises_on_closed_connection_during_large_read(socket_pair):
+    sender, buffered = socket_pair
+    sender.sendall(b'abc')
+    sender.shutdown(socket.SHUT_WR)
+
+    with pytest.raises(OSError):
+        buffered.read_exactly(2 * MAX_RECEIVE_BUFFER_SIZE)
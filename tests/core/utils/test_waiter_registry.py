@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from trinity._utils.datastructures import WaiterRegistry
+
+
+@pytest.mark.asyncio
+async def test_waiter_registry_resolves_only_matching_waiters():
+    registry = WaiterRegistry[bytes]()
+    waiter_a = registry.register(b'a')
+    waiter_b = registry.register(b'b')
+
+    assert registry.resolve((b'a', b'c')) == 1
+
+    assert waiter_a.done()
+    assert not waiter_b.done()
+    assert b'a' not in registry
+    assert b'b' in registry
+
+
+@pytest.mark.asyncio
+async def test_waiter_registry_resolves_all_waiters_on_a_key():
+    registry = WaiterRegistry[bytes]()
+    waiters = tuple(registry.register(b'a') for _ in range(3))
+    assert len(registry) == 1
+
+    assert registry.resolve((b'a', )) == 3
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+    assert len(registry) == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_registry_unregister():
+    registry = WaiterRegistry[bytes]()
+    waiter = registry.register(b'a')
+    other_waiter = registry.register(b'a')
+
+    registry.unregister(b'a', waiter)
+    assert b'a' in registry
+
+    registry.unregister(b'a', other_waiter)
+    assert b'a' not in registry
+    assert registry.resolve((b'a', )) == 0
+    assert not waiter.done()
+
+    # unregistering twice is harmless
+    registry.unregister(b'a', waiter)
+
+
+@pytest.mark.asyncio
+async def test_waiter_registry_skips_cancelled_waiters():
+    registry = WaiterRegistry[bytes]()
+    cancelled_waiter = registry.register(b'a')
+    waiter = registry.register(b'a')
+    cancelled_waiter.cancel()
+
+    assert registry.resolve((b'a', )) == 1
+    assert waiter.done()
@@ -163,6 +163,10 @@ def test_chain_can_track_canonical_head_across_restarts(
     chain_db = chain.db
     del chain
 
+    assert chain_db.get_validator_pubkeys() == b"".join(
+        validator.pubkey for validator in genesis_state.validators
+    )
+
     block_sink = ChainDBBlockSink(chain_db)
     fork_choice = LMDGHOSTForkChoice.from_db(chain_db, config, block_sink)
     chain = BeaconChain(chain_db, fork_choice)
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from eth_typing import BLSPubkey, Hash32
+import pytest
 
 from eth2.beacon.constants import EMPTY_SIGNATURE, GENESIS_SLOT
 from eth2.beacon.db.chain2 import BeaconChainDB
@@ -93,6 +94,27 @@ def test_chain2_full(base_db, genesis_state, config):
             assert chain_db.get_block_by_slot(Slot(slot), BeaconBlock) is None
 
 
+@pytest.mark.parametrize("appended_counts", ((), (1,), (3, 1021, 1, 2048, 5)))
+def test_chain2_validator_pubkeys(base_db, genesis_state, appended_counts, config):
+    chain_db = BeaconChainDB.from_genesis(
+        base_db, genesis_state, SignedBeaconBlock, config
+    )
+
+    pubkeys = b""
+    for count in appended_counts:
+        new_pubkeys = b"".join(
+            n.to_bytes(48, byteorder="little")
+            for n in range(len(pubkeys) // 48, len(pubkeys) // 48 + count)
+        )
+        chain_db.append_validator_pubkeys(new_pubkeys)
+        pubkeys += new_pubkeys
+
+        assert chain_db.get_validator_pubkey_count() == len(pubkeys) // 48
+        assert chain_db.get_validator_pubkeys() == pubkeys
+
+    assert BeaconChainDB(base_db).get_validator_pubkeys() == pubkeys
+
+
 def _mini_stf(
     state: BeaconState, block: Optional[BeaconBlock], config: Eth2Config
 ) -> BeaconState:
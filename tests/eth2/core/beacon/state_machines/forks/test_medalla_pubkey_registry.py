@@ -0,0 +1,106 @@
+import pytest
+
+from eth2._utils.bls import bls
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import EpochsContext
+from eth2.beacon.state_machines.forks.medalla.pubkey_registry import PubkeyRegistry
+
+
+def _mk_pubkey(n, prefix=b""):
+    return prefix + n.to_bytes(48 - len(prefix), byteorder="big")
+
+
+def test_pubkey_registry():
+    pubkeys = [_mk_pubkey(n) for n in range(10)]
+    registry = PubkeyRegistry(b"".join(pubkeys[:4]))
+    registry.extend(pubkeys[4:])
+
+    assert len(registry) == len(pubkeys)
+    assert registry.get_pubkeys() == b"".join(pubkeys)
+    assert registry.get_pubkeys(7) == b"".join(pubkeys[7:])
+    for index, pubkey in enumerate(pubkeys):
+        assert registry.get_pubkey(index) == pubkey
+        assert registry.get_index(pubkey) == index
+
+    assert registry.get_index(_mk_pubkey(10)) is None
+    with pytest.raises(IndexError):
+        registry.get_pubkey(10)
+    with pytest.raises(ValueError):
+        registry.append(b"\x01" * 47)
+    with pytest.raises(ValueError):
+        PubkeyRegistry(b"\x01" * 49)
+
+
+def test_pubkey_registry_with_colliding_hashes():
+    # all of these pubkeys start with the same bytes
+    prefix = b"\xaa" * 8
+    registry = PubkeyRegistry()
+    for n in range(5):
+        assert registry.append(_mk_pubkey(n, prefix)) == n
+
+    for n in range(5):
+        assert registry.get_index(_mk_pubkey(n, prefix)) == n
+    assert registry.get_index(_mk_pubkey(5, prefix)) is None
+
+
+def test_epochs_contexts_share_pubkey_registry(genesis_state, config):
+    validators = genesis_state.validators
+    state = genesis_state.set("validators", validators[:-2])
+
+    epochs_ctx = EpochsContext(config)
+    epochs_ctx.sync_pubkeys(state)
+    other_epochs_ctx = epochs_ctx.copy()
+    other_epochs_ctx.sync_pubkeys(genesis_state)
+
+    registry = epochs_ctx.pubkey_registry
+    assert other_epochs_ctx.pubkey_registry is registry
+    assert len(registry) == len(validators)
+
+    last_pubkey = validators[-1].pubkey
+    assert other_epochs_ctx.get_validator_index(last_pubkey) == len(validators) - 1
+    assert other_epochs_ctx.get_pubkey(len(validators) - 1) == last_pubkey
+    # the pubkeys synced by the copy are not part of the original context
+    assert epochs_ctx.get_validator_index(last_pubkey) is None
+    with pytest.raises(IndexError):
+        epochs_ctx.get_pubkey(len(validators) - 1)
+
+    # a context loaded from a filled registry does not append again
+    loaded_epochs_ctx = EpochsContext(config, registry)
+    loaded_epochs_ctx.sync_pubkeys(genesis_state)
+    assert loaded_epochs_ctx.pubkey_registry is registry
+    assert len(registry) == len(validators)
+    assert loaded_epochs_ctx.get_validator_index(last_pubkey) == len(validators) - 1
+
+
+def test_epochs_context_with_conflicting_pubkey_registry(genesis_state, config):
+    registry = PubkeyRegistry(
+        b"".join(_mk_pubkey(n) for n in range(len(genesis_state.validators)))
+    )
+
+    epochs_ctx = EpochsContext(config, registry)
+    epochs_ctx.sync_pubkeys(genesis_state)
+
+    assert epochs_ctx.pubkey_registry is not registry
+    for index, validator in enumerate(genesis_state.validators):
+        assert epochs_ctx.get_validator_index(validator.pubkey) == index
+    assert epochs_ctx.get_validator_index(_mk_pubkey(0)) is None
+
+
+def test_epochs_context_caches_aggregate_pubkeys(genesis_state, config):
+    epochs_ctx = EpochsContext(config)
+    epochs_ctx.load_state(genesis_state)
+
+    slot = genesis_state.slot
+    committee = epochs_ctx.get_beacon_committee(slot, 0)
+    bitfield = tuple(i % 2 == 0 for i in range(len(committee)))
+    attesting_pubkeys = tuple(
+        genesis_state.validators[index].pubkey
+        for index, bit in zip(committee, bitfield)
+        if bit
+    )
+
+    aggregate_pubkey = epochs_ctx.get_aggregate_pubkey(slot, 0, bitfield)
+    assert aggregate_pubkey == bls.aggregate_pubkeys(*attesting_pubkeys)
+    assert epochs_ctx.current_shuffling.aggregate_pubkeys[(slot, 0, bitfield)] == (
+        aggregate_pubkey
+    )
+    assert epochs_ctx.copy().get_aggregate_pubkey(slot, 0, bitfield) is aggregate_pubkey
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from eth2.beacon.committee_helpers import compute_shuffled_index
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    _inner_shuffle_list,
+    compute_shuffling,
+    unshuffle_list,
+)
+
+vectorized_shuffling = pytest.importorskip(
+    "eth2.beacon.state_machines.forks.medalla.vectorized_shuffling"
+)
+
+
+@pytest.mark.parametrize("list_size", (0, 1, 2, 3, 100, 256, 257, 1000))
+@pytest.mark.parametrize("forwards", (True, False))
+def test_vectorized_shuffle_matches_loop(list_size, forwards, config):
+    seed = random.Random(list_size).getrandbits(256).to_bytes(32, "little")
+    indices = list(range(0, 3 * list_size, 3))
+
+    expected = list(indices)
+    _inner_shuffle_list(expected, seed, forwards, config)
+    shuffled = list(indices)
+    vectorized_shuffling.inner_shuffle_list(shuffled, seed, forwards, config)
+
+    assert shuffled == expected
+
+
+def test_unshuffle_list_matches_spec(config):
+    seed = b"\x42" * 32
+    indices = list(range(100))
+
+    shuffling = list(indices)
+    unshuffle_list(shuffling, seed, config)
+
+    assert shuffling == [
+        indices[
+            compute_shuffled_index(
+                position, len(indices), seed, config.SHUFFLE_ROUND_COUNT
+            )
+        ]
+        for position in range(len(indices))
+    ]
+
+
+def test_compute_shuffling_is_cached(config):
+    seed = b"\x01" * 32
+    active_indices = list(range(200))
+
+    shuffling = compute_shuffling(active_indices, seed, config)
+    assert compute_shuffling(list(active_indices), seed, config) is shuffling
+
+    expected = list(active_indices)
+    unshuffle_list(expected, seed, config)
+    assert list(shuffling) == expected
+
+    assert compute_shuffling(active_indices, b"\x02" * 32, config) != shuffling
+    assert compute_shuffling(active_indices[1:], seed, config) != shuffling
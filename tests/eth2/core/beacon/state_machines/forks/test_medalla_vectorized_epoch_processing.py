@@ -0,0 +1,65 @@
+import pytest
+
+from eth2.beacon.state_machines.forks.medalla.eth2fastspec import (
+    EpochsContext,
+    process_epoch,
+    process_slots,
+)
+from eth2.beacon.tools.builder.state import create_mock_epoch_transition_state
+
+vectorized_epoch = pytest.importorskip(
+    "eth2.beacon.state_machines.forks.medalla.vectorized_epoch"
+)
+
+
+def _load_epochs_ctx(state, config):
+    epochs_ctx = EpochsContext(config)
+    epochs_ctx.load_state(state)
+    return epochs_ctx
+
+
+@pytest.mark.parametrize(
+    "validator_count, epoch, finalized_epoch, seed",
+    (
+        # Genesis epoch: no rewards or penalties
+        (128, 0, 0, 1),
+        (128, 1, 0, 2),
+        (256, 5, 3, 3),
+        # Inactivity leak
+        (256, 9, 2, 4),
+        (512, 10, 8, 5),
+    ),
+)
+def test_vectorized_process_epoch_matches_fastspec(
+    genesis_state, validator_count, epoch, finalized_epoch, seed, config
+):
+    state = create_mock_epoch_transition_state(
+        genesis_state, validator_count, epoch, finalized_epoch, config, seed
+    )
+
+    expected_state = process_epoch(_load_epochs_ctx(state, config), state, config)
+    vectorized_state = vectorized_epoch.process_epoch(
+        _load_epochs_ctx(state, config), state, config
+    )
+
+    assert vectorized_state.balances == expected_state.balances
+    assert vectorized_state.validators == expected_state.validators
+    assert vectorized_state.hash_tree_root == expected_state.hash_tree_root
+
+
+def test_process_slots_with_vectorized_epoch_processing(genesis_state, config):
+    state = create_mock_epoch_transition_state(genesis_state, 256, 3, 1, config)
+    target_slot = state.slot + 2 * config.SLOTS_PER_EPOCH
+
+    expected_state = process_slots(
+        _load_epochs_ctx(state, config), state, target_slot, config
+    )
+    vectorized_state = process_slots(
+        _load_epochs_ctx(state, config),
+        state,
+        target_slot,
+        config,
+        vectorized_epoch.process_epoch,
+    )
+
+    assert vectorized_state.hash_tree_root == expected_state.hash_tree_root
@@ -0,0 +1,104 @@
+from eth_utils import ValidationError
+import pytest
+
+from eth2.beacon.committee_helpers import get_beacon_proposer_index
+from eth2.beacon.constants import GENESIS_EPOCH
+from eth2.beacon.exceptions import NoCommitteeAssignment
+from eth2.beacon.helpers import compute_start_slot_at_epoch
+from eth2.beacon.tools.builder.committee_assignment import get_committee_assignment
+from eth2.beacon.tools.builder.duty_index import DutyIndex, compute_shuffling_key
+
+
+@pytest.mark.parametrize(
+    (
+        "validator_count,"
+        "slots_per_epoch,"
+        "target_committee_size,"
+        "max_committees_per_slot,"
+        "state_epoch,"
+        "epoch,"
+    ),
+    [
+        (40, 16, 1, 16, 0, 0),  # genesis
+        (40, 16, 1, 16, 1, 1),  # current epoch
+        (40, 16, 1, 16, 1, 0),  # previous epoch
+        (40, 16, 1, 16, 1, 2),  # next epoch
+        (100, 8, 4, 4, 1, 1),  # several validators per committee
+    ],
+)
+def test_duty_index_matches_committee_assignment(
+    genesis_state, slots_per_epoch, config, validator_count, state_epoch, epoch
+):
+    state_slot = compute_start_slot_at_epoch(state_epoch, slots_per_epoch)
+    state = genesis_state.set("slot", state_slot)
+    duty_index = DutyIndex.from_state(state, epoch, config)
+
+    assert duty_index.epoch == epoch
+    assert duty_index.shuffling_key == compute_shuffling_key(state, epoch, config)
+    for validator_index in range(validator_count):
+        expected = get_committee_assignment(state, config, epoch, validator_index)
+        assignment = duty_index.get_assignment(validator_index)
+        assert assignment.slot == expected.slot
+        assert assignment.committee_index == expected.committee_index
+        assert assignment.committee_size == len(expected.committee)
+        assert expected.committee[assignment.committee_position] == validator_index
+
+
+@pytest.mark.parametrize(
+    (
+        "validator_count,"
+        "slots_per_epoch,"
+        "target_committee_size,"
+        "max_committees_per_slot,"
+    ),
+    [(40, 16, 1, 16)],
+)
+def test_duty_index_proposers(genesis_state, slots_per_epoch, config):
+    state = genesis_state.set("slot", slots_per_epoch)
+    current_epoch = state.current_epoch(slots_per_epoch)
+    duty_index = DutyIndex.from_state(state, current_epoch, config)
+
+    proposer_slots = {}
+    for validator_index in range(len(state.validators)):
+        for slot in duty_index.get_assignment(validator_index).proposer_slots:
+            proposer_slots[slot] = validator_index
+
+    start_slot = compute_start_slot_at_epoch(current_epoch, slots_per_epoch)
+    assert sorted(proposer_slots) == list(
+        range(start_slot, start_slot + slots_per_epoch)
+    )
+    for slot, validator_index in proposer_slots.items():
+        assert (
+            get_beacon_proposer_index(state.set("slot", slot), config)
+            == validator_index
+        )
+
+    # Proposers of the next epoch are not known yet
+    next_epoch_index = DutyIndex.from_state(state, current_epoch + 1, config)
+    assert all(
+        not next_epoch_index.get_assignment(validator_index).proposer_slots
+        for validator_index in range(len(state.validators))
+    )
+    with pytest.raises(ValidationError):
+        DutyIndex.from_state(state, current_epoch + 2, config)
+
+
+@pytest.mark.parametrize(
+    (
+        "validator_count,"
+        "slots_per_epoch,"
+        "target_committee_size,"
+        "max_committees_per_slot,"
+    ),
+    [(40, 16, 1, 16)],
+)
+def test_duty_index_no_assignment(genesis_state, slots_per_epoch, config):
+    state = genesis_state
+    validator_index = 1
+    current_epoch = state.current_epoch(slots_per_epoch)
+    validator = state.validators[validator_index].set("exit_epoch", GENESIS_EPOCH)
+    state = state.transform(["validators", validator_index], validator)
+
+    duty_index = DutyIndex.from_state(state, current_epoch, config)
+    with pytest.raises(NoCommitteeAssignment):
+        duty_index.get_assignment(validator_index)
@@ -1,6 +1,6 @@
 import pytest
 
-from eth2._utils.bls import bls
+from eth2._utils.bls import SignatureBatch, bls
 from eth2._utils.bls.backends.milagro import MilagroBackend
 from eth2._utils.bls.backends.py_ecc import PyECCBackend
 from eth2.beacon.exceptions import SignatureError
@@ -73,3 +73,76 @@ def test_validate_invalid_lengths(backend):
         bls.validate(msg, b"\x00", b"\x00" * 48)
     with pytest.raises(SignatureError):
         bls.validate(msg, b"\x00" * 96, b"\x00")
+
+
+def _mk_signature_sets(msgs, privkey_groups):
+    for msg, privkeys in zip(msgs, privkey_groups):
+        pubkeys = tuple(bls.sk_to_pk(privkey) for privkey in privkeys)
+        signature = bls.aggregate(*(bls.sign(privkey, msg) for privkey in privkeys))
+        yield pubkeys, msg, signature
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_signature_batch(backend):
+    bls.use(backend)
+    msgs = (b"\x32" * 32, b"\x32" * 32, b"\x33" * 32)
+    privkey_groups = ((42,), (4242, 424242), (43,))
+
+    batch = SignatureBatch()
+    for pubkeys, msg, signature in _mk_signature_sets(msgs, privkey_groups):
+        batch.add(msg, signature, *pubkeys)
+
+    assert len(batch) == 3
+    assert batch.get_invalid_indices() == ()
+    batch.validate()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_signature_batch_with_swapped_signatures(backend):
+    bls.use(backend)
+    msg = b"\x32" * 32
+    (pubkeys_0, _, sig_0), (pubkeys_1, _, sig_1), (pubkeys_2, _, sig_2) = tuple(
+        _mk_signature_sets((msg,) * 3, ((42,), (4242,), (424242,)))
+    )
+
+    # The sum of the signatures is still the signature of the sum of the public keys
+    batch = SignatureBatch()
+    batch.add(msg, sig_0, *pubkeys_0)
+    batch.add(msg, sig_2, *pubkeys_1)
+    batch.add(msg, sig_1, *pubkeys_2)
+
+    assert not bls.verify_multiple(
+        ((pubkeys_0, msg, sig_0), (pubkeys_1, msg, sig_2), (pubkeys_2, msg, sig_1))
+    )
+    assert batch.get_invalid_indices() == (1, 2)
+    with pytest.raises(SignatureError):
+        batch.validate()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_signature_batch_invalid_lengths(backend):
+    bls.use(backend)
+    batch = SignatureBatch()
+    with pytest.raises(SignatureError):
+        batch.add(b"\x32" * 32, b"\x00", b"\x00" * 48)
+    with pytest.raises(SignatureError):
+        batch.add(b"\x32" * 32, b"\x42" * 96)
+    assert len(batch) == 0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_aggregate_pubkeys(backend):
+    bls.use(backend)
+    msg = b"\x32" * 32
+    privkeys = (42, 4242, 424242)
+    pubkeys = tuple(bls.sk_to_pk(privkey) for privkey in privkeys)
+    aggregate_sig = bls.aggregate(*(bls.sign(privkey, msg) for privkey in privkeys))
+
+    aggregate_pubkey = bls.aggregate_pubkeys(*pubkeys)
+    assert aggregate_pubkey == bls.aggregate_pubkeys(*reversed(pubkeys))
+    assert bls.aggregate_pubkeys(pubkeys[0]) == pubkeys[0]
+    assert bls.verify(msg, aggregate_sig, aggregate_pubkey)
+    assert not bls.verify(msg, aggregate_sig, bls.aggregate_pubkeys(*pubkeys[:2]))
+
+    with pytest.raises(ValueError):
+        bls.aggregate_pubkeys()
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+import sha3
+
+from p2p.constants import RLPX_HEADER_DATA
+from p2p.exceptions import DecryptionError
+from p2p.framing import FRAME_HEADER_SIZE, FrameCodec
+
+
+AES_SECRET = b'\x01' * 32
+MAC_SECRET = b'\x02' * 32
+
+# Two frames, encrypted by the frame encryption that used to be inlined in Transport
+KNOWN_CIPHERTEXT = bytes.fromhex(
+    '7298cc67e5831eadc6ce23d23ea663789dc7e2f27ddfa9a5f33f4000842ba9c9'
+    'bec0cbe528d939cd082adec4fed32207b7d78419d2daad51acb75d88335da335'
+    'bf35991ef5bb03bf937992457124c14190a6d6537a4bf292b9f4ed6dd895ca7e'
+    'b7c69fb0859f34facc240ed50ed66e1b3376d97a5980f90579c3e9473b44f421'
+)
+
+
+@pytest.fixture
+def codec_pair():
+    alice = FrameCodec(
+        AES_SECRET, MAC_SECRET, sha3.keccak_256(b'egress'), sha3.keccak_256(b'ingress'),
+    )
+    bob = FrameCodec(
+        AES_SECRET, MAC_SECRET, sha3.keccak_256(b'ingress'), sha3.keccak_256(b'egress'),
+    )
+    return alice, bob
+
+
+def _make_frame(body):
+    return len(body).to_bytes(3, 'big') + RLPX_HEADER_DATA, body
+
+
+def test_frame_codec_matches_known_ciphertext(codec_pair):
+    alice, bob = codec_pair
+
+    ciphertext = alice.encrypt(*_make_frame(b'\x10hello')) + alice.encrypt(*_make_frame(b'\x02'))
+    assert ciphertext == KNOWN_CIPHERTEXT
+
+    first, second = bob.feed(KNOWN_CIPHERTEXT)
+    assert (first.header, first.body) == _make_frame(b'\x10hello')
+    assert (second.header, second.body) == _make_frame(b'\x02')
+
+
+@pytest.mark.parametrize('chunk_size', (1, 7, 16, 100, 4096, 10 ** 6))
+def test_frame_codec_decrypts_frames_fed_in_chunks(codec_pair, chunk_size):
+    alice, bob = codec_pair
+    frames = tuple(
+        _make_frame(b'\x10' + os.urandom(size)) for size in (0, 1, 15, 16, 31, 1000, 70000)
+    )
+    data = b''.join(alice.encrypt(header, body) for header, body in frames)
+
+    messages = []
+    for offset in range(0, len(data), chunk_size):
+        messages.extend(bob.feed(data[offset:offset + chunk_size]))
+
+    assert tuple((message.header, message.body) for message in messages) == frames
+    assert bob.bytes_needed == FRAME_HEADER_SIZE
+
+
+def test_frame_codec_bytes_needed(codec_pair):
+    alice, bob = codec_pair
+    ciphertext = alice.encrypt(*_make_frame(b'\x10' * 20))
+
+    assert bob.feed(ciphertext[:10]) == ()
+    assert bob.bytes_needed == FRAME_HEADER_SIZE - 10
+
+    # once the header is in, the whole padded body and its MAC are needed
+    assert bob.feed(ciphertext[10:FRAME_HEADER_SIZE]) == ()
+    assert bob.bytes_needed == 32 + 16
+
+    assert len(bob.feed(ciphertext[FRAME_HEADER_SIZE:])) == 1
+
+
+def test_frame_codec_rejects_bad_mac(codec_pair):
+    alice, bob = codec_pair
+    ciphertext = bytearray(alice.encrypt(*_make_frame(b'\x10hello')))
+    # flip a bit in the frame MAC
+    ciphertext[-1] ^= 1
+
+    with pytest.raises(DecryptionError):
+        bob.feed(bytes(ciphertext))
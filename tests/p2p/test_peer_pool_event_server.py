@@ -1,13 +1,19 @@
+import asyncio
+
 import pytest
 
 from async_service import background_asyncio_service
 
-from trinity.protocol.common.events import PeerCountRequest
+from trinity.protocol.common import peer_pool_event_bus
+from trinity.protocol.common.events import PeerCountRequest, PeerPoolMessageEvent
 from trinity.protocol.common.peer_pool_event_bus import (
     DefaultPeerPoolEventServer,
 )
 
+from p2p.disconnect import DisconnectReason
 from p2p.tools.paragon import (
+    BroadcastData,
+    BroadcastDataPayload,
     ParagonMockPeerPoolWithConnectedPeers,
 )
 from p2p.tools.factories import (
@@ -26,3 +32,65 @@ async def test_event_bus_requests_against_peer_pool(request, event_loop, event_b
             res = await event_bus.request(PeerCountRequest())
 
             assert res.peer_count == 2
+
+
+def _block_drain(peer, monkeypatch):
+    drained = asyncio.Event()
+
+    async def drain():
+        await drained.wait()
+
+    transport = peer.connection.get_multiplexer().get_transport()
+    monkeypatch.setattr(transport, 'drain', drain)
+    return drained
+
+
+def _record_sends(peer, monkeypatch):
+    sent = []
+    monkeypatch.setattr(peer.sub_proto, 'send', sent.append)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_event_server_sends_once_peer_drains(monkeypatch, event_bus):
+    async with ParagonPeerPairFactory() as (alice, bob):
+        peer_pool = ParagonMockPeerPoolWithConnectedPeers([alice, bob])
+        event_server = DefaultPeerPoolEventServer(event_bus, peer_pool)
+        drained = _block_drain(alice, monkeypatch)
+        alice_sent = _record_sends(alice, monkeypatch)
+        bob_sent = _record_sends(bob, monkeypatch)
+
+        async with background_asyncio_service(event_server):
+            commands = tuple(BroadcastData(BroadcastDataPayload(bytes([i]))) for i in range(3))
+            for command in commands:
+                await event_server.handle_send_command(PeerPoolMessageEvent(alice.session, command))
+            await event_server.handle_send_command(PeerPoolMessageEvent(bob.session, commands[0]))
+            await asyncio.sleep(0.01)
+
+            # Sends to alice wait for her to drain, without holding up the sends to bob
+            assert alice_sent == []
+            assert bob_sent == [commands[0]]
+
+            drained.set()
+            await asyncio.sleep(0.01)
+            assert alice_sent == list(commands)
+
+
+@pytest.mark.asyncio
+async def test_event_server_disconnects_peer_that_does_not_drain(monkeypatch, event_bus):
+    monkeypatch.setattr(peer_pool_event_bus, 'WRITE_BUFFER_DRAIN_TIMEOUT', 0.01)
+    async with ParagonPeerPairFactory() as (alice, bob):
+        peer_pool = ParagonMockPeerPoolWithConnectedPeers([alice, bob])
+        event_server = DefaultPeerPoolEventServer(event_bus, peer_pool)
+        _block_drain(alice, monkeypatch)
+        alice_sent = _record_sends(alice, monkeypatch)
+        disconnect_reasons = []
+        monkeypatch.setattr(alice, 'disconnect_nowait', disconnect_reasons.append)
+
+        async with background_asyncio_service(event_server):
+            command = BroadcastData(BroadcastDataPayload(b'data'))
+            await event_server.handle_send_command(PeerPoolMessageEvent(alice.session, command))
+            await asyncio.sleep(0.05)
+
+        assert alice_sent == []
+        assert disconnect_reasons == [DisconnectReason.TIMEOUT]
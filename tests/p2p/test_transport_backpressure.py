@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from rlp import sedes
+
+from p2p.commands import BaseCommand, RLPCodec
+from p2p.exceptions import PeerConnectionLost
+from p2p.tools.factories import TransportPairFactory
+import p2p.transport
+
+
+class CommandForTest(BaseCommand[bytes]):
+    protocol_command_id = 0
+    serialization_codec = RLPCodec(sedes=sedes.binary)
+
+
+def record_writes(transport):
+    writes = []
+    original_write = transport._writer.write
+
+    def write(data):
+        writes.append(data)
+        original_write(data)
+
+    transport._writer.write = write
+    return writes
+
+
+@pytest.mark.asyncio
+async def test_transport_coalesces_sends_into_one_write():
+    alice_transport, bob_transport = await TransportPairFactory()
+    writes = record_writes(alice_transport)
+
+    payloads = tuple(bytes([value]) * 100 for value in range(5))
+    for payload in payloads:
+        alice_transport.send(CommandForTest(payload).encode(0, snappy_support=False))
+
+    assert writes == []
+    assert alice_transport.queued_bytes > 100 * len(payloads)
+
+    await alice_transport.drain()
+    assert len(writes) == 1
+    assert alice_transport.queued_bytes == 0
+
+    for payload in payloads:
+        message = await asyncio.wait_for(bob_transport.recv(), timeout=1)
+        assert CommandForTest.decode(message, snappy_support=False).payload == payload
+
+
+@pytest.mark.asyncio
+async def test_transport_flushes_sends_on_next_loop_iteration():
+    alice_transport, bob_transport = await TransportPairFactory()
+    writes = record_writes(alice_transport)
+
+    alice_transport.send(CommandForTest(b'first').encode(0, snappy_support=False))
+    alice_transport.send(CommandForTest(b'second').encode(0, snappy_support=False))
+    await asyncio.sleep(0)
+
+    assert len(writes) == 1
+    for payload in (b'first', b'second'):
+        message = await asyncio.wait_for(bob_transport.recv(), timeout=1)
+        assert CommandForTest.decode(message, snappy_support=False).payload == payload
+
+
+@pytest.mark.asyncio
+async def test_transport_disconnects_when_too_many_bytes_are_queued(monkeypatch):
+    monkeypatch.setattr(p2p.transport, 'MAX_WRITE_BUFFER_SIZE', 1000)
+    alice_transport, _ = await TransportPairFactory()
+    writes = record_writes(alice_transport)
+
+    message = CommandForTest(b'\x00' * 600).encode(0, snappy_support=False)
+    alice_transport.send(message)
+    with pytest.raises(PeerConnectionLost):
+        alice_transport.send(message)
+
+    assert alice_transport.is_closing
+    assert alice_transport.queued_bytes == 0
+    with pytest.raises(PeerConnectionLost):
+        alice_transport.send(message)
+
+    # The queued messages are dropped, instead of being written to a closing transport
+    await asyncio.sleep(0)
+    assert writes == []
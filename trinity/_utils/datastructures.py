@@ -2,11 +2,14 @@ from abc import ABC, abstractmethod
 from asyncio import (
     AbstractEventLoop,
     Event,
+    Future,
     Lock,
     PriorityQueue,
     Queue,
     QueueFull,
+    get_event_loop,
 )
+from collections import defaultdict
 from enum import Enum
 from functools import (
     total_ordering,
@@ -18,6 +21,7 @@ from typing import (
     Any,
     Callable,
     Collection,
+    DefaultDict,
     Dict,
     Generic,
     Iterable,
@@ -50,6 +54,7 @@ from trinity._utils.tree_root import (
 
 TPrerequisite = TypeVar('TPrerequisite', bound=Enum)
 TTask = TypeVar('TTask')
+TKey = TypeVar('TKey')
 TTaskID = TypeVar('TTaskID')
 
 
@@ -283,6 +288,66 @@ class TaskQueue(Generic[TTask]):
         return task in self._tasks
 
 
+class WaiterRegistry(Generic[TKey]):
+    """
+    Let coroutines wait for specific keys to arrive, and wake up exactly the coroutines
+    waiting on a key when it arrives, instead of waking up every waiter to re-check its keys.
+
+    A waiter calls register() for each key of interest, awaits the returned futures, and must
+    call unregister() when it stops waiting, whether or not the keys arrived. Whoever makes
+    keys available calls resolve() with those keys.
+    """
+
+    # all pending futures, by the key they are waiting on
+    _waiters: DefaultDict[TKey, Set['Future[None]']]
+
+    def __init__(self, *, loop: AbstractEventLoop = None) -> None:
+        self._loop = loop
+        self._waiters = defaultdict(set)
+
+    def register(self, key: TKey) -> 'Future[None]':
+        """
+        :return: a future that is resolved when ``key`` arrives
+        """
+        if self._loop is None:
+            future: 'Future[None]' = get_event_loop().create_future()
+        else:
+            future = self._loop.create_future()
+        self._waiters[key].add(future)
+        return future
+
+    def unregister(self, key: TKey, future: 'Future[None]') -> None:
+        waiters = self._waiters.get(key)
+        if waiters is None:
+            return
+
+        waiters.discard(future)
+        if not waiters:
+            del self._waiters[key]
+
+    def resolve(self, keys: Iterable[TKey]) -> int:
+        """
+        Wake up all coroutines waiting on any of ``keys``.
+
+        :return: how many waiting futures were resolved
+        """
+        num_resolved = 0
+        for key in keys:
+            for future in self._waiters.pop(key, ()):
+                if not future.done():
+                    future.set_result(None)
+                    num_resolved += 1
+        return num_resolved
+
+    def __len__(self) -> int:
+        """How many distinct keys are being waited on"""
+        return len(self._waiters)
+
+    def __contains__(self, key: TKey) -> bool:
+        """Determine if any coroutine is waiting on the key"""
+        return key in self._waiters
+
+
 class BaseTaskPrerequisites(Generic[TTask, TPrerequisite]):
     """
     Keep track of which prerequisites on a task are complete. It is used internally by
@@ -8,28 +8,113 @@ import threading
 from typing import Iterator
 
 
+# The receive buffer starts at this size, and doubles whenever a single ``recv_into`` fills
+# it completely, up to the maximum.
+INITIAL_RECEIVE_BUFFER_SIZE = 64 * 1024
+MAX_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
 class BufferedSocket:
+    """
+    Read exact-length payloads from a socket.
+
+    Reads that fit in the receive buffer are served from it. The buffer is filled with
+    ``recv_into`` and consumed by moving a read offset, so the unread data isn't copied
+    on every read. Reads that don't fit in the buffer are received straight from the socket.
+    """
     def __init__(self, sock: socket.socket) -> None:
         self._socket = sock
-        self._buffer = bytearray()
+        self._buffer = bytearray(INITIAL_RECEIVE_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        # Unread data lives in self._buffer[self._read_offset:self._write_offset]
+        self._read_offset = 0
+        self._write_offset = 0
         self.sendall = sock.sendall
         self.close = sock.close
         self.shutdown = sock.shutdown
         self.__enter__ = sock.__enter__
         self.__exit__ = sock.__exit__
 
+    @property
+    def buffered_size(self) -> int:
+        return self._write_offset - self._read_offset
+
     def read_exactly(self, num_bytes: int) -> bytes:
-        while len(self._buffer) < num_bytes:
+        start = self._read_offset
+        end = start + num_bytes
+        if end <= self._write_offset:
+            self._read_offset = end
+            return bytes(self._view[start:end])
+        elif num_bytes > len(self._buffer):
+            return self._read_large(num_bytes)
+        else:
+            self._fill(num_bytes)
+            self._read_offset += num_bytes
+            return bytes(self._view[self._read_offset - num_bytes:self._read_offset])
+
+    def _fill(self, num_bytes: int) -> None:
+        """
+        Receive until at least ``num_bytes`` are buffered. ``num_bytes`` must fit in the buffer.
+        """
+        buffered_size = self.buffered_size
+        if self._read_offset + num_bytes > len(self._buffer):
+            # Not enough room left at the end: move the unread data to the front.
+            self._view[:buffered_size] = self._view[self._read_offset:self._write_offset]
+            self._read_offset = 0
+            self._write_offset = buffered_size
+
+        while buffered_size < num_bytes:
+            free_space = len(self._buffer) - self._write_offset
+            num_received = self._socket.recv_into(self._view[self._write_offset:])
+            if num_received == 0:
+                raise OSError("Connection closed")
 
-            data = self._socket.recv(4096)
+            self._write_offset += num_received
+            buffered_size += num_received
+            if num_received == free_space:
+                self._maybe_grow()
 
-            if data == b"":
-                raise OSError("Connection closed")
+    def _maybe_grow(self) -> None:
+        """
+        The socket filled the whole buffer, so it probably has more data waiting. Switch to
+        a bigger buffer, to need fewer ``recv_into`` calls for the same amount of data.
+        """
+        new_size = min(2 * len(self._buffer), MAX_RECEIVE_BUFFER_SIZE)
+        if new_size == len(self._buffer):
+            return
+
+        buffered_size = self.buffered_size
+        new_buffer = bytearray(new_size)
+        new_buffer[:buffered_size] = self._view[self._read_offset:self._write_offset]
 
-            self._buffer.extend(data)
-        payload = self._buffer[:num_bytes]
-        self._buffer = self._buffer[num_bytes:]
-        return bytes(payload)
+        self._view.release()
+        self._buffer = new_buffer
+        self._view = memoryview(new_buffer)
+        self._read_offset = 0
+        self._write_offset = buffered_size
+
+    def _read_large(self, num_bytes: int) -> bytes:
+        """
+        Read a payload that is bigger than the buffer: take whatever is already buffered,
+        and receive the rest straight from the socket, without passing through the buffer.
+        """
+        chunks = [bytes(self._view[self._read_offset:self._write_offset])]
+        remaining = num_bytes - len(chunks[0])
+        self._read_offset = self._write_offset = 0
+
+        while remaining:
+            # MSG_WAITALL usually receives the whole remainder in a single call
+            chunk = self._socket.recv(remaining, socket.MSG_WAITALL)
+            if chunk == b"":
+                raise OSError("Connection closed")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        if len(chunks) == 2 and not chunks[0]:
+            # Avoid copying the payload, when nothing was buffered
+            return chunks[1]
+        else:
+            return b"".join(chunks)
 
 
 class IPCSocketServer(ABC):
@@ -5,6 +5,7 @@ from lahja import EndpointAPI
 
 from trinity.config import Eth1AppConfig
 from trinity.constants import SYNC_BEAM
+from trinity.db.cache import ContentAddressedCache, ReadCacheReporter
 from trinity.db.manager import DBClient
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
@@ -37,7 +38,11 @@ class BeamChainExecutionComponent(AsyncioIsolatedComponent):
         app_config = trinity_config.get_app_config(Eth1AppConfig)
         chain_config = app_config.get_chain_config()
 
-        base_db = DBClient.connect(trinity_config.database_ipc_path)
+        read_cache = ContentAddressedCache()
+        base_db = DBClient.connect(
+            trinity_config.database_ipc_path,
+            read_cache=read_cache,
+        )
 
         with base_db:
             beam_chain = make_pausing_beam_chain(
@@ -47,9 +52,13 @@ class BeamChainExecutionComponent(AsyncioIsolatedComponent):
                 base_db,
                 event_bus,
                 loop=asyncio.get_event_loop(),
+                # pause once for all the data that the rest of the block is predicted to need
+                batch_missing_data=True,
             )
 
             import_server = BlockImportServer(event_bus, beam_chain)
 
-            async with background_asyncio_service(import_server) as manager:
+            reporter = ReadCacheReporter(read_cache, 'beam_exec')
+            async with background_asyncio_service(reporter), \
+                    background_asyncio_service(import_server) as manager:
                 await manager.wait_finished()
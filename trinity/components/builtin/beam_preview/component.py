@@ -1,8 +1,21 @@
+from argparse import (
+    ArgumentParser,
+    _SubParsersAction,
+)
 import asyncio
+import contextlib
+import os
 
 from async_service import background_asyncio_service
+from asyncio_run_in_process import open_in_process
+from eth_utils import ValidationError
 from lahja import EndpointAPI
 
+from trinity._utils.logging import child_process_logging
+from trinity.boot_info import BootInfo
+from trinity.components.builtin.metrics.component import metrics_service_from_args
+from trinity.components.builtin.metrics.service.asyncio import AsyncioMetricsService
+from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_SERVICE
 from trinity.config import (
     Eth1AppConfig,
 )
@@ -13,70 +26,138 @@ from trinity.db.manager import DBClient
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
 )
+from trinity.extensibility.event_bus import AsyncioEventBusService
+from trinity.sync.beam.constants import MAX_CONCURRENT_SPECULATIVE_EXECUTIONS
 from trinity.sync.beam.importer import (
     make_pausing_beam_chain,
+    BlockPreviewDispatcher,
     BlockPreviewServer,
 )
 
 
+async def run_preview_worker(
+        boot_info: BootInfo,
+        endpoint_name: str,
+        max_speculative_executions: int) -> None:
+    """
+    Run a single preview worker, which executes the block previews that the
+    :class:`~trinity.sync.beam.importer.BlockPreviewDispatcher` sends it.
+    """
+    with child_process_logging(boot_info):
+        trinity_config = boot_info.trinity_config
+        app_config = trinity_config.get_app_config(Eth1AppConfig)
+        chain_config = app_config.get_chain_config()
+
+        event_bus_service = AsyncioEventBusService(trinity_config, endpoint_name)
+        async with background_asyncio_service(event_bus_service):
+            event_bus = await event_bus_service.get_event_bus()
+            base_db = DBClient.connect(trinity_config.database_ipc_path)
+
+            with base_db:
+                beam_chain = make_pausing_beam_chain(
+                    chain_config.vm_configuration,
+                    chain_config.chain_id,
+                    chain_config.consensus_context_class,
+                    base_db,
+                    event_bus,
+                    # these preview executions are lower priority than the primary block import
+                    loop=asyncio.get_event_loop(),
+                    urgent=False,
+                )
+
+                preview_server = BlockPreviewServer(
+                    event_bus,
+                    beam_chain,
+                    max_speculative_executions,
+                )
+
+                async with background_asyncio_service(preview_server) as manager:
+                    await manager.wait_finished()
+
+
 class BeamChainPreviewComponent(AsyncioIsolatedComponent):
     """
     Subscribe to events that request a block import: ``DoStatelessBlockPreview``.
     On every preview, run through all the transactions, downloading the
     necessary data to execute them with the EVM.
 
-    The beam sync previewer blocks when data is missing, so it's important to run
-    in an isolated process.
+    The beam sync previewer blocks when data is missing, so previews run in a pool of
+    isolated worker processes. Each preview goes to the least loaded worker.
     """
-    _beam_chain = None
-    shard_num: int
+    name = "Beam Sync Chain Preview"
 
     @property
     def is_enabled(self) -> bool:
         return self._boot_info.args.sync_mode.upper() == SYNC_BEAM.upper()
 
-    async def do_run(self, event_bus: EndpointAPI) -> None:
-        trinity_config = self._boot_info.trinity_config
-        app_config = trinity_config.get_app_config(Eth1AppConfig)
-        chain_config = app_config.get_chain_config()
-
-        base_db = DBClient.connect(trinity_config.database_ipc_path)
+    @classmethod
+    def configure_parser(cls, arg_parser: ArgumentParser, subparser: _SubParsersAction) -> None:
+        arg_parser.add_argument(
+            '--beam-preview-workers',
+            type=int,
+            default=None,
+            help=(
+                "Number of worker processes that execute blocks ahead of Beam Sync, to "
+                "download the state they need. Defaults to the number of CPU cores."
+            ),
+        )
+
+    @classmethod
+    def validate_cli(cls, boot_info: BootInfo) -> None:
+        num_workers = boot_info.args.beam_preview_workers
+        if num_workers is not None and num_workers < 1:
+            raise ValidationError(
+                f"--beam-preview-workers must be at least 1, got {num_workers}"
+            )
 
-        with base_db:
-            loop = asyncio.get_event_loop()
+    def get_num_workers(self) -> int:
+        num_workers = self._boot_info.args.beam_preview_workers
+        if num_workers is None:
+            return os.cpu_count() or 1
+        else:
+            return num_workers
 
-            beam_chain = make_pausing_beam_chain(
-                chain_config.vm_configuration,
-                chain_config.chain_id,
-                chain_config.consensus_context_class,
-                base_db,
+    async def do_run(self, event_bus: EndpointAPI) -> None:
+        boot_info = self._boot_info
+
+        if boot_info.args.enable_metrics:
+            metrics_service = metrics_service_from_args(boot_info.args, AsyncioMetricsService)
+        else:
+            # Use a NoopMetricsService so that no code branches need to be taken if metrics
+            # are disabled
+            metrics_service = NOOP_METRICS_SERVICE
+
+        num_workers = self.get_num_workers()
+        # The speculative executions are split between the workers, to constrain the I/O
+        max_speculative_executions = max(1, MAX_CONCURRENT_SPECULATIVE_EXECUTIONS // num_workers)
+        worker_endpoint_names = tuple(
+            f'{self.get_endpoint_name()}-worker-{worker_num}'
+            for worker_num in range(num_workers)
+        )
+
+        async with contextlib.AsyncExitStack() as stack:
+            await stack.enter_async_context(background_asyncio_service(metrics_service))
+
+            for endpoint_name in worker_endpoint_names:
+                worker_proc = await stack.enter_async_context(open_in_process(
+                    run_preview_worker,
+                    boot_info,
+                    endpoint_name,
+                    max_speculative_executions,
+                    subprocess_kwargs=self.get_subprocess_kwargs(),
+                ))
+                self.logger.debug(
+                    "Started beam preview worker %s (pid=%d)",
+                    endpoint_name,
+                    worker_proc.pid,
+                )
+
+            self.logger.info("Started %d beam preview workers", num_workers)
+
+            dispatcher = BlockPreviewDispatcher(
                 event_bus,
-                # these preview executions are lower priority than the primary block import
-                loop=loop,
-                urgent=False,
+                worker_endpoint_names,
+                metrics_service.registry,
             )
-
-            preview_server = BlockPreviewServer(event_bus, beam_chain, self.shard_num)
-
-            async with background_asyncio_service(preview_server) as manager:
+            async with background_asyncio_service(dispatcher) as manager:
                 await manager.wait_finished()
-
-
-class BeamChainPreviewComponent0(BeamChainPreviewComponent):
-    shard_num = 0
-    name = "Beam Sync Chain Preview 0"
-
-
-class BeamChainPreviewComponent1(BeamChainPreviewComponent):
-    shard_num = 1
-    name = "Beam Sync Chain Preview 1"
-
-
-class BeamChainPreviewComponent2(BeamChainPreviewComponent):
-    shard_num = 2
-    name = "Beam Sync Chain Preview 2"
-
-
-class BeamChainPreviewComponent3(BeamChainPreviewComponent):
-    shard_num = 3
-    name = "Beam Sync Chain Preview 3"
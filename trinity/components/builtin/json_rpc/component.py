@@ -27,7 +27,8 @@ from trinity.chains.light_eventbus import (
     EventBusLightPeerChain,
 )
 from trinity.db.beacon.chain import AsyncBeaconChainDB
-from trinity.db.manager import DBClient
+from trinity.db.cache import ContentAddressedCache, ReadCacheReporter
+from trinity.db.manager import PooledDBClient
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
 )
@@ -52,10 +53,11 @@ from trinity._utils.services import run_background_asyncio_services
 @contextlib.contextmanager
 def chain_for_eth1_config(trinity_config: TrinityConfig,
                           eth1_app_config: Eth1AppConfig,
-                          event_bus: EndpointAPI) -> Iterator[AsyncChainAPI]:
+                          event_bus: EndpointAPI,
+                          read_cache: ContentAddressedCache = None) -> Iterator[AsyncChainAPI]:
     chain_config = eth1_app_config.get_chain_config()
 
-    db = DBClient.connect(trinity_config.database_ipc_path)
+    db = PooledDBClient.connect(trinity_config.database_ipc_path, read_cache=read_cache)
 
     with db:
         if eth1_app_config.database_mode is Eth1DbMode.LIGHT:
@@ -74,7 +76,8 @@ def chain_for_eth1_config(trinity_config: TrinityConfig,
 def chain_for_beacon_config(trinity_config: TrinityConfig,
                             beacon_app_config: BeaconAppConfig,
                             ) -> Iterator[AsyncBeaconChainDB]:
-    db = DBClient.connect(trinity_config.database_ipc_path)
+    # NOTE: no read cache, beacon data is not stored under the keccak hash of its value
+    db = PooledDBClient.connect(trinity_config.database_ipc_path)
     with db:
         yield AsyncBeaconChainDB(db)
 
@@ -82,6 +85,7 @@ def chain_for_beacon_config(trinity_config: TrinityConfig,
 @contextlib.contextmanager
 def chain_for_config(trinity_config: TrinityConfig,
                      event_bus: EndpointAPI,
+                     read_cache: ContentAddressedCache = None,
                      ) -> Iterator[Union[AsyncChainAPI, AsyncBeaconChainDB]]:
     if trinity_config.has_app_config(BeaconAppConfig):
         beacon_app_config = trinity_config.get_app_config(BeaconAppConfig)
@@ -89,7 +93,8 @@ def chain_for_config(trinity_config: TrinityConfig,
             yield beacon_chain
     elif trinity_config.has_app_config(Eth1AppConfig):
         eth1_app_config = trinity_config.get_app_config(Eth1AppConfig)
-        with chain_for_eth1_config(trinity_config, eth1_app_config, event_bus) as eth1_chain:
+        with chain_for_eth1_config(
+                trinity_config, eth1_app_config, event_bus, read_cache) as eth1_chain:
             yield eth1_chain
     else:
         raise Exception("Unsupported Node Type")
@@ -178,11 +183,15 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
         boot_info = self._boot_info
         trinity_config = boot_info.trinity_config
 
-        with chain_for_config(trinity_config, event_bus) as chain:
+        read_cache = ContentAddressedCache()
+        with chain_for_config(trinity_config, event_bus, read_cache) as chain:
+            services: Tuple[Service, ...]
             if trinity_config.has_app_config(Eth1AppConfig):
                 modules = initialize_eth1_modules(chain, event_bus, trinity_config)
+                services = (ReadCacheReporter(read_cache, 'json_rpc'),)
             elif trinity_config.has_app_config(BeaconAppConfig):
                 modules = initialize_beacon_modules(chain, event_bus)
+                services = ()
             else:
                 raise Exception("Unsupported Node Type")
 
@@ -190,7 +199,7 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
 
             # Run IPC Server
             ipc_server = IPCServer(rpc, boot_info.trinity_config.jsonrpc_ipc_path)
-            services_to_exit: Tuple[Service, ...] = (
+            services_to_exit: Tuple[Service, ...] = services + (
                 ipc_server,
             )
             try:
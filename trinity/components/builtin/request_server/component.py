@@ -15,7 +15,8 @@ from trinity.config import (
 from trinity.constants import (
     TO_NETWORKING_BROADCAST_CONFIG,
 )
-from trinity.db.manager import DBClient
+from trinity.db.cache import ContentAddressedCache, ReadCacheReporter
+from trinity.db.manager import PooledDBClient
 from trinity.db.eth1.chain import AsyncChainDB
 from trinity.db.eth1.header import AsyncHeaderDB
 from trinity.extensibility import (
@@ -43,7 +44,11 @@ class RequestServerComponent(AsyncioIsolatedComponent):
     async def do_run(self, event_bus: EndpointAPI) -> None:
         boot_info = self._boot_info
         trinity_config = boot_info.trinity_config
-        base_db = DBClient.connect(trinity_config.database_ipc_path)
+        read_cache = ContentAddressedCache()
+        base_db = PooledDBClient.connect(
+            trinity_config.database_ipc_path,
+            read_cache=read_cache,
+        )
         with base_db:
             if trinity_config.has_app_config(Eth1AppConfig):
                 server = self.make_eth1_request_server(
@@ -54,7 +59,9 @@ class RequestServerComponent(AsyncioIsolatedComponent):
             else:
                 raise Exception("Trinity config must have eth1 config")
 
-            async with background_asyncio_service(server) as manager:
+            reporter = ReadCacheReporter(read_cache, 'request_server')
+            async with background_asyncio_service(reporter), \
+                    background_asyncio_service(server) as manager:
                 await manager.wait_finished()
 
     @classmethod
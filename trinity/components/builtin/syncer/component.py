@@ -11,6 +11,7 @@ from argparse import (
 )
 import asyncio
 import logging
+from pathlib import Path
 from typing import (
     Any,
     cast,
@@ -29,6 +30,7 @@ from eth_utils import (
 )
 
 from p2p.asyncio_utils import create_task, wait_first
+from p2p.exchange import normalization_pool
 
 from trinity.boot_info import BootInfo
 from trinity.config import (
@@ -69,6 +71,9 @@ from trinity.sync.full.service import (
 from trinity.sync.beam.service import (
     BeamSyncService,
 )
+from trinity.sync.beam.witness import (
+    BlockWitnessRecorder,
+)
 from trinity.sync.header.chain import (
     HeaderChainSyncer,
 )
@@ -196,6 +201,15 @@ class BeamSyncStrategy(BaseSyncStrategy):
             help="Force beam sync to activate on a specific block number (for testing)",
             default=None,
         )
+        arg_group.add_argument(
+            '--record-beam-witnesses',
+            type=Path,
+            help=(
+                "Append the witness of every beam-imported block to the given file,"
+                " to replay the imports offline"
+            ),
+            default=None,
+        )
         add_disable_backfill_arg(arg_group)
         add_sync_from_checkpoint_arg(arg_group)
 
@@ -207,6 +221,11 @@ class BeamSyncStrategy(BaseSyncStrategy):
                    peer_pool: BasePeerPool,
                    event_bus: EndpointAPI) -> None:
 
+        if args.record_beam_witnesses is None:
+            witness_recorder = None
+        else:
+            witness_recorder = BlockWitnessRecorder(args.record_beam_witnesses)
+
         syncer = BeamSyncService(
             chain,
             AsyncChainDB(base_db),
@@ -215,7 +234,8 @@ class BeamSyncStrategy(BaseSyncStrategy):
             event_bus,
             args.sync_from_checkpoint,
             args.force_beam_block_number,
-            not args.disable_backfill
+            not args.disable_backfill,
+            witness_recorder,
         )
 
         async with background_asyncio_service(syncer) as manager:
@@ -311,11 +331,29 @@ class SyncerComponent(AsyncioIsolatedComponent):
         for sync_strategy in cls.strategies:
             sync_strategy.configure_parser(syncing_parser)
 
+        syncing_parser.add_argument(
+            '--normalization-workers',
+            type=int,
+            default=0,
+            help=(
+                "Number of worker processes that hash and build tries for downloaded block "
+                "bodies, receipts and node data, and check the proof of work seals of "
+                "downloaded headers. With 0 (the default), that happens in the syncing "
+                "process."
+            ),
+        )
+
     @classmethod
     def validate_cli(cls, boot_info: BootInfo) -> None:
         # this will trigger a ValidationError if the specified strategy isn't known.
         cls.get_active_strategy(boot_info)
 
+        if boot_info.args.normalization_workers < 0:
+            raise ValidationError(
+                f"--normalization-workers must not be negative, got "
+                f"{boot_info.args.normalization_workers}"
+            )
+
         # This will trigger a ValidationError if the loaded EIP1085 file
         # has errors such as an unsupported mining method
         boot_info.trinity_config.get_app_config(Eth1AppConfig).get_chain_config()
@@ -368,14 +406,15 @@ class SyncerComponent(AsyncioIsolatedComponent):
         node = NodeClass(event_bus, metrics_service, trinity_config)
         strategy = self.get_active_strategy(boot_info)
 
-        async with background_asyncio_service(node) as node_manager:
-            sync_task = create_task(
-                self.launch_sync(node, strategy, boot_info, event_bus), self.name)
-            # The Node service is our responsibility, so we must exit if either that or the syncer
-            # returns.
-            node_manager_task = create_task(
-                node_manager.wait_finished(), f'{NodeClass.__name__} wait_finished() task')
-            await wait_first([sync_task, node_manager_task], max_wait_after_cancellation=2)
+        with normalization_pool(boot_info.args.normalization_workers):
+            async with background_asyncio_service(node) as node_manager:
+                sync_task = create_task(
+                    self.launch_sync(node, strategy, boot_info, event_bus), self.name)
+                # The Node service is our responsibility, so we must exit if either that or the
+                # syncer returns.
+                node_manager_task = create_task(
+                    node_manager.wait_finished(), f'{NodeClass.__name__} wait_finished() task')
+                await wait_first([sync_task, node_manager_task], max_wait_after_cancellation=2)
 
     async def launch_sync(self,
                           node: Node[BasePeer],
@@ -16,10 +16,7 @@ from trinity.components.builtin.beam_exec.component import (
     BeamChainExecutionComponent,
 )
 from trinity.components.builtin.beam_preview.component import (
-    BeamChainPreviewComponent0,
-    BeamChainPreviewComponent1,
-    BeamChainPreviewComponent2,
-    BeamChainPreviewComponent3,
+    BeamChainPreviewComponent,
 )
 from trinity.components.builtin.ethstats.component import (
     EthstatsComponent,
@@ -78,10 +75,7 @@ BEACON_NODE_COMPONENTS: Tuple[Type[BaseComponentAPI], ...] = (
 
 ETH1_NODE_COMPONENTS: Tuple[Type[BaseComponentAPI], ...] = (
     BeamChainExecutionComponent,
-    BeamChainPreviewComponent0,
-    BeamChainPreviewComponent1,
-    BeamChainPreviewComponent2,
-    BeamChainPreviewComponent3,
+    BeamChainPreviewComponent,
     EthstatsComponent,
     ExportBlockComponent,
     ImportBlockComponent,
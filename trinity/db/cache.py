@@ -0,0 +1,166 @@
+import asyncio
+from collections import OrderedDict
+import threading
+from typing import Optional
+
+from async_service import Service
+from eth_hash.auto import keccak
+from pyformance import MetricsRegistry
+
+from trinity._utils.logging import get_logger
+
+
+# Cache values of up to this many bytes (keys included), by default
+DEFAULT_READ_CACHE_SIZE = 32 * 1024 * 1024
+
+# How many seconds to wait in between each report of the hits and misses of a read cache
+READ_CACHE_REPORT_INTERVAL = 30.0
+
+
+class ContentAddressedCache:
+    """
+    A thread-safe, size-bounded LRU cache of database values, which only accepts a value
+    if it is stored under its own keccak hash, like trie nodes, bytecodes and headers.
+
+    Such a value can never change for its key, so a cached value is always correct, no matter
+    what other processes write to the database, and it never needs to be invalidated.
+    """
+    def __init__(self, max_size: int = DEFAULT_READ_CACHE_SIZE) -> None:
+        if max_size < 1:
+            raise ValueError(f"Cache size must be at least 1 byte, got {max_size}")
+
+        self._max_size = max_size
+        self._size = 0
+        self._values: 'OrderedDict[bytes, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_cacheable_key(key: bytes) -> bool:
+        return len(key) == 32
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes in cached keys and values
+        """
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups:
+            return self.hits / lookups
+        else:
+            return 0.0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Return the cached value for ``key``, or ``None`` if it is not cached.
+        """
+        if not self.is_cacheable_key(key):
+            return None
+
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            else:
+                self._values.move_to_end(key)
+                self.hits += 1
+                return value
+
+    def maybe_add(self, key: bytes, value: bytes) -> bool:
+        """
+        Cache ``value`` if ``key`` is its keccak hash.
+
+        :return: whether the value was cached
+        """
+        item_size = len(key) + len(value)
+        if not self.is_cacheable_key(key) or item_size > self._max_size:
+            return False
+        elif keccak(value) != key:
+            return False
+
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                return True
+
+            self._values[key] = value
+            self._size += item_size
+            while self._size > self._max_size:
+                evicted_key, evicted_value = self._values.popitem(last=False)
+                self._size -= len(evicted_key) + len(evicted_value)
+
+        return True
+
+    def evict(self, key: bytes) -> None:
+        """
+        Drop ``key`` from the cache. This is only needed to keep local deletes visible.
+        """
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+            except KeyError:
+                return
+            else:
+                self._size -= len(key) + len(value)
+
+    def __str__(self) -> str:
+        return (
+            f"ContentAddressedCache(items={len(self)}, bytes={self.size}/{self.max_size}, "
+            f"hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.2%})"
+        )
+
+
+class ReadCacheReporter(Service):
+    """
+    Periodically log the hits and misses of the read cache of a process, and set them on
+    gauges if a metrics registry is supplied.
+    """
+    logger = get_logger('trinity.db.cache.ReadCacheReporter')
+
+    def __init__(
+            self,
+            cache: ContentAddressedCache,
+            name: str,
+            metrics_registry: MetricsRegistry = None,
+            interval: float = READ_CACHE_REPORT_INTERVAL) -> None:
+        self._cache = cache
+        self._name = name
+        self._metrics_registry = metrics_registry
+        self._interval = interval
+
+    async def run(self) -> None:
+        while self.manager.is_running:
+            await asyncio.sleep(self._interval)
+            self.report()
+
+    def report(self) -> None:
+        self.logger.debug("DB read cache of %s: %s", self._name, self._cache)
+        if self._metrics_registry is None:
+            return
+
+        for stat, value in (
+                ('hits', self._cache.hits),
+                ('misses', self._cache.misses),
+                ('hit_rate', self._cache.hit_rate),
+                ('size', self._cache.size)):
+            self._metrics_registry.gauge(
+                f'trinity.db/{self._name}_read_cache_{stat}.gauge'
+            ).set_value(value)
@@ -2,6 +2,7 @@ from abc import abstractmethod
 from typing import (
     Dict,
     Iterable,
+    Optional,
     Sequence,
     Tuple,
     Type,
@@ -15,10 +16,12 @@ from eth.abc import (
     ReceiptAPI,
     SignedTransactionAPI,
 )
+from eth.constants import GENESIS_PARENT_HASH
 from eth.db.chain import ChainDB
 
 from trinity._utils.async_dispatch import async_method
 from trinity.db.eth1.header import BaseAsyncHeaderDB
+from trinity.db.manager import db_multi_exists, db_multi_get
 
 
 class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
@@ -34,6 +37,14 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     async def coro_get(self, key: bytes) -> bytes:
         ...
 
+    @abstractmethod
+    async def coro_multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        ...
+
+    @abstractmethod
+    async def coro_multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        ...
+
     @abstractmethod
     async def coro_persist_block(
         self,
@@ -41,6 +52,14 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
         ...
 
+    @abstractmethod
+    async def coro_persist_blocks(
+        self,
+        blocks: Sequence[BlockAPI],
+        trie_data_dicts: Iterable[Dict[Hash32, bytes]] = (),
+    ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
+        ...
+
     @abstractmethod
     async def coro_persist_uncles(self, uncles: Sequence[BlockHeaderAPI]) -> Hash32:
         ...
@@ -70,8 +89,43 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
 
 
 class AsyncChainDB(BaseAsyncChainDB):
+    def persist_blocks(
+            self,
+            blocks: Sequence[BlockAPI],
+            trie_data_dicts: Iterable[Dict[Hash32, bytes]] = (),
+            genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH,
+    ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
+        """
+        Persist a contiguous range of blocks, with their transaction lookups, and any trie
+        data that goes with them (like receipt tries), in a single atomic batch.
+
+        :param blocks: blocks in ascending order, the first one's parent must already be stored
+        :param trie_data_dicts: trie nodes to write in the same batch, keyed by their hash
+        :return: the hashes that became canonical, and the hashes that are no longer canonical
+        """
+        new_canonical_hashes: Tuple[Hash32, ...] = ()
+        old_canonical_hashes: Tuple[Hash32, ...] = ()
+        with self.db.atomic_batch() as db:
+            for trie_data_dict in trie_data_dicts:
+                self._persist_trie_data_dict(db, trie_data_dict)
+
+            for block in blocks:
+                new_hashes, old_hashes = self._persist_block(db, block, genesis_parent_hash)
+                new_canonical_hashes += new_hashes
+                old_canonical_hashes += old_hashes
+
+        return new_canonical_hashes, old_canonical_hashes
+
+    def multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        return db_multi_exists(self.db, keys)
+
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        return db_multi_get(self.db, keys)
+
     coro_exists = async_method(BaseAsyncChainDB.exists)
     coro_get = async_method(BaseAsyncChainDB.get)
+    coro_multi_exists = async_method(multi_exists)
+    coro_multi_get = async_method(multi_get)
     coro_get_block_header_by_hash = async_method(BaseAsyncChainDB.get_block_header_by_hash)
     coro_get_canonical_head = async_method(BaseAsyncChainDB.get_canonical_head)
     coro_get_score = async_method(BaseAsyncChainDB.get_score)
@@ -82,6 +136,7 @@ class AsyncChainDB(BaseAsyncChainDB):
     coro_persist_header = async_method(BaseAsyncChainDB.persist_header)
     coro_persist_header_chain = async_method(BaseAsyncChainDB.persist_header_chain)
     coro_persist_block = async_method(BaseAsyncChainDB.persist_block)
+    coro_persist_blocks = async_method(persist_blocks)
     coro_persist_header_chain = async_method(BaseAsyncChainDB.persist_header_chain)
     coro_persist_uncles = async_method(BaseAsyncChainDB.persist_uncles)
     coro_persist_trie_data_dict = async_method(BaseAsyncChainDB.persist_trie_data_dict)
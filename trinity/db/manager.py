@@ -3,13 +3,19 @@ import enum
 import errno
 import itertools
 import logging
+import os
 import pathlib
+import queue
 import socket
 import struct
 import threading
 from types import TracebackType
 from typing import (
     Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
     Type,
 )
 
@@ -17,12 +23,14 @@ from eth_utils.toolz import partition
 
 from eth.abc import (
     AtomicDatabaseAPI,
+    DatabaseAPI,
 )
 from eth.db.atomic import AtomicDBWriteBatch
 from eth.db.backends.base import BaseAtomicDB
 from eth.db.diff import DBDiff
 
 from trinity._utils.ipc import wait_for_ipc
+from trinity.db.cache import ContentAddressedCache
 from trinity._utils.socket import BufferedSocket, IPCSocketServer
 
 
@@ -33,6 +41,8 @@ class Operation(enum.Enum):
     DELETE = b'\x02'
     EXISTS = b'\x03'
     ATOMIC_BATCH = b'\x04'
+    MULTI_GET = b'\x05'
+    MULTI_EXISTS = b'\x06'
 
 
 GET = Operation.GET
@@ -111,6 +121,36 @@ ATOMIC_BATCH Response:
 - Success Byte: 0x01
 """
 
+MULTI_GET = Operation.MULTI_GET
+"""
+MULTI_GET Request:
+
+- Operation Byte: 0x05
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+MULTI_GET Response:
+
+- Result Bytes: Array of (Found: 0x01 or Missing: 0x00), one per requested key
+- Value Sizes: Array of 4-byte little endian, one per found key
+- Values: Array of raw bytes, one per found key
+"""
+
+MULTI_EXISTS = Operation.MULTI_EXISTS
+"""
+MULTI_EXISTS Request:
+
+- Operation Byte: 0x06
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+MULTI_EXISTS Response:
+
+- Result Bytes: Array of (True: 0x01 or False: 0x00), one per requested key
+"""
+
 
 LEN_BYTES = 4
 DOUBLE_LEN_BYTES = 2 * LEN_BYTES
@@ -171,6 +211,10 @@ class DBManager(IPCSocketServer):
                     self.handle_EXISTS(sock)
                 elif operation is ATOMIC_BATCH:
                     self.handle_ATOMIC_BATCH(sock)
+                elif operation is MULTI_GET:
+                    self.handle_MULTI_GET(sock)
+                elif operation is MULTI_EXISTS:
+                    self.handle_MULTI_EXISTS(sock)
                 else:
                     self.logger.error("Got unhandled operation %s", operation)
             except Exception as err:
@@ -243,6 +287,58 @@ class DBManager(IPCSocketServer):
 
         sock.sendall(SUCCESS_BYTE)
 
+    def handle_MULTI_GET(self, sock: BufferedSocket) -> None:
+        keys = _read_keys(sock)
+
+        result_bytes = bytearray()
+        values = []
+        for key in keys:
+            try:
+                value = self.db[key]
+            except KeyError:
+                result_bytes += FAIL_BYTE
+            else:
+                result_bytes += SUCCESS_BYTE
+                values.append(value)
+
+        fmt_str = '<' + 'I' * len(values)
+        value_sizes_data = struct.pack(fmt_str, *(len(value) for value in values))
+        sock.sendall(bytes(result_bytes) + value_sizes_data + b''.join(values))
+
+    def handle_MULTI_EXISTS(self, sock: BufferedSocket) -> None:
+        keys = _read_keys(sock)
+        sock.sendall(b''.join(
+            SUCCESS_BYTE if key in self.db else FAIL_BYTE
+            for key in keys
+        ))
+
+
+def _read_keys(sock: BufferedSocket) -> Tuple[bytes, ...]:
+    key_count = int.from_bytes(sock.read_exactly(LEN_BYTES), 'little')
+    if not key_count:
+        return ()
+
+    fmt_str = '<' + 'I' * key_count
+    key_sizes = struct.unpack(fmt_str, sock.read_exactly(LEN_BYTES * key_count))
+    keys_data = sock.read_exactly(sum(key_sizes))
+
+    keys = []
+    offset = 0
+    for key_size in key_sizes:
+        keys.append(keys_data[offset:offset + key_size])
+        offset += key_size
+    return tuple(keys)
+
+
+def _encode_keys(operation: Operation, keys: Sequence[bytes]) -> bytes:
+    fmt_str = '<I' + 'I' * len(keys)
+    key_count_and_size_data = struct.pack(
+        fmt_str,
+        len(keys),
+        *(len(key) for key in keys),
+    )
+    return operation.value + key_count_and_size_data + b''.join(keys)
+
 
 class AtomicBatch(AtomicDBWriteBatch):
     """
@@ -265,9 +361,14 @@ class AtomicBatch(AtomicDBWriteBatch):
 class DBClient(BaseAtomicDB):
     logger = logging.getLogger('trinity.db.client.DBClient')
 
-    def __init__(self, sock: socket.socket):
+    def __init__(self, sock: socket.socket, read_cache: ContentAddressedCache = None):
         self._socket = BufferedSocket(sock)
         self._lock = threading.Lock()
+        self._read_cache = read_cache
+
+    @property
+    def read_cache(self) -> Optional[ContentAddressedCache]:
+        return self._read_cache
 
     def __enter__(self) -> None:
         self._socket.__enter__()
@@ -279,6 +380,18 @@ class DBClient(BaseAtomicDB):
         self._socket.__exit__(exc_type, exc_value, exc_tb)
 
     def __getitem__(self, key: bytes) -> bytes:
+        if self._read_cache is None:
+            return self._remote_get(key)
+
+        cached_value = self._read_cache.get(key)
+        if cached_value is not None:
+            return cached_value
+
+        value = self._remote_get(key)
+        self._read_cache.maybe_add(key, value)
+        return value
+
+    def _remote_get(self, key: bytes) -> bytes:
         with self._lock:
             self._socket.sendall(GET.value + len(key).to_bytes(LEN_BYTES, 'little') + key)
             result_byte = self._socket.read_exactly(1)
@@ -300,6 +413,9 @@ class DBClient(BaseAtomicDB):
             Result(self._socket.read_exactly(1))
 
     def __delitem__(self, key: bytes) -> None:
+        if self._read_cache is not None:
+            self._read_cache.evict(key)
+
         with self._lock:
             self._socket.sendall(DELETE.value + len(key).to_bytes(4, 'little') + key)
             result_byte = self._socket.read_exactly(1)
@@ -323,12 +439,93 @@ class DBClient(BaseAtomicDB):
         else:
             raise Exception(f"Unknown result byte: {result_byte.hex}")
 
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        """
+        Look up all of ``keys`` in a single round trip to the :class:`DBManager`.
+
+        :return: the values in the same order as ``keys``, with ``None`` for missing keys
+        """
+        if self._read_cache is None:
+            return self._remote_multi_get(keys)
+
+        values = [self._read_cache.get(key) for key in keys]
+        uncached_indices = tuple(index for index, value in enumerate(values) if value is None)
+        if uncached_indices:
+            remote_values = self._remote_multi_get(tuple(keys[index] for index in uncached_indices))
+            for index, value in zip(uncached_indices, remote_values):
+                if value is not None:
+                    self._read_cache.maybe_add(keys[index], value)
+                values[index] = value
+        return tuple(values)
+
+    def _remote_multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        if not keys:
+            return ()
+
+        with self._lock:
+            self._socket.sendall(_encode_keys(MULTI_GET, keys))
+            result_bytes = self._socket.read_exactly(len(keys))
+            found_count = result_bytes.count(SUCCESS_BYTE)
+            if found_count:
+                fmt_str = '<' + 'I' * found_count
+                value_sizes = struct.unpack(
+                    fmt_str,
+                    self._socket.read_exactly(LEN_BYTES * found_count),
+                )
+                values_data = self._socket.read_exactly(sum(value_sizes))
+            else:
+                value_sizes = ()
+                values_data = b''
+
+        values = []
+        value_size_iter = iter(value_sizes)
+        offset = 0
+        for result_byte in result_bytes:
+            if result_byte == SUCCESS_BYTE[0]:
+                value_size = next(value_size_iter)
+                values.append(values_data[offset:offset + value_size])
+                offset += value_size
+            elif result_byte == FAIL_BYTE[0]:
+                values.append(None)
+            else:
+                raise Exception(f"Unknown result byte: {result_byte:02x}")
+        return tuple(values)
+
+    def multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        """
+        Check for the presence of all of ``keys`` in a single round trip to the
+        :class:`DBManager`.
+
+        :return: whether each key is present, in the same order as ``keys``
+        """
+        if not keys:
+            return ()
+
+        with self._lock:
+            self._socket.sendall(_encode_keys(MULTI_EXISTS, keys))
+            result_bytes = self._socket.read_exactly(len(keys))
+
+        results = []
+        for result_byte in result_bytes:
+            if result_byte == SUCCESS_BYTE[0]:
+                results.append(True)
+            elif result_byte == FAIL_BYTE[0]:
+                results.append(False)
+            else:
+                raise Exception(f"Unknown result byte: {result_byte:02x}")
+        return tuple(results)
+
     @contextlib.contextmanager
     def atomic_batch(self) -> Iterator[AtomicBatch]:
         batch = AtomicBatch(self)
         yield batch
-        diff = batch.finalize()
+        self._write_diff(batch.finalize())
+
+    def _write_diff(self, diff: DBDiff) -> None:
         pending_deletes = diff.deleted_keys()
+        if self._read_cache is not None:
+            for key in pending_deletes:
+                self._read_cache.evict(key)
         pending_kv_pairs = diff.pending_items()
 
         kv_pair_count = len(pending_kv_pairs)
@@ -365,12 +562,198 @@ class DBClient(BaseAtomicDB):
         self._socket.close()
 
     @classmethod
-    def connect(cls, path: pathlib.Path, timeout: int = 5) -> "DBClient":
+    def connect(cls,
+                path: pathlib.Path,
+                timeout: int = 5,
+                read_cache: ContentAddressedCache = None) -> "DBClient":
+        """
+        Connect to the :class:`DBManager` listening at ``path``.
+
+        :param read_cache: if supplied, serve reads of content-addressed values from this
+            cache, and add such values to it when they are read from the database
+        """
         wait_for_ipc(path, timeout)
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         cls.logger.debug("Opened connection to %s: %s", path, s)
         s.connect(str(path))
-        return cls(s)
+        return cls(s, read_cache)
+
+
+# Matches the default number of workers of the asyncio default executor, which is where
+# the ``coro_*`` database methods run, so that each of them can get its own connection.
+DEFAULT_POOL_SIZE = min(32, (os.cpu_count() or 1) + 4)
+
+
+class PooledDBClient(BaseAtomicDB):
+    """
+    Serve the BaseAtomicDB API over a pool of :class:`DBClient` connections to the
+    :class:`DBManager`, which serves every connection in its own thread.
+
+    Each operation checks out an idle connection (or opens a new one, up to ``pool_size``),
+    so that operations from different threads run concurrently instead of queueing on the
+    lock of a single connection.
+    """
+    logger = logging.getLogger('trinity.db.client.PooledDBClient')
+
+    def __init__(self,
+                 path: pathlib.Path,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 read_cache: ContentAddressedCache = None) -> None:
+        if pool_size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {pool_size}")
+
+        self._path = path
+        self._pool_size = pool_size
+        # All connections share the same cache
+        self._read_cache = read_cache
+        self._idle_clients: 'queue.LifoQueue[DBClient]' = queue.LifoQueue()
+        # DBClient is a Mapping, so it is not hashable and can't be kept in a set
+        self._open_clients: List[DBClient] = []
+        self._open_clients_lock = threading.Lock()
+        self._available_slots = threading.BoundedSemaphore(pool_size)
+        self._is_closed = False
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    @property
+    def read_cache(self) -> Optional[ContentAddressedCache]:
+        return self._read_cache
+
+    @property
+    def num_open_connections(self) -> int:
+        return len(self._open_clients)
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self,
+                 exc_type: Type[BaseException],
+                 exc_value: BaseException,
+                 exc_tb: TracebackType) -> None:
+        self.close()
+
+    def _open_client(self) -> DBClient:
+        with self._open_clients_lock:
+            if self._is_closed:
+                raise OSError(f"{self} is closed")
+            client = DBClient.connect(self._path, read_cache=self._read_cache)
+            self._open_clients.append(client)
+        return client
+
+    def _discard_client(self, client: DBClient) -> None:
+        with self._open_clients_lock:
+            # compare by identity, because Mapping equality compares the contents
+            self._open_clients = [
+                open_client for open_client in self._open_clients if open_client is not client
+            ]
+        try:
+            client.close()
+        except OSError as err:
+            self.logger.debug("Error closing broken connection to %s: %s", self._path, err)
+
+    @contextlib.contextmanager
+    def _checkout(self) -> Iterator[DBClient]:
+        with self._available_slots:
+            try:
+                client = self._idle_clients.get_nowait()
+            except queue.Empty:
+                client = self._open_client()
+
+            try:
+                yield client
+            except KeyError:
+                # A missing key is reported only after the full response was read,
+                # so the connection is still in a clean state.
+                self._idle_clients.put(client)
+                raise
+            except BaseException:
+                # The connection might be left in the middle of a request or response.
+                self._discard_client(client)
+                raise
+            else:
+                self._idle_clients.put(client)
+
+    def __getitem__(self, key: bytes) -> bytes:
+        with self._checkout() as client:
+            return client[key]
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        with self._checkout() as client:
+            client[key] = value
+
+    def __delitem__(self, key: bytes) -> None:
+        with self._checkout() as client:
+            del client[key]
+
+    def _exists(self, key: bytes) -> bool:
+        with self._checkout() as client:
+            return client._exists(key)
+
+    def multi_get(self, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+        with self._checkout() as client:
+            return client.multi_get(keys)
+
+    def multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        with self._checkout() as client:
+            return client.multi_exists(keys)
+
+    @contextlib.contextmanager
+    def atomic_batch(self) -> Iterator[AtomicBatch]:
+        # Reads during the batch fall through to the pool, and only the final write
+        # checks out a connection.
+        batch = AtomicBatch(self)
+        yield batch
+        diff = batch.finalize()
+        with self._checkout() as client:
+            client._write_diff(diff)
+
+    def close(self) -> None:
+        with self._open_clients_lock:
+            self._is_closed = True
+            clients = tuple(self._open_clients)
+            self._open_clients.clear()
+
+        for client in clients:
+            client.close()
+
+    @classmethod
+    def connect(cls,
+                path: pathlib.Path,
+                pool_size: int = DEFAULT_POOL_SIZE,
+                timeout: int = 5,
+                read_cache: ContentAddressedCache = None) -> "PooledDBClient":
+        wait_for_ipc(path, timeout)
+        pooled_client = cls(path, pool_size, read_cache)
+        # Open the first connection eagerly, so that connection problems show up right away.
+        # The rest are opened on demand.
+        pooled_client._idle_clients.put(pooled_client._open_client())
+        cls.logger.debug("Opened connection pool of size %d to %s", pool_size, path)
+        return pooled_client
+
+
+def db_multi_get(db: DatabaseAPI, keys: Sequence[bytes]) -> Tuple[Optional[bytes], ...]:
+    """
+    Look up all of ``keys`` in ``db``, using a single round trip if ``db`` is a
+    :class:`DBClient` or :class:`PooledDBClient`, and falling back to one lookup per key otherwise.
+    """
+    if isinstance(db, (DBClient, PooledDBClient)):
+        return db.multi_get(keys)
+    else:
+        return tuple(db.get(key) for key in keys)
+
+
+def db_multi_exists(db: DatabaseAPI, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+    """
+    Check for the presence of all of ``keys`` in ``db``, using a single round trip
+    if ``db`` is a :class:`DBClient` or :class:`PooledDBClient`, and falling back to one
+    lookup per key otherwise.
+    """
+    if isinstance(db, (DBClient, PooledDBClient)):
+        return db.multi_exists(keys)
+    else:
+        return tuple(key in db for key in keys)
 
 
 def _run() -> None:
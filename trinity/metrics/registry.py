@@ -1,4 +1,4 @@
-from prometheus_client import CollectorRegistry, Counter, Gauge
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 
 class AllMetrics:
@@ -67,6 +67,26 @@ class AllMetrics:
             "validator_sent_attestation", "counter of attested", registry=registry
         )  # noqa: E501
 
+        # Validator API
+        self.validator_api_state_cache_hits = Counter(
+            "validator_api_state_cache_hits",
+            "counter of advanced states served from the cache",
+            registry=registry,
+        )
+        self.validator_api_state_cache_misses = Counter(
+            "validator_api_state_cache_misses",
+            "counter of states advanced to a slot on request",
+            registry=registry,
+        )
+
+        # Validator client
+        self.validator_signing_seconds = Histogram(
+            "validator_signing_seconds",
+            "time from submitting a duty to the signing pool to getting its signature",
+            ["duty_type"],
+            registry=registry,
+        )
+
 
 registry = CollectorRegistry()
 metrics = AllMetrics(registry)
@@ -14,7 +14,8 @@ from p2p.peer_pool import BasePeerPool
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.chains.full import FullChain
-from trinity.db.manager import DBClient
+from trinity.db.cache import ContentAddressedCache, ReadCacheReporter
+from trinity.db.manager import PooledDBClient
 from trinity.db.eth1.header import (
     AsyncHeaderDB,
     BaseAsyncHeaderDB,
@@ -51,7 +52,11 @@ class Node(Service, Generic[TPeer]):
                  metrics_service: MetricsServiceAPI,
                  trinity_config: TrinityConfig) -> None:
         self.trinity_config = trinity_config
-        self._base_db = DBClient.connect(trinity_config.database_ipc_path)
+        self._read_cache = ContentAddressedCache()
+        self._base_db = PooledDBClient.connect(
+            trinity_config.database_ipc_path,
+            read_cache=self._read_cache,
+        )
         self._headerdb = AsyncHeaderDB(self._base_db)
 
         self._jsonrpc_ipc_path: Path = trinity_config.jsonrpc_ipc_path
@@ -130,4 +135,9 @@ class Node(Service, Generic[TPeer]):
             self.manager.run_daemon_child_service(self.get_p2p_server())
             self.manager.run_daemon_child_service(self.get_event_server())
             self.manager.run_daemon_child_service(self.metrics_service)
+            self.manager.run_daemon_child_service(ReadCacheReporter(
+                self._read_cache,
+                'node',
+                self.metrics_service.registry,
+            ))
             await self.manager.wait_finished()
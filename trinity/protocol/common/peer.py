@@ -150,11 +150,15 @@ class BaseChainPeerReporterRegistry(PeerReporterRegistry[BaseChainPeer]):
         td_gauge = self._get_td_gauge(peer_id)
         head_gauge.set_value(0)
         td_gauge.set_value(0)
+        self._get_queued_bytes_gauge(peer_id).set_value(0)
 
     def make_periodic_update(self, peer: BaseChainPeer, peer_id: int) -> None:
         head_gauge = self._get_blockheight_gauge(peer_id)
         td_gauge = self._get_td_gauge(peer_id)
 
+        transport = peer.connection.get_multiplexer().get_transport()
+        self._get_queued_bytes_gauge(peer_id).set_value(transport.queued_bytes)
+
         head_info = peer.head_info
         try:
             td_gauge.set_value(head_info.head_td)
@@ -176,6 +180,9 @@ class BaseChainPeerReporterRegistry(PeerReporterRegistry[BaseChainPeer]):
     def _get_td_gauge(self, peer_id: int) -> SimpleGauge:
         return self.metrics_registry.gauge(f"trinity.p2p/peer_{peer_id}_total_difficulty.gauge")
 
+    def _get_queued_bytes_gauge(self, peer_id: int) -> SimpleGauge:
+        return self.metrics_registry.gauge(f"trinity.p2p/peer_{peer_id}_queued_bytes.gauge")
+
 
 class BaseChainPeerFactory(BasePeerFactory):
     context: ChainContext
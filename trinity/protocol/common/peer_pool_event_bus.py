@@ -25,6 +25,8 @@ from lahja import (
 )
 
 from p2p.abc import CommandAPI, SessionAPI
+from p2p.constants import WRITE_BUFFER_DRAIN_TIMEOUT
+from p2p.disconnect import DisconnectReason
 from p2p.exceptions import PeerConnectionLost
 from p2p.peer import (
     BasePeer,
@@ -104,12 +106,35 @@ class PeerPoolEventServer(Service, PeerSubscriber, Generic[TPeer]):
         """
         Process any :class:`trinity.protocol.common.events.PeerPoolMessageEvent` by
         sending the wrapped command through the protocol of the corresponding session.
+
+        The command is sent once the peer has read enough of what was already sent to it.
+        Each send waits in its own task, so that a slow peer doesn't hold up the sends to
+        other peers.
         """
         await self.try_with_session(
             event.session,
-            lambda peer: peer.sub_proto.send(event.command)
+            lambda peer: self.manager.run_task(self._send_when_drained, peer, event.command)
         )
 
+    @async_fire_and_forget
+    async def _send_when_drained(self, peer: TPeer, command: CommandAPI[Any]) -> None:
+        # Waiting sends are let through by the transport's drain lock in the order they
+        # started waiting, so commands to a peer still go out in the order they were sent.
+        try:
+            await asyncio.wait_for(
+                peer.connection.get_multiplexer().drain(),
+                timeout=WRITE_BUFFER_DRAIN_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            self.logger.info(
+                "Disconnecting from %s, which did not read what was sent to it in %d seconds",
+                peer,
+                WRITE_BUFFER_DRAIN_TIMEOUT,
+            )
+            peer.disconnect_nowait(DisconnectReason.TIMEOUT)
+        else:
+            peer.sub_proto.send(command)
+
     def run_daemon_event(self,
                          event_type: Type[TEvent],
                          event_handler_fn: Callable[[TEvent], Any]) -> None:
@@ -1,23 +1,22 @@
 from typing import (
-    Iterable,
-)
-
-from eth_utils import (
-    to_tuple,
+    Dict,
+    Tuple,
 )
 
 from eth.db.trie import make_trie_root_and_nodes
 from eth_hash.auto import keccak
+from eth_typing import Hash32
 import rlp
 
-from p2p.exchange import BaseNormalizer
+from p2p.exchange import BaseParallelNormalizer
 
 from trinity.protocol.common.typing import (
-    BlockBodyBundle,
     BlockBodyBundles,
     NodeDataBundles,
     ReceiptsBundles,
+    ReceiptsByBlock,
 )
+from trinity.rlp.block_body import BlockBody
 
 from .commands import (
     BlockBodiesV65,
@@ -26,29 +25,61 @@ from .commands import (
 )
 
 
-class GetNodeDataNormalizer(BaseNormalizer[NodeDataV65, NodeDataBundles]):
-    is_normalization_slow = True
+TrieRootAndData = Tuple[Hash32, Dict[Hash32, bytes]]
+
+
+class GetNodeDataNormalizer(
+        BaseParallelNormalizer[NodeDataV65, NodeDataBundles, Tuple[Hash32, ...]]):
+    """
+    Hashing a full response of 384 nodes takes ~6.7ms of the syncing process, with the
+    pycryptodome keccak. Sending it to the normalization pool and reading back the hashes
+    takes ~0.4ms of the syncing process, so node data is hashed in the pool too.
+    """
 
-    def normalize_result(self, cmd: NodeDataV65) -> NodeDataBundles:
-        node_keys = map(keccak, cmd.payload)
-        result = tuple(zip(node_keys, cmd.payload))
-        return result
+    @staticmethod
+    def compute(payload: Tuple[bytes, ...]) -> Tuple[Hash32, ...]:
+        return tuple(Hash32(keccak(node)) for node in payload)
 
+    def combine(self, cmd: NodeDataV65, node_keys: Tuple[Hash32, ...]) -> NodeDataBundles:
+        return tuple(zip(node_keys, cmd.payload))
 
-class ReceiptsNormalizer(BaseNormalizer[ReceiptsV65, ReceiptsBundles]):
-    is_normalization_slow = True
 
-    def normalize_result(self, cmd: ReceiptsV65) -> ReceiptsBundles:
-        trie_roots_and_data = map(make_trie_root_and_nodes, cmd.payload)
+class ReceiptsNormalizer(
+        BaseParallelNormalizer[ReceiptsV65, ReceiptsBundles, Tuple[TrieRootAndData, ...]]):
+
+    @staticmethod
+    def compute(payload: ReceiptsByBlock) -> Tuple[TrieRootAndData, ...]:
+        return tuple(map(make_trie_root_and_nodes, payload))
+
+    def combine(
+            self,
+            cmd: ReceiptsV65,
+            trie_roots_and_data: Tuple[TrieRootAndData, ...]) -> ReceiptsBundles:
         return tuple(zip(cmd.payload, trie_roots_and_data))
 
 
-class GetBlockBodiesNormalizer(BaseNormalizer[BlockBodiesV65, BlockBodyBundles]):
-    is_normalization_slow = True
+class GetBlockBodiesNormalizer(
+        BaseParallelNormalizer[
+            BlockBodiesV65,
+            BlockBodyBundles,
+            Tuple[Tuple[TrieRootAndData, Hash32], ...],
+        ]):
+
+    @staticmethod
+    def compute(payload: Tuple[BlockBody, ...]) -> Tuple[Tuple[TrieRootAndData, Hash32], ...]:
+        return tuple(
+            (
+                make_trie_root_and_nodes(body.transactions),
+                Hash32(keccak(rlp.encode(body.uncles))),
+            )
+            for body in payload
+        )
 
-    @to_tuple
-    def normalize_result(self, cmd: BlockBodiesV65) -> Iterable[BlockBodyBundle]:
-        for body in cmd.payload:
-            uncle_hashes = keccak(rlp.encode(body.uncles))
-            transaction_root_and_nodes = make_trie_root_and_nodes(body.transactions)
-            yield body, transaction_root_and_nodes, uncle_hashes
+    def combine(
+            self,
+            cmd: BlockBodiesV65,
+            computed: Tuple[Tuple[TrieRootAndData, Hash32], ...]) -> BlockBodyBundles:
+        return tuple(
+            (body, transaction_root_and_nodes, uncles_hash)
+            for body, (transaction_root_and_nodes, uncles_hash) in zip(cmd.payload, computed)
+        )
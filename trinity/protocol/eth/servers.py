@@ -143,10 +143,11 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
         nodes = []
         missing_node_hashes = []
         # Only serve up to MAX_STATE_FETCH items in every request.
-        for node_hash in set(node_hashes[:MAX_STATE_FETCH]):
-            try:
-                node = await self.db.coro_get(node_hash)
-            except KeyError:
+        unique_node_hashes = tuple(set(node_hashes[:MAX_STATE_FETCH]))
+        # Look up all the nodes at once, to avoid a database round trip per node
+        found_nodes = await self.db.coro_multi_get(unique_node_hashes)
+        for node_hash, node in zip(unique_node_hashes, found_nodes):
+            if node is None:
                 missing_node_hashes.append(node_hash)
             else:
                 nodes.append(node)
@@ -2,6 +2,7 @@ import asyncio
 import time
 from typing import (
     AsyncIterator,
+    Collection,
     Iterable,
     Sequence,
     Set,
@@ -89,6 +90,7 @@ from trinity.sync.header.chain import SequentialHeaderChainGapSyncer
 from trinity.sync.beam.state import (
     BeamDownloader,
 )
+from trinity.sync.beam.witness import BlockWitnessRecorder
 from trinity._utils.pauser import Pauser
 from trinity._utils.timer import Timer
 from trinity._utils.logging import get_logger
@@ -116,6 +118,9 @@ class BeamSyncer(Service):
 
     There is an option, currently only used for testing, to force beam sync at a particular
     block number (rather than trigger it when catching up with a peer).
+
+    There is also an option to record the witness of every imported block with the
+    given :class:`~trinity.sync.beam.witness.BlockWitnessRecorder`, to replay it offline.
     """
     def __init__(
             self,
@@ -127,7 +132,8 @@ class BeamSyncer(Service):
             checkpoint: Checkpoint = None,
             force_beam_block_number: BlockNumber = None,
             enable_backfill: bool = True,
-            enable_state_backfill: bool = True) -> None:
+            enable_state_backfill: bool = True,
+            witness_recorder: BlockWitnessRecorder = None) -> None:
         self.logger = get_logger('trinity.sync.beam.chain.BeamSyncer')
 
         self._body_for_header_exists = body_for_header_exists(chain_db, chain)
@@ -179,6 +185,7 @@ class BeamSyncer(Service):
             self._state_downloader,
             self._backfiller,
             event_bus,
+            witness_recorder,
         )
         self._launchpoint_header_syncer = HeaderLaunchpointSyncer(self._header_syncer)
         self._body_syncer = RegularChainBodySyncer(
@@ -719,6 +726,9 @@ class BeamBlockImporter(BaseBlockImporter, Service):
 
     It independently runs other state preloads, like the accounts for the
     block transactions.
+
+    If a witness recorder is given, it records the witness of each imported block: the
+    trie nodes and bytecodes that the import read.
     """
     def __init__(
             self,
@@ -726,12 +736,14 @@ class BeamBlockImporter(BaseBlockImporter, Service):
             db: DatabaseAPI,
             state_getter: BeamDownloader,
             backfiller: BeamStateBackfill,
-            event_bus: EndpointAPI) -> None:
+            event_bus: EndpointAPI,
+            witness_recorder: BlockWitnessRecorder = None) -> None:
         self.logger = get_logger('trinity.sync.beam.chain.BeamBlockImporter')
         self._chain = chain
         self._db = db
         self._state_downloader = state_getter
         self._backfiller = backfiller
+        self._witness_recorder = witness_recorder
 
         self._blocks_imported = 0
         self._preloaded_account_state = 0
@@ -773,8 +785,35 @@ class BeamBlockImporter(BaseBlockImporter, Service):
             raise ValidationError(f"Requsted {block} to be imported, but ran {import_done.block}")
         self._blocks_imported += 1
         self._log_stats()
+
+        if self._witness_recorder is not None:
+            await asyncio.get_event_loop().run_in_executor(
+                None,
+                self._record_witness,
+                parent_header,
+                block,
+                import_done.result.meta_witness.hashes,
+            )
         return import_done.result
 
+    def _record_witness(
+            self,
+            parent_header: BlockHeaderAPI,
+            block: BlockAPI,
+            node_hashes: Collection[Hash32]) -> None:
+        nodes = tuple(
+            node for node in (self._db.get(node_hash) for node_hash in node_hashes)
+            if node is not None
+        )
+        num_bytes = self._witness_recorder.record(parent_header, block, nodes)
+        self.logger.debug(
+            "Recorded witness of %s: %d of %d nodes, %d bytes",
+            block.header,
+            len(nodes),
+            len(node_hashes),
+            num_bytes,
+        )
+
     async def preview_transactions(
             self,
             header: BlockHeaderAPI,
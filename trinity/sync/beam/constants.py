@@ -14,17 +14,19 @@ TOO_LONG_PREDICTIVE_PEER_DELAY = 2.0
 # nodes we can request at once from a single peer.
 REQUEST_BUFFER_MULTIPLIER = 16
 
-# How many different processes are running previews? They will split the
-# block imports equally. A higher number means a slower startup, but more
-# previews are possible at a time (given that you have enough CPU cores).
-# The sensitivity of this number is relatively unexplored.
-NUM_PREVIEW_SHARDS = 4
-
 # How many speculative executions should we run concurrently? This is
 #   a global number, not per process or thread. It is necessary to
-#   constrain the I/O, which can become the global bottleneck.
+#   constrain the I/O, which can become the global bottleneck. It is split
+#   equally between the preview worker processes.
 MAX_CONCURRENT_SPECULATIVE_EXECUTIONS = 40
-MAX_SPECULATIVE_EXECUTIONS_PER_PROCESS = MAX_CONCURRENT_SPECULATIVE_EXECUTIONS // NUM_PREVIEW_SHARDS
+
+# How many seconds to wait in between each report of the load on the preview workers
+PREVIEW_WORKER_REPORT_INTERVAL = 10.0
+
+# How many seconds to wait for a preview worker to reply that a preview is complete,
+#   before no longer counting the preview as queued on the worker. A worker that does
+#   not reply by then has likely crashed, or is stuck.
+PREVIEW_WORKER_TIMEOUT = 600.0
 
 # How many seconds to wait in between each progress log, in the middle of a block
 #   Intuition: Report about 5 times per block. If progressing in at least real time,
@@ -50,6 +52,11 @@ MAX_ACCEPTABLE_WAIT_FOR_URGENT_NODE = 0.4
 #   node, and reissues the event to request it again.
 BLOCK_IMPORT_MISSING_STATE_TIMEOUT = 600
 
+# When the block importer pauses for missing state data, it also looks for the data that
+#   the upcoming transactions are predicted to need, and requests it in the same batch.
+#   This is the most data that is requested in one batch.
+MAX_MISSING_DATA_BATCH_SIZE = 256
+
 # If Beam Sync wants to use a queen, but is stuck waiting for it to show up,
 #   then log a warning if it's been too long. If it's been more than this
 #   many seconds, then log the warning:
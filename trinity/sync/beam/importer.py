@@ -1,16 +1,22 @@
 from abc import abstractmethod
 import asyncio
 from concurrent import futures
+from functools import partial
 from operator import attrgetter
 import time
 from typing import (
     Any,
+    Awaitable,
     Callable,
+    Dict,
+    Iterable,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
+    Union,
     cast,
 )
 
@@ -30,6 +36,7 @@ from eth.abc import (
 )
 from eth.typing import VMConfiguration
 from eth.vm.interrupt import (
+    EVMMissingData,
     MissingAccountTrieNode,
     MissingBytecode,
     MissingStorageTrieNode,
@@ -50,15 +57,17 @@ from eth_utils.toolz import (
 
 from lahja import EndpointAPI
 from lahja.common import BroadcastConfig
+from pyformance import MetricsRegistry
 
 from trinity._utils.timer import Timer
 from trinity.chains.full import FullChain
 from trinity.exceptions import StateUnretrievable
 from trinity.sync.beam.constants import (
     BLOCK_IMPORT_MISSING_STATE_TIMEOUT,
-    MAX_SPECULATIVE_EXECUTIONS_PER_PROCESS,
+    MAX_MISSING_DATA_BATCH_SIZE,
     MIN_GAS_LOG_WAIT,
-    NUM_PREVIEW_SHARDS,
+    PREVIEW_WORKER_REPORT_INTERVAL,
+    PREVIEW_WORKER_TIMEOUT,
 )
 from trinity.sync.common.events import (
     CollectMissingAccount,
@@ -66,10 +75,12 @@ from trinity.sync.common.events import (
     CollectMissingStorage,
     DoStatelessBlockImport,
     DoStatelessBlockPreview,
+    DoWorkerBlockPreview,
     MissingAccountResult,
     MissingBytecodeResult,
     MissingStorageResult,
     StatelessBlockImportDone,
+    WorkerBlockPreviewDone,
 )
 from trinity._utils.logging import get_logger
 
@@ -84,10 +95,21 @@ class BeamStats:
     # How much time is spent waiting on retrieving nodes?
     data_pause_time = 0.0
 
+    # How many times did execution pause to wait for missing data?
+    num_pauses = 0
+
+    # How many of the requests for missing data were predicted, and sent along with a
+    #   request for data that execution was paused on?
+    num_predicted_requests = 0
+
     @property
     def num_nodes(self) -> int:
         return self.num_account_nodes + self.num_bytecodes + self.num_storage_nodes
 
+    @property
+    def num_requests(self) -> int:
+        return self.num_accounts + self.num_bytecodes + self.num_storages
+
     @property
     def avg_rtt(self) -> float:
         if self.num_nodes:
@@ -95,6 +117,27 @@ class BeamStats:
         else:
             return 0
 
+    def compare(self, baseline: 'BeamStats') -> str:
+        """
+        Describe how the pauses of this execution compare to the pauses of the
+        ``baseline`` execution of the same transactions, like one that requested
+        missing data one item at a time.
+        """
+        def _change(before: float, after: float) -> str:
+            if before:
+                return f"{100 * (after - before) / before:+.0f}%"
+            else:
+                return "n/a"
+
+        return (
+            f"BeamStat comparison: pauses={baseline.num_pauses}->{self.num_pauses} "
+            f"({_change(baseline.num_pauses, self.num_pauses)}), "
+            f"wait={humanize_seconds(baseline.data_pause_time)}->"
+            f"{humanize_seconds(self.data_pause_time)} "
+            f"({_change(baseline.data_pause_time, self.data_pause_time)}), "
+            f"requests={baseline.num_requests}->{self.num_requests}"
+        )
+
     def __str__(self) -> str:
         avg_rtt = self.avg_rtt
 
@@ -104,7 +147,8 @@ class BeamStats:
             f"BeamStat: accts={self.num_accounts}, "
             f"a_nodes={self.num_account_nodes}, codes={self.num_bytecodes}, "
             f"strg={self.num_storages}, s_nodes={self.num_storage_nodes}, "
-            f"nodes={self.num_nodes}, rtt={avg_rtt:.3f}s, wait={wait_time}"
+            f"nodes={self.num_nodes}, rtt={avg_rtt:.3f}s, wait={wait_time}, "
+            f"pauses={self.num_pauses}, predicted={self.num_predicted_requests}"
         )
 
     def __repr__(self) -> str:
@@ -112,7 +156,8 @@ class BeamStats:
             f"BeamStats(num_accounts={self.num_accounts}, "
             f"num_account_nodes={self.num_account_nodes}, num_bytecodes={self.num_bytecodes}, "
             f"num_storages={self.num_storages}, num_storage_nodes={self.num_storage_nodes}, "
-            f"data_pause_time={self.data_pause_time:.3f}s)"
+            f"data_pause_time={self.data_pause_time:.3f}s, num_pauses={self.num_pauses}, "
+            f"num_predicted_requests={self.num_predicted_requests})"
         )
 
 
@@ -160,13 +205,26 @@ def make_pausing_beam_chain(
         db: AtomicDatabaseAPI,
         event_bus: EndpointAPI,
         loop: asyncio.AbstractEventLoop,
-        urgent: bool = True) -> BeamChain:
+        urgent: bool = True,
+        batch_missing_data: bool = False) -> BeamChain:
     """
     Patch the py-evm chain with a VMState that pauses when state data
     is missing, and emits an event which requests the missing data.
+
+    :param batch_missing_data: on every pause, also request the missing data that the
+        rest of the block is predicted to need, instead of only the data that is missing
     """
     pausing_vm_config = tuple(
-        (starting_block, pausing_vm_decorator(vm, event_bus, loop, urgent=urgent))
+        (
+            starting_block,
+            pausing_vm_decorator(
+                vm,
+                event_bus,
+                loop,
+                urgent=urgent,
+                batch_missing_data=batch_missing_data,
+            ),
+        )
         for starting_block, vm in vm_config
     )
     PausingBeamChain = BeamChain.configure(
@@ -179,12 +237,26 @@ def make_pausing_beam_chain(
 
 TVMFuncReturn = TypeVar('TVMFuncReturn')
 
+MissingDataResult = Union[MissingAccountResult, MissingBytecodeResult, MissingStorageResult]
+
+MISSING_DATA_EXCEPTIONS = (MissingAccountTrieNode, MissingBytecode, MissingStorageTrieNode)
+
+
+def _get_missing_data_key(missing_data: EVMMissingData) -> Hash32:
+    if isinstance(missing_data, MissingBytecode):
+        return missing_data.missing_code_hash
+    elif isinstance(missing_data, (MissingAccountTrieNode, MissingStorageTrieNode)):
+        return missing_data.missing_node_hash
+    else:
+        raise TypeError(f"Unknown type of missing data: {missing_data!r}")
+
 
 def pausing_vm_decorator(
         original_vm_class: Type[VirtualMachineAPI],
         event_bus: EndpointAPI,
         loop: asyncio.AbstractEventLoop,
-        urgent: bool = True) -> Type[VirtualMachineAPI]:
+        urgent: bool = True,
+        batch_missing_data: bool = False) -> Type[VirtualMachineAPI]:
     """
     Decorate a py-evm VM so that it will pause when data is missing
     """
@@ -234,6 +306,40 @@ def pausing_vm_decorator(
         else:
             raise StateUnretrievable("No servers for CollectMissingBytecode")
 
+    def request_missing_datum(
+            missing_datum: EVMMissingData,
+            block_number: BlockNumber) -> Awaitable[MissingDataResult]:
+        if isinstance(missing_datum, MissingAccountTrieNode):
+            return request_missing_account(
+                missing_datum.missing_node_hash,
+                missing_datum.address_hash,
+                missing_datum.state_root_hash,
+                block_number,
+            )
+        elif isinstance(missing_datum, MissingBytecode):
+            return request_missing_bytecode(missing_datum.missing_code_hash, block_number)
+        elif isinstance(missing_datum, MissingStorageTrieNode):
+            return request_missing_storage(
+                missing_datum.missing_node_hash,
+                missing_datum.requested_key,
+                missing_datum.storage_root_hash,
+                missing_datum.account_address,
+                block_number,
+            )
+        else:
+            raise TypeError(f"Unknown kind of missing data: {missing_datum!r}")
+
+    async def request_missing_batch(
+            missing_data: Sequence[EVMMissingData],
+            block_number: BlockNumber) -> Tuple[MissingDataResult, ...]:
+        """
+        Request all of the missing data at once, and wait until all of it is retrieved.
+        """
+        results = await asyncio.gather(*(
+            request_missing_datum(datum, block_number) for datum in missing_data
+        ))
+        return tuple(results)
+
     class PausingVMState(original_vm_class.get_state_class()):  # type: ignore
         """
         A custom version of VMState that pauses EVM execution when required data is missing.
@@ -245,20 +351,50 @@ def pausing_vm_decorator(
             super().__init__(*args, **kwargs)
             self.stats_counter = BeamStats()
 
+            # The transactions that are about to be applied, and how many of them were
+            #   started, to predict the data they need when batching missing data
+            self._expected_transactions: Tuple[SignedTransactionAPI, ...] = ()
+            self._expected_senders: Dict[int, Address] = {}
+            self._num_started_transactions = 0
+            self._recipient: Optional[Address] = None
+
+            # The accounts whose code was read, and their storage slots that were read,
+            #   keyed by the recipient of the transaction that read them
+            self._reads_by_recipient: Dict[Address, Dict[Address, Set[int]]] = {}
+
+        def expect_transactions(self, transactions: Sequence[SignedTransactionAPI]) -> None:
+            """
+            Register the transactions that are about to be applied, in order.
+            """
+            self._expected_transactions = tuple(transactions)
+            self._expected_senders = {}
+            self._num_started_transactions = 0
+
+        def apply_transaction(self, transaction: SignedTransactionAPI) -> ComputationAPI:
+            self._num_started_transactions += 1
+            self._recipient = transaction.to or None
+            return super().apply_transaction(transaction)
+
         def _pause_on_missing_data(
                 self,
-                vm_method: Callable[[Any], TVMFuncReturn],
+                vm_method: Callable[..., TVMFuncReturn],
                 *args: Any,
                 **kwargs: Any) -> TVMFuncReturn:
             """
             Catch exceptions about missing state data and pause while waiting for
             the event bus to reply with the needed data. Repeat if there is a request timeout.
             """
+            if batch_missing_data:
+                request_missing_data = self._request_missing_data_in_batches
+            else:
+                request_missing_data = self._request_missing_data
+
             while True:
                 try:
-                    return self._request_missing_data(vm_method, *args, **kwargs)
+                    return request_missing_data(vm_method, *args, **kwargs)
                 except futures.TimeoutError:
                     self.stats_counter.data_pause_time += self.node_retrieval_timeout
+                    self.stats_counter.num_pauses += 1
 
                     if urgent:
                         log_func = self.logger.warning
@@ -273,7 +409,7 @@ def pausing_vm_decorator(
 
         def _request_missing_data(
                 self,
-                vm_method: Callable[[Any], TVMFuncReturn],
+                vm_method: Callable[..., TVMFuncReturn],
                 *args: Any,
                 **kwargs: Any) -> TVMFuncReturn:
             """
@@ -282,7 +418,7 @@ def pausing_vm_decorator(
             """
             while True:
                 try:
-                    return vm_method(*args, **kwargs)  # type: ignore
+                    return vm_method(*args, **kwargs)
                 except MissingAccountTrieNode as exc:
                     t = Timer()
                     account_future = asyncio.run_coroutine_threadsafe(
@@ -307,6 +443,7 @@ def pausing_vm_decorator(
                     # Collect the amount of paused time before checking if we should exit, so
                     #   it shows up in logged statistics.
                     self.stats_counter.data_pause_time += t.elapsed
+                    self.stats_counter.num_pauses += 1
                     if not account_event.is_retry_acceptable:
                         raise StateUnretrievable("Server asked us to stop trying")
                     self.stats_counter.num_accounts += 1
@@ -328,6 +465,7 @@ def pausing_vm_decorator(
                             exc.missing_code_hash[:2].hex(),
                         )
                     self.stats_counter.data_pause_time += t.elapsed
+                    self.stats_counter.num_pauses += 1
                     if not bytecode_event.is_retry_acceptable:
                         raise StateUnretrievable("Server asked us to stop trying")
                     self.stats_counter.num_bytecodes += 1
@@ -353,19 +491,135 @@ def pausing_vm_decorator(
                             exc.missing_node_hash[:2].hex(),
                         )
                     self.stats_counter.data_pause_time += t.elapsed
+                    self.stats_counter.num_pauses += 1
                     if not storage_event.is_retry_acceptable:
                         raise StateUnretrievable("Server asked us to stop trying")
                     self.stats_counter.num_storages += 1
                     self.stats_counter.num_storage_nodes += storage_event.num_nodes_collected
 
+        def _request_missing_data_in_batches(
+                self,
+                vm_method: Callable[..., TVMFuncReturn],
+                *args: Any,
+                **kwargs: Any) -> TVMFuncReturn:
+            """
+            Catch exceptions about missing state data, and pause while waiting for the
+            event bus to reply with the needed data, along with all the missing data
+            that the rest of the block is predicted to need.
+            """
+            while True:
+                try:
+                    return vm_method(*args, **kwargs)
+                except MISSING_DATA_EXCEPTIONS as exc:
+                    t = Timer()
+                    missing_data = self._predict_missing_data(exc)
+                    batch_future = asyncio.run_coroutine_threadsafe(
+                        request_missing_batch(missing_data, self.block_number),
+                        loop,
+                    )
+                    results = batch_future.result(timeout=self.node_retrieval_timeout)
+                    if urgent:
+                        self.logger.debug(
+                            "Paused for a batch of %d missing data for %.3fs (starts on %s)",
+                            len(missing_data),
+                            t.elapsed,
+                            _get_missing_data_key(exc)[:2].hex(),
+                        )
+
+                    self.stats_counter.data_pause_time += t.elapsed
+                    self.stats_counter.num_pauses += 1
+                    if not all(result.is_retry_acceptable for result in results):
+                        raise StateUnretrievable("Server asked us to stop trying")
+                    self.stats_counter.num_predicted_requests += len(missing_data) - 1
+                    for result in results:
+                        if isinstance(result, MissingAccountResult):
+                            self.stats_counter.num_accounts += 1
+                            self.stats_counter.num_account_nodes += result.num_nodes_collected
+                        elif isinstance(result, MissingBytecodeResult):
+                            self.stats_counter.num_bytecodes += 1
+                        else:
+                            self.stats_counter.num_storages += 1
+                            self.stats_counter.num_storage_nodes += result.num_nodes_collected
+
+        def _predict_missing_data(
+                self,
+                missing_datum: EVMMissingData) -> Tuple[EVMMissingData, ...]:
+            """
+            Return ``missing_datum``, followed by the data that is missing from the database
+            for the rest of the block. The data that is needed is predicted from the senders
+            and recipients of the upcoming transactions, and from the data that earlier
+            transactions to the same recipients read.
+            """
+            missing_data = {_get_missing_data_key(missing_datum): missing_datum}
+            for read in self._predict_reads():
+                if len(missing_data) >= MAX_MISSING_DATA_BATCH_SIZE:
+                    break
+                try:
+                    read()
+                except MISSING_DATA_EXCEPTIONS as exc:
+                    missing_data.setdefault(_get_missing_data_key(exc), exc)
+            return tuple(missing_data.values())
+
+        def _predict_reads(self) -> Iterable[Callable[[], Any]]:
+            get_nonce = super().get_nonce
+            get_code = super().get_code
+            get_storage = super().get_storage
+
+            predicted_accounts: Set[Address] = set()
+            predicted_recipients: Set[Address] = set()
+            # The transaction in progress is included, it might not have read everything yet
+            first_index = max(self._num_started_transactions - 1, 0)
+            for index in range(first_index, len(self._expected_transactions)):
+                sender = self._get_expected_sender(index)
+                if sender not in predicted_accounts:
+                    predicted_accounts.add(sender)
+                    yield partial(get_nonce, sender)
+
+                recipient = self._expected_transactions[index].to
+                if not recipient or recipient in predicted_recipients:
+                    continue
+                predicted_recipients.add(recipient)
+                predicted_accounts.add(recipient)
+                yield partial(get_code, recipient)
+
+                for address, slots in self._reads_by_recipient.get(recipient, {}).items():
+                    if address not in predicted_accounts:
+                        predicted_accounts.add(address)
+                        yield partial(get_code, address)
+                    for slot in slots:
+                        yield partial(get_storage, address, slot)
+
+        def _get_expected_sender(self, index: int) -> Address:
+            # Recovering the sender is relatively slow, so only do it once per transaction
+            if index not in self._expected_senders:
+                self._expected_senders[index] = self._expected_transactions[index].sender
+            return self._expected_senders[index]
+
+        def _record_read(self, address: Address, slot: int = None) -> None:
+            if self._recipient is None:
+                return
+            reads = self._reads_by_recipient.setdefault(self._recipient, {})
+            read_slots = reads.setdefault(address, set())
+            if slot is not None:
+                read_slots.add(slot)
+
         def get_balance(self, account: bytes) -> int:
             return self._pause_on_missing_data(super().get_balance, account)
 
         def get_code(self, account: bytes) -> bytes:
+            if batch_missing_data:
+                self._record_read(Address(account))
             return self._pause_on_missing_data(super().get_code, account)
 
-        def get_storage(self, *args: Any, **kwargs: Any) -> int:
-            return self._pause_on_missing_data(super().get_storage, *args, **kwargs)
+        def get_storage(self, address: Address, slot: int, from_journal: bool = True) -> int:
+            if batch_missing_data:
+                self._record_read(address, slot)
+            return self._pause_on_missing_data(
+                super().get_storage,
+                address,
+                slot,
+                from_journal,
+            )
 
         def delete_storage(self, *args: Any, **kwargs: Any) -> None:
             return self._pause_on_missing_data(super().delete_storage, *args, **kwargs)
@@ -424,6 +678,14 @@ def pausing_vm_decorator(
         def get_beam_stats(self) -> BeamStats:
             return self.state.stats_counter
 
+        def apply_all_transactions(
+                self,
+                transactions: Sequence[SignedTransactionAPI],
+                base_header: BlockHeaderAPI,
+        ) -> Tuple[BlockHeaderAPI, Tuple[ReceiptAPI, ...], Tuple[ComputationAPI, ...]]:
+            self.state.expect_transactions(transactions)
+            return super().apply_all_transactions(transactions, base_header)
+
         def transaction_applied_hook(
                 self,
                 transaction_index: int,
@@ -718,22 +980,26 @@ def partial_speculative_execute(
 
 
 class BlockPreviewServer(Service):
+    """
+    Run the block previews that the :class:`BlockPreviewDispatcher` assigns to this preview
+    worker, and reply when the preview of the whole block is complete.
+    """
     logger = get_logger('trinity.sync.beam.BlockPreviewServer')
 
     def __init__(
             self,
             event_bus: EndpointAPI,
             beam_chain: BeamChain,
-            shard_num: int) -> None:
+            max_speculative_executions: int) -> None:
         self._event_bus = event_bus
         self._beam_chain = beam_chain
 
-        if shard_num < 0 or shard_num >= NUM_PREVIEW_SHARDS:
+        if max_speculative_executions < 1:
             raise ValidationError(
-                f"Can only run up to {NUM_PREVIEW_SHARDS}, tried to run {shard_num}"
+                f"Must run at least 1 speculative execution, tried {max_speculative_executions}"
             )
         else:
-            self._shard_num = shard_num
+            self._max_speculative_executions = max_speculative_executions
 
     async def run(self) -> None:
         self.manager.run_daemon_task(self.serve, self._event_bus, self._beam_chain)
@@ -744,26 +1010,24 @@ class BlockPreviewServer(Service):
             event_bus: EndpointAPI,
             beam_chain: BeamChain) -> None:
         """
-        Listen to DoStatelessBlockPreview events, and execute the transactions to prefill
+        Listen to DoWorkerBlockPreview events, and execute the transactions to prefill
         all the needed state data.
         """
         with futures.ThreadPoolExecutor(
-            max_workers=MAX_SPECULATIVE_EXECUTIONS_PER_PROCESS,
+            max_workers=self._max_speculative_executions,
             thread_name_prefix="trinity-spec-exec-",
         ) as speculative_thread_executor:
 
-            async for event in event_bus.stream(DoStatelessBlockPreview):
-                if event.header.block_number % NUM_PREVIEW_SHARDS != self._shard_num:
-                    continue
-
+            async for event in event_bus.stream(DoWorkerBlockPreview):
                 self.logger.debug(
-                    "DoStatelessBlockPreview-%d is previewing new block: %s",
-                    self._shard_num,
+                    "%s is previewing new block: %s",
+                    event_bus.name,
                     event.header,
                 )
                 # Parallel Execution:
                 # Run a complete block end-to-end
-                asyncio.get_event_loop().run_in_executor(
+                preview_timer = Timer()
+                preview_completion = asyncio.get_event_loop().run_in_executor(
                     # Maybe build the pausing chain inside the new process,
                     # so we can use process pool?
                     None,
@@ -773,6 +1037,12 @@ class BlockPreviewServer(Service):
                         event.transactions,
                     )
                 )
+                self.manager.run_task(
+                    self._reply_when_complete,
+                    event,
+                    preview_completion,
+                    preview_timer,
+                )
 
                 # Speculative Execution:
                 # Split transactions into groups by sender, and run them independently.
@@ -792,5 +1062,141 @@ class BlockPreviewServer(Service):
                             sender_transactions,
                         )
                     )
-                # we don't need to broadcast that the preview is complete, so immediately
+                # The reply is sent when the preview is complete, so immediately
                 # look for next preview request. That way, we can run them in parallel.
+
+    async def _reply_when_complete(
+            self,
+            event: DoWorkerBlockPreview,
+            preview_completion: Awaitable[None],
+            preview_timer: Timer) -> None:
+        try:
+            await preview_completion
+        except Exception:
+            self.logger.exception("Unexpected error while previewing %s", event.header)
+
+        await self._event_bus.broadcast(
+            WorkerBlockPreviewDone(preview_timer.elapsed),
+            event.broadcast_config(),
+        )
+
+
+class PreviewWorkerLoad:
+    """
+    The load on a single preview worker, as seen by the :class:`BlockPreviewDispatcher`.
+    """
+    def __init__(self, endpoint_name: str) -> None:
+        self.endpoint_name = endpoint_name
+
+        # How many previews were sent to the worker, and are not complete yet?
+        self.num_queued = 0
+
+        # How many previews did the worker complete?
+        self.num_completed = 0
+
+        # How many previews did the worker not reply to in time?
+        self.num_timed_out = 0
+
+        # How much time did the worker spend on completed previews?
+        self.busy_time = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.endpoint_name}: queued={self.num_queued} completed={self.num_completed} "
+            f"timed_out={self.num_timed_out} busy={self.busy_time:.1f}s"
+        )
+
+
+class BlockPreviewDispatcher(Service):
+    """
+    Listen to DoStatelessBlockPreview events, and send each one to the least loaded of
+    the preview workers. A worker is more loaded if it has more previews queued, or if it
+    has the same number queued and spent more time on previews.
+    """
+    logger = get_logger('trinity.sync.beam.BlockPreviewDispatcher')
+
+    def __init__(
+            self,
+            event_bus: EndpointAPI,
+            worker_endpoint_names: Sequence[str],
+            metrics_registry: MetricsRegistry) -> None:
+        if not worker_endpoint_names:
+            raise ValidationError("Must dispatch block previews to at least 1 worker")
+
+        self._event_bus = event_bus
+        self._metrics_registry = metrics_registry
+        self._worker_loads = tuple(PreviewWorkerLoad(name) for name in worker_endpoint_names)
+
+    @property
+    def worker_loads(self) -> Tuple[PreviewWorkerLoad, ...]:
+        return self._worker_loads
+
+    async def run(self) -> None:
+        self.manager.run_daemon_task(self._report_loads)
+        self.manager.run_daemon_task(self.dispatch, self._event_bus)
+        await self.manager.wait_finished()
+
+    async def dispatch(self, event_bus: EndpointAPI) -> None:
+        async for event in event_bus.stream(DoStatelessBlockPreview):
+            available_workers = tuple(
+                worker for worker in self._worker_loads
+                if event_bus.is_endpoint_subscribed_to(worker.endpoint_name, DoWorkerBlockPreview)
+            )
+            if not available_workers:
+                self.logger.debug(
+                    "Dropping preview of %s, because no preview worker is running",
+                    event.header,
+                )
+                continue
+
+            worker = min(available_workers, key=attrgetter('num_queued', 'busy_time'))
+            # Count the preview as queued right away, so the next one goes to another worker
+            worker.num_queued += 1
+            self.manager.run_task(self._preview_on_worker, worker, event)
+
+    async def _preview_on_worker(
+            self,
+            worker: PreviewWorkerLoad,
+            event: DoStatelessBlockPreview) -> None:
+        try:
+            preview_done = await asyncio.wait_for(
+                self._event_bus.request(
+                    DoWorkerBlockPreview(event.header, event.transactions),
+                    BroadcastConfig(filter_endpoint=worker.endpoint_name),
+                ),
+                timeout=PREVIEW_WORKER_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            worker.num_timed_out += 1
+            self.logger.warning(
+                "Preview worker %s did not complete the preview of %s in %.0fs",
+                worker.endpoint_name,
+                event.header,
+                PREVIEW_WORKER_TIMEOUT,
+            )
+            return
+        finally:
+            worker.num_queued -= 1
+
+        worker.num_completed += 1
+        worker.busy_time += preview_done.busy_time
+
+    async def _report_loads(self) -> None:
+        while self.manager.is_running:
+            await asyncio.sleep(PREVIEW_WORKER_REPORT_INTERVAL)
+
+            for worker_num, worker in enumerate(self._worker_loads):
+                self._metrics_registry.gauge(
+                    f'trinity.beam/preview_worker_{worker_num}_queued.gauge'
+                ).set_value(worker.num_queued)
+                self._metrics_registry.gauge(
+                    f'trinity.beam/preview_worker_{worker_num}_busy_time.gauge'
+                ).set_value(worker.busy_time)
+                self._metrics_registry.gauge(
+                    f'trinity.beam/preview_worker_{worker_num}_timed_out.gauge'
+                ).set_value(worker.num_timed_out)
+
+            self.logger.debug(
+                "Preview worker loads: %s",
+                ", ".join(str(worker) for worker in self._worker_loads),
+            )
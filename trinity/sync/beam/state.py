@@ -41,9 +41,10 @@ from p2p.peer import BasePeer, PeerSubscriber
 from trie import HexaryTrie
 from trie.exceptions import MissingTrieNode
 
-from trinity._utils.datastructures import TaskQueue
+from trinity._utils.datastructures import TaskQueue, WaiterRegistry
 from trinity._utils.logging import get_logger
 from trinity._utils.timer import Timer
+from trinity.db.manager import db_multi_exists
 from trinity.protocol.common.typing import (
     NodeDataBundles,
 )
@@ -116,8 +117,8 @@ class BeamDownloader(Service, PeerSubscriber):
         buffer_size = MAX_STATE_FETCH * REQUEST_BUFFER_MULTIPLIER
         self._node_tasks = TaskQueue[Hash32](buffer_size, lambda task: 0)
 
-        # list of events waiting on new data
-        self._new_data_event: asyncio.Event = asyncio.Event()
+        # coroutines waiting on specific nodes to be stored in the database
+        self._node_waiters = WaiterRegistry[Hash32]()
 
         self._peer_pool = peer_pool
 
@@ -186,13 +187,11 @@ class BeamDownloader(Service, PeerSubscriber):
         return max(0, max_factor)
 
     def _get_unique_missing_hashes(self, hashes: Iterable[Hash32]) -> Set[Hash32]:
+        unique_hashes = tuple(set(hashes))
+        # Check all the hashes at once, to avoid a database round trip per hash
+        is_present = db_multi_exists(self._db, unique_hashes)
         return set(
-            node_hash for node_hash in hashes if node_hash not in self._db
-        )
-
-    def _get_unique_present_hashes(self, hashes: Iterable[Hash32]) -> Set[Hash32]:
-        return set(
-            node_hash for node_hash in hashes if node_hash in self._db
+            node_hash for node_hash, present in zip(unique_hashes, is_present) if not present
         )
 
     async def _wait_for_nodes(
@@ -206,22 +205,35 @@ class BeamDownloader(Service, PeerSubscriber):
 
         :return: number of new nodes received -- might be smaller than len(node_hashes) on timeout
         """
-        loop = asyncio.get_event_loop()
-        missing_nodes = await loop.run_in_executor(
-            None,
-            self._get_unique_missing_hashes,
-            node_hashes,
-        )
+        unique_hashes = set(node_hashes)
+        # Register before checking the database, so that no node can arrive unnoticed
+        #   between the check and the registration.
+        waiters = {
+            node_hash: self._node_waiters.register(node_hash) for node_hash in unique_hashes
+        }
+        try:
+            loop = asyncio.get_event_loop()
+            missing_nodes = await loop.run_in_executor(
+                None,
+                self._get_unique_missing_hashes,
+                unique_hashes,
+            )
 
-        unrequested_nodes = tuple(
-            node_hash for node_hash in missing_nodes if node_hash not in queue
-        )
-        if missing_nodes:
-            if unrequested_nodes:
-                await queue.add(unrequested_nodes)
-            return await self._node_hashes_present(missing_nodes, timeout)
-        else:
-            return 0
+            unrequested_nodes = tuple(
+                node_hash for node_hash in missing_nodes if node_hash not in queue
+            )
+            if missing_nodes:
+                if unrequested_nodes:
+                    await queue.add(unrequested_nodes)
+                return await self._node_hashes_present(
+                    {node_hash: waiters[node_hash] for node_hash in missing_nodes},
+                    timeout,
+                )
+            else:
+                return 0
+        finally:
+            for node_hash, waiter in waiters.items():
+                self._node_waiters.unregister(node_hash, waiter)
 
     def _account_review(
             self,
@@ -573,39 +585,47 @@ class BeamDownloader(Service, PeerSubscriber):
             urgent: bool) -> Tuple[NodeDataBundles, NodeDataBundles, ETHPeer]:
         nodes = await self._request_nodes(peer, node_hashes)
 
+        if urgent:
+            # Requested nodes that are still awaited, even after this response is stored
+            returned_hashes = set(node_hash for node_hash, _ in nodes)
+            unresolved_hashes = tuple(
+                node_hash for node_hash in node_hashes
+                if node_hash not in returned_hashes and node_hash in self._node_waiters
+            )
+        else:
+            # Don't bother checking if the nodes were found another way, if they are predictive
+            unresolved_hashes = ()
+
         loop = asyncio.get_event_loop()
         (
             new_nodes,
             found_independent,
-        ) = await loop.run_in_executor(None, self._store_nodes, node_hashes, nodes, urgent)
+        ) = await loop.run_in_executor(None, self._store_nodes, unresolved_hashes, nodes)
 
-        if new_nodes:
-            # If there are any new nodes returned, then notify any coros that are waiting on
-            #   node data to resume.
-            self._new_data_event.set()
-        elif urgent and found_independent:
-            # If urgent, and the data was retrieved another way (like backfilled), then
-            #   still trigger a new data event. That way, urgent coros don't
-            #   get stuck hanging until a timeout. This can cause an especially
-            #   flaky test_beam_syncer_backfills_all_state[42].
-            self._new_data_event.set()
+        # All returned nodes are in the database now, whether they are new or not, so wake up
+        #   any coros that are waiting on them.
+        self._node_waiters.resolve(node_hash for node_hash, _ in nodes)
+        # If urgent, and the data was retrieved another way (like backfilled), then
+        #   still wake up the waiting coros. That way, urgent coros don't
+        #   get stuck hanging until a timeout. This can cause an especially
+        #   flaky test_beam_syncer_backfills_all_state[42].
+        self._node_waiters.resolve(found_independent)
 
         return nodes, new_nodes, peer
 
     def _store_nodes(
             self,
-            node_hashes: Tuple[Hash32, ...],
-            nodes: NodeDataBundles,
-            urgent: bool) -> Tuple[NodeDataBundles, bool]:
+            unresolved_hashes: Tuple[Hash32, ...],
+            nodes: NodeDataBundles) -> Tuple[NodeDataBundles, Tuple[Hash32, ...]]:
         """
         Store supplied nodes in the database, return the subset of them that are new.
-        Also, return whether the requested nodes were found another way, if the
-        nodes are urgently-needed.
+        Also, return which of the unresolved hashes were found another way, like by backfill.
         """
 
+        is_present = db_multi_exists(self._db, tuple(node_hash for node_hash, _ in nodes))
         new_nodes = tuple(
-            (node_hash, node) for node_hash, node in nodes
-            if node_hash not in self._db
+            node_bundle for node_bundle, present in zip(nodes, is_present)
+            if not present
         )
 
         if new_nodes:
@@ -614,44 +634,33 @@ class BeamDownloader(Service, PeerSubscriber):
                 for node_hash, node in new_nodes:
                     batch[node_hash] = node
 
-            # Don't bother checking if the nodes were found another way
-            found_independent = False
-        elif urgent:
-            # Check if the nodes were found another way, if they are urgently needed
-            for requested_hash in node_hashes:
-                if requested_hash in self._db:
-                    found_independent = True
-                    break
-            else:
-                found_independent = False
+        if unresolved_hashes:
+            is_present = db_multi_exists(self._db, unresolved_hashes)
+            found_independent = tuple(
+                node_hash for node_hash, present in zip(unresolved_hashes, is_present) if present
+            )
         else:
-            # Don't bother checking if the nodes were found another way, if they are predictive
-            found_independent = False
+            found_independent = ()
 
         return new_nodes, found_independent
 
-    async def _node_hashes_present(self, node_hashes: Set[Hash32], timeout: float) -> int:
+    async def _node_hashes_present(
+            self,
+            waiters: Dict[Hash32, 'asyncio.Future[None]'],
+            timeout: float) -> int:
         """
-        Block until the supplied node hashes have been inserted into the database.
+        Block until the supplied node hashes have been inserted into the database, as signaled
+        by their waiters in the node waiter registry.
 
-        :return: number of new nodes received -- might be smaller than len(node_hashes) on timeout
+        :return: number of new nodes received -- might be smaller than len(waiters) on timeout
         """
-        remaining_hashes = node_hashes.copy()
-
-        loop = asyncio.get_event_loop()
         start_time = time.monotonic()
-        while remaining_hashes and time.monotonic() - start_time < timeout:
-            await self._new_data_event.wait()
-            self._new_data_event.clear()
+        _, pending = await asyncio.wait(waiters.values(), timeout=timeout)
 
-            found_hashes = await loop.run_in_executor(
-                None,
-                self._get_unique_present_hashes,
-                remaining_hashes,
+        if pending:
+            remaining_hashes = set(
+                node_hash for node_hash, waiter in waiters.items() if not waiter.done()
             )
-            remaining_hashes -= found_hashes
-
-        if remaining_hashes:
             self.logger.error(
                 "Could not collect node data for hashes %r within %.0f seconds (took %.1fs)",
                 remaining_hashes,
@@ -659,7 +668,7 @@ class BeamDownloader(Service, PeerSubscriber):
                 time.monotonic() - start_time,
             )
 
-        return len(node_hashes) - len(remaining_hashes)
+        return len(waiters) - len(pending)
 
     def register_peer(self, peer: BasePeer) -> None:
         self._num_peers += 1
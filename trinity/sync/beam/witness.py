@@ -0,0 +1,104 @@
+"""
+Record the witness of each beam-imported block: all the trie nodes and bytecodes that were
+read to execute it. A recorded block can be imported again later against an in-memory
+database, without any network access, which makes beam imports reproducible.
+
+Witnesses are appended to a file as length-prefixed RLP records of the parent header, the
+block, and the values of the witness nodes. The node hashes are not stored, because they
+are the keccak of the values.
+"""
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Tuple,
+    Type,
+)
+
+from eth.abc import (
+    BlockAPI,
+    BlockHeaderAPI,
+)
+from eth.rlp.headers import BlockHeader
+import rlp
+
+# Size of the prefix of each record, with the length of its RLP payload
+RECORD_LENGTH_SIZE = 4
+
+
+class BlockWitness(NamedTuple):
+    parent_header: BlockHeaderAPI
+    encoded_block: bytes
+    nodes: Tuple[bytes, ...]
+
+    @property
+    def block_number(self) -> int:
+        return self.parent_header.block_number + 1
+
+    def get_block(self, block_class: Type[BlockAPI]) -> BlockAPI:
+        """
+        Decode the block, with the block class of the VM that imports it.
+        """
+        return rlp.decode(self.encoded_block, sedes=block_class)
+
+
+def write_block_witness(
+        stream: BinaryIO,
+        parent_header: BlockHeaderAPI,
+        block: BlockAPI,
+        nodes: Iterable[bytes]) -> int:
+    """
+    Append the witness of ``block`` to ``stream``.
+
+    :return: the number of bytes written
+    """
+    payload = rlp.encode([rlp.encode(parent_header), rlp.encode(block), tuple(nodes)])
+    stream.write(len(payload).to_bytes(RECORD_LENGTH_SIZE, 'big'))
+    stream.write(payload)
+    return RECORD_LENGTH_SIZE + len(payload)
+
+
+def read_block_witnesses(stream: BinaryIO) -> Iterator[BlockWitness]:
+    """
+    Yield the block witnesses of ``stream``, in the order they were recorded.
+    """
+    while True:
+        length_prefix = stream.read(RECORD_LENGTH_SIZE)
+        if not length_prefix:
+            return
+
+        payload_length = int.from_bytes(length_prefix, 'big')
+        payload = stream.read(payload_length)
+        if len(length_prefix) < RECORD_LENGTH_SIZE or len(payload) < payload_length:
+            raise rlp.DecodingError("Block witness record is truncated", payload)
+
+        encoded_parent_header, encoded_block, nodes = rlp.decode(payload)
+        yield BlockWitness(
+            rlp.decode(encoded_parent_header, sedes=BlockHeader),
+            encoded_block,
+            tuple(nodes),
+        )
+
+
+class BlockWitnessRecorder:
+    """
+    Append block witnesses to the file at ``path``.
+    """
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def record(
+            self,
+            parent_header: BlockHeaderAPI,
+            block: BlockAPI,
+            nodes: Iterable[bytes]) -> int:
+        """
+        Append the witness of ``block``. The file is only open while writing, so that every
+        completed record is available to readers, even if the node is killed.
+
+        :return: the number of bytes written
+        """
+        with self.path.open('ab') as witness_file:
+            return write_block_witness(witness_file, parent_header, block, nodes)
@@ -159,3 +159,26 @@ class DoStatelessBlockPreview(BaseEvent):
     """
     header: BlockHeaderAPI
     transactions: Tuple[SignedTransactionAPI, ...]
+
+
+@dataclass
+class WorkerBlockPreviewDone(BaseEvent):
+    """
+    Response to :cls:`DoWorkerBlockPreview`, emitted after the preview worker finished
+    executing the whole block, whether the preview succeeded or not.
+    """
+    busy_time: float
+
+
+@dataclass
+class DoWorkerBlockPreview(BaseRequestResponseEvent[WorkerBlockPreviewDone]):
+    """
+    The preview dispatcher emits this event to a single preview worker, to run the preview
+    of a :cls:`DoStatelessBlockPreview` that it received.
+    """
+    header: BlockHeaderAPI
+    transactions: Tuple[SignedTransactionAPI, ...]
+
+    @staticmethod
+    def expected_response_type() -> Type[WorkerBlockPreviewDone]:
+        return WorkerBlockPreviewDone
@@ -4,7 +4,7 @@ from concurrent.futures import CancelledError
 import contextlib
 import functools
 from operator import attrgetter, itemgetter
-from random import randrange
+from random import randrange, sample
 from typing import (
     Any,
     AsyncIterator,
@@ -43,6 +43,10 @@ from eth_utils.toolz import (
     take,
 )
 
+from eth.consensus.pow import (
+    PowConsensus,
+    check_pow,
+)
 from eth.exceptions import (
     HeaderNotFound,
 )
@@ -52,6 +56,7 @@ from lahja import EndpointAPI
 from p2p.abc import CommandAPI
 from p2p.constants import SEAL_CHECK_RANDOM_SAMPLE_RATE
 from p2p.exceptions import BaseP2PError, PeerConnectionLost
+from p2p.exchange.pool import get_normalization_pool
 from p2p.logging import loggable
 from p2p.peer import BasePeer, PeerSubscriber
 from trinity._utils.timer import Timer
@@ -788,11 +793,7 @@ class HeaderMeatSyncer(Service, PeerSubscriber, Generic[TChainPeer]):
             return tuple()
         else:
             try:
-                await self._chain.coro_validate_chain(
-                    parent_header,
-                    headers,
-                    SEAL_CHECK_RANDOM_SAMPLE_RATE,
-                )
+                await self._validate_segment(parent_header, headers)
             except ValidationError as e:
                 self.logger.warning(
                     "Received invalid header segment from %s against known parent %s, "
@@ -812,6 +813,52 @@ class HeaderMeatSyncer(Service, PeerSubscriber, Generic[TChainPeer]):
                     )
                 return headers
 
+    async def _validate_segment(
+            self,
+            parent_header: BlockHeaderAPI,
+            headers: Tuple[BlockHeaderAPI, ...]) -> None:
+        """
+        Validate a segment of headers against its parent, checking the seals of a random
+        sample of them. If there is a normalization pool, proof of work seals are checked
+        in the pool, so that segments from many peers can be validated at once.
+
+        :raise ValidationError: if any header in the segment is invalid
+        """
+        pool = get_normalization_pool()
+        num_seal_checks = len(headers) // SEAL_CHECK_RANDOM_SAMPLE_RATE
+        sealed_headers = sample(headers, num_seal_checks)
+
+        if pool is None or not all(self._has_pow_seal(header) for header in sealed_headers):
+            await self._chain.coro_validate_chain(
+                parent_header,
+                headers,
+                SEAL_CHECK_RANDOM_SAMPLE_RATE,
+            )
+        else:
+            # The seals are checked in the pool, so only check everything else here
+            await self._chain.coro_validate_chain(
+                parent_header,
+                headers,
+                seal_check_random_sample_rate=0,
+            )
+            loop = asyncio.get_event_loop()
+            await asyncio.gather(*(
+                loop.run_in_executor(
+                    pool,
+                    check_pow,
+                    header.block_number,
+                    header.mining_hash,
+                    header.mix_hash,
+                    header.nonce,
+                    header.difficulty,
+                )
+                for header in sealed_headers
+            ))
+
+    def _has_pow_seal(self, header: BlockHeaderAPI) -> bool:
+        vm_class = self._chain.get_vm_class_for_block_number(header.block_number)
+        return issubclass(vm_class.consensus_class, PowConsensus)
+
     async def _request_headers(
             self, peer: TChainPeer, start_at: BlockIdentifier, length: int
     ) -> Tuple[BlockHeaderAPI, ...]:
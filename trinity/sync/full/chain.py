@@ -519,6 +519,9 @@ class ChainSyncStats(NamedTuple):
     num_transactions: int
     transactions_per_second: float
 
+    num_bytes: int
+    bytes_per_second: float
+
 
 class ChainSyncPerformanceTracker:
     def __init__(self, head: BlockHeaderAPI) -> None:
@@ -536,12 +539,21 @@ class ChainSyncPerformanceTracker:
         # EMA of the transactions per second
         self.transactions_per_second_ema = EMA(initial_value=0, smoothing_factor=0.05)
 
+        # EMA of the bytes written per second
+        self.bytes_per_second_ema = EMA(initial_value=0, smoothing_factor=0.05)
+
         # Number of transactions processed
         self.num_transactions = 0
 
+        # Number of bytes of trie data written to the database
+        self.num_bytes = 0
+
     def record_transactions(self, count: int) -> None:
         self.num_transactions += count
 
+    def record_bytes(self, count: int) -> None:
+        self.num_bytes += count
+
     def set_latest_head(self, head: BlockHeaderAPI) -> None:
         self.latest_head = head
 
@@ -551,9 +563,11 @@ class ChainSyncPerformanceTracker:
         num_blocks = self.latest_head.block_number - self.prev_head.block_number
         blocks_per_second = num_blocks / elapsed
         transactions_per_second = self.num_transactions / elapsed
+        bytes_per_second = self.num_bytes / elapsed
 
         self.blocks_per_second_ema.update(blocks_per_second)
         self.transactions_per_second_ema.update(transactions_per_second)
+        self.bytes_per_second_ema.update(bytes_per_second)
 
         stats = ChainSyncStats(
             prev_head=self.prev_head,
@@ -563,10 +577,13 @@ class ChainSyncPerformanceTracker:
             blocks_per_second=self.blocks_per_second_ema.value,
             num_transactions=self.num_transactions,
             transactions_per_second=self.transactions_per_second_ema.value,
+            num_bytes=self.num_bytes,
+            bytes_per_second=self.bytes_per_second_ema.value,
         )
 
         # reset the counters
         self.num_transactions = 0
+        self.num_bytes = 0
         self.prev_head = self.latest_head
 
         return stats
@@ -623,6 +640,10 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
             dependency_extractor=attrgetter('parent_hash'),
             max_tasks=buffer_size,
         )
+
+        # Receipt trie data, by receipt root, waiting to be persisted along with its blocks
+        self._pending_receipts: Dict[Hash32, Dict[Hash32, bytes]] = {}
+
         # Track whether the fast chain syncer completed its goal
         self.is_complete = False
 
@@ -687,6 +708,7 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
                     "txs=%-5d  "
                     "bps=%-3d  "
                     "tps=%-4d  "
+                    "kBps=%-5d  "
                     "elapsed=%0.1f  "
                     "head=#%d %s  "
                     "age=%s"
@@ -695,6 +717,7 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
                 stats.num_transactions,
                 stats.blocks_per_second,
                 stats.transactions_per_second,
+                stats.bytes_per_second / 1024,
                 stats.elapsed,
                 stats.latest_head.block_number,
                 humanize_hash(stats.latest_head.hash),
@@ -732,10 +755,15 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
 
     async def _persist_blocks(self, headers: Sequence[BlockHeaderAPI]) -> None:
         """
-        Persist blocks for the given headers, directly to the database
+        Persist blocks for the given headers, directly to the database. All the blocks and
+        their receipts are written in a single atomic batch.
 
         :param headers: headers for which block bodies and receipts have been downloaded
         """
+        if not headers:
+            return
+
+        blocks = []
         for header in headers:
             vm_class = self.chain.get_vm_class(header)
             block_class = vm_class.get_block_class()
@@ -755,9 +783,21 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
                 # record progress in the tracker
                 self.tracker.record_transactions(len(transactions))
 
-            block = block_class(header, transactions, uncles)
-            await self.db.coro_persist_block(block)
-            self.tracker.set_latest_head(header)
+            blocks.append(block_class(header, transactions, uncles))
+
+        # Headers can share a receipt root, so only the first one to be persisted
+        # writes the receipts. Later ones find them already in the database.
+        receipt_roots = set(header.receipt_root for header in headers)
+        receipt_trie_data = tuple(
+            self._pending_receipts.pop(root)
+            for root in receipt_roots
+            if root in self._pending_receipts
+        )
+
+        await self.db.coro_persist_blocks(blocks, receipt_trie_data)
+
+        self.tracker.record_bytes(sum(map(_trie_data_size, receipt_trie_data)))
+        self.tracker.set_latest_head(headers[-1])
 
     async def _assign_receipt_download_to_peers(self) -> None:
         """
@@ -825,15 +865,17 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
         Fast sync writes all the block body bundle data directly to the database,
         in order to make it... fast.
         """
-        for (_, (_, trie_data_dict), _) in bundles:
-            await self.db.coro_persist_trie_data_dict(trie_data_dict)
+        trie_data_dicts = tuple(trie_data_dict for (_, (_, trie_data_dict), _) in bundles)
+        await self.db.coro_persist_trie_data_dict(merge(*trie_data_dicts))
+        self.tracker.record_bytes(sum(map(_trie_data_size, trie_data_dicts)))
 
     async def _process_receipts(
             self,
             peer: ETHPeer,
             all_headers: Sequence[BlockHeaderAPI]) -> Tuple[BlockHeaderAPI, ...]:
         """
-        Downloads and persists the receipts for the given set of block headers.
+        Downloads the receipts for the given set of block headers, and keeps them to be
+        persisted along with their blocks, in :meth:`_persist_blocks`.
         Some receipts may be trivial, having a blank root hash, and will not be requested.
 
         :param peer: to issue the receipt request to
@@ -875,12 +917,11 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
             await peer.disconnect(DisconnectReason.BAD_PROTOCOL)
             return trivial_headers
 
-        # process all of the returned receipts, storing their trie data
-        # dicts in the database
+        # process all of the returned receipts, holding on to their trie data
+        # dicts until their blocks are persisted
         receipts, trie_roots_and_data_dicts = zip(*receipt_bundles)
         receipt_roots, trie_data_dicts = zip(*trie_roots_and_data_dicts)
-        for trie_data in trie_data_dicts:
-            await self.db.coro_persist_trie_data_dict(trie_data)
+        self._pending_receipts.update(zip(receipt_roots, trie_data_dicts))
 
         # Identify which headers have the receipt roots that are now complete.
         completed_header_groups = tuple(
@@ -1255,5 +1296,9 @@ def _is_body_empty(header: BlockHeaderAPI) -> bool:
     return header.transaction_root == BLANK_ROOT_HASH and header.uncles_hash == EMPTY_UNCLE_HASH
 
 
+def _trie_data_size(trie_data_dict: Dict[Hash32, bytes]) -> int:
+    return sum(len(key) + len(value) for key, value in trie_data_dict.items())
+
+
 def _is_receipts_empty(header: BlockHeaderAPI) -> bool:
     return header.receipt_root == BLANK_ROOT_HASH
@@ -0,0 +1,209 @@
+import asyncio
+import contextlib
+from typing import (
+    Awaitable,
+    Callable,
+    Counter,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+import weakref
+
+from async_service import Service
+
+from eth_utils.toolz import partition_all
+
+from p2p.exceptions import (
+    NoConnectedPeers,
+    NoEligiblePeers,
+    PeerConnectionLost,
+)
+from p2p.stats.ema import EMA
+
+from trinity.db.eth1.header import BaseAsyncHeaderDB
+from trinity.protocol.les.peer import LESPeer, LESPeerPool
+from trinity._utils.logging import get_logger
+from trinity._utils.timer import Timer
+
+# How quickly does the measured latency of a peer follow its latest round trip?
+LATENCY_SMOOTHING_FACTOR = 0.3
+
+TKey = TypeVar('TKey')
+TResult = TypeVar('TResult')
+
+
+class PeerRequestScheduler:
+    """
+    Choose which peer to send each light request to. Requests are spread across all the
+    eligible peers, preferring the peers with the lowest measured latency and the fewest
+    requests in flight.
+
+    Peers are eligible if their total difficulty is at least the one of our canonical head,
+    so that they should have every block we know about. If no peer is that far along, use
+    the peer with the highest total difficulty.
+    """
+    logger = get_logger('trinity.sync.light.PeerRequestScheduler')
+
+    def __init__(self, peer_pool: LESPeerPool, headerdb: BaseAsyncHeaderDB) -> None:
+        self._peer_pool = peer_pool
+        self._headerdb = headerdb
+        self._latencies: 'weakref.WeakKeyDictionary[LESPeer, EMA]' = weakref.WeakKeyDictionary()
+        self._num_in_flight: Counter[LESPeer] = Counter()
+
+    async def choose_peer(self) -> LESPeer:
+        """
+        :raise NoEligiblePeers: if no peers are connected
+        """
+        peers = await self._get_eligible_peers()
+
+        measured_latencies = tuple(
+            self._latencies[peer].value for peer in peers if peer in self._latencies
+        )
+        # Assume unmeasured peers are as fast as the fastest one, so they get tried
+        default_latency = min(measured_latencies, default=0.0)
+
+        def get_expected_wait(peer: LESPeer) -> float:
+            if peer in self._latencies:
+                latency = self._latencies[peer].value
+            else:
+                latency = default_latency
+            return latency * (self._num_in_flight[peer] + 1)
+
+        # Spread requests over peers with the same expected wait, like unmeasured peers
+        # before any latency is known
+        return min(peers, key=lambda peer: (get_expected_wait(peer), self._num_in_flight[peer]))
+
+    async def _get_eligible_peers(self) -> Tuple[LESPeer, ...]:
+        try:
+            highest_td_peer = cast(LESPeer, self._peer_pool.highest_td_peer)
+        except NoConnectedPeers as exc:
+            raise NoEligiblePeers() from exc
+
+        head = await self._headerdb.coro_get_canonical_head()
+        head_score = await self._headerdb.coro_get_score(head.hash)
+
+        eligible_peers: List[LESPeer] = []
+        for peer in self._peer_pool.connected_nodes.values():
+            try:
+                peer_td = peer.head_info.head_td
+            except PeerConnectionLost:
+                continue
+            if peer_td >= head_score:
+                eligible_peers.append(cast(LESPeer, peer))
+
+        if eligible_peers:
+            return tuple(eligible_peers)
+        else:
+            return (highest_td_peer,)
+
+    @contextlib.contextmanager
+    def track_request(self, peer: LESPeer) -> Iterator[None]:
+        """
+        Count the request as in flight while in the context, and measure its round trip.
+        A request that times out counts as a round trip of the time spent waiting.
+        """
+        self._num_in_flight[peer] += 1
+        timer = Timer()
+        try:
+            yield
+        except asyncio.TimeoutError:
+            self._record_latency(peer, timer.elapsed)
+            raise
+        else:
+            self._record_latency(peer, timer.elapsed)
+        finally:
+            self._num_in_flight[peer] -= 1
+            if not self._num_in_flight[peer]:
+                del self._num_in_flight[peer]
+
+    def get_latency(self, peer: LESPeer) -> float:
+        """
+        :raise KeyError: if no request to the peer has completed yet
+        """
+        return self._latencies[peer].value
+
+    def _record_latency(self, peer: LESPeer, latency: float) -> None:
+        if peer in self._latencies:
+            self._latencies[peer].update(latency)
+        else:
+            self._latencies[peer] = EMA(latency, LATENCY_SMOOTHING_FACTOR)
+
+
+class RequestBatcher(Service, Generic[TKey, TResult]):
+    """
+    Coalesce concurrent requests for items of the same type into multi-item requests, and
+    deduplicate requests for items that are already in flight.
+
+    ``fetch_batch`` must return one result for each key, in the same order. If it returns
+    fewer results, we can't tell which items are missing, so each item of the batch is
+    fetched again on its own.
+    """
+    logger = get_logger('trinity.sync.light.RequestBatcher')
+
+    def __init__(
+            self,
+            fetch_batch: Callable[[Tuple[TKey, ...]], Awaitable[Sequence[TResult]]],
+            max_batch_size: int) -> None:
+        self._fetch_batch = fetch_batch
+        self._max_batch_size = max_batch_size
+
+        self._in_flight: Dict[TKey, 'asyncio.Future[TResult]'] = {}
+        self._queued: List[TKey] = []
+        self._new_requests = asyncio.Event()
+
+    async def get(self, key: TKey) -> TResult:
+        """
+        Get the result for ``key``, from a batch that is already in flight if possible.
+        """
+        if key not in self._in_flight:
+            self._in_flight[key] = asyncio.get_event_loop().create_future()
+            self._queued.append(key)
+            self._new_requests.set()
+
+        # Shield the future, because other requests might be waiting for it
+        return await asyncio.shield(self._in_flight[key])
+
+    async def run(self) -> None:
+        while self.manager.is_running:
+            await self._new_requests.wait()
+            # Let all the requests that were made concurrently join the batch
+            await asyncio.sleep(0)
+            self._new_requests.clear()
+
+            queued, self._queued = self._queued, []
+            for batch in partition_all(self._max_batch_size, queued):
+                self.manager.run_task(self._fetch, batch)
+
+    async def _fetch(self, keys: Tuple[TKey, ...]) -> None:
+        try:
+            results = await self._fetch_batch(keys)
+        except asyncio.CancelledError:
+            for key in keys:
+                self._in_flight.pop(key).cancel()
+            raise
+        except Exception as exc:
+            for key in keys:
+                self._in_flight.pop(key).set_exception(exc)
+            return
+
+        if len(results) < len(keys) and len(keys) > 1:
+            self.logger.debug(
+                "Got %d results for a batch of %d items, fetching each item on its own",
+                len(results),
+                len(keys),
+            )
+            for key in keys:
+                self.manager.run_task(self._fetch, (key,))
+        elif len(results) != len(keys):
+            error = ValueError(f"Expected one result for each of {keys}, got {results}")
+            for key in keys:
+                self._in_flight.pop(key).set_exception(error)
+        else:
+            for key, result in zip(keys, results):
+                self._in_flight.pop(key).set_result(result)
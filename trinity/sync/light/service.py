@@ -9,13 +9,15 @@ from functools import (
 )
 from typing import (
     Any,
+    Awaitable,
     Callable,
-    cast,
     List,
     FrozenSet,
     Optional,
+    Sequence,
     Tuple,
     Type,
+    TypeVar,
 )
 import weakref
 
@@ -50,7 +52,6 @@ from eth.rlp.receipts import Receipt
 from p2p.abc import CommandAPI
 from p2p.exceptions import (
     BadLESResponse,
-    NoConnectedPeers,
     NoEligiblePeers,
 )
 from p2p.commands import BaseCommand
@@ -66,9 +67,24 @@ from p2p.peer import PeerSubscriber
 from trinity.db.eth1.header import BaseAsyncHeaderDB
 from trinity.protocol.les.peer import LESPeer, LESPeerPool
 from trinity.protocol.les.commands import ProofsV1, ProofsV2
+from trinity.protocol.les.constants import (
+    MAX_BODIES_FETCH,
+    MAX_CODE_FETCH,
+    MAX_PROOFS_FETCH,
+    MAX_RECEIPTS_FETCH,
+)
+from trinity.protocol.les.payloads import ContractCodeRequest, ProofRequest
 from trinity.rlp.block_body import BlockBody
+from trinity.sync.light.scheduler import PeerRequestScheduler, RequestBatcher
 from trinity._utils.logging import get_logger
 
+TItem = TypeVar('TItem')
+TResult = TypeVar('TResult')
+
+# An item that was requested from a peer, and the peer that sent it. The item is None if
+#   the peer does not have it.
+PeerItem = Tuple[LESPeer, Optional[TItem]]
+
 
 def service_timeout(timeout: int) -> Callable[..., Any]:
     """
@@ -113,9 +129,20 @@ class BaseLightPeerChain(ABC):
 
 
 class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
+    """
+    Request chain data from LES peers, on demand. Concurrent requests for items of the same
+    type are coalesced into multi-item LES requests, requests for items that are already in
+    flight are deduplicated, and requests are spread across the eligible peers by their
+    measured latency.
+    """
     reply_timeout = REPLY_TIMEOUT
     headerdb: BaseAsyncHeaderDB = None
     _pending_replies: "weakref.WeakValueDictionary[int, asyncio.Future[CommandAPI[Any]]]"
+    _header_batcher: RequestBatcher[Hash32, PeerItem[BlockHeader]]
+    _body_batcher: RequestBatcher[Hash32, PeerItem[BlockBody]]
+    _receipt_batcher: RequestBatcher[Hash32, PeerItem[Tuple[Receipt, ...]]]
+    _proof_batcher: RequestBatcher[Tuple[Hash32, Hash32], PeerItem[Tuple[bytes, ...]]]
+    _code_batcher: RequestBatcher[Tuple[Hash32, Hash32], PeerItem[bytes]]
 
     def __init__(self, headerdb: BaseAsyncHeaderDB, peer_pool: LESPeerPool) -> None:
         PeerSubscriber.__init__(self)
@@ -123,6 +150,14 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         self.headerdb = headerdb
         self.peer_pool = peer_pool
         self._pending_replies = weakref.WeakValueDictionary()
+        self._scheduler = PeerRequestScheduler(peer_pool, headerdb)
+
+        # A header query starts from a single block, so header requests can't be coalesced
+        self._header_batcher = RequestBatcher(self._fetch_block_headers, max_batch_size=1)
+        self._body_batcher = RequestBatcher(self._fetch_block_bodies, MAX_BODIES_FETCH)
+        self._receipt_batcher = RequestBatcher(self._fetch_receipts, MAX_RECEIPTS_FETCH)
+        self._proof_batcher = RequestBatcher(self._fetch_proofs, MAX_PROOFS_FETCH)
+        self._code_batcher = RequestBatcher(self._fetch_contract_codes, MAX_CODE_FETCH)
 
     # TODO: be more specific about what messages we want.
     subscription_msg_types: FrozenSet[Type[CommandAPI[Any]]] = frozenset({BaseCommand})
@@ -132,6 +167,16 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
     msg_queue_maxsize = 500
 
     async def run(self) -> None:
+        batchers: Tuple[ServiceAPI, ...] = (
+            self._header_batcher,
+            self._body_batcher,
+            self._receipt_batcher,
+            self._proof_batcher,
+            self._code_batcher,
+        )
+        for batcher in batchers:
+            self.manager.run_daemon_child_service(batcher)
+
         with self.subscribe(self.peer_pool):
             while self.manager.is_running:
                 peer, cmd = await self.msg_queue.get()
@@ -162,32 +207,42 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         :raise asyncio.TimeoutError: if an individual request or the overall process times out
         """
         return await self._retry_on_bad_response(
-            partial(self._get_block_header_by_hash, block_hash)
+            partial(self._header_batcher.get, block_hash),
+            partial(self._validate_block_header, block_hash),
         )
 
+    async def _validate_block_header(
+            self,
+            block_hash: Hash32,
+            peer: LESPeer,
+            header: Optional[BlockHeader]) -> BlockHeader:
+        if header is None:
+            raise HeaderNotFound(f"Peer {peer} has no block with hash {block_hash.hex()}")
+        elif header.hash != block_hash:
+            raise BadLESResponse(
+                f"Received header hash ({header.hex_hash}) does not "
+                f"match what we requested ({encode_hex(block_hash)})"
+            )
+        else:
+            return header
+
     @alru_cache(maxsize=1024, cache_exceptions=False)
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_block_body_by_hash(self, block_hash: Hash32) -> BlockBody:
-        peer = cast(LESPeer, self.peer_pool.highest_td_peer)
-        self.logger.debug("Fetching block %s from %s", encode_hex(block_hash), peer)
-        request_id = peer.les_api.send_get_block_bodies([block_hash])
-        block_bodies = await self._wait_for_reply(request_id)
-        if not block_bodies.payload.bodies:
+        peer, body = await self._body_batcher.get(block_hash)
+        if body is None:
             raise BlockNotFound(f"Peer {peer} has no block with hash {block_hash.hex()}")
-        return block_bodies.payload.bodies[0]
+        return body
 
     # TODO add a get_receipts() method to BaseChain API, and dispatch to this, as needed
 
     @alru_cache(maxsize=1024, cache_exceptions=False)
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_receipts(self, block_hash: Hash32) -> List[Receipt]:
-        peer = cast(LESPeer, self.peer_pool.highest_td_peer)
-        self.logger.debug("Fetching %s receipts from %s", encode_hex(block_hash), peer)
-        request_id = peer.les_api.send_get_receipts((block_hash,))
-        receipts = await self._wait_for_reply(request_id)
-        if not receipts.payload.receipts:
+        _, receipts = await self._receipt_batcher.get(block_hash)
+        if receipts is None:
             raise BlockNotFound(f"No block with hash {block_hash.hex()} found")
-        return receipts.payload.receipts[0]
+        return list(receipts)
 
     # TODO implement AccountDB exceptions that provide the info needed to
     # request accounts and code (and storage?)
@@ -196,19 +251,19 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_account(self, block_hash: Hash32, address: ETHAddress) -> Account:
         return await self._retry_on_bad_response(
-            partial(self._get_account_from_peer, block_hash, address)
+            partial(self._proof_batcher.get, (block_hash, keccak(address))),
+            partial(self._validate_account_proof, block_hash, address),
         )
 
-    async def _get_account_from_peer(
+    async def _validate_account_proof(
             self,
             block_hash: Hash32,
             address: ETHAddress,
-            peer: LESPeer) -> Account:
-        state_key = keccak(address)
-        proof = await self._get_proof(peer, block_hash, state_key=state_key, storage_key=None)
-        header = await self._get_block_header_by_hash(block_hash, peer)
+            peer: LESPeer,
+            proof: Optional[Tuple[bytes, ...]]) -> Account:
+        header = await self.coro_get_block_header_by_hash(block_hash)
         try:
-            rlp_account = HexaryTrie.get_from_proof(header.state_root, state_key, proof)
+            rlp_account = HexaryTrie.get_from_proof(header.state_root, keccak(address), proof or ())
         except BadTrieProof as exc:
             raise BadLESResponse(
                 f"Peer {peer} returned an invalid proof for account {encode_hex(address)} "
@@ -240,29 +295,25 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         code_hash = account.code_hash
 
         return await self._retry_on_bad_response(
-            partial(self._get_contract_code_from_peer, block_hash, address, code_hash)
+            partial(self._code_batcher.get, (block_hash, keccak(address))),
+            partial(self._validate_contract_code, block_hash, address, code_hash),
         )
 
-    async def _get_contract_code_from_peer(
+    async def _validate_contract_code(
             self,
             block_hash: Hash32,
             address: ETHAddress,
             code_hash: Hash32,
-            peer: LESPeer) -> bytes:
+            peer: LESPeer,
+            bytecode: Optional[bytes]) -> bytes:
         """
-        A single attempt to get the contract code from the given peer
+        Check the contract code that the given peer sent
 
-        :raise BadLESResponse: if the peer replies with contract code that does not match the
+        :raise BadLESResponse: if the peer replied with contract code that does not match the
             account's code hash
         """
-        # request contract code
-        request_id = peer.les_api.send_get_contract_code(block_hash, keccak(address))
-        contract_codes = await self._wait_for_reply(request_id)
-
-        if not contract_codes.payload.codes:
+        if bytecode is None:
             bytecode = b''
-        else:
-            bytecode = contract_codes.payload.codes[0]
 
         # validate bytecode against a proven account
         if code_hash == keccak(bytecode):
@@ -358,41 +409,130 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
             )
         return header
 
-    async def _get_proof(self,
-                         peer: LESPeer,
-                         block_hash: Hash32,
-                         state_key: Hash32,
-                         storage_key: Optional[Hash32],
-                         from_level: int = 0) -> Tuple[bytes, ...]:
-        request_id = peer.les_api.send_get_proof(block_hash, state_key, storage_key, from_level)
-        proofs = await self._wait_for_reply(request_id)
+    async def _fetch_block_headers(
+            self,
+            block_hashes: Tuple[Hash32, ...]) -> Tuple[PeerItem[BlockHeader], ...]:
+        block_hash, = block_hashes
+        peer = await self._scheduler.choose_peer()
+        self.logger.debug("Fetching header %s from %s", encode_hex(block_hash), peer)
+        with self._scheduler.track_request(peer):
+            headers = await peer.chain_api.get_block_headers(
+                block_hash,
+                max_headers=1,
+                skip=0,
+                reverse=False,
+            )
+        return self._get_peer_items(peer, block_hashes, headers)
+
+    async def _fetch_block_bodies(
+            self,
+            block_hashes: Tuple[Hash32, ...]) -> Tuple[PeerItem[BlockBody], ...]:
+        peer = await self._scheduler.choose_peer()
+        self.logger.debug("Fetching %d blocks from %s", len(block_hashes), peer)
+        with self._scheduler.track_request(peer):
+            request_id = peer.les_api.send_get_block_bodies(block_hashes)
+            block_bodies = await self._wait_for_reply(request_id)
+        return await self._validate_peer_items(peer, block_hashes, block_bodies.payload.bodies)
+
+    async def _fetch_receipts(
+            self,
+            block_hashes: Tuple[Hash32, ...]) -> Tuple[PeerItem[Tuple[Receipt, ...]], ...]:
+        peer = await self._scheduler.choose_peer()
+        self.logger.debug("Fetching receipts of %d blocks from %s", len(block_hashes), peer)
+        with self._scheduler.track_request(peer):
+            request_id = peer.les_api.send_get_receipts(block_hashes)
+            receipts = await self._wait_for_reply(request_id)
+        return await self._validate_peer_items(peer, block_hashes, receipts.payload.receipts)
+
+    async def _fetch_proofs(
+            self,
+            keys: Tuple[Tuple[Hash32, Hash32], ...]) -> Tuple[PeerItem[Tuple[bytes, ...]], ...]:
+        peer = await self._scheduler.choose_peer()
+        proof_requests = tuple(
+            ProofRequest(block_hash, storage_key=None, state_key=state_key, from_level=0)
+            for block_hash, state_key in keys
+        )
+        with self._scheduler.track_request(peer):
+            request_id = peer.les_api.send_get_proofs(*proof_requests)
+            proofs = await self._wait_for_reply(request_id)
+
         if isinstance(proofs, ProofsV1):
-            if proofs.payload.proofs:
-                return proofs.payload.proofs[0]
-            else:
-                return ()
+            return await self._validate_peer_items(peer, keys, proofs.payload.proofs)
         elif isinstance(proofs, ProofsV2):
-            return proofs.payload.proof
+            # LES v2 merges the nodes of all the proofs, which is a valid proof of each key
+            return tuple((peer, proofs.payload.proof) for _ in keys)
         else:
             raise Exception("Unreachable")
 
-    async def _retry_on_bad_response(self, make_request_to_peer: Callable[[LESPeer], Any]) -> Any:
+    async def _fetch_contract_codes(
+            self,
+            keys: Tuple[Tuple[Hash32, Hash32], ...]) -> Tuple[PeerItem[bytes], ...]:
+        peer = await self._scheduler.choose_peer()
+        code_requests = tuple(
+            ContractCodeRequest(block_hash=block_hash, account=account_key)
+            for block_hash, account_key in keys
+        )
+        with self._scheduler.track_request(peer):
+            request_id = peer.les_api.send_get_contract_codes(*code_requests)
+            contract_codes = await self._wait_for_reply(request_id)
+        return await self._validate_peer_items(peer, keys, contract_codes.payload.codes)
+
+    async def _validate_peer_items(
+            self,
+            peer: LESPeer,
+            keys: Sequence[Any],
+            items: Sequence[TItem]) -> Tuple[PeerItem[TItem], ...]:
+        """
+        :raise BadLESResponse: if the peer replied with more items than were requested
+        """
+        if len(items) > len(keys):
+            self.logger.warning(
+                "Disconnecting from peer %s, because it sent %d items for %d requested",
+                peer,
+                len(items),
+                len(keys),
+            )
+            await peer.disconnect(DisconnectReason.SUBPROTOCOL_ERROR)
+            raise BadLESResponse(
+                f"Peer {peer} sent {len(items)} items when {len(keys)} were requested"
+            )
+        return self._get_peer_items(peer, keys, items)
+
+    @staticmethod
+    def _get_peer_items(
+            peer: LESPeer,
+            keys: Sequence[Any],
+            items: Sequence[TItem]) -> Tuple[PeerItem[TItem], ...]:
+        if len(keys) == 1 and not items:
+            # The peer doesn't have the only item we asked for
+            return ((peer, None),)
+        else:
+            return tuple((peer, item) for item in items)
+
+    async def _retry_on_bad_response(
+            self,
+            fetch: Callable[[], Awaitable[PeerItem[TItem]]],
+            validate: Callable[[LESPeer, Optional[TItem]], Awaitable[TResult]]) -> TResult:
         """
-        Make a call to a peer. If it behaves badly, drop it and retry with a different peer.
+        Fetch an item from a peer. If the peer behaves badly, drop it and retry, which will
+        probably pick a different peer.
 
-        :param make_request_to_peer: an abstract call to a peer that may raise a BadLESResponse
+        :param fetch: get an item, along with the peer it came from
+        :param validate: check an item from the given peer, and return the result, or raise a
+            BadLESResponse
 
         :raise NoEligiblePeers: if no peers are available to fulfill the request
         :raise asyncio.TimeoutError: if an individual request or the overall process times out
         """
         for _ in range(MAX_REQUEST_ATTEMPTS):
             try:
-                peer = cast(LESPeer, self.peer_pool.highest_td_peer)
-            except NoConnectedPeers as exc:
-                raise NoEligiblePeers() from exc
+                peer, item = await fetch()
+            except BadLESResponse:
+                # The peer was already disconnected, so reattempt
+                continue
 
             try:
-                return await make_request_to_peer(peer)
+                return await validate(peer, item)
             except BadLESResponse as exc:
                 self.logger.warning("Disconnecting from peer, because: %s", exc)
                 await peer.disconnect(DisconnectReason.SUBPROTOCOL_ERROR)